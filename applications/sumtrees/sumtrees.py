@@ -127,6 +127,7 @@ def _read_into_tree_array(
                 store_tree_weights=use_tree_weights,
                 preserve_underscores=preserve_underscores,
                 rooting=rooting,
+                tree_offset=tree_offset,
                 ignore_unrecognized_keyword_arguments=True,
                 )
         current_source_index = None
@@ -136,7 +137,6 @@ def _read_into_tree_array(
                 current_yielder_index = tree_yielder.current_file_index
                 if current_yielder_index != current_source_index:
                     current_source_index = current_yielder_index
-                    current_tree_offset = 0
                     source_name = tree_yielder.current_file_name
                     if source_name is None:
                         source_name = "<stdin>"
@@ -144,11 +144,12 @@ def _read_into_tree_array(
                         info_message_func("Analyzing {} of {}: '{}'".format(current_source_index+1, len(tree_sources), source_name), wrap=False)
                     else:
                         info_message_func("Analyzing: '{}'".format(source_name), wrap=False)
-                if current_tree_offset >= tree_offset:
-                    tree_array.add_tree(tree=tree, is_bipartitions_updated=False)
-                    _log_progress(source_name, current_tree_offset)
-                else:
-                    _log_progress(source_name, current_tree_offset)
+                    # burn-in trees have been skipped over by the yielder
+                    for current_tree_offset in range(tree_offset):
+                        _log_progress(source_name, current_tree_offset)
+                    current_tree_offset = tree_offset
+                tree_array.add_tree(tree=tree, is_bipartitions_updated=False)
+                _log_progress(source_name, current_tree_offset)
                 current_tree_offset += 1
         except (Exception, KeyboardInterrupt) as e:
             if debug_mode and not isinstance(e, KeyboardInterrupt):
@@ -489,14 +490,13 @@ class TreeProcessor(object):
 ##############################################################################
 ## Output
 
-def _write_trees(trees,
-        output_dest,
-        args,
-        file_comments):
+def _get_tree_writer_kwargs(args, file_comments):
+    """
+    Returns the schema and keyword arguments with which to write output
+    trees.
+    """
     if args.output_tree_format == "newick" or args.output_tree_format == "phylip":
-        trees.write_to_stream(
-                output_dest,
-                "newick",
+        return "newick", dict(
                 suppress_rooting=False,
                 suppress_edge_lengths=True if args.edge_length_summarization == "clear" else False,
                 unquoted_underscores=True if args.preserve_underscores else False,
@@ -506,9 +506,7 @@ def _write_trees(trees,
                 suppress_item_comments=args.clear_item_comments,
                 )
     elif args.output_tree_format == "nexus":
-        trees.write_to_stream(
-                output_dest,
-                "nexus",
+        return "nexus", dict(
                 suppress_rooting=False,
                 suppress_edge_lengths=True if args.edge_length_summarization == "clear" else False,
                 unquoted_underscores=True if args.preserve_underscores else False,
@@ -520,15 +518,36 @@ def _write_trees(trees,
                 file_comments=file_comments,
                 )
     elif args.output_tree_format == "nexml":
-        if file_comments:
-            trees.comments = file_comments
-        trees.write_to_stream(
-                output_dest,
-                "nexml",
-                )
+        return "nexml", {}
     else:
         raise ValueError(args.output_tree_format)
 
+def _write_trees(trees,
+        output_dest,
+        args,
+        file_comments):
+    schema, kwargs = _get_tree_writer_kwargs(args, file_comments)
+    if schema == "nexml" and file_comments:
+        trees.comments = file_comments
+    trees.write_to_stream(output_dest, schema, **kwargs)
+
+def _open_tree_stream_writer(output_dest,
+        taxon_namespace,
+        args,
+        file_comments):
+    """
+    Returns a |TreeStreamWriter| to write output trees one at a time, as they
+    are produced.
+    """
+    schema, kwargs = _get_tree_writer_kwargs(args, file_comments)
+    writer = dendropy.TreeStreamWriter(output_dest,
+            schema,
+            taxon_namespace=taxon_namespace,
+            **kwargs)
+    if schema == "nexml" and file_comments:
+        writer.tree_list.comments = file_comments
+    return writer
+
 ##############################################################################
 ## Front-End
 
@@ -1922,7 +1941,29 @@ def main():
         seen_split_bitmasks = set()
         all_bipartitions = collections.OrderedDict()
         bipartition_table = []
-        bipartitions_as_trees = dendropy.TreeList(taxon_namespace=tree_array.taxon_namespace)
+
+        # bipartitions as trees are written out as they are produced
+        if not args.suppress_analysis_metainformation:
+            metainfo = []
+            metainfo.append("============")
+            metainfo.append("Bipartitions")
+            metainfo.append("============")
+            metainfo.append("")
+            metainfo.append("\n".join((
+                    "Bipartitions in the source set of trees, represented ",
+                    "as trees, with information summarized from the source ",
+                    "set of trees annotated as metadata.",
+                    )))
+            metainfo.extend(summarization_metainfo)
+        else:
+            metainfo = []
+        output_path = extended_output_paths["bipartition-trees"]
+        messenger.info("Writing bipartition trees to: '{}'".format(output_path))
+        bipartition_trees_writer = _open_tree_stream_writer(
+                output_dest=output_path,
+                taxon_namespace=tree_array.taxon_namespace,
+                args=args,
+                file_comments=metainfo)
         # bipartition_stats_fieldname_map
         # biparitition_table_fieldnames = [
         #         "bipartitionId",
@@ -2027,22 +2068,23 @@ def main():
                 tree.seed_node.annotations.add_new(
                         textprocessing.snake_case(key),
                         value)
-            bipartitions_as_trees.append(tree)
+            bipartition_trees_writer.write(tree)
 
             all_bipartitions[bipartition] = bipartition_data
             return bipartition
 
-        # this is to preserve order seen in Mr. Bayes
-        _add_split_bitmask_data(all_taxa_bitmask)
-        for taxon in tree_array.taxon_namespace:
-            split_bitmask = tree_array.taxon_namespace.taxon_bitmask(taxon)
-            _add_split_bitmask_data(split_bitmask)
+        with bipartition_trees_writer:
+            # this is to preserve order seen in Mr. Bayes
+            _add_split_bitmask_data(all_taxa_bitmask)
+            for taxon in tree_array.taxon_namespace:
+                split_bitmask = tree_array.taxon_namespace.taxon_bitmask(taxon)
+                _add_split_bitmask_data(split_bitmask)
 
-        # add the rest in order
-        sd_split_bitmasks = list(tree_array.split_distribution.split_counts.keys())
-        sd_split_bitmasks.sort(key=lambda x: tree_array.split_distribution.split_counts[x], reverse=True)
-        for split_bitmask in sd_split_bitmasks:
-            _add_split_bitmask_data(split_bitmask)
+            # add the rest in order
+            sd_split_bitmasks = list(tree_array.split_distribution.split_counts.keys())
+            sd_split_bitmasks.sort(key=lambda x: tree_array.split_distribution.split_counts[x], reverse=True)
+            for split_bitmask in sd_split_bitmasks:
+                _add_split_bitmask_data(split_bitmask)
 
         #### EXTENDED OUTPUT: topologies / trprobs
         if not args.suppress_analysis_metainformation:
@@ -2085,29 +2127,6 @@ def main():
                     args=args,
                     file_comments=metainfo)
 
-        #### EXTENDED OUTPUT: bipartition trees
-        if not args.suppress_analysis_metainformation:
-            metainfo = []
-            metainfo.append("============")
-            metainfo.append("Bipartitions")
-            metainfo.append("============")
-            metainfo.append("")
-            metainfo.append("\n".join((
-                    "Bipartitions in the source set of trees, represented ",
-                    "as trees, with information summarized from the source ",
-                    "set of trees annotated as metadata.",
-                    )))
-            metainfo.extend(summarization_metainfo)
-        else:
-            metainfo = []
-        output_path = extended_output_paths["bipartition-trees"]
-        messenger.info("Writing bipartition trees to: '{}'".format(output_path))
-        with open(output_path, "w") as out:
-            _write_trees(trees=bipartitions_as_trees,
-                    output_dest=out,
-                    args=args,
-                    file_comments=metainfo)
-
         #### EXTENDED OUTPUT: bipartition table
         output_path = extended_output_paths["bipartition-table"]
         messenger.info("Writing bipartition table to: '{}'".format(output_path))
@@ -0,0 +1,14 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+import dendropy
+from dendropy.simulate import treesim
+
+taxa = dendropy.TaxonNamespace(["z{}".format(i) for i in range(1, 21)])
+with dendropy.TreeStreamWriter("kingman.nex", "nexus", taxon_namespace=taxa) as writer:
+    for rep in range(100000):
+        tree = treesim.pure_kingman_tree(
+                taxon_namespace=taxa,
+                pop_size=10000)
+        tree.label = "rep{}".format(rep + 1)
+        writer.write(tree)
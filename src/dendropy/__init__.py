@@ -34,6 +34,11 @@ from dendropy.datamodel.treemodel import Bipartition
 from dendropy.datamodel.treemodel import Edge
 from dendropy.datamodel.treemodel import Node
 from dendropy.datamodel.treemodel import Tree
+from dendropy.datamodel.treemodel import CompactBipartition
+from dendropy.datamodel.treemodel import CompactEdge
+from dendropy.datamodel.treemodel import CompactNode
+from dendropy.datamodel.treemodel import CompactTree
+from dendropy.datamodel.treemodel import FlatTree
 from dendropy.datamodel.treecollectionmodel import TreeList
 from dendropy.datamodel.treecollectionmodel import SplitDistribution
 from dendropy.datamodel.treecollectionmodel import TreeArray
@@ -48,24 +53,34 @@ from dendropy.datamodel.charstatemodel import INFINITE_SITES_STATE_ALPHABET
 from dendropy.datamodel.charstatemodel import new_standard_state_alphabet
 from dendropy.datamodel.charmatrixmodel import CharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import CharacterMatrix
+from dendropy.datamodel.charmatrixmodel import ByteCodedCharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import DnaCharacterDataSequence
+from dendropy.datamodel.charmatrixmodel import ByteCodedDnaCharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import DnaCharacterMatrix
 from dendropy.datamodel.charmatrixmodel import NucleotideCharacterDataSequence
+from dendropy.datamodel.charmatrixmodel import ByteCodedNucleotideCharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import NucleotideCharacterMatrix
 from dendropy.datamodel.charmatrixmodel import RnaCharacterDataSequence
+from dendropy.datamodel.charmatrixmodel import ByteCodedRnaCharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import RnaCharacterMatrix
 from dendropy.datamodel.charmatrixmodel import ProteinCharacterDataSequence
+from dendropy.datamodel.charmatrixmodel import ByteCodedProteinCharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import ProteinCharacterMatrix
 from dendropy.datamodel.charmatrixmodel import RestrictionSitesCharacterDataSequence
+from dendropy.datamodel.charmatrixmodel import ByteCodedRestrictionSitesCharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import RestrictionSitesCharacterMatrix
 from dendropy.datamodel.charmatrixmodel import InfiniteSitesCharacterDataSequence
+from dendropy.datamodel.charmatrixmodel import ByteCodedInfiniteSitesCharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import InfiniteSitesCharacterMatrix
 from dendropy.datamodel.charmatrixmodel import StandardCharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import StandardCharacterMatrix
 from dendropy.datamodel.charmatrixmodel import ContinuousCharacterDataSequence
 from dendropy.datamodel.charmatrixmodel import ContinuousCharacterMatrix
 from dendropy.calculate.phylogeneticdistance import PhylogeneticDistanceMatrix
+from dendropy.calculate.phylogeneticdistance import LCAIndex
 from dendropy.datamodel.datasetmodel import DataSet
+from dendropy.dataio.treefileindex import TreeFileIndex
+from dendropy.dataio.treestreamwriter import TreeStreamWriter
 from dendropy.utility.error import ImmutableTaxonNamespaceError
 from dendropy.utility.error import DataParseError
 from dendropy.utility.error import UnsupportedSchemaError
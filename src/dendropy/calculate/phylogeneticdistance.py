@@ -22,6 +22,7 @@ Taxon-to-taxon phylogenetic distances.
 """
 
 import math
+import array
 import collections
 import csv
 from dendropy.calculate import statistics
@@ -252,7 +253,14 @@ class PhylogeneticDistanceMatrix(object):
         Calculates the distances. Note that the path length (in number of
         steps) between taxa that span the root will be off by one if
         the tree is unrooted.
+
+        ``tree`` may also be a |FlatTree|, in which case MRCA's are given
+        as node indexes of the |FlatTree| and, if ``is_store_path_edges`` is
+        |True|, path edges are given as the indexes of the head nodes of the
+        edges.
         """
+        if isinstance(tree, dendropy.FlatTree):
+            return self._compile_from_flat_tree(tree)
         self.clear()
         self.taxon_namespace = tree.taxon_namespace
         # for i1, t1 in enumerate(self.taxon_namespace):
@@ -319,6 +327,68 @@ class PhylogeneticDistanceMatrix(object):
         self._mirror_lookups()
         # assert self._tree_length == tree.length()
 
+    def _compile_from_flat_tree(self, flat_tree):
+        self.clear()
+        self.taxon_namespace = flat_tree.taxon_namespace
+        self._tree_length = 0.0
+        self._num_edges = 0
+        if self.is_store_path_edges:
+            default_pedges = []
+        else:
+            default_pedges = None
+        edge_lengths = flat_tree.edge_lengths
+        desc_paths = [None] * len(flat_tree)
+        for node in flat_tree.postorder_index_iter():
+            if edge_lengths[node] == edge_lengths[node]: # NaN for undefined edge length
+                self._tree_length += edge_lengths[node]
+            self._num_edges += 1
+            children = flat_tree.child_indexes(node)
+            if len(children) == 0:
+                desc_paths[node] = {node : (0,0, default_pedges)}
+            else:
+                node_desc_paths = {}
+                desc_paths[node] = node_desc_paths
+                for cidx1, c1 in enumerate(children):
+                    c1_edge_length = edge_lengths[c1]
+                    if c1_edge_length != c1_edge_length:
+                        c1_edge_length = 0.0
+                    for desc1, (desc1_plen, desc1_psteps, desc1_pedges) in desc_paths[c1].items():
+                        if self.is_store_path_edges:
+                            pedges = list(desc1_pedges + [c1])
+                        else:
+                            pedges = default_pedges
+                        node_desc_paths[desc1] = (desc1_plen + c1_edge_length, desc1_psteps + 1, pedges)
+                        taxon1 = flat_tree.taxon(desc1)
+                        assert taxon1 is not None
+                        if taxon1 not in self._taxon_phylogenetic_distances:
+                            self._mapped_taxa.add(taxon1)
+                            self._taxon_phylogenetic_distances[taxon1] = {}
+                            self._taxon_phylogenetic_distances[taxon1][taxon1] = 0.0
+                            self._taxon_phylogenetic_path_steps[taxon1] = {}
+                            self._taxon_phylogenetic_path_steps[taxon1][taxon1] = 0
+                            if self.is_store_path_edges:
+                                self._taxon_phylogenetic_path_edges[taxon1] = {}
+                                self._taxon_phylogenetic_path_edges[taxon1][taxon1] = []
+                            self._mrca[taxon1] = {taxon1: desc1}
+                        for c2 in children[cidx1+1:]:
+                            c2_edge_length = edge_lengths[c2]
+                            if c2_edge_length != c2_edge_length:
+                                c2_edge_length = 0.0
+                            for desc2, (desc2_plen, desc2_psteps, desc2_pedges) in desc_paths[c2].items():
+                                taxon2 = flat_tree.taxon(desc2)
+                                self._mapped_taxa.add(taxon2)
+                                self._mrca[taxon1][taxon2] = node
+                                self._all_distinct_mapped_taxa_pairs.add( frozenset([taxon1, taxon2]) )
+                                pat_dist = node_desc_paths[desc1][0] + desc2_plen + c2_edge_length
+                                self._taxon_phylogenetic_distances[taxon1][taxon2] = pat_dist
+                                path_steps = node_desc_paths[desc1][1] + desc2_psteps + 1
+                                self._taxon_phylogenetic_path_steps[taxon1][taxon2] = path_steps
+                                if self.is_store_path_edges:
+                                    pedges = tuple(node_desc_paths[desc1][2] + [c2] + desc2_pedges[::-1])
+                                    self._taxon_phylogenetic_path_edges[taxon1][taxon2] = pedges
+                    desc_paths[c1] = None
+        self._mirror_lookups()
+
     def compile_from_dict(self, distances, taxon_namespace):
         self.clear()
         self.taxon_namespace = taxon_namespace
@@ -1599,3 +1669,220 @@ class NodeDistanceMatrix(object):
                 normalization_factor = 1.0
         return dmatrix, normalization_factor
 
+
+class LCAIndex(object):
+    """
+    Answers most-recent common ancestor (MRCA), depth and distance queries for
+    the nodes of a tree without pairwise precomputation.
+
+    The index is built in O(n log n) time from an Euler tour of the tree and a
+    sparse table over the depths of the nodes visited in the tour, so that the
+    MRCA of any two nodes is found in constant time (and the MRCA of *k* nodes
+    in O(k) time), and the patristic distance between two nodes is derived
+    from the distances of the nodes and their MRCA from the root.
+
+    The index reflects the structure and edge lengths of the tree at the time
+    that it was built. :meth:`LCAIndex.is_current()` reports whether the
+    structure of the tree may have changed since, and
+    :meth:`Tree.lca_index()` returns an index that is rebuilt as needed.
+    """
+
+    @classmethod
+    def from_tree(cls, tree):
+        lca_index = cls()
+        lca_index.compile_from_tree(tree=tree)
+        return lca_index
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.tree = None
+        self._structure_version = None
+        self._nodes = []
+        self._node_index_map = {}
+        self._taxon_node_index_map = {}
+        self._stale_taxa = set()
+        self._node_depths = array.array("l")
+        self._node_root_distances = array.array("d")
+        self._first_euler_positions = array.array("l")
+        self._sparse_table = []
+
+    def compile_from_tree(self, tree):
+        self.clear()
+        self.tree = tree
+        self._structure_version = tree._get_structure_version()
+        nodes = self._nodes
+        node_index_map = self._node_index_map
+        taxon_node_index_map = self._taxon_node_index_map
+        node_depths = self._node_depths
+        node_root_distances = self._node_root_distances
+        first_euler_positions = self._first_euler_positions
+        euler_tour = array.array("l")
+
+        # Euler tour: each node is recorded on entry and after returning from
+        # each of its children
+        seed_node = tree.seed_node
+        nodes.append(seed_node)
+        node_index_map[seed_node] = 0
+        node_depths.append(0)
+        node_root_distances.append(0.0)
+        first_euler_positions.append(0)
+        euler_tour.append(0)
+        stack = [[seed_node, 0, 0]]
+        while stack:
+            entry = stack[-1]
+            node, node_idx, child_pos = entry
+            if child_pos < len(node._child_nodes):
+                entry[2] = child_pos + 1
+                child = node._child_nodes[child_pos]
+                child_idx = len(nodes)
+                nodes.append(child)
+                node_index_map[child] = child_idx
+                node_depths.append(node_depths[node_idx] + 1)
+                length = child.edge.length
+                if length is None:
+                    length = 0.0
+                node_root_distances.append(node_root_distances[node_idx] + length)
+                first_euler_positions.append(len(euler_tour))
+                euler_tour.append(child_idx)
+                stack.append([child, child_idx, 0])
+            else:
+                stack.pop()
+                if stack:
+                    euler_tour.append(stack[-1][1])
+        for node_idx, node in enumerate(nodes):
+            if node.taxon is not None and node.taxon not in taxon_node_index_map:
+                taxon_node_index_map[node.taxon] = node_idx
+
+        # Sparse table: row k holds, for each position i of the tour, the
+        # index of the shallowest node in tour positions [i, i + 2**k)
+        sparse_table = self._sparse_table
+        sparse_table.append(euler_tour)
+        span = 1
+        num_positions = len(euler_tour)
+        while span * 2 <= num_positions:
+            prev_row = sparse_table[-1]
+            row = array.array("l", [a if node_depths[a] <= node_depths[b] else b
+                    for a, b in zip(prev_row, prev_row[span:])])
+            sparse_table.append(row)
+            span *= 2
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def is_current(self):
+        """
+        Returns |False| if nodes may have been added, removed or rearranged
+        since the index was built.
+        """
+        return (self.tree is not None
+                and self._structure_version == self.tree._get_structure_version())
+
+    def _note_node_taxon_changed(self, node, old_taxon, new_taxon):
+        # Called by |Node| (for the index kept by :meth:`Tree.lca_index()`)
+        # when the taxon of ``node`` is reassigned, which leaves the tree
+        # structure, and so the rest of the index, unchanged. Taxa mapped to
+        # the first node (in preorder) with the taxon are kept so, and a taxon
+        # that may map to another node is looked up again when next queried.
+        node_idx = self._node_index_map[node]
+        taxon_node_index_map = self._taxon_node_index_map
+        if old_taxon is not None and taxon_node_index_map.get(old_taxon, None) == node_idx:
+            del taxon_node_index_map[old_taxon]
+            self._stale_taxa.add(old_taxon)
+        if new_taxon is not None and new_taxon not in self._stale_taxa:
+            other_idx = taxon_node_index_map.get(new_taxon, None)
+            if other_idx is None or node_idx < other_idx:
+                taxon_node_index_map[new_taxon] = node_idx
+
+    def _reindex_taxon(self, taxon):
+        self._stale_taxa.discard(taxon)
+        for node_idx, node in enumerate(self._nodes):
+            if node.taxon is taxon:
+                self._taxon_node_index_map[taxon] = node_idx
+                break
+
+    def _get_node_index(self, item):
+        try:
+            return self._node_index_map[item]
+        except KeyError:
+            if item in self._stale_taxa:
+                self._reindex_taxon(item)
+            try:
+                return self._taxon_node_index_map[item]
+            except KeyError:
+                raise KeyError("Node or taxon not found in tree: {}".format(item))
+
+    def _lca_node_index(self, node_idx1, node_idx2):
+        if node_idx1 == node_idx2:
+            return node_idx1
+        pos1 = self._first_euler_positions[node_idx1]
+        pos2 = self._first_euler_positions[node_idx2]
+        if pos1 > pos2:
+            pos1, pos2 = pos2, pos1
+        k = (pos2 - pos1 + 1).bit_length() - 1
+        row = self._sparse_table[k]
+        a = row[pos1]
+        b = row[pos2 - (1 << k) + 1]
+        if self._node_depths[a] <= self._node_depths[b]:
+            return a
+        return b
+
+    def mrca(self, *args):
+        """
+        Returns the MRCA of the given nodes or taxa.
+
+        Parameters
+        ----------
+        \*args : |Node| or |Taxon| objects
+            The nodes, or taxa associated with nodes, of the tree.
+
+        Returns
+        -------
+        |Node|
+            The deepest node that is an ancestor of (or is itself) each of
+            the nodes given or associated with the taxa given.
+        """
+        if not args:
+            raise TypeError("At least one node or taxon must be specified")
+        node_idx = self._get_node_index(args[0])
+        for item in args[1:]:
+            node_idx = self._lca_node_index(node_idx, self._get_node_index(item))
+        return self._nodes[node_idx]
+
+    def depth(self, node):
+        """
+        Returns the number of edges between ``node`` (a |Node| or |Taxon|)
+        and the seed node of the tree.
+        """
+        return self._node_depths[self._get_node_index(node)]
+
+    def root_distance(self, node):
+        """
+        Returns the sum of edge lengths between ``node`` (a |Node| or |Taxon|)
+        and the seed node of the tree. Edges without lengths are treated as
+        having a length of 0.
+        """
+        return self._node_root_distances[self._get_node_index(node)]
+
+    def patristic_distance(self, node1, node2):
+        """
+        Returns the sum of edge lengths on the path between ``node1`` and
+        ``node2`` (each a |Node| or |Taxon|).
+        """
+        node_idx1 = self._get_node_index(node1)
+        node_idx2 = self._get_node_index(node2)
+        mrca_idx = self._lca_node_index(node_idx1, node_idx2)
+        d = self._node_root_distances
+        return d[node_idx1] + d[node_idx2] - 2 * d[mrca_idx]
+
+    def path_edge_count(self, node1, node2):
+        """
+        Returns the number of edges on the path between ``node1`` and
+        ``node2`` (each a |Node| or |Taxon|).
+        """
+        node_idx1 = self._get_node_index(node1)
+        node_idx2 = self._get_node_index(node2)
+        mrca_idx = self._lca_node_index(node_idx1, node_idx2)
+        d = self._node_depths
+        return d[node_idx1] + d[node_idx2] - 2 * d[mrca_idx]
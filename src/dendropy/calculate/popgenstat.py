@@ -30,10 +30,14 @@ from dendropy.calculate import combinatorics
 ## internal functions: generally taking lower-level data, such as sequences etc.
 ###############################################################################
 
-def _count_differences(char_sequences, state_alphabet, ignore_uncertain=True):
+def _count_differences(char_sequences, state_alphabet, ignore_uncertain=True, weights=None):
     """
     Returns pair of values: total number of pairwise differences observed between
     all sequences, and mean number of pairwise differences pair base.
+
+    If given, ``weights`` are the number of sites represented by each column
+    of ``char_sequences``, e.g. the ``weights`` of the site patterns returned
+    by ``DiscreteCharacterMatrix.compress_site_patterns()``.
     """
     sum_diff = 0.0
     mean_diff = 0.0
@@ -56,20 +60,20 @@ def _count_differences(char_sequences, state_alphabet, ignore_uncertain=True):
     for sequence in char_sequences:
         seq = [getattr(char, attr) for char in sequence]
         reduced_char_sequences.append(seq)
+    if weights is None:
+        weights = [1] * len(reduced_char_sequences[0])
 
     for vidx, i in enumerate(reduced_char_sequences[:-1]):
         for j in reduced_char_sequences[vidx+1:]:
             diff = 0
             counted = 0
             comps += 1
-            for cidx, c in enumerate(i):
-                c1 = c
-                c2 = j[cidx]
+            for c1, c2, weight in zip(i, j, weights):
                 if c1 in states_to_ignore or c2 in states_to_ignore:
                     continue
-                counted += 1
+                counted += weight
                 if c1 is not c2:
-                    diff += 1
+                    diff += weight
             sum_diff += float(diff)
             # If counted < 0, this means that there is sites between these sequences
             # in which both are not ignored: i.e., one or the other has a gap
@@ -82,14 +86,14 @@ def _count_differences(char_sequences, state_alphabet, ignore_uncertain=True):
             sq_diff += (diff ** 2)
     return sum_diff, mean_diff / comps, sq_diff
 
-def _nucleotide_diversity(char_sequences, state_alphabet, ignore_uncertain=True):
+def _nucleotide_diversity(char_sequences, state_alphabet, ignore_uncertain=True, weights=None):
     """
     Returns $\pi$, the proportional nucleotide diversity, calculated for a
     list of character sequences.
     """
-    return _count_differences(char_sequences, state_alphabet, ignore_uncertain)[1]
+    return _count_differences(char_sequences, state_alphabet, ignore_uncertain, weights)[1]
 
-def _average_number_of_pairwise_differences(char_sequences, state_alphabet, ignore_uncertain=True):
+def _average_number_of_pairwise_differences(char_sequences, state_alphabet, ignore_uncertain=True, weights=None):
     """
     Returns $k$ (Tajima 1983; Wakely 1996), calculated for a set of sequences:
 
@@ -99,12 +103,15 @@ def _average_number_of_pairwise_differences(char_sequences, state_alphabet, igno
     $i$th and $j$th sequence, and $n$ is the number of DNA sequences
     sampled.
     """
-    sum_diff, mean_diff, sq_diff = _count_differences(char_sequences, state_alphabet, ignore_uncertain)
+    sum_diff, mean_diff, sq_diff = _count_differences(char_sequences, state_alphabet, ignore_uncertain, weights)
     return sum_diff / combinatorics.choose(len(char_sequences), 2)
 
-def _num_segregating_sites(char_sequences, state_alphabet, ignore_uncertain=True):
+def _num_segregating_sites(char_sequences, state_alphabet, ignore_uncertain=True, weights=None):
     """
     Returns the raw number of segregating sites (polymorphic sites).
+
+    If given, ``weights`` are the number of sites represented by each column
+    of ``char_sequences``.
     """
     s = 0
     if ignore_uncertain:
@@ -122,7 +129,7 @@ def _num_segregating_sites(char_sequences, state_alphabet, ignore_uncertain=True
             if f1 in states_to_ignore or f2 in states_to_ignore:
                 continue
             if f1 is not f2:
-                s += 1
+                s += 1 if weights is None else weights[i]
                 break
     return s
 
@@ -166,45 +173,57 @@ def num_segregating_sites(char_matrix, ignore_uncertain=True):
     """
     Returns the raw number of segregating sites (polymorphic sites).
     """
+    site_patterns = char_matrix.compress_site_patterns()
     return _num_segregating_sites(
-            char_matrix.sequences(),
+            site_patterns.sequences(),
             char_matrix.default_state_alphabet,
-            ignore_uncertain)
+            ignore_uncertain,
+            weights=site_patterns.weights)
 
 def average_number_of_pairwise_differences(char_matrix, ignore_uncertain=True):
     """
     Returns $k$, calculated for a character block.
     """
-    return _average_number_of_pairwise_differences(char_matrix.sequences(), char_matrix.default_state_alphabet, ignore_uncertain)
+    site_patterns = char_matrix.compress_site_patterns()
+    return _average_number_of_pairwise_differences(site_patterns.sequences(), char_matrix.default_state_alphabet, ignore_uncertain, weights=site_patterns.weights)
 
 def nucleotide_diversity(char_matrix, ignore_uncertain=True):
     """
     Returns $\pi$, calculated for a character block.
     """
-    return _nucleotide_diversity(char_matrix.sequences(), char_matrix.default_state_alphabet, ignore_uncertain)
+    site_patterns = char_matrix.compress_site_patterns()
+    return _nucleotide_diversity(site_patterns.sequences(), char_matrix.default_state_alphabet, ignore_uncertain, weights=site_patterns.weights)
 
 def tajimas_d(char_matrix, ignore_uncertain=True):
     """
     Returns Tajima's D.
     """
-    sequences = char_matrix.sequences()
+    site_patterns = char_matrix.compress_site_patterns()
+    sequences = site_patterns.sequences()
     num_sequences = len(sequences)
-    avg_num_pairwise_differences = _average_number_of_pairwise_differences(sequences, char_matrix.default_state_alphabet, ignore_uncertain=ignore_uncertain)
+    avg_num_pairwise_differences = _average_number_of_pairwise_differences(
+            sequences,
+            char_matrix.default_state_alphabet,
+            ignore_uncertain=ignore_uncertain,
+            weights=site_patterns.weights)
     num_segregating_sites = _num_segregating_sites(
             sequences,
             char_matrix.default_state_alphabet,
-            ignore_uncertain=ignore_uncertain)
+            ignore_uncertain=ignore_uncertain,
+            weights=site_patterns.weights)
     return _tajimas_d(num_sequences, avg_num_pairwise_differences, num_segregating_sites)
 
 def wattersons_theta(char_matrix, ignore_uncertain=True):
     """
     Returns Watterson's Theta (per sequence)
     """
-    sequences = char_matrix.sequences()
+    site_patterns = char_matrix.compress_site_patterns()
+    sequences = site_patterns.sequences()
     num_segregating_sites = _num_segregating_sites(
             sequences,
             char_matrix.default_state_alphabet,
-            ignore_uncertain=ignore_uncertain)
+            ignore_uncertain=ignore_uncertain,
+            weights=site_patterns.weights)
     a1 = sum([1.0/i for i in range(1, len(sequences))])
     return float(num_segregating_sites) / a1
 
@@ -22,6 +22,7 @@ Statistics, metrics, measurements, and values calculated on (single) trees.
 """
 
 import math
+from dendropy.datamodel import treemodel
 from dendropy.calculate import phylogeneticdistance
 
 EULERS_CONSTANT = 0.5772156649015328606065120900824024310421
@@ -62,6 +63,8 @@ def B1(tree):
     number of nodes between each interior node and tip over all internal
     nodes excluding root.
     """
+    if isinstance(tree, treemodel.FlatTree):
+        return _flat_tree_B1(tree)
     b1 = 0.0
     nd_mi = {}
     for nd in tree.postorder_node_iter():
@@ -95,21 +98,24 @@ def colless_tree_imbalance(tree, normalize="max"):
             no normalization
 
     """
-    colless = 0.0
-    num_leaves = 0
-    subtree_leaves = {}
-    for nd in tree.postorder_node_iter():
-        if nd.is_leaf():
-            subtree_leaves[nd] = 1
-            num_leaves += 1
-        else:
-            total_leaves = 0
-            if len(nd._child_nodes) > 2:
-                raise TypeError("Colless' tree imbalance statistic requires strictly bifurcating trees")
-            left = subtree_leaves[nd._child_nodes[0]]
-            right = subtree_leaves[nd._child_nodes[1]]
-            colless += abs(right-left)
-            subtree_leaves[nd] = right + left
+    if isinstance(tree, treemodel.FlatTree):
+        colless, num_leaves = _flat_tree_colless_sum(tree)
+    else:
+        colless = 0.0
+        num_leaves = 0
+        subtree_leaves = {}
+        for nd in tree.postorder_node_iter():
+            if nd.is_leaf():
+                subtree_leaves[nd] = 1
+                num_leaves += 1
+            else:
+                total_leaves = 0
+                if len(nd._child_nodes) > 2:
+                    raise TypeError("Colless' tree imbalance statistic requires strictly bifurcating trees")
+                left = subtree_leaves[nd._child_nodes[0]]
+                right = subtree_leaves[nd._child_nodes[1]]
+                colless += abs(right-left)
+                subtree_leaves[nd] = right + left
     if normalize == "yule":
         colless = float(colless - (num_leaves * math.log(num_leaves)) - (num_leaves * (EULERS_CONSTANT - 1.0 - math.log(2))))/num_leaves
     elif normalize == "pda":
@@ -150,13 +156,22 @@ def pybus_harvey_gamma(tree, prec=0.00001):
     node = None
     speciation_ages = []
     n = 0
-    if tree.seed_node.age is None:
-        tree.calc_node_ages(ultrametricity_precision=prec)
-    for node in tree.postorder_node_iter():
-        if len(node.child_nodes()) == 2:
-            speciation_ages.append(node.age)
-        else:
-            n += 1
+    if isinstance(tree, treemodel.FlatTree):
+        if tree.node_ages is None:
+            tree.calc_node_ages(ultrametricity_precision=prec)
+        for node, num_child_nodes in enumerate(tree.num_child_nodes):
+            if num_child_nodes == 2:
+                speciation_ages.append(tree.node_ages[node])
+            else:
+                n += 1
+    else:
+        if tree.seed_node.age is None:
+            tree.calc_node_ages(ultrametricity_precision=prec)
+        for node in tree.postorder_node_iter():
+            if len(node.child_nodes()) == 2:
+                speciation_ages.append(node.age)
+            else:
+                n += 1
     if node is None:
         raise ValueError("Empty tree encountered")
     speciation_ages.sort(reverse=True)
@@ -187,6 +202,9 @@ def N_bar(tree):
     Returns the $\bar{N}$ statistic: the average number of nodes above a
     terminal node.
     """
+    if isinstance(tree, treemodel.FlatTree):
+        nbar, leaf_count = _flat_tree_leaf_ancestor_count(tree)
+        return float(nbar) / leaf_count
     leaf_count = 0
     nbar = 0
     for leaf_node in tree.leaf_node_iter():
@@ -213,12 +231,15 @@ def sackin_index(tree, normalize=True):
             no normalization
 
     """
-    leaf_count = 0
-    num_anc = 0
-    for leaf_node in tree.leaf_node_iter():
-        leaf_count += 1
-        for parent in leaf_node.ancestor_iter(inclusive=False):
-            num_anc += 1
+    if isinstance(tree, treemodel.FlatTree):
+        num_anc, leaf_count = _flat_tree_leaf_ancestor_count(tree)
+    else:
+        leaf_count = 0
+        num_anc = 0
+        for leaf_node in tree.leaf_node_iter():
+            leaf_count += 1
+            for parent in leaf_node.ancestor_iter(inclusive=False):
+                num_anc += 1
     if normalize == "yule":
         x = sum(1.0/j for j in range(2, leaf_count+1))
         s = float(num_anc - (2 * leaf_count * x))/leaf_count
@@ -239,6 +260,15 @@ def treeness(tree):
     """
     internal = 0.0
     external = 0.0
+    if isinstance(tree, treemodel.FlatTree):
+        num_child_nodes = tree.num_child_nodes
+        edge_lengths = tree.edge_lengths
+        for nd in range(1, len(num_child_nodes)):
+            if num_child_nodes[nd]:
+                internal += edge_lengths[nd]
+            else:
+                external += edge_lengths[nd]
+        return internal/(external + internal)
     for nd in tree.postorder_node_iter():
         if not nd._parent_node:
             continue
@@ -248,3 +278,57 @@ def treeness(tree):
             internal += nd.edge.length
     return internal/(external + internal)
 
+###########################################################################
+### Support for |FlatTree| objects
+
+def _flat_tree_B1(flat_tree):
+    b1 = 0.0
+    parent_indexes = flat_tree.parent_indexes
+    num_child_nodes = flat_tree.num_child_nodes
+    nd_mi = [0] * len(parent_indexes)
+    for nd in range(len(parent_indexes)-1, 0, -1):
+        if num_child_nodes[nd]:
+            mi = nd_mi[nd] + 1
+            b1 += 1.0/mi
+        else:
+            mi = 0
+        parent = parent_indexes[nd]
+        if mi > nd_mi[parent]:
+            nd_mi[parent] = mi
+    return b1
+
+def _flat_tree_colless_sum(flat_tree):
+    colless = 0.0
+    num_leaves = 0
+    num_child_nodes = flat_tree.num_child_nodes
+    first_child_indexes = flat_tree.first_child_indexes
+    next_sibling_indexes = flat_tree.next_sibling_indexes
+    subtree_leaves = [0] * len(num_child_nodes)
+    for nd in range(len(num_child_nodes)-1, -1, -1):
+        if not num_child_nodes[nd]:
+            subtree_leaves[nd] = 1
+            num_leaves += 1
+        else:
+            if num_child_nodes[nd] != 2:
+                raise TypeError("Colless' tree imbalance statistic requires strictly bifurcating trees")
+            left_nd = first_child_indexes[nd]
+            left = subtree_leaves[left_nd]
+            right = subtree_leaves[next_sibling_indexes[left_nd]]
+            colless += abs(right-left)
+            subtree_leaves[nd] = right + left
+    return colless, num_leaves
+
+def _flat_tree_leaf_ancestor_count(flat_tree):
+    parent_indexes = flat_tree.parent_indexes
+    num_child_nodes = flat_tree.num_child_nodes
+    depths = [0] * len(parent_indexes)
+    num_anc = 0
+    leaf_count = 0
+    for nd in range(1, len(parent_indexes)):
+        depths[nd] = depths[parent_indexes[nd]] + 1
+        if not num_child_nodes[nd]:
+            num_anc += depths[nd]
+            leaf_count += 1
+    if len(parent_indexes) == 1:
+        leaf_count = 1
+    return num_anc, leaf_count
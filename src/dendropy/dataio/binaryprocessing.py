@@ -0,0 +1,369 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Primitives for reading and writing the compact, versioned "dendropy-bin"
+binary format.
+
+A "dendropy-bin" document consists of a header (the format signature, the
+format version, and a code identifying the kind of content stored), followed
+by a sequence of values of the following types, all little-endian:
+
+    - unsigned integers and floats: 8 bytes each;
+    - flags: single bytes, with 0 for |False|, 1 for |True| and 2 for |None|;
+    - arrays: the array type code as a single byte, the number of items, and
+      then the raw bytes of the items;
+    - string lists: an array of the lengths of the UTF-8 encoded strings
+      (with -1 for |None|), and then the concatenated UTF-8 encoded strings;
+    - bitmask lists: the number of bytes per bitmask, the number of bitmasks,
+      and then the concatenated bitmasks, each encoded in that many bytes.
+
+Floating-point values of |None| (e.g., missing edge lengths) are stored as
+NaN. Since all bulk data is stored as fixed-width arrays, documents are read
+with a few bulk array copies (out of a memory map of the file, where
+possible) rather than being parsed.
+"""
+
+import io
+import sys
+import math
+import mmap
+import array
+import struct
+from dendropy.utility import error
+
+FORMAT_SIGNATURE = b"\x89DPYBIN\n"
+FORMAT_VERSION = 1
+
+# Codes identifying the content of a document
+TREE_LISTS_CONTENT = 1
+TREE_ARRAY_CONTENT = 2
+SPLIT_DISTRIBUTION_CONTENT = 3
+
+_CONTENT_DESCRIPTIONS = {
+        TREE_LISTS_CONTENT: "tree lists",
+        TREE_ARRAY_CONTENT: "a tree array",
+        SPLIT_DISTRIBUTION_CONTENT: "a split distribution",
+        }
+
+# Type codes of the arrays that may be stored, with their item sizes
+_ARRAY_ITEM_SIZES = {
+        "b": 1,
+        "i": 4,
+        "q": 8,
+        "d": 8,
+        }
+
+_HEADER = struct.Struct("<8sHB")
+_UINT = struct.Struct("<Q")
+_FLOAT = struct.Struct("<d")
+_ARRAY_HEADER = struct.Struct("<cQ")
+
+FLAG_VALUES = {False: 0, True: 1, None: 2}
+FLAGS = (False, True, None)
+
+_IS_BIG_ENDIAN = sys.byteorder == "big"
+
+def get_binary_stream(stream):
+    """
+    Returns the binary stream underlying ``stream`` if it is a text stream
+    (e.g., a file opened in text mode), or ``stream`` itself otherwise.
+    """
+    if isinstance(stream, io.TextIOBase):
+        try:
+            return stream.buffer
+        except AttributeError:
+            raise TypeError("'dendropy-bin' data can only be read from or written to binary streams (e.g., files or io.BytesIO objects), not {}".format(type(stream).__name__))
+    return stream
+
+def peek_content_type(stream):
+    """
+    Returns the content type code of the "dendropy-bin" document at the
+    current position of ``stream``, leaving the position unchanged, or |None|
+    if ``stream`` cannot be repositioned or does not hold such a document.
+    """
+    stream = get_binary_stream(stream)
+    try:
+        if not stream.seekable():
+            return None
+        position = stream.tell()
+        header = stream.read(_HEADER.size)
+        stream.seek(position)
+    except (AttributeError, IOError, OSError):
+        return None
+    if len(header) < _HEADER.size:
+        return None
+    signature, version, content_type = _HEADER.unpack(header)
+    if signature != FORMAT_SIGNATURE:
+        return None
+    return content_type
+
+def float_or_nan(value):
+    if value is None:
+        return float("nan")
+    return value
+
+def float_or_none(value):
+    if math.isnan(value):
+        return None
+    return value
+
+def pack_bitmasks(bitmasks):
+    """
+    Returns a tuple, (number of bytes per bitmask, bytes), of the bitmasks
+    in the iterable ``bitmasks`` each encoded (little-endian) in the same
+    number of bytes.
+    """
+    bitmasks = list(bitmasks)
+    max_bitmask = 0
+    for bitmask in bitmasks:
+        max_bitmask |= bitmask
+    num_bytes = max(1, (max_bitmask.bit_length() + 7) // 8)
+    return num_bytes, b"".join([bitmask.to_bytes(num_bytes, "little") for bitmask in bitmasks])
+
+def get_bit_map(source_bit_indexes, target_bit_indexes):
+    """
+    Returns a list, ``bit_map``, such that ``bit_map[source_bit_indexes[i]]``
+    is ``target_bit_indexes[i]``, for remapping bitmasks with
+    :func:`remap_bitmask()`, or |None| if no remapping is needed.
+    """
+    source_bit_indexes = list(source_bit_indexes)
+    target_bit_indexes = list(target_bit_indexes)
+    if source_bit_indexes == target_bit_indexes:
+        return None
+    bit_map = list(range(max(source_bit_indexes) + 1))
+    for source_bit_index, target_bit_index in zip(source_bit_indexes, target_bit_indexes):
+        bit_map[source_bit_index] = target_bit_index
+    return bit_map
+
+def remap_bitmask(bitmask, bit_map):
+    """
+    Returns ``bitmask`` with each bit ``i`` set moved to bit ``bit_map[i]``.
+    """
+    remapped = 0
+    i = 0
+    while bitmask:
+        if bitmask & 1:
+            remapped |= 1 << bit_map[i]
+        bitmask >>= 1
+        i += 1
+    return remapped
+
+class BinaryEncoder(object):
+    """
+    Writes the values of a "dendropy-bin" document to a binary stream.
+    """
+
+    def __init__(self, stream):
+        if isinstance(stream, io.TextIOBase):
+            stream.flush()
+        self.stream = get_binary_stream(stream)
+
+    def write_header(self, content_type):
+        self.stream.write(_HEADER.pack(FORMAT_SIGNATURE, FORMAT_VERSION, content_type))
+
+    def write_uint(self, value):
+        self.stream.write(_UINT.pack(value))
+
+    def write_float(self, value):
+        self.stream.write(_FLOAT.pack(float_or_nan(value)))
+
+    def write_flag(self, value):
+        self.stream.write(bytes((FLAG_VALUES[value],)))
+
+    def write_array(self, typecode, values):
+        if not isinstance(values, array.array) or values.typecode != typecode:
+            values = array.array(typecode, values)
+        self.stream.write(_ARRAY_HEADER.pack(typecode.encode("ascii"), len(values)))
+        if _IS_BIG_ENDIAN:
+            values = array.array(typecode, values)
+            values.byteswap()
+        self.stream.write(values.tobytes())
+
+    def write_strings(self, strings):
+        lengths = array.array("i")
+        encoded = []
+        for s in strings:
+            if s is None:
+                lengths.append(-1)
+            else:
+                if not isinstance(s, str):
+                    s = str(s)
+                s = s.encode("utf-8")
+                lengths.append(len(s))
+                encoded.append(s)
+        self.write_array("i", lengths)
+        self.stream.write(b"".join(encoded))
+
+    def write_string(self, s):
+        self.write_strings([s])
+
+    def write_bitmasks(self, bitmasks):
+        bitmasks = list(bitmasks)
+        num_bytes, data = pack_bitmasks(bitmasks)
+        self.write_uint(num_bytes)
+        self.write_uint(len(bitmasks))
+        self.stream.write(data)
+
+class BinaryDecoder(object):
+    """
+    Reads the values of a "dendropy-bin" document from a binary stream.
+
+    The rest of the stream is memory-mapped if it is a file on disk, and read
+    in otherwise. ``close()`` must be called when done, to release the memory
+    map and to leave the stream positioned at the end of the document.
+    """
+
+    def __init__(self, stream):
+        self._source_stream = stream
+        self.stream = get_binary_stream(stream)
+        self._mmap = None
+        self._start = 0
+        data = None
+        if isinstance(getattr(self.stream, "raw", None), io.FileIO):
+            try:
+                self._start = self.stream.tell()
+                self._mmap = mmap.mmap(self.stream.fileno(), 0, access=mmap.ACCESS_READ)
+                data = self._mmap
+            except (ValueError, IOError, OSError):
+                # e.g., empty files cannot be mapped
+                self._mmap = None
+                self._start = 0
+        if data is None:
+            data = self.stream.read()
+        self.data = memoryview(data)
+        self.offset = self._start
+
+    def close(self):
+        if self.data is None:
+            return
+        self.data.release()
+        self.data = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+            self.stream.seek(self.offset)
+
+    def _error(self, message):
+        return error.DataParseError(message=message, stream=self._source_stream)
+
+    def _take(self, num_bytes):
+        start = self.offset
+        end = start + num_bytes
+        if end > len(self.data):
+            raise self._error("Unexpected end of 'dendropy-bin' data")
+        self.offset = end
+        return self.data[start:end]
+
+    def read_header(self, expected_content_type=None):
+        """
+        Reads the document header, and returns the content type code.
+        """
+        if len(self.data) - self.offset < _HEADER.size:
+            raise self._error("Not 'dendropy-bin' data")
+        signature, version, content_type = _HEADER.unpack_from(self.data, self.offset)
+        if signature != FORMAT_SIGNATURE:
+            raise self._error("Not 'dendropy-bin' data")
+        if version > FORMAT_VERSION:
+            raise self._error("Unsupported 'dendropy-bin' format version: {} (maximum supported version: {})".format(version, FORMAT_VERSION))
+        self.offset += _HEADER.size
+        if expected_content_type is not None and content_type != expected_content_type:
+            raise self._error("Expecting 'dendropy-bin' data of {}, but found {}".format(
+                _CONTENT_DESCRIPTIONS[expected_content_type],
+                _CONTENT_DESCRIPTIONS.get(content_type, "unknown content (type {})".format(content_type))))
+        return content_type
+
+    def read_uint(self):
+        return _UINT.unpack(self._take(_UINT.size))[0]
+
+    def read_float(self):
+        return float_or_none(_FLOAT.unpack(self._take(_FLOAT.size))[0])
+
+    def read_flag(self):
+        try:
+            return FLAGS[self._take(1)[0]]
+        except IndexError:
+            raise self._error("Invalid flag value")
+
+    def read_array(self, typecode):
+        stored_typecode, num_items = _ARRAY_HEADER.unpack(self._take(_ARRAY_HEADER.size))
+        if stored_typecode.decode("ascii") != typecode:
+            raise self._error("Expecting array of type '{}', but found '{}'".format(typecode, stored_typecode.decode("ascii")))
+        values = array.array(typecode)
+        values.frombytes(self._take(num_items * _ARRAY_ITEM_SIZES[typecode]))
+        if _IS_BIG_ENDIAN:
+            values.byteswap()
+        return values
+
+    def read_strings(self):
+        lengths = self.read_array("i")
+        total_length = 0
+        for length in lengths:
+            if length > 0:
+                total_length += length
+        data = self._take(total_length).tobytes()
+        strings = []
+        offset = 0
+        for length in lengths:
+            if length < 0:
+                strings.append(None)
+            else:
+                strings.append(data[offset:offset+length].decode("utf-8"))
+                offset += length
+        return strings
+
+    def read_string(self):
+        strings = self.read_strings()
+        if len(strings) != 1:
+            raise self._error("Expecting a single string, but found {}".format(len(strings)))
+        return strings[0]
+
+    def read_bitmasks(self):
+        num_bytes = self.read_uint()
+        num_bitmasks = self.read_uint()
+        data = self._take(num_bytes * num_bitmasks).tobytes()
+        from_bytes = int.from_bytes
+        return [from_bytes(data[i:i+num_bytes], "little") for i in range(0, len(data), num_bytes)]
+
+def write_taxon_namespace(encoder, taxon_namespace):
+    encoder.write_string(taxon_namespace.label)
+    encoder.write_strings([taxon.label for taxon in taxon_namespace])
+
+def get_taxa(taxon_namespace, labels, is_case_sensitive=False):
+    """
+    Returns a list of the taxa in ``taxon_namespace`` with the given
+    ``labels``, in order, adding new taxa to ``taxon_namespace`` for labels
+    not already in it.
+    """
+    if len(taxon_namespace) == 0:
+        return [taxon_namespace.new_taxon(label=label) for label in labels]
+    label_taxon_map = {}
+    for taxon in taxon_namespace:
+        if taxon.label is not None:
+            key = taxon.label if is_case_sensitive else taxon.label.lower()
+            label_taxon_map.setdefault(key, taxon)
+    taxa = []
+    for label in labels:
+        taxon = None
+        if label is not None:
+            taxon = label_taxon_map.get(label if is_case_sensitive else label.lower(), None)
+        if taxon is None:
+            taxon = taxon_namespace.new_taxon(label=label)
+        taxa.append(taxon)
+    return taxa
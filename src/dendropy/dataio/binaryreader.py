@@ -0,0 +1,185 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Deserialization of trees from the "dendropy-bin" binary format.
+"""
+
+import collections
+from dendropy.dataio import ioservice
+from dendropy.dataio import binaryprocessing
+
+class BinaryReader(ioservice.DataReader):
+    """
+    Reader for tree lists stored in the "dendropy-bin" binary format (see
+    :mod:`dendropy.dataio.binaryprocessing`).
+    """
+
+    # The trees of a collection, as stored: the tree attributes are
+    # sequences with an element per tree, and the node attributes are
+    # sequences of the nodes of all the trees, each tree in preorder, with
+    # ``node_offsets[i]`` the index of the first node of tree ``i``.
+    TreesData = collections.namedtuple("TreesData", [
+        "labels",
+        "rootings",
+        "weights",
+        "node_offsets",
+        "num_child_nodes",
+        "taxon_indexes",
+        "edge_lengths",
+        "node_labels",
+        ])
+
+    is_tree_skipping_supported = True
+
+    def __init__(self, **kwargs):
+        """
+        Keyword Arguments
+        -----------------
+        case_sensitive_taxon_labels : boolean, default: |False|
+            If |True|, then case is respected when matching the taxon labels
+            of the data to those of the taxa of an existing
+            |TaxonNamespace|. Default is |False|: case is ignored.
+        ignore_unrecognized_keyword_arguments : boolean, default: |False|
+            If |True|, then unsupported or unrecognized keyword arguments will
+            not result in an error. Default is |False|: unsupported keyword
+            arguments will result in an error.
+        """
+        ioservice.DataReader.__init__(self)
+        self.case_sensitive_taxon_labels = kwargs.pop("case_sensitive_taxon_labels", False)
+        self.check_for_unused_keyword_arguments(kwargs)
+
+    ###########################################################################
+    ## Reader Interface
+
+    def _read(self,
+            stream,
+            taxon_namespace_factory=None,
+            tree_list_factory=None,
+            char_matrix_factory=None,
+            state_alphabet_factory=None,
+            global_annotations_target=None):
+        taxon_namespaces = []
+        tree_lists = []
+        decoder = binaryprocessing.BinaryDecoder(stream)
+        try:
+            decoder.read_header(binaryprocessing.TREE_LISTS_CONTENT)
+            namespaces_taxa = []
+            for namespace_index in range(decoder.read_uint()):
+                label = decoder.read_string()
+                taxon_labels = decoder.read_strings()
+                if self.attached_taxon_namespace is not None:
+                    taxon_namespace = self.attached_taxon_namespace
+                elif taxon_namespace_factory is not None:
+                    taxon_namespace = taxon_namespace_factory(label=label)
+                    taxon_namespaces.append(taxon_namespace)
+                else:
+                    namespaces_taxa.append((None, None))
+                    continue
+                taxa = binaryprocessing.get_taxa(taxon_namespace,
+                        taxon_labels,
+                        is_case_sensitive=self.case_sensitive_taxon_labels)
+                namespaces_taxa.append((taxon_namespace, taxa))
+            for collection_index in range(decoder.read_uint()):
+                label = decoder.read_string()
+                taxon_namespace, taxa = namespaces_taxa[decoder.read_uint()]
+                trees_data = self._read_trees_data(decoder)
+                if tree_list_factory is None or taxon_namespace is None:
+                    continue
+                tree_list = tree_list_factory(label=label, taxon_namespace=taxon_namespace)
+                tree_lists.append(tree_list)
+                for tree_index in range(len(trees_data.labels)):
+                    if self._is_tree_skipped(collection_index, tree_index):
+                        continue
+                    self._build_tree(tree_list.new_tree(), trees_data, tree_index, taxa)
+        finally:
+            decoder.close()
+        return self.Product(
+                taxon_namespaces=taxon_namespaces,
+                tree_lists=tree_lists,
+                char_matrices=[])
+
+    def _count_trees(self, stream):
+        decoder = binaryprocessing.BinaryDecoder(stream)
+        try:
+            decoder.read_header(binaryprocessing.TREE_LISTS_CONTENT)
+            for namespace_index in range(decoder.read_uint()):
+                decoder.read_string()
+                decoder.read_strings()
+            tree_counts = []
+            for collection_index in range(decoder.read_uint()):
+                decoder.read_string()
+                decoder.read_uint()
+                tree_counts.append(len(self._read_trees_data(decoder).labels))
+        finally:
+            decoder.close()
+        return tree_counts
+
+    ###########################################################################
+    ## Support
+
+    def _read_trees_data(self, decoder):
+        labels = decoder.read_strings()
+        rootings = decoder.read_array("b")
+        weights = decoder.read_array("d")
+        node_offsets = [0]
+        for num_nodes in decoder.read_array("q"):
+            node_offsets.append(node_offsets[-1] + num_nodes)
+        return BinaryReader.TreesData(
+                labels=labels,
+                rootings=rootings,
+                weights=weights,
+                node_offsets=node_offsets,
+                num_child_nodes=decoder.read_array("i"),
+                taxon_indexes=decoder.read_array("i"),
+                edge_lengths=decoder.read_array("d"),
+                node_labels=decoder.read_strings())
+
+    def _build_tree(self, tree, trees_data, tree_index, taxa):
+        tree.label = trees_data.labels[tree_index]
+        tree.is_rooted = binaryprocessing.FLAGS[trees_data.rootings[tree_index]]
+        tree.weight = binaryprocessing.float_or_none(trees_data.weights[tree_index])
+        num_child_nodes = trees_data.num_child_nodes
+        taxon_indexes = trees_data.taxon_indexes
+        edge_lengths = trees_data.edge_lengths
+        node_labels = trees_data.node_labels
+        float_or_none = binaryprocessing.float_or_none
+        node_factory = tree.node_factory
+        # nodes with children still to be attached, with the number of
+        # children outstanding for each
+        open_nodes = []
+        start = trees_data.node_offsets[tree_index]
+        for node_index in range(start, trees_data.node_offsets[tree_index + 1]):
+            if node_index == start:
+                node = tree.seed_node
+            else:
+                node = node_factory()
+                parent = open_nodes[-1]
+                parent[0].add_child(node)
+                parent[1] -= 1
+                if parent[1] == 0:
+                    open_nodes.pop()
+            node.label = node_labels[node_index]
+            taxon_index = taxon_indexes[node_index]
+            if taxon_index >= 0:
+                node.taxon = taxa[taxon_index]
+            node.edge.length = float_or_none(edge_lengths[node_index])
+            if num_child_nodes[node_index]:
+                open_nodes.append([node, num_child_nodes[node_index]])
+        return tree
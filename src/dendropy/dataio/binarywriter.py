@@ -0,0 +1,119 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Serialization of trees to the "dendropy-bin" binary format.
+"""
+
+import array
+from dendropy.utility import error
+from dendropy.dataio import ioservice
+from dendropy.dataio import binaryprocessing
+
+class BinaryWriter(ioservice.DataWriter):
+    """
+    Writer of tree lists in the "dendropy-bin" binary format (see
+    :mod:`dendropy.dataio.binaryprocessing`).
+
+    The taxon namespaces are stored once, and each tree is stored as the
+    number of children, taxon index, edge length and label of each of its
+    nodes, in preorder, along with its label, rooting state and weight. Other
+    information, such as metadata annotations and comments, is not stored.
+    """
+
+    def __init__(self, **kwargs):
+        """
+        Keyword Arguments
+        -----------------
+        ignore_unrecognized_keyword_arguments : boolean, default: |False|
+            If |True|, then unsupported or unrecognized keyword arguments will
+            not result in an error. Default is |False|: unsupported keyword
+            arguments will result in an error.
+        """
+        ioservice.DataWriter.__init__(self)
+        self.check_for_unused_keyword_arguments(kwargs)
+
+    def _write(self,
+            stream,
+            taxon_namespaces=None,
+            tree_lists=None,
+            char_matrices=None,
+            global_annotations_target=None):
+        if char_matrices:
+            raise error.UnsupportedSchemaError("Character matrices cannot be written in 'dendropy-bin' format")
+        if tree_lists is None:
+            tree_lists = []
+        if self.attached_taxon_namespace is not None:
+            taxon_namespaces = [self.attached_taxon_namespace]
+            tree_lists = [tree_list for tree_list in tree_lists
+                    if tree_list.taxon_namespace is self.attached_taxon_namespace]
+        namespace_indexes = {}
+        namespaces = []
+        for taxon_namespace in list(taxon_namespaces or []) + [tree_list.taxon_namespace for tree_list in tree_lists]:
+            if id(taxon_namespace) not in namespace_indexes:
+                namespace_indexes[id(taxon_namespace)] = len(namespaces)
+                namespaces.append(taxon_namespace)
+        encoder = binaryprocessing.BinaryEncoder(stream)
+        encoder.write_header(binaryprocessing.TREE_LISTS_CONTENT)
+        encoder.write_uint(len(namespaces))
+        for taxon_namespace in namespaces:
+            binaryprocessing.write_taxon_namespace(encoder, taxon_namespace)
+        encoder.write_uint(len(tree_lists))
+        for tree_list in tree_lists:
+            encoder.write_string(tree_list.label)
+            encoder.write_uint(namespace_indexes[id(tree_list.taxon_namespace)])
+            self._write_trees(encoder, tree_list)
+
+    def _write_trees(self, encoder, tree_list):
+        taxon_namespace = tree_list.taxon_namespace
+        taxon_indexes = dict((taxon, idx) for idx, taxon in enumerate(taxon_namespace))
+        labels = []
+        rootings = array.array("b")
+        weights = array.array("d")
+        num_nodes = array.array("q")
+        num_child_nodes = array.array("i")
+        node_taxon_indexes = array.array("i")
+        edge_lengths = array.array("d")
+        node_labels = []
+        for tree in tree_list:
+            labels.append(tree.label)
+            rootings.append(binaryprocessing.FLAG_VALUES[tree.is_rooted])
+            weights.append(binaryprocessing.float_or_nan(tree.weight))
+            tree_num_nodes = 0
+            for node in tree.preorder_node_iter():
+                num_child_nodes.append(len(node._child_nodes))
+                if node.taxon is None:
+                    node_taxon_indexes.append(-1)
+                else:
+                    try:
+                        node_taxon_indexes.append(taxon_indexes[node.taxon])
+                    except KeyError:
+                        raise ValueError("{} is not in the taxon namespace of the trees".format(node.taxon))
+                edge_lengths.append(binaryprocessing.float_or_nan(node.edge.length))
+                node_labels.append(node.label)
+                tree_num_nodes += 1
+            num_nodes.append(tree_num_nodes)
+        encoder.write_strings(labels)
+        encoder.write_array("b", rootings)
+        encoder.write_array("d", weights)
+        encoder.write_array("q", num_nodes)
+        encoder.write_array("i", num_child_nodes)
+        encoder.write_array("i", node_taxon_indexes)
+        encoder.write_array("d", edge_lengths)
+        encoder.write_strings(node_labels)
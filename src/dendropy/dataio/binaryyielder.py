@@ -0,0 +1,97 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Implementation of "dendropy-bin"-schema tree iterator.
+"""
+
+from dendropy.dataio import ioservice
+from dendropy.dataio import binaryreader
+from dendropy.dataio import binaryprocessing
+
+class BinaryTreeDataYielder(
+        ioservice.TreeDataYielder,
+        binaryreader.BinaryReader):
+
+    def __init__(self,
+            files=None,
+            taxon_namespace=None,
+            tree_type=None,
+            tree_offset=None,
+            **kwargs):
+        """
+
+        Parameters
+        ----------
+        files : iterable of sources
+            Iterable of sources, which can either be strings specifying file
+            paths or file-like objects open for reading. If a source element is
+            a string, then it is assumed to be a path to a file. Otherwise, the
+            source is assumed to be a file-like object.
+        taxon_namespace : |TaxonNamespace| instance
+            The operational taxonomic unit concept namespace to use to manage
+            taxon definitions.
+        tree_offset : integer or None
+            If not |None|, then the number of trees to skip (without
+            constructing them) at the start of each source. Negative offsets
+            work like negative list indexes.
+        \*\*kwargs : keyword arguments
+            These will be passed directly to the base
+            `binaryreader.BinaryReader` class. See `binaryreader.BinaryReader`
+            for details.
+        """
+        ioservice.TreeDataYielder.__init__(self,
+                files=files,
+                taxon_namespace=taxon_namespace,
+                tree_type=tree_type,
+                tree_offset=tree_offset)
+        binaryreader.BinaryReader.__init__(self,
+                **kwargs)
+        self.attached_taxon_namespace = self.taxon_namespace
+
+    ###########################################################################
+    ## Implementation of DataYielder interface
+
+    def _yield_items_from_stream(self, stream):
+        decoder = binaryprocessing.BinaryDecoder(stream)
+        try:
+            decoder.read_header(binaryprocessing.TREE_LISTS_CONTENT)
+            namespaces_taxa = []
+            for namespace_index in range(decoder.read_uint()):
+                decoder.read_string()
+                namespaces_taxa.append(binaryprocessing.get_taxa(self.taxon_namespace,
+                        decoder.read_strings(),
+                        is_case_sensitive=self.case_sensitive_taxon_labels))
+            collections = []
+            for collection_index in range(decoder.read_uint()):
+                decoder.read_string()
+                taxa = namespaces_taxa[decoder.read_uint()]
+                collections.append((self._read_trees_data(decoder), taxa))
+        finally:
+            decoder.close()
+        if self._num_trees_to_skip is None:
+            # negative offset: the number of trees is known
+            num_trees = sum(len(trees_data.labels) for trees_data, taxa in collections)
+            self._num_trees_to_skip = max(0, num_trees + self.tree_offset)
+        for trees_data, taxa in collections:
+            for tree_index in range(len(trees_data.labels)):
+                if self._num_trees_to_skip:
+                    self._num_trees_to_skip -= 1
+                    continue
+                yield self._build_tree(self.tree_factory(), trees_data, tree_index, taxa)
@@ -39,10 +39,15 @@ class FastaReader(ioservice.DataReader):
         default_state_alphabet: |StateAlphabet| instance
             A |StateAlphabet| object to be used to manage the alphabet of the
             characters (|StandardCharacterMatrix| **only**).
+        byte_coded: bool
+            If |True|, then sequences of fixed-alphabet data types (e.g.,
+            "dna" or "protein") are stored compactly as arrays of state codes
+            (see :attr:`CharacterMatrix.is_byte_coded`). Default is |False|.
         """
         ioservice.DataReader.__init__(self)
         self.data_type = kwargs.pop("data_type", None)
         self.default_state_alphabet = kwargs.pop("default_state_alphabet", None)
+        self.byte_coded = kwargs.pop("byte_coded", False)
         if self.default_state_alphabet is not None:
             if self.data_type is None:
                 self.data_type = "standard"
@@ -72,6 +77,9 @@ class FastaReader(ioservice.DataReader):
                     self.data_type,
                     label=None,
                     taxon_namespace=taxon_namespace)
+        if self.byte_coded and char_matrix.byte_coded_character_sequence_type is not None:
+            char_matrix.is_byte_coded = True
+        is_byte_coded = char_matrix.is_byte_coded
         symbol_state_map = char_matrix.default_state_alphabet.full_symbol_state_map
         curr_vec = None
         curr_taxon = None
@@ -90,6 +98,8 @@ class FastaReader(ioservice.DataReader):
             elif curr_vec is None:
                 raise DataParseError(message="FASTA error: Expecting a lines starting with > before sequences", line_num=line_index + 1, stream=stream)
             else:
+                if is_byte_coded and curr_vec.extend_symbols(s):
+                    continue
                 states = []
                 for col_ind, c in enumerate(s):
                     c = c.strip()
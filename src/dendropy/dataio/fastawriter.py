@@ -66,7 +66,7 @@ class FastaWriter(ioservice.DataWriter):
                     stream.write(str(c))
                     col_count += 1
             else:
-                s = "".join("{}".format(c) for c in seq)
+                s = seq.symbols_as_string()
                 stream.write("{}\n".format(s))
             stream.write("\n\n")
 
@@ -23,6 +23,7 @@ import warnings
 from dendropy.datamodel import taxonmodel
 from dendropy.utility import deprecate
 from dendropy.utility import textprocessing
+from dendropy.utility import filesys
 if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
 
@@ -79,8 +80,17 @@ class DataReader(IOService):
             ["taxon_namespaces", "tree_lists", "char_matrices"]
             )
 
+    # Readers that can pass over unwanted tree statements without parsing
+    # them (see ``_is_tree_skipped()``) should set this to |True|, and
+    # should implement ``_count_trees()`` to support negative offsets.
+    is_tree_skipping_supported = False
+
     def __init__(self):
         IOService.__init__(self)
+        # ``(collection_offset, tree_offset)`` of the trees wanted in the
+        # current read, if trees are being skipped
+        self._tree_skip_offsets = None
+        self._num_skipped_trees = 0
 
     def _read(self,
             stream,
@@ -259,7 +269,9 @@ class DataReader(IOService):
             stream,
             taxon_namespace_factory,
             tree_list_factory,
-            global_annotations_target=None):
+            global_annotations_target=None,
+            collection_offset=None,
+            tree_offset=None):
         """
         Reads tree data from source into tree objects.
 
@@ -349,19 +361,119 @@ class DataReader(IOService):
             sense) of general metadata or annotations in the data source. If
             |None|, then such metadata or annotations will not be stored.
 
+        collection_offset : integer or None
+            If not |None|, then only the trees in the collection at this
+            0-based index are wanted: the trees of all other collections may
+            be skipped over without being parsed, in which case their
+            |TreeList| objects will be empty. Negative offsets work like
+            negative list indexes. IndexError is raised if the offset is out
+            of range.
+
+        tree_offset : integer or None
+            If not |None|, then the trees before this 0-based index in the
+            collection given by ``collection_offset`` (or the first
+            collection, if ``collection_offset`` is not specified) are left
+            out of its |TreeList|. Where supported by the reader (e.g., for
+            NEWICK and NEXUS sources), these trees are skipped over without
+            being parsed. Negative offsets work like negative list indexes,
+            and are resolved by counting the trees in the source first if
+            ``stream`` is seekable. IndexError is raised if the offset is
+            equal to or greater than the number of trees in the collection.
+
         Returns
         -------
         List of |TreeList| objects.
 
         """
-        # ``product`` is a namedtuple("DataReaderProducts", ["taxon_namespaces", "tree_lists", "char_matrices"])
-        product = self._read(stream=stream,
-                taxon_namespace_factory=taxon_namespace_factory,
-                tree_list_factory=tree_list_factory,
-                char_matrix_factory=None,
-                state_alphabet_factory=None,
-                global_annotations_target=global_annotations_target)
-        return product.tree_lists
+        if collection_offset is None and tree_offset is None:
+            # ``product`` is a namedtuple("DataReaderProducts", ["taxon_namespaces", "tree_lists", "char_matrices"])
+            product = self._read(stream=stream,
+                    taxon_namespace_factory=taxon_namespace_factory,
+                    tree_list_factory=tree_list_factory,
+                    char_matrix_factory=None,
+                    state_alphabet_factory=None,
+                    global_annotations_target=global_annotations_target)
+            return product.tree_lists
+        if collection_offset is None:
+            collection_offset = 0
+        skip_offsets = None
+        if self.is_tree_skipping_supported:
+            skip_tree_offset = tree_offset if tree_offset is not None else 0
+            if collection_offset >= 0 and skip_tree_offset >= 0:
+                skip_offsets = (collection_offset, skip_tree_offset)
+            else:
+                tree_counts = self._count_trees_and_rewind(stream)
+                if tree_counts is not None:
+                    skip_collection_offset = collection_offset
+                    if skip_collection_offset < 0:
+                        skip_collection_offset += len(tree_counts)
+                    if 0 <= skip_collection_offset < len(tree_counts):
+                        if skip_tree_offset < 0:
+                            skip_tree_offset = max(0, tree_counts[skip_collection_offset] + skip_tree_offset)
+                        skip_offsets = (skip_collection_offset, skip_tree_offset)
+        self._tree_skip_offsets = skip_offsets
+        self._num_skipped_trees = 0
+        try:
+            product = self._read(stream=stream,
+                    taxon_namespace_factory=taxon_namespace_factory,
+                    tree_list_factory=tree_list_factory,
+                    char_matrix_factory=None,
+                    state_alphabet_factory=None,
+                    global_annotations_target=global_annotations_target)
+        finally:
+            self._tree_skip_offsets = None
+        tree_lists = product.tree_lists
+        if collection_offset >= len(tree_lists):
+            raise IndexError("Collection offset out of range: {} (number of collections = {}, maximum valid collection offset = {})".format(collection_offset, len(tree_lists), len(tree_lists)-1))
+        target_tree_list = tree_lists[collection_offset]
+        num_trees = self._num_skipped_trees + len(target_tree_list)
+        if tree_offset is not None:
+            if tree_offset >= num_trees:
+                raise IndexError("Tree offset out of range: {} (number of trees in source = {}, maximum valid tree offset = {})".format(tree_offset, num_trees, num_trees-1))
+            if skip_offsets is None and tree_offset != 0:
+                del target_tree_list[:tree_offset]
+        return tree_lists
+
+    def _is_tree_skipped(self, collection_index, tree_index):
+        """
+        Returns |True| if the tree at 0-based index ``tree_index`` of the
+        collection at 0-based index ``collection_index`` in the current data
+        source is not wanted and should be skipped over without being parsed.
+        """
+        if self._tree_skip_offsets is None:
+            return False
+        if collection_index != self._tree_skip_offsets[0]:
+            return True
+        if tree_index < self._tree_skip_offsets[1]:
+            self._num_skipped_trees += 1
+            return True
+        return False
+
+    def _count_trees(self, stream):
+        """
+        Returns a list of the number of trees in each collection of trees in
+        ``stream`` (which is consumed in doing so), or |None| if they cannot
+        be counted without parsing the trees.
+        """
+        return None
+
+    def _count_trees_and_rewind(self, stream):
+        """
+        As ``_count_trees()``, but restores the position of ``stream``
+        afterwards. Returns |None| if ``stream`` is not seekable.
+        """
+        try:
+            if not stream.seekable():
+                return None
+        except AttributeError:
+            pass
+        try:
+            start = stream.tell()
+        except (AttributeError, IOError, OSError):
+            return None
+        tree_counts = self._count_trees(stream)
+        stream.seek(start)
+        return tree_counts
 
     def read_char_matrices(self,
             stream,
@@ -388,6 +500,12 @@ class DataWriter(IOService):
     be implemented by derived classes specializing in particular data formats.
     """
 
+    # Writers that can write trees one at a time as they are produced (see
+    # |TreeStreamWriter|) should set this to |True|, and should implement
+    # ``_write_tree_stream_open()``, ``_write_tree_stream_tree()`` and
+    # ``_write_tree_stream_close()``.
+    is_tree_streaming_supported = False
+
     def __init__(self, **kwargs):
         """
         Constructs and configures a `DataWriter` object by "harvesting" keyword
@@ -495,6 +613,36 @@ class DataWriter(IOService):
                 char_matrices=[char_matrix],
                 global_annotations_target=None)
 
+    def _write_tree_stream_open(self, stream, tree_list):
+        """
+        Writes whatever precedes the trees of a stream of trees to ``stream``.
+
+        Parameters
+        ----------
+
+        stream : file or file-like object
+            Destination for data.
+        tree_list : |TreeList| object
+            An empty |TreeList| standing for the trees to be written, with
+            the label, |TaxonNamespace|, annotations and comments of the
+            collection.
+        """
+        raise NotImplementedError
+
+    def _write_tree_stream_tree(self, stream, tree_list, tree, tree_index):
+        """
+        Writes ``tree``, the ``tree_index``-th tree of the stream of trees
+        opened by ``_write_tree_stream_open()``, to ``stream``.
+        """
+        raise NotImplementedError
+
+    def _write_tree_stream_close(self, stream, tree_list):
+        """
+        Writes whatever follows the trees of a stream of trees opened by
+        ``_write_tree_stream_open()`` to ``stream``.
+        """
+        raise NotImplementedError
+
 ###############################################################################
 ## DataYielder
 
@@ -532,7 +680,7 @@ class DataYielder(IOService):
 
     def iterate_over_file(self, current_file):
         if textprocessing.is_str_type(current_file):
-            self._current_file = open(current_file, "r")
+            self._current_file = filesys.open_file(current_file, "r")
             self._current_file_name = current_file
         else:
             self._current_file = current_file
@@ -555,17 +703,77 @@ class DataYielder(IOService):
 
 class TreeDataYielder(DataYielder):
 
+    # Whether the yielder can yield just the bipartitions of each tree,
+    # without constructing it (see ``splits_only``).
+    is_splits_only_supported = False
+
     def __init__(self,
             files=None,
             taxon_namespace=None,
-            tree_type=None):
+            tree_type=None,
+            tree_offset=None):
+        """
+        Parameters
+        ----------
+        tree_offset : integer or None
+            If not |None|, then the number of trees to skip at the start of
+            each source (e.g., as burn-in). Negative offsets work like negative
+            list indexes, i.e., a ``tree_offset`` of -10 means to yield only
+            the last 10 trees of each source.
+        """
         DataYielder.__init__(self, files=files)
         self.taxon_namespace = taxon_namespace
         assert self.taxon_namespace is not None
         self.attached_taxon_namespace = self.taxon_namespace
         self.tree_type = tree_type
+        self.tree_offset = tree_offset
+        # If |True| (only if ``is_splits_only_supported``), then, instead of
+        # trees, ``NewickReader.TreeSplits`` records of the bipartitions of
+        # the trees are yielded.
+        self.splits_only = False
+        # Number of trees still to be skipped in the current source, or
+        # |None| if not yet known. Yielders that can pass over tree statements
+        # without parsing them should do so while this is non-zero, decrementing
+        # it for each tree skipped (see ``_resolve_num_trees_to_skip()``);
+        # otherwise, the unwanted trees are parsed and then discarded.
+        self._num_trees_to_skip = 0
 
     def tree_factory(self):
         return self.tree_type(taxon_namespace=self.taxon_namespace)
 
+    def iterate_over_file(self, current_file):
+        if not self.tree_offset:
+            for tree in DataYielder.iterate_over_file(self, current_file):
+                yield tree
+        elif self.tree_offset > 0:
+            self._num_trees_to_skip = self.tree_offset
+            for tree in DataYielder.iterate_over_file(self, current_file):
+                if self._num_trees_to_skip:
+                    self._num_trees_to_skip -= 1
+                else:
+                    yield tree
+        else:
+            self._num_trees_to_skip = None
+            last_trees = collections.deque(maxlen=-self.tree_offset)
+            for tree in DataYielder.iterate_over_file(self, current_file):
+                if self._num_trees_to_skip is None:
+                    # trees could not be counted in advance
+                    last_trees.append(tree)
+                else:
+                    yield tree
+            for tree in last_trees:
+                yield tree
+        self._num_trees_to_skip = 0
+
+    def _resolve_num_trees_to_skip(self, stream, reader):
+        """
+        For a negative ``tree_offset``, uses ``reader`` to count the trees in
+        ``stream`` (if it is seekable), to work out how many trees to skip at
+        the start of the stream.
+        """
+        if self._num_trees_to_skip is None:
+            tree_counts = reader._count_trees_and_rewind(stream)
+            if tree_counts is not None:
+                self._num_trees_to_skip = max(0, sum(tree_counts) + self.tree_offset)
+
 
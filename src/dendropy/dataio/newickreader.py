@@ -23,6 +23,7 @@ Parsing of NEWICK-format tree from a stream.
 
 import re
 import warnings
+import collections
 from dendropy.utility import error
 from dendropy.utility import deprecate
 from dendropy.utility.textprocessing import StringIO
@@ -40,6 +41,7 @@ class NewickReader(ioservice.DataReader):
 
     _default_rooting_directive = None
     _default_tree_weight = 1.0
+    is_tree_skipping_supported = True
 
     class NewickReaderError(error.DataParseError):
         def __init__(self, message,
@@ -118,6 +120,15 @@ class NewickReader(ioservice.DataReader):
                     col_num=col_num,
                     stream=stream)
 
+    # The bipartitions of a tree statement parsed without constructing a tree
+    # (see ``_parse_tree_statement_splits()``): the split bitmasks and edge
+    # lengths of the edges, in the order of :meth:`Tree.encode_bipartitions()`,
+    # the weight (|None| if not stored) and rooting state of the tree, and the
+    # leafset bitmask of the tree as a whole.
+    TreeSplits = collections.namedtuple(
+            "TreeSplits",
+            ["split_bitmasks", "edge_lengths", "weight", "is_rooted", "leafset_bitmask"])
+
     def __init__(self, **kwargs):
         """Keyword Arguments
         -----------------
@@ -321,16 +332,36 @@ class NewickReader(ioservice.DataReader):
                 enable_lookup_by_taxon_number=False,
                 case_sensitive=self.case_sensitive_taxon_labels)
         tree_factory = tree_list.new_tree
-        for tree in self.tree_iter(stream=stream,
-                taxon_symbol_mapper=taxon_symbol_mapper,
-                tree_factory=tree_factory):
-            pass
+        nexus_tokenizer = nexusprocessing.NexusTokenizer(stream,
+                preserve_unquoted_underscores=self.preserve_unquoted_underscores)
+        tree_index = 0
+        while True:
+            if self._is_tree_skipped(0, tree_index):
+                if not self._skip_tree_statement(nexus_tokenizer,
+                        taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol):
+                    break
+            else:
+                tree = self._parse_tree_statement(
+                        nexus_tokenizer=nexus_tokenizer,
+                        tree_factory=tree_factory,
+                        taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+                if tree is None:
+                    break
+            tree_index += 1
         product = self.Product(
                 taxon_namespaces=None,
                 tree_lists=[tree_list],
                 char_matrices=None)
         return product
 
+    def _count_trees(self, stream):
+        nexus_tokenizer = nexusprocessing.NexusTokenizer(stream,
+                preserve_unquoted_underscores=self.preserve_unquoted_underscores)
+        num_trees = 0
+        while self._skip_tree_statement(nexus_tokenizer):
+            num_trees += 1
+        return [num_trees]
+
     def _get_rooting(self):
         """
         Get rooting interpretation configuration.
@@ -399,6 +430,419 @@ class NewickReader(ioservice.DataReader):
             current_token = nexus_tokenizer.next_token()
         return tree
 
+    def _skip_tree_statement(self, nexus_tokenizer, taxon_symbol_map_fn=None):
+        """
+        Passes over a single tree statement in a token stream without
+        constructing a tree, respecting quoted labels and comments. Has the
+        same expectations as ``_parse_tree_statement()``, and likewise leaves
+        the current token as the token immediately following the semi-colon,
+        if any. Returns |False| if there is no tree statement left in the
+        stream.
+
+        If ``taxon_symbol_map_fn`` is given, then the statement is tokenized
+        so that the labels that would be mapped to taxa if the tree were
+        parsed are passed to it, in the same order, and the taxon namespace
+        ends up as if the tree had been read (see
+        ``_map_tree_statement_taxa()``). Otherwise, the contents of the
+        statement are not even tokenized.
+        """
+        current_token = nexus_tokenizer.current_token
+        while (current_token == ";" or current_token is None) and not nexus_tokenizer.is_eof():
+            current_token = nexus_tokenizer.require_next_token()
+        nexus_tokenizer.clear_captured_comments()
+        if nexus_tokenizer.is_eof():
+            return False
+        if taxon_symbol_map_fn is None:
+            is_terminated = nexus_tokenizer.skip_past_delimiter(";")
+        else:
+            is_terminated = self._map_tree_statement_taxa(nexus_tokenizer, taxon_symbol_map_fn)
+        if (not is_terminated
+                and self.terminating_semicolon_required):
+            raise NewickReader.NewickReaderIncompleteTreeStatementError(
+                    message="Incomplete or improperly-terminated tree statement (end of stream reached instead of a semi-colon ';')",
+                    line_num=nexus_tokenizer.current_line_num,
+                    col_num=nexus_tokenizer.current_column_num,
+                    stream=nexus_tokenizer.src)
+        current_token = nexus_tokenizer.current_token
+        while current_token == ";" and not nexus_tokenizer.is_eof():
+            nexus_tokenizer.clear_captured_comments()
+            current_token = nexus_tokenizer.next_token()
+        return True
+
+    def _map_tree_statement_taxa(self, nexus_tokenizer, taxon_symbol_map_fn):
+        """
+        Passes the labels of the nodes of the tree statement starting at the
+        current token to ``taxon_symbol_map_fn``, following the grammar of
+        ``_parse_tree_node_description()``, and in the same order, for those
+        nodes which would be assigned taxa, without checking the syntax of
+        the statement or constructing a tree. On reaching the terminating
+        semi-colon, this becomes the current token and |True| is returned;
+        otherwise the stream is exhausted and |False| is returned.
+        """
+        nexus_tokenizer.clear_captured_comments()
+        # comments are not needed
+        capture_comments = nexus_tokenizer.capture_comments
+        nexus_tokenizer.capture_comments = False
+        try:
+            next_token = nexus_tokenizer.next_token
+            is_leaf_taxon_mapped = not self.suppress_leaf_node_taxa
+            is_internal_taxon_mapped = not self.suppress_internal_node_taxa
+            # a label after a closing parenthesis is that of an internal node
+            is_taxon_mapped = is_leaf_taxon_mapped
+            current_token = nexus_tokenizer.current_token
+            while current_token is not None:
+                if current_token == ";":
+                    return True
+                if current_token == "(" or current_token == ",":
+                    is_taxon_mapped = is_leaf_taxon_mapped
+                elif current_token == ")":
+                    is_taxon_mapped = is_internal_taxon_mapped
+                elif current_token == ":":
+                    # edge length
+                    next_token()
+                elif self.is_parse_jplace_tokens and current_token == "{":
+                    # edge number
+                    while current_token is not None and current_token != "}":
+                        current_token = next_token()
+                elif is_taxon_mapped:
+                    taxon_symbol_map_fn(current_token)
+                current_token = next_token()
+            return False
+        finally:
+            nexus_tokenizer.capture_comments = capture_comments
+
+    def _parse_tree_statement_splits(self,
+            nexus_tokenizer,
+            taxon_namespace,
+            taxon_symbol_map_fn):
+        """
+        Parses a single tree statement from a token stream as
+        ``_parse_tree_statement()`` does, with the same expectations and
+        errors, but, instead of constructing a tree, computes the leafset
+        bitmasks of the nodes as they are completed, using a stack of the
+        nodes that are still open, and returns a ``TreeSplits`` record with
+        the bipartitions that :meth:`Tree.encode_bipartitions()` would have
+        given the tree (i.e., with nodes of outdegree one suppressed and the
+        basal bifurcation of an unrooted tree collapsed). Returns |None| if
+        there is no tree statement left in the stream.
+        """
+        current_token = nexus_tokenizer.current_token
+        tree_comments = nexus_tokenizer.pull_captured_comments()
+        while (current_token == ";" or current_token is None) and not nexus_tokenizer.is_eof():
+            current_token = nexus_tokenizer.require_next_token()
+            tree_comments = nexus_tokenizer.pull_captured_comments()
+        if nexus_tokenizer.is_eof():
+            return None
+        if current_token != "(":
+            self._parenthesis_nesting_level = 0
+        else:
+            self._parenthesis_nesting_level = 1
+        is_rooted = self._parse_tree_rooting_state("")
+        if self.store_tree_weights:
+            weight = self.default_tree_weight
+        else:
+            weight = None
+        if tree_comments:
+            for comment in tree_comments:
+                stripped_comment = comment.strip()
+                if stripped_comment in ["&u", "&U", "&r", "&R"]:
+                    is_rooted = self._parse_tree_rooting_state(stripped_comment)
+                elif (self.store_tree_weights
+                        and (stripped_comment.startswith("&W ") or stripped_comment.startswith("&w "))
+                        ):
+                    weight = self._parse_tree_weight(stripped_comment, nexus_tokenizer)
+        self._tree_statement_complete = False
+        self._seen_taxa = set()
+        # The leafset bitmasks and edge lengths of the nodes, in post-order
+        # (the order in which they are completed), with |None| as the leafset
+        # bitmask of a node dropped by the collapse of a basal bifurcation.
+        leafset_bitmasks = []
+        edge_lengths = []
+        seed_node = self._parse_tree_node_splits(
+                nexus_tokenizer=nexus_tokenizer,
+                taxon_namespace=taxon_namespace,
+                taxon_symbol_map_fn=taxon_symbol_map_fn,
+                is_rooted=is_rooted,
+                leafset_bitmasks=leafset_bitmasks,
+                edge_lengths=edge_lengths)
+        current_token = nexus_tokenizer.current_token
+        if not self._tree_statement_complete:
+            raise NewickReader.NewickReaderIncompleteTreeStatementError(
+                    message="Incomplete or improperly-terminated tree statement (last character read was '{}' instead of a semi-colon ';')".format(nexus_tokenizer.current_token),
+                    line_num=nexus_tokenizer.token_line_num,
+                    col_num=nexus_tokenizer.token_column_num,
+                    stream=nexus_tokenizer.src)
+        self._seen_taxa = None
+        self._parenthesis_nesting_level = None
+        self._tree_statement_complete = None
+        while current_token == ";" and not nexus_tokenizer.is_eof():
+            nexus_tokenizer.clear_captured_comments()
+            current_token = nexus_tokenizer.next_token()
+        # the edge lengths of the edges collapsed along with nodes of
+        # outdegree one, including the seed node, are carried down onto the
+        # edges of their children
+        self._merge_suppressed_edge_length(seed_node, edge_lengths)
+        tree_leafset_bitmask = seed_node[2]
+        split_bitmasks = []
+        lengths = []
+        if is_rooted or not tree_leafset_bitmask:
+            for leafset_bitmask, edge_length in zip(leafset_bitmasks, edge_lengths):
+                if leafset_bitmask is not None:
+                    if tree_leafset_bitmask:
+                        split_bitmasks.append(leafset_bitmask)
+                    else:
+                        split_bitmasks.append(0)
+                    lengths.append(edge_length)
+        else:
+            lowest_relevant_bit = tree_leafset_bitmask & -tree_leafset_bitmask
+            for leafset_bitmask, edge_length in zip(leafset_bitmasks, edge_lengths):
+                if leafset_bitmask is not None:
+                    if leafset_bitmask & lowest_relevant_bit:
+                        split_bitmasks.append((~leafset_bitmask) & tree_leafset_bitmask)
+                    else:
+                        split_bitmasks.append(leafset_bitmask & tree_leafset_bitmask)
+                    lengths.append(edge_length)
+        return NewickReader.TreeSplits(
+                split_bitmasks=split_bitmasks,
+                edge_lengths=lengths,
+                weight=weight,
+                is_rooted=is_rooted,
+                leafset_bitmask=tree_leafset_bitmask)
+
+    def _parse_tree_node_splits(self,
+            nexus_tokenizer,
+            taxon_namespace,
+            taxon_symbol_map_fn,
+            is_rooted,
+            leafset_bitmasks,
+            edge_lengths):
+        """
+        Parses the nodes of a tree statement for
+        ``_parse_tree_statement_splits()``, following the grammar (and
+        checks) of ``_parse_tree_node_description()``, but iteratively. Each
+        completed node is summarized by a list of: the index of its entry in
+        ``leafset_bitmasks`` and ``edge_lengths`` (that of its only child, for
+        a node of outdegree one, which does not get an entry of its own), its
+        number of children, its leafset bitmask and, for a node of outdegree
+        one, its edge length, which is yet to be added to that of its child.
+        Returns the summary of the seed node.
+        """
+        # Each open node is a list of: the summaries of its children so far,
+        # whether a child node has been parsed (as ``node_created`` in
+        # ``_parse_tree_node_description()``), and whether it is internal.
+        open_nodes = [[[], False, None]]
+        is_parsing_children = nexus_tokenizer.current_token == "("
+        if is_parsing_children:
+            nexus_tokenizer.require_next_token()
+        while True:
+            if is_parsing_children:
+                nexus_tokenizer.clear_captured_comments()
+                current_token = nexus_tokenizer.current_token
+                node = open_nodes[-1]
+                if current_token == ",":
+                    if not node[1]:
+                        # a preceding blank node
+                        node[0].append(self._add_node_split(None, None, None, leafset_bitmasks, edge_lengths))
+                    nexus_tokenizer.require_next_token()
+                    while nexus_tokenizer.current_token == ",":
+                        # another blank node
+                        node[0].append(self._add_node_split(None, None, None, leafset_bitmasks, edge_lengths))
+                        nexus_tokenizer.require_next_token()
+                    if not node[1] and nexus_tokenizer.current_token == ")":
+                        node[0].append(self._add_node_split(None, None, None, leafset_bitmasks, edge_lengths))
+                        node[1] = True
+                elif current_token == ")":
+                    # end of child nodes
+                    self._parenthesis_nesting_level -= 1
+                    nexus_tokenizer.require_next_token()
+                    is_parsing_children = False
+                elif current_token == "(":
+                    self._parenthesis_nesting_level += 1
+                    open_nodes.append([[], False, True])
+                    nexus_tokenizer.require_next_token()
+                else:
+                    # a leaf node
+                    open_nodes.append([[], False, False])
+                    is_parsing_children = False
+                continue
+            # parse the label, edge length etc. of the last open node
+            node = open_nodes[-1]
+            child_nodes, is_internal_node = node[0], node[2]
+            if is_internal_node is None and child_nodes:
+                is_internal_node = True
+            edge_length = None
+            taxon = None
+            label_parsed = False
+            is_end_of_node = False
+            self._tree_statement_complete = False
+            while True:
+                nexus_tokenizer.clear_captured_comments()
+                current_token = nexus_tokenizer.current_token
+                if current_token == ":":
+                    nexus_tokenizer.require_next_token()
+                    if not self.suppress_edge_lengths:
+                        try:
+                            edge_length = self.edge_length_type(nexus_tokenizer.current_token)
+                        except ValueError:
+                            raise NewickReader.NewickReaderMalformedStatementError(
+                                    message="Invalid edge length: '{}'".format(nexus_tokenizer.current_token),
+                                    line_num=nexus_tokenizer.token_line_num,
+                                    col_num=nexus_tokenizer.token_column_num,
+                                    stream=nexus_tokenizer.src)
+                    try:
+                        nexus_tokenizer.require_next_token()
+                    except tokenizer.Tokenizer.UnexpectedEndOfStreamError as e:
+                        if self.terminating_semicolon_required:
+                            message = e.message + ". (Perhaps the terminating semicolon for the tree statement is missing? If so, add a semicolon to the tree statement or specify 'terminating_semicolon_required=False' to allow for missing semicolons)"
+                            raise tokenizer.Tokenizer.UnexpectedEndOfStreamError(
+                                    message=message,
+                                    line_num=e.line_num,
+                                    col_num=e.col_num,
+                                    stream=e.stream)
+                        else:
+                            self._tree_statement_complete = True
+                            break
+                elif current_token == ")" or current_token == ",":
+                    # end of this node
+                    is_end_of_node = True
+                    break
+                elif current_token == ";":
+                    # end of tree statement
+                    self._tree_statement_complete = True
+                    nexus_tokenizer.next_token()
+                    break
+                elif current_token == "(":
+                    self._parenthesis_nesting_level += 1
+                    raise NewickReader.NewickReaderMalformedStatementError(
+                            message="Malformed tree statement",
+                            line_num=nexus_tokenizer.token_line_num,
+                            col_num=nexus_tokenizer.token_column_num,
+                            stream=nexus_tokenizer.src)
+                elif self.is_parse_jplace_tokens and current_token == '{':
+                    # edge number from .jplace format: not needed here
+                    nexus_tokenizer.require_next_token()
+                    int(nexus_tokenizer.current_token)
+                    nexus_tokenizer.require_next_token() # for closing '}'
+                    nexus_tokenizer.require_next_token()
+                else:
+                    if label_parsed:
+                        msg = "Expecting ':'"
+                        if self.is_parse_jplace_tokens:
+                            msg += ", '{'"
+                        msg += ", ')', ',' or ';' after reading label but found '{}'".format(current_token)
+                        raise NewickReader.NewickReaderMalformedStatementError(
+                                message=msg,
+                                line_num=nexus_tokenizer.token_line_num,
+                                col_num=nexus_tokenizer.token_column_num,
+                                stream=nexus_tokenizer.src)
+                    if not ( (is_internal_node and self.suppress_internal_node_taxa)
+                            or ((not is_internal_node) and self.suppress_leaf_node_taxa) ):
+                        taxon = taxon_symbol_map_fn(current_token)
+                        if taxon in self._seen_taxa:
+                            raise NewickReader.NewickReaderDuplicateTaxonError(
+                                    message=taxon.label,
+                                    line_num=nexus_tokenizer.token_line_num,
+                                    col_num=nexus_tokenizer.token_column_num,
+                                    stream=nexus_tokenizer.src)
+                        self._seen_taxa.add(taxon)
+                    label_parsed = True
+                    try:
+                        nexus_tokenizer.require_next_token()
+                    except tokenizer.Tokenizer.UnexpectedEndOfStreamError:
+                        if self.terminating_semicolon_required:
+                            raise
+                        else:
+                            break
+            open_nodes.pop()
+            if is_end_of_node:
+                node_split = self._add_node_split(child_nodes, taxon, edge_length,
+                        leafset_bitmasks, edge_lengths, taxon_namespace)
+                if not open_nodes:
+                    # the seed node, ended without a semi-colon: reported by
+                    # the caller
+                    return node_split
+                open_nodes[-1][0].append(node_split)
+                open_nodes[-1][1] = True
+                is_parsing_children = True
+                continue
+            ## if we are here, we have reached the end of the tree (and so,
+            ## with balanced parentheses, are at the seed node)
+            if self._parenthesis_nesting_level != 0:
+                raise NewickReader.NewickReaderMalformedStatementError(
+                        message="Unbalanced parentheses at tree statement termination: balance index = {}".format(self._parenthesis_nesting_level),
+                        line_num=nexus_tokenizer.token_line_num,
+                        col_num=nexus_tokenizer.token_column_num,
+                        stream=nexus_tokenizer.src)
+            if not is_rooted and len(child_nodes) == 2:
+                self._collapse_basal_bifurcation_splits(child_nodes, leafset_bitmasks, edge_lengths)
+            return self._add_node_split(child_nodes, taxon, edge_length,
+                    leafset_bitmasks, edge_lengths, taxon_namespace)
+
+    def _add_node_split(self,
+            child_nodes,
+            taxon,
+            edge_length,
+            leafset_bitmasks,
+            edge_lengths,
+            taxon_namespace=None):
+        """
+        Returns the summary of a completed node (see
+        ``_parse_tree_node_splits()``), adding its entry to
+        ``leafset_bitmasks`` and ``edge_lengths`` unless it has a single
+        child.
+        """
+        if not child_nodes:
+            if taxon is None:
+                leafset_bitmask = 0
+            else:
+                leafset_bitmask = taxon_namespace.taxon_bitmask(taxon)
+            leafset_bitmasks.append(leafset_bitmask)
+            edge_lengths.append(edge_length)
+            return [len(leafset_bitmasks) - 1, 0, leafset_bitmask, None]
+        for child_node in child_nodes:
+            self._merge_suppressed_edge_length(child_node, edge_lengths)
+        if len(child_nodes) == 1:
+            child_node = child_nodes[0]
+            return [child_node[0], 1, child_node[2], edge_length]
+        leafset_bitmask = 0
+        for child_node in child_nodes:
+            leafset_bitmask |= child_node[2]
+        leafset_bitmasks.append(leafset_bitmask)
+        edge_lengths.append(edge_length)
+        return [len(leafset_bitmasks) - 1, len(child_nodes), leafset_bitmask, None]
+
+    def _merge_suppressed_edge_length(self, node_split, edge_lengths):
+        # as in :meth:`Tree.encode_bipartitions()`, when a node of outdegree
+        # one is suppressed
+        edge_length = node_split[3]
+        if edge_length is not None:
+            index = node_split[0]
+            if edge_lengths[index] is None:
+                edge_lengths[index] = edge_length
+            else:
+                edge_lengths[index] += edge_length
+            node_split[3] = None
+
+    def _collapse_basal_bifurcation_splits(self, child_nodes, leafset_bitmasks, edge_lengths):
+        # as in :meth:`Tree.collapse_basal_bifurcation()`: the children of
+        # the node dropped take its place among the children of the seed
+        # node, which leaves the post-order sequence of the other nodes (and
+        # the leafset bitmask of the seed node) unchanged
+        if child_nodes[1][1] >= 2:
+            to_keep, to_del = child_nodes
+        elif child_nodes[0][1] >= 2:
+            to_del, to_keep = child_nodes
+        else:
+            return
+        to_del_edge_length = edge_lengths[to_del[0]]
+        if to_keep[1] == 1:
+            if to_keep[3] is not None and to_del_edge_length is not None:
+                to_keep[3] += to_del_edge_length
+        else:
+            if edge_lengths[to_keep[0]] is not None and to_del_edge_length is not None:
+                edge_lengths[to_keep[0]] += to_del_edge_length
+        leafset_bitmasks[to_del[0]] = None
+
     def _process_tree_comments(self, tree, tree_comments, nexus_tokenizer):
         # NOTE: this also unconditionally sets the tree rootedness and
         # weighting if no comment indicating these are found; for this to work
@@ -419,34 +863,8 @@ class NewickReader(ioservice.DataReader):
             elif (self.store_tree_weights
                     and (stripped_comment.startswith("&W ") or stripped_comment.startswith("&w "))
                     ):
-                try:
-                    weight_expression = stripped_comment[2:]
-                    if not weight_expression:
-                        raise ValueError
-                    we_parts = weight_expression.split("/")
-                    if len(we_parts) > 2:
-                        raise ValueError
-                        # raise NewickReader.NewickReaderInvalidValueError(
-                        #         message="Invalid tree weight expression: '{}'".format(weight_expression),
-                        #         line_num=nexus_tokenizer.token_line_num,
-                        #         col_num=nexus_tokenizer.token_column_num,
-                        #         stream=nexus_tokenizer.src)
-                    elif len(we_parts) == 2:
-                        x = float(we_parts[0])
-                        y = float(we_parts[1])
-                        tree.weight = x/y
-                    else:
-                        tree.weight = float(we_parts[0])
-                    weighting_token_found = True
-                except ValueError:
-                    exc = NewickReader.NewickReaderInvalidValueError(
-                            message="Invalid tree weight expression: '{}'".format(stripped_comment),
-                            line_num=nexus_tokenizer.token_line_num,
-                            col_num=nexus_tokenizer.token_column_num,
-                            stream=nexus_tokenizer.src)
-                    exc.__context__ = None # Python 3.0, 3.1, 3.2
-                    exc.__cause__ = None # Python 3.3, 3.4
-                    raise exc
+                tree.weight = self._parse_tree_weight(stripped_comment, nexus_tokenizer)
+                weighting_token_found = True
             elif self.extract_comment_metadata and comment.startswith("&"):
                 annotations = nexusprocessing.parse_comment_metadata_to_annotations(
                     comment=comment)
@@ -461,6 +879,39 @@ class NewickReader(ioservice.DataReader):
         if self.store_tree_weights and not weighting_token_found:
             tree.weight = self.default_tree_weight
 
+    def _parse_tree_weight(self, weight_comment, nexus_tokenizer):
+        """
+        Returns the tree weight given by a (stripped) comment of the form
+        "&W <weight>" or "&W <x>/<y>".
+        """
+        try:
+            weight_expression = weight_comment[2:]
+            if not weight_expression:
+                raise ValueError
+            we_parts = weight_expression.split("/")
+            if len(we_parts) > 2:
+                raise ValueError
+                # raise NewickReader.NewickReaderInvalidValueError(
+                #         message="Invalid tree weight expression: '{}'".format(weight_expression),
+                #         line_num=nexus_tokenizer.token_line_num,
+                #         col_num=nexus_tokenizer.token_column_num,
+                #         stream=nexus_tokenizer.src)
+            elif len(we_parts) == 2:
+                x = float(we_parts[0])
+                y = float(we_parts[1])
+                return x/y
+            else:
+                return float(we_parts[0])
+        except ValueError:
+            exc = NewickReader.NewickReaderInvalidValueError(
+                    message="Invalid tree weight expression: '{}'".format(weight_comment),
+                    line_num=nexus_tokenizer.token_line_num,
+                    col_num=nexus_tokenizer.token_column_num,
+                    stream=nexus_tokenizer.src)
+            exc.__context__ = None # Python 3.0, 3.1, 3.2
+            exc.__cause__ = None # Python 3.3, 3.4
+            raise exc
+
     def _parse_tree_rooting_state(self, rooting_comment=None):
         """
         Returns rooting state for tree with given rooting comment token, taking
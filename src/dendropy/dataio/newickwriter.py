@@ -37,6 +37,8 @@ class NewickWriter(ioservice.DataWriter):
     Formatter for Newick data.
     """
 
+    is_tree_streaming_supported = True
+
     def __init__(self, **kwargs):
         """
 
@@ -196,6 +198,12 @@ class NewickWriter(ioservice.DataWriter):
         if self.edge_label_compose_fn is None:
             self.edge_label_compose_fn = self._format_edge_length
         self.check_for_unused_keyword_arguments(kwargs)
+        # Escaped taxon tokens of leaves, as used by the fast path of
+        # ``_write_tree()``, and the settings under which they were composed
+        self._escaped_taxon_tree_tokens = {}
+        self._escaped_taxon_tree_tokens_key = None
+        self._escaped_label_tree_tokens = {}
+        self._escaped_label_tree_tokens_key = None
 
     def _get_taxon_tree_token(self, taxon):
         if self.taxon_token_map is None:
@@ -242,6 +250,19 @@ class NewickWriter(ioservice.DataWriter):
         for tree in tree_list:
             self._write_tree(stream, tree)
             stream.write("\n")
+        self._write_tree_list_annotations(stream, tree_list)
+
+    def _write_tree_stream_open(self, stream, tree_list):
+        pass
+
+    def _write_tree_stream_tree(self, stream, tree_list, tree, tree_index):
+        self._write_tree(stream, tree)
+        stream.write("\n")
+
+    def _write_tree_stream_close(self, stream, tree_list):
+        self._write_tree_list_annotations(stream, tree_list)
+
+    def _write_tree_list_annotations(self, stream, tree_list):
         # In Newick format, no clear way to distinguish between
         # annotations/comments associated with tree collection and
         # annotations/comments associated with first tree. So we place them at
@@ -288,13 +309,157 @@ class NewickWriter(ioservice.DataWriter):
                 annotation_comments,
                 tree_comments,
                 ))
-        tree.apply(
-                before_fn=lambda x: self._write_node_open(x, stream),
-                after_fn=lambda x: self._write_node_close(x, stream),
-                leaf_fn=lambda x: self._write_leaf(x, stream),
-                )
+        tree_body = self._compose_tree_body(tree)
+        if tree_body is not None:
+            stream.write(tree_body)
+        else:
+            tree.apply(
+                    before_fn=lambda x: self._write_node_open(x, stream),
+                    after_fn=lambda x: self._write_node_close(x, stream),
+                    leaf_fn=lambda x: self._write_leaf(x, stream),
+                    )
         stream.write(";")
 
+    def _compose_tree_body(self, tree):
+        """
+        Fast path of ``_write_tree()``: returns the nodes of ``tree`` as a
+        single NEWICK string (without the terminating semi-colon), built in a
+        single postorder pass, or |None| if the general, node-by-node, path
+        has to be taken because custom label composition functions are in use
+        or there are node or edge annotations or comments to be written.
+        """
+        if (self.node_label_compose_fn is not None
+                or getattr(self.edge_label_compose_fn, "__func__", None) is not NewickWriter._format_edge_length):
+            return None
+        check_annotations = not self.suppress_annotations
+        check_comments = not self.suppress_item_comments
+        write_edge_lengths = not self.suppress_edge_lengths
+        format_real_value = self._real_value_formatter
+        render_node_tag = self._render_node_tag
+        leaf_node_labels_suppressed = self.suppress_leaf_node_labels
+        internal_labels_suppressed = (self.suppress_internal_taxon_labels
+                and self.suppress_internal_node_labels)
+        if self.taxon_token_map:
+            escaped_label_tokens = None
+            escaped_taxon_tokens = self._get_escaped_taxon_tree_tokens()
+            compose_escaped_taxon_tree_token = self._compose_escaped_taxon_tree_token
+        else:
+            # tokens depend on the taxon labels alone, and are looked up by
+            # label (which is faster than by taxon)
+            escaped_label_tokens = self._get_escaped_label_tree_tokens()
+            compose_escaped_label_tree_token = self._compose_escaped_label_tree_token
+        parts = []
+        append = parts.append
+        for node in tree.postorder_node_iter():
+            edge = node._edge
+            if ((check_annotations and (node.has_annotations or edge.has_annotations))
+                    or (check_comments and (node.comments or edge.comments))):
+                return None
+            if node._child_nodes:
+                append(")")
+                if not internal_labels_suppressed and (node._taxon is not None or node._label):
+                    append(render_node_tag(node))
+            else:
+                # A leaf starts the subtrees of all the ancestors of which
+                # it is the first descendant, and so opens them.
+                num_opened = 0
+                subtree_node = node
+                parent_node = node._parent_node
+                while parent_node is not None and parent_node._child_nodes[0] is subtree_node:
+                    num_opened += 1
+                    subtree_node = parent_node
+                    parent_node = subtree_node._parent_node
+                if parent_node is not None:
+                    append(",")
+                if num_opened:
+                    append("(" * num_opened)
+                taxon = node._taxon
+                if taxon is not None and (leaf_node_labels_suppressed or not node._label):
+                    if escaped_label_tokens is not None:
+                        label = taxon._label
+                        token = escaped_label_tokens.get(label, None)
+                        if token is None:
+                            token = compose_escaped_label_tree_token(label)
+                            escaped_label_tokens[label] = token
+                        append(token)
+                    else:
+                        entry = escaped_taxon_tokens.get(taxon, None)
+                        if entry is None or entry[0] is not taxon._label:
+                            entry = (taxon._label, compose_escaped_taxon_tree_token(taxon))
+                            escaped_taxon_tokens[taxon] = entry
+                        append(entry[1])
+                else:
+                    append(render_node_tag(node))
+            if write_edge_lengths:
+                length = edge.length
+                if length is not None:
+                    append(":")
+                    append(format_real_value(length))
+        return "".join(parts)
+
+    def _get_escaped_taxon_tree_tokens(self):
+        """
+        Returns the dictionary mapping taxa to their labels and escaped tokens
+        as leaf labels, as composed for the current labelling settings. Each
+        token is composed when first needed, and reused for subsequent trees
+        for as long as the label of the taxon stays the same.
+        """
+        key = (self.taxon_token_map,
+                self.suppress_leaf_taxon_labels,
+                self.preserve_spaces,
+                self.unquoted_underscores)
+        if (self._escaped_taxon_tree_tokens_key is None
+                or any(k1 is not k2 for k1, k2 in zip(key, self._escaped_taxon_tree_tokens_key))):
+            self._escaped_taxon_tree_tokens = {}
+            self._escaped_taxon_tree_tokens_key = key
+        return self._escaped_taxon_tree_tokens
+
+    def _get_escaped_label_tree_tokens(self):
+        """
+        As :meth:`NewickWriter._get_escaped_taxon_tree_tokens()`, but for
+        writing without a ``taxon_token_map``, when the tokens are those of
+        the taxon labels, by which they are looked up.
+        """
+        key = (self.suppress_leaf_taxon_labels,
+                self.preserve_spaces,
+                self.unquoted_underscores)
+        if key != self._escaped_label_tree_tokens_key:
+            self._escaped_label_tree_tokens = {}
+            self._escaped_label_tree_tokens_key = key
+        return self._escaped_label_tree_tokens
+
+    def _compose_escaped_taxon_tree_token(self, taxon):
+        """
+        Returns the tag of a leaf node associated with ``taxon`` (and without
+        a label to be written), as composed by ``_render_node_tag()``.
+        """
+        if taxon.label is None or self.suppress_leaf_taxon_labels:
+            return ""
+        if self.taxon_token_map:
+            token = self.taxon_token_map.get(taxon, None)
+            if token is None:
+                token = str(taxon.label)
+        else:
+            token = str(taxon.label)
+        return self._escape_tree_token(token)
+
+    def _compose_escaped_label_tree_token(self, label):
+        """
+        Returns the tag of a leaf node associated with a taxon labeled
+        ``label`` (and without a label to be written), as composed by
+        ``_render_node_tag()`` without a ``taxon_token_map``.
+        """
+        if label is None or self.suppress_leaf_taxon_labels:
+            return ""
+        return self._escape_tree_token(str(label))
+
+    def _escape_tree_token(self, token):
+        if not token:
+            return ""
+        return nexusprocessing.escape_nexus_token(token,
+                preserve_spaces=self.preserve_spaces,
+                quote_underscores=not self.unquoted_underscores)
+
     def _write_node_open(self, node, out):
         if node._parent_node is None or node._parent_node._child_nodes[0] is node:
             out.write("(")
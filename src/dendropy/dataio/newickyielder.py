@@ -28,10 +28,14 @@ from dendropy.dataio import nexusprocessing
 
 class NewickTreeDataYielder(ioservice.TreeDataYielder):
 
+    is_splits_only_supported = True
+
     def __init__(self,
             files=None,
             taxon_namespace=None,
             tree_type=None,
+            tree_offset=None,
+            splits_only=False,
             **kwargs):
         """
 
@@ -45,6 +49,16 @@ class NewickTreeDataYielder(ioservice.TreeDataYielder):
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        tree_offset : integer or None
+            If not |None|, then the number of trees to skip (without parsing
+            them) at the start of each source. Negative offsets work like
+            negative list indexes.
+        splits_only : bool
+            If |True|, then, instead of a |Tree|, a
+            ``NewickReader.TreeSplits`` record of the split bitmasks and edge
+            lengths that :meth:`Tree.encode_bipartitions()` would give each
+            tree (along with its weight and rooting state) is yielded,
+            without the tree being constructed.
         \*\*kwargs : keyword arguments
             These will be passed directly to the base `newickreader.NexusReader`
             class. See `newickreader.NexusReader` for details.
@@ -52,13 +66,16 @@ class NewickTreeDataYielder(ioservice.TreeDataYielder):
         ioservice.TreeDataYielder.__init__(self,
                 files=files,
                 taxon_namespace=taxon_namespace,
-                tree_type=tree_type)
+                tree_type=tree_type,
+                tree_offset=tree_offset)
+        self.splits_only = splits_only
         self.newick_reader = newickreader.NewickReader(**kwargs)
 
     ###########################################################################
     ## Implementation of DataYielder interface
 
     def _yield_items_from_stream(self, stream):
+        self._resolve_num_trees_to_skip(stream, self.newick_reader)
         nexus_tokenizer = nexusprocessing.NexusTokenizer(stream,
                 preserve_unquoted_underscores=self.newick_reader.preserve_unquoted_underscores)
         taxon_symbol_mapper = nexusprocessing.NexusTaxonSymbolMapper(
@@ -66,10 +83,22 @@ class NewickTreeDataYielder(ioservice.TreeDataYielder):
                 enable_lookup_by_taxon_number=False,
                 case_sensitive=self.newick_reader.case_sensitive_taxon_labels)
         while True:
-            tree = self.newick_reader._parse_tree_statement(
-                    nexus_tokenizer=nexus_tokenizer,
-                    tree_factory=self.tree_factory,
-                    taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+            if self._num_trees_to_skip:
+                if not self.newick_reader._skip_tree_statement(nexus_tokenizer,
+                        taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol):
+                    break
+                self._num_trees_to_skip -= 1
+                continue
+            if self.splits_only:
+                tree = self.newick_reader._parse_tree_statement_splits(
+                        nexus_tokenizer=nexus_tokenizer,
+                        taxon_namespace=self.attached_taxon_namespace,
+                        taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+            else:
+                tree = self.newick_reader._parse_tree_statement(
+                        nexus_tokenizer=nexus_tokenizer,
+                        tree_factory=self.tree_factory,
+                        taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
             if tree is None:
                 break
             yield tree
@@ -24,6 +24,7 @@ Implementation of NEXML-schema tree iterator.
 import sys
 if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
+from xml.etree import ElementTree
 from dendropy.dataio import ioservice
 from dendropy.dataio import nexmlreader
 from dendropy.dataio import xmlprocessing
@@ -36,6 +37,7 @@ class NexmlTreeDataYielder(
             files=None,
             taxon_namespace=None,
             tree_type=None,
+            tree_offset=None,
             **kwargs):
         """
 
@@ -49,6 +51,9 @@ class NexmlTreeDataYielder(
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        tree_offset : integer or None
+            If not |None|, then the number of trees to skip at the start of
+            each source. Negative offsets work like negative list indexes.
         \*\*kwargs : keyword arguments
             These will be passed directly to the base `nexmlreader.NexusReader`
             class. See `nexmlreader.NexusReader` for details.
@@ -56,7 +61,8 @@ class NexmlTreeDataYielder(
         ioservice.TreeDataYielder.__init__(self,
                 files=files,
                 taxon_namespace=taxon_namespace,
-                tree_type=tree_type)
+                tree_type=tree_type,
+                tree_offset=tree_offset)
         nexmlreader.NexmlReader.__init__(self,
                 **kwargs)
         self.attached_taxon_namespace = self.taxon_namespace
@@ -65,25 +71,60 @@ class NexmlTreeDataYielder(
     ## Implementation of DataYielder interface
 
     def _yield_items_from_stream(self, stream):
-        xml_doc = xmlprocessing.XmlDocument(file_obj=stream,
-                subelement_factory=self._subelement_factory)
-        self._namespace_registry = xml_doc.namespace_registry
-        xml_root = xml_doc.root
-        self._parse_taxon_namespaces(xml_root)
+        """
+        Parses ``stream`` incrementally, building each tree as soon as its
+        ``<tree>`` element has been read, and discarding every ``<otus>``,
+        ``<characters>`` and ``<tree>`` element once it has been dealt with, so
+        that no more than a single tree of the document is held in memory
+        at any one time.
+        """
+        self._namespace_registry = xmlprocessing.XmlNamespaces()
         tree_parser = nexmlreader._NexmlTreeParser(
                 id_taxon_map=self._id_taxon_map,
                 annotations_processor_fn=self._parse_annotations,
                 )
-        for trees_idx, trees_element in enumerate(xml_root.iter_trees()):
-            trees_id = trees_element.get('id', "Trees" + str(trees_idx))
-            trees_label = trees_element.get('label', None)
-            otus_id = trees_element.get('otus', None)
-            if otus_id is None:
-                raise Exception("Taxa block not specified for trees block '{}'".format(otus_id))
-            taxon_namespace = self._id_taxon_namespace_map.get(otus_id, None)
-            if not taxon_namespace:
-                raise Exception("Tree block '{}': Taxa block '{}' not found".format(trees_id, otus_id))
-            for tree_element in trees_element.findall_tree():
-                tree_obj = self.tree_factory()
-                tree_parser.build_tree(tree_obj, tree_element, otus_id)
-                yield tree_obj
+        tag_namer = self._subelement_factory(None)
+        otus_tag = tag_namer.compose_tag("otus")
+        characters_tag = tag_namer.compose_tag("characters")
+        trees_tag = tag_namer.compose_tag("trees")
+        tree_tag = tag_namer.compose_tag("tree")
+        open_elements = []
+        trees_idx = -1
+        otus_id = None
+        for event, element in ElementTree.iterparse(stream, ("start", "end", "start-ns")):
+            if event == "start-ns":
+                prefix, namespace = element
+                self._namespace_registry.add_namespace(prefix=prefix, namespace=namespace)
+                continue
+            if event == "start":
+                open_elements.append(element)
+                if element.tag == trees_tag:
+                    trees_idx += 1
+                    trees_id = element.get('id', "Trees" + str(trees_idx))
+                    otus_id = element.get('otus', None)
+                    if otus_id is None:
+                        raise Exception("Taxa block not specified for trees block '{}'".format(trees_id))
+                    taxon_namespace = self._id_taxon_namespace_map.get(otus_id, None)
+                    if not taxon_namespace:
+                        raise Exception("Tree block '{}': Taxa block '{}' not found".format(trees_id, otus_id))
+                continue
+            open_elements.pop()
+            if element.tag == tree_tag:
+                if otus_id is None:
+                    continue
+                if self._num_trees_to_skip:
+                    self._num_trees_to_skip -= 1
+                    tree_obj = None
+                else:
+                    tree_obj = self.tree_factory()
+                    tree_parser.build_tree(tree_obj, self._subelement_factory(element), otus_id)
+                open_elements[-1].remove(element)
+                if tree_obj is not None:
+                    yield tree_obj
+            elif element.tag in (otus_tag, trees_tag, characters_tag):
+                if element.tag == otus_tag:
+                    self._parse_taxon_namespace(self._subelement_factory(element))
+                elif element.tag == trees_tag:
+                    otus_id = None
+                if open_elements:
+                    open_elements[-1].remove(element)
@@ -85,6 +85,7 @@ class NexusTokenizer(Tokenizer):
                 self.uncaptured_delimiters.append("\n")
             if "\r" not in self.uncaptured_delimiters:
                 self.uncaptured_delimiters.append("\r")
+        self._compile_scanners()
 
     def set_hyphens_as_captured_delimiters(self, hyphens_as_captured_delimiters):
         if hyphens_as_captured_delimiters:
@@ -95,6 +96,7 @@ class NexusTokenizer(Tokenizer):
                 self.captured_delimiters.remove("-")
             except ValueError:
                 pass
+        self._compile_scanners()
 
     def require_next_token_ucase(self):
         t = self.require_next_token()
@@ -166,7 +168,7 @@ class NexusTaxonSymbolMapper(object):
     this class or, at least, the tenure of the management of
     |TaxonNamespace| and member |Taxon| objects by this class.
     This is to ensure that the various supplementatl mappings (in particular,
-    the label mapping and the taxon number mapping) are synchronized.
+    the taxon number mapping) are synchronized.
     To this end, the of the |TaxonNamespace| object is locked, and all
     |Taxon| object creation should be through this class's native
     methods.
@@ -181,10 +183,8 @@ class NexusTaxonSymbolMapper(object):
         self.case_sensitive = case_sensitive
         if not self.case_sensitive:
             self.token_taxon_map = container.CaseInsensitiveDict()
-            self.label_taxon_map = container.CaseInsensitiveDict()
         else:
             self.token_taxon_map = {}
-            self.label_taxon_map = {}
         self.number_taxon_map = {}
         self.number_taxon_label_map = {}
         self.enable_lookup_by_taxon_number = enable_lookup_by_taxon_number
@@ -212,10 +212,6 @@ class NexusTaxonSymbolMapper(object):
 
     def reset_supplemental_mappings(self):
         self.token_taxon_map.clear()
-        if not self.case_sensitive:
-            self.label_taxon_map = container.CaseInsensitiveDict(self._taxon_namespace.label_taxon_map())
-        else:
-            self.label_taxon_map = self._taxon_namespace.label_taxon_map()
         self.number_taxon_map.clear()
         for idx, taxon in enumerate(self._taxon_namespace):
             s = str(idx+1)
@@ -240,10 +236,13 @@ class NexusTaxonSymbolMapper(object):
             return self.token_taxon_map[symbol]
         except KeyError:
             pass
-        try:
-            return self.label_taxon_map[symbol]
-        except KeyError:
-            pass
+        # label look-ups go through the (indexed) taxon namespace itself, and
+        # so also find taxa added to it directly rather than through this
+        # mapper (e.g., those of a TRANSLATE block, to which internal node
+        # labels then resolve)
+        taxon = self._taxon_namespace.get_taxon(symbol, is_case_sensitive=self.case_sensitive)
+        if taxon is not None:
+            return taxon
         if self.enable_lookup_by_taxon_number:
             try:
                 return self.number_taxon_map[symbol]
@@ -260,7 +259,6 @@ class NexusTaxonSymbolMapper(object):
         self._taxon_namespace.is_mutable = self.taxon_namespace_original_mutability_state
         t = self._taxon_namespace.new_taxon(label)
         self._taxon_namespace.is_mutable = False
-        self.label_taxon_map[label] = t
         taxon_number = str(len(self._taxon_namespace))
         self.number_taxon_map[taxon_number] = t
         return t
@@ -269,7 +267,6 @@ class NexusTaxonSymbolMapper(object):
         self._taxon_namespace.is_mutable = self.taxon_namespace_original_mutability_state
         self._taxon_namespace.add_taxon(taxon)
         self._taxon_namespace.is_mutable = False
-        self.label_taxon_map[taxon.label] = taxon
         taxon_number = str(len(self._taxon_namespace))
         self.number_taxon_map[taxon_number] = taxon
         return taxon
@@ -468,6 +465,9 @@ def format_item_annotations_as_comments(
     body = separator.join(parts)
     return prefix + body + suffix
 
+NEXUS_TOKEN_PUNCTUATION_PATTERN = re.compile('[\(\)\[\]\{\}\\\/\,\;\:\=\*\'\"\`\+\-\<\>\0\t\n]')
+NEXUS_TOKEN_PUNCTUATION_OR_WHITESPACE_PATTERN = re.compile('[\(\)\[\]\{\}\\\/\,\;\:\=\*\'\"\`\+\-\<\>\0\t\n\r ]')
+
 def escape_nexus_token(label, preserve_spaces=False, quote_underscores=True):
     """
     Properly protects a NEXUS token.
@@ -476,9 +476,9 @@ def escape_nexus_token(label, preserve_spaces=False, quote_underscores=True):
         return ""
     if not preserve_spaces \
             and "_" not in label \
-            and not re.search('[\(\)\[\]\{\}\\\/\,\;\:\=\*\'\"\`\+\-\<\>\0\t\n]', label):
+            and not NEXUS_TOKEN_PUNCTUATION_PATTERN.search(label):
         label = label.replace(' ', '_').replace('\t', '_')
-    elif re.search('[\(\)\[\]\{\}\\\/\,\;\:\=\*\'\"\`\+\-\<\>\0\t\n\r ]', label) \
+    elif NEXUS_TOKEN_PUNCTUATION_OR_WHITESPACE_PATTERN.search(label) \
         or quote_underscores and "_" in label:
         s = label.split("'")
         if len(s) == 1:
@@ -35,6 +35,8 @@ from dendropy.dataio import newickreader
 class NexusReader(ioservice.DataReader):
     "Encapsulates loading and parsing of a NEXUS schema file."
 
+    is_tree_skipping_supported = True
+
     class BlockTerminatedException(Exception):
         pass
 
@@ -283,6 +285,10 @@ class NexusReader(ioservice.DataReader):
             |True|: tree data will be read.
         attached_taxon_namespace : |TaxonNamespace|
             Unify all operational taxonomic unit definitions in this namespace.
+        byte_coded : bool
+            If |True|, then sequences of fixed-alphabet data types (e.g.,
+            "dna" or "protein") are stored compactly as arrays of state codes
+            (see :attr:`CharacterMatrix.is_byte_coded`). Default is |False|.
         ignore_unrecognized_keyword_arguments : boolean, default: |False|
             If |True|, then unsupported or unrecognized keyword arguments will
             not result in an error. Default is |False|: unsupported keyword
@@ -299,6 +305,7 @@ class NexusReader(ioservice.DataReader):
         self.exclude_trees = kwargs.pop("exclude_trees", False)
         self._data_type = kwargs.pop("data_type", "standard")
         self.attached_taxon_namespace = kwargs.pop("attached_taxon_namespace", None)
+        self.byte_coded = kwargs.pop("byte_coded", False)
 
         # Following are undocumented for a GOOD reason! They are experimental and subject to change!
         self.unconstrained_taxa_accumulation_mode = kwargs.pop("unconstrained_taxa_accumulation_mode", False)
@@ -367,6 +374,38 @@ class NexusReader(ioservice.DataReader):
                 char_matrices=self._char_matrices)
         return self._product
 
+    def _count_trees(self, stream):
+        # Each NEXUS command ends with a semi-colon, so only the first one or
+        # two tokens of each command need to be examined.
+        nexus_tokenizer = nexusprocessing.NexusTokenizer(stream,
+                preserve_unquoted_underscores=self.preserve_underscores)
+        token = nexus_tokenizer.next_token()
+        if token is None or token.upper() != "#NEXUS":
+            return None
+        tree_counts = []
+        num_trees = None
+        while True:
+            token = nexus_tokenizer.next_token_ucase()
+            if token is None:
+                break
+            if token == "BEGIN":
+                token = nexus_tokenizer.next_token_ucase()
+                if token == "TREES":
+                    num_trees = 0
+            elif token == "END" or token == "ENDBLOCK":
+                # as in ``_parse_trees_block()``, a collection is only
+                # created for a trees block with at least one tree
+                if num_trees:
+                    tree_counts.append(num_trees)
+                num_trees = None
+            elif token == "TREE" and num_trees is not None:
+                num_trees += 1
+            if token != ";" and not nexus_tokenizer.skip_past_delimiter(";"):
+                break
+        if num_trees:
+            tree_counts.append(num_trees)
+        return tree_counts
+
     ###########################################################################
     ## Tokenizer Control
 
@@ -487,6 +526,8 @@ class NexusReader(ioservice.DataReader):
                 data_type,
                 taxon_namespace=taxon_namespace,
                 label=title)
+        if self.byte_coded and char_matrix.byte_coded_character_sequence_type is not None:
+            char_matrix.is_byte_coded = True
         self._char_matrices.append(char_matrix)
         return char_matrix
 
@@ -927,12 +968,13 @@ class NexusReader(ioservice.DataReader):
         taxon_namespace = char_block.taxon_namespace
         token = self._nexus_tokenizer.next_token()
         state_alphabet = char_block.default_state_alphabet
+        is_byte_coded = char_block.is_byte_coded
         first_sequence_defined = None
         if self._interleave:
             try:
                 while token != ";" and not self._nexus_tokenizer.is_eof():
                     taxon = self._get_taxon(taxon_namespace=taxon_namespace, label=token)
-                    self._read_character_states(char_block[taxon], state_alphabet, first_sequence_defined)
+                    self._read_character_states(char_block[taxon], state_alphabet, first_sequence_defined, is_byte_coded)
                     if first_sequence_defined is None:
                         first_sequence_defined = char_block[taxon]
                     token = self._nexus_tokenizer.next_token()
@@ -941,7 +983,7 @@ class NexusReader(ioservice.DataReader):
         else:
             while token != ';' and not self._nexus_tokenizer.is_eof():
                 taxon = self._get_taxon(taxon_namespace=taxon_namespace, label=token)
-                self._read_character_states(char_block[taxon], state_alphabet, first_sequence_defined)
+                self._read_character_states(char_block[taxon], state_alphabet, first_sequence_defined, is_byte_coded)
                 if first_sequence_defined is None:
                     first_sequence_defined = char_block[taxon]
                 if len(char_block[taxon]) < self._file_specified_nchar:
@@ -1011,6 +1053,62 @@ class NexusReader(ioservice.DataReader):
         #     self._nexus_tokenizer.skip_to_semicolon()
         return tree
 
+    def _parse_tree_statement_splits(self, taxon_symbol_mapper):
+        """
+        Processes a TREE command as ``_parse_tree_statement()`` does, but
+        returns only the bipartitions of the tree, as a
+        ``NewickReader.TreeSplits`` record, without constructing it (see
+        ``NewickReader._parse_tree_statement_splits()``).
+        """
+        token = self._nexus_tokenizer.next_token()
+        if token == '*':
+            token = self._nexus_tokenizer.next_token()
+        tree_name = token
+        token = self._nexus_tokenizer.next_token()
+        if token != '=':
+            raise self._nexus_error("Expecting '=' in definition of Tree '%s' but found '%s'" % (tree_name, token))
+        self._nexus_tokenizer.clear_captured_comments()
+        # advance to '('; comments will be processed by newick reader
+        self._nexus_tokenizer.next_token()
+        return self.newick_reader._parse_tree_statement_splits(
+                nexus_tokenizer=self._nexus_tokenizer,
+                taxon_namespace=taxon_symbol_mapper.taxon_namespace,
+                taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+
+    def _skip_tree_statement(self, taxon_symbol_mapper=None):
+        """
+        Passes over a TREE command without constructing a tree. Assumes that
+        the file reader is positioned right after the "TREE" token in a TREE
+        command. As with ``_parse_tree_statement()``, the current token will
+        then be the token immediately following the terminating semi-colon.
+        If ``taxon_symbol_mapper`` is given, then the taxa referenced by the
+        tree are still mapped by it, in the same order as if the tree had been
+        parsed (see ``NewickReader._map_tree_statement_taxa()``); otherwise,
+        the contents of the command are not even tokenized.
+        """
+        self._nexus_tokenizer.clear_captured_comments()
+        if taxon_symbol_mapper is None:
+            is_terminated = self._nexus_tokenizer.skip_past_delimiter(";")
+        else:
+            token = self._nexus_tokenizer.next_token()
+            if token == '*':
+                token = self._nexus_tokenizer.next_token()
+            tree_name = token
+            token = self._nexus_tokenizer.next_token()
+            if token != '=':
+                raise self._nexus_error("Expecting '=' in definition of Tree '%s' but found '%s'" % (tree_name, token))
+            self._nexus_tokenizer.next_token()
+            is_terminated = self.newick_reader._map_tree_statement_taxa(
+                    nexus_tokenizer=self._nexus_tokenizer,
+                    taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+        if not is_terminated:
+            raise self._nexus_error("Unexpected end of stream in TREE statement",
+                    NexusReader.IncompleteBlockError)
+        token = self._nexus_tokenizer.current_token
+        while token == ";" and not self._nexus_tokenizer.is_eof():
+            self._nexus_tokenizer.clear_captured_comments()
+            token = self._nexus_tokenizer.next_token()
+
     def _build_tree_from_newick_tree_string(self, tree_factory, taxon_symbol_mapper):
         tree = self.newick_reader._parse_tree_statement(
                 nexus_tokenizer=self._nexus_tokenizer,
@@ -1070,6 +1168,7 @@ class NexusReader(ioservice.DataReader):
         taxon_symbol_mapper = None
         trees_block = None
         block_title = None
+        tree_index = 0
         # while ((not self._nexus_tokenizer.is_eof())
         #         and self._nexus_tokenizer.current_token is not None
         #         and self._nexus_tokenixer.current_token != 'END'
@@ -1111,9 +1210,13 @@ class NexusReader(ioservice.DataReader):
                     ## statement. Typically, this will be
                     ## 'TREE' if there is another tree, or
                     ## 'END'/'ENDBLOCK'.
-                    tree = self._parse_tree_statement(
-                            tree_factory=tree_factory,
-                            taxon_symbol_mapper=taxon_symbol_mapper)
+                    if self._is_tree_skipped(len(self._tree_lists) - 1, tree_index):
+                        self._skip_tree_statement(taxon_symbol_mapper)
+                    else:
+                        tree = self._parse_tree_statement(
+                                tree_factory=tree_factory,
+                                taxon_symbol_mapper=taxon_symbol_mapper)
+                    tree_index += 1
                     if self._nexus_tokenizer.is_eof() or not self._nexus_tokenizer.current_token:
                         break
                     if self._nexus_tokenizer.cast_current_token_to_ucase() != "TREE":
@@ -1238,6 +1341,7 @@ class NexusReader(ioservice.DataReader):
             character_data_vector,
             state_alphabet,
             first_sequence_defined,
+            is_byte_coded=False,
             ):
         """
         Reads character sequence data substatement until the number of
@@ -1260,6 +1364,9 @@ class NexusReader(ioservice.DataReader):
         where `<.>` is a StateIdentity object with the characters within the
         brackets as symbol(s).
 
+        If ``is_byte_coded`` is |True|, then tokens of plain state symbols are
+        added directly to ``character_data_vector``, a byte-coded sequence.
+
         """
         if self._interleave:
             self._nexus_tokenizer.set_capture_eol(True)
@@ -1292,6 +1399,14 @@ class NexusReader(ioservice.DataReader):
             elif token == ";":
                 raise NexusReader.BlockTerminatedException
             else:
+                if (is_byte_coded
+                        and len(character_data_vector) + len(states_to_add) + len(token) <= self._file_specified_nchar
+                        and self._match_char.isdisjoint(token)):
+                    if states_to_add:
+                        character_data_vector.extend(states_to_add)
+                        states_to_add = []
+                    if character_data_vector.extend_symbols(token):
+                        continue
                 for c in token:
                     if c in self._match_char:
                         try:
@@ -38,6 +38,8 @@ class NexusWriter(ioservice.DataWriter):
     Formatter for NEXUS data.
     """
 
+    is_tree_streaming_supported = True
+
     def __init__(self, **kwargs):
         """
 
@@ -230,22 +232,9 @@ class NexusWriter(ioservice.DataWriter):
             char_matrices=None,
             global_annotations_target=None):
 
-        # Header
-        stream.write('#NEXUS\n\n')
-
-        # File/Document-level annotations and comments
-        if self.file_comments:
-            self._write_comments(stream, self.file_comments)
-        if global_annotations_target is not None:
-            self._write_item_annotations(stream, global_annotations_target)
-            self._write_item_comments(stream, global_annotations_target)
-
-        # Other blocks
-        if self.preamble_blocks:
-            for block in self.preamble_blocks:
-                stream.write(block)
-                stream.write("\n")
-            stream.write("\n")
+        # Header, file/document-level annotations and comments, and other
+        # blocks
+        self._write_preamble(stream, global_annotations_target)
 
         # Taxon namespace discovery
         candidate_taxon_namespaces = collections.OrderedDict()
@@ -290,6 +279,45 @@ class NexusWriter(ioservice.DataWriter):
                             tree_list=tree_list)
 
         # Write out remaining
+        self._write_supplemental_blocks(stream)
+
+    ###########################################################################
+    ## Tree Streaming
+
+    def _write_tree_stream_open(self, stream, tree_list):
+        self.taxon_namespaces_to_write = [tree_list.taxon_namespace]
+        self._write_preamble(stream, None)
+        if not self.simple and not self.suppress_taxa_blocks:
+            self._write_taxa_block(stream, tree_list.taxon_namespace)
+        self._write_trees_block_open(stream, tree_list)
+        self._num_streamed_taxa = len(tree_list.taxon_namespace)
+
+    def _write_tree_stream_tree(self, stream, tree_list, tree, tree_index):
+        if len(tree_list.taxon_namespace) != self._num_streamed_taxa:
+            raise ValueError("Taxa have been added to the taxon namespace since the NEXUS taxa block and translate statement were written: all taxa must be present before the first tree is written")
+        self._write_tree_statement(stream, tree, tree_index)
+
+    def _write_tree_stream_close(self, stream, tree_list):
+        self._write_trees_block_close(stream)
+        self._write_supplemental_blocks(stream)
+
+    ###########################################################################
+    ## Support
+
+    def _write_preamble(self, stream, global_annotations_target):
+        stream.write('#NEXUS\n\n')
+        if self.file_comments:
+            self._write_comments(stream, self.file_comments)
+        if global_annotations_target is not None:
+            self._write_item_annotations(stream, global_annotations_target)
+            self._write_item_comments(stream, global_annotations_target)
+        if self.preamble_blocks:
+            for block in self.preamble_blocks:
+                stream.write(block)
+                stream.write("\n")
+            stream.write("\n")
+
+    def _write_supplemental_blocks(self, stream):
         if self.supplemental_blocks:
             for block in self.supplemental_blocks:
                 stream.write(block)
@@ -309,12 +337,19 @@ class NexusWriter(ioservice.DataWriter):
         taxon_to_include = self._get_taxa_to_include(taxon_namespace)
         stream.write("    DIMENSIONS NTAX={};\n".format(len(taxon_to_include)))
         stream.write("    TAXLABELS\n")
+        preserve_spaces = self.preserve_spaces
+        quote_underscores = not self.unquoted_underscores
+        lines = []
         for taxon in taxon_to_include:
-            stream.write("        {}\n".format(
-                nexusprocessing.escape_nexus_token(taxon.label, preserve_spaces=self.preserve_spaces, quote_underscores=not self.unquoted_underscores),
+            lines.append("        {}\n".format(
+                nexusprocessing.escape_nexus_token(taxon.label, preserve_spaces=preserve_spaces, quote_underscores=quote_underscores),
                 ))
-            self._write_item_annotations(stream, taxon)
-            self._write_item_comments(stream, taxon)
+            if taxon.has_annotations or taxon.comments:
+                stream.write("".join(lines))
+                lines = []
+                self._write_item_annotations(stream, taxon)
+                self._write_item_comments(stream, taxon)
+        stream.write("".join(lines))
         stream.write("  ;\n")
         stream.write("END;\n\n")
 
@@ -341,24 +376,33 @@ class NexusWriter(ioservice.DataWriter):
         stream.write("{}\n             ;\n".format(statement))
 
     def _write_trees_block(self, stream, tree_list):
+        self._write_trees_block_open(stream, tree_list)
+        for tree_idx, tree in enumerate(tree_list):
+            self._write_tree_statement(stream, tree, tree_idx)
+        self._write_trees_block_close(stream)
+
+    def _write_trees_block_open(self, stream, tree_list):
         stream.write("BEGIN TREES;\n")
         self._write_block_title(stream, tree_list)
         self._write_item_annotations(stream, tree_list)
         self._write_item_comments(stream, tree_list)
         self._write_link_to_taxa_block(stream, tree_list.taxon_namespace)
         self._set_and_write_translate_block(stream, tree_list.taxon_namespace)
-        for tree_idx, tree in enumerate(tree_list):
-            if tree.label:
-                tree_name = tree.label
-            else:
-                tree_name = str(tree_idx+1)
-            tree_name = nexusprocessing.escape_nexus_token(
-                    tree_name,
-                    preserve_spaces=self.preserve_spaces,
-                    quote_underscores=not self.unquoted_underscores)
-            stream.write("    TREE {} = ".format(tree_name))
-            self._newick_writer._write_tree(stream, tree)
-            stream.write("\n")
+
+    def _write_tree_statement(self, stream, tree, tree_idx):
+        if tree.label:
+            tree_name = tree.label
+        else:
+            tree_name = str(tree_idx+1)
+        tree_name = nexusprocessing.escape_nexus_token(
+                tree_name,
+                preserve_spaces=self.preserve_spaces,
+                quote_underscores=not self.unquoted_underscores)
+        stream.write("    TREE {} = ".format(tree_name))
+        self._newick_writer._write_tree(stream, tree)
+        stream.write("\n")
+
+    def _write_trees_block_close(self, stream):
         stream.write("END;\n\n")
 
     def _write_char_block(self, stream, char_matrix):
@@ -460,7 +504,7 @@ class NexusWriter(ioservice.DataWriter):
             self._write_comments(stream, item.comments)
 
     def _write_item_annotations(self, stream, item):
-        if not self.suppress_annotations and item.annotations:
+        if not self.suppress_annotations and item.has_annotations:
             a = nexusprocessing.format_item_annotations_as_comments(item,
                     nhx=self.annotations_as_nhx,
                     real_value_format_specifier=self.real_value_format_specifier)
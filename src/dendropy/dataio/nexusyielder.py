@@ -33,10 +33,14 @@ class NexusTreeDataYielder(
         ioservice.TreeDataYielder,
         nexusreader.NexusReader):
 
+    is_splits_only_supported = True
+
     def __init__(self,
             files=None,
             taxon_namespace=None,
             tree_type=None,
+            tree_offset=None,
+            splits_only=False,
             **kwargs):
         """
 
@@ -51,6 +55,16 @@ class NexusTreeDataYielder(
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        tree_offset : integer or None
+            If not |None|, then the number of trees to skip (without parsing
+            them) at the start of each source. Negative offsets work like
+            negative list indexes.
+        splits_only : bool
+            If |True|, then, instead of a |Tree|, a
+            ``NewickReader.TreeSplits`` record of the split bitmasks and edge
+            lengths that :meth:`Tree.encode_bipartitions()` would give each
+            tree (along with its weight and rooting state) is yielded,
+            without the tree being constructed.
         \*\*kwargs : keyword arguments
             These will be passed directly to the base `nexusreader.NexusReader`
             class. See `nexusreader.NexusReader` for details.
@@ -58,7 +72,9 @@ class NexusTreeDataYielder(
         ioservice.TreeDataYielder.__init__(self,
                 files=files,
                 taxon_namespace=taxon_namespace,
-                tree_type=tree_type)
+                tree_type=tree_type,
+                tree_offset=tree_offset)
+        self.splits_only = splits_only
         self.assume_newick_if_not_nexus = kwargs.pop("assume_newick_if_not_nexus", False)
         kwargs["attached_taxon_namespace"] = self.attached_taxon_namespace
         nexusreader.NexusReader.__init__(self, **kwargs)
@@ -69,6 +85,9 @@ class NexusTreeDataYielder(
     ## Implementation of DataYielder interface
 
     def _yield_items_from_stream(self, stream):
+        self._resolve_num_trees_to_skip(stream, self)
+        if self._num_trees_to_skip is None and self.assume_newick_if_not_nexus:
+            self._resolve_num_trees_to_skip(stream, self.newick_reader)
         if self._nexus_tokenizer is None:
             self.create_tokenizer(stream,
                 preserve_unquoted_underscores=self.preserve_underscores)
@@ -82,9 +101,21 @@ class NexusTreeDataYielder(
                         enable_lookup_by_taxon_number=False,
                         )
                 while True:
-                    tree = self._build_tree_from_newick_tree_string(
-                            tree_factory=self.tree_factory,
-                            taxon_symbol_mapper=taxon_symbol_mapper)
+                    if self._num_trees_to_skip:
+                        if not self.newick_reader._skip_tree_statement(self._nexus_tokenizer,
+                                taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol):
+                            break
+                        self._num_trees_to_skip -= 1
+                        continue
+                    if self.splits_only:
+                        tree = self.newick_reader._parse_tree_statement_splits(
+                                nexus_tokenizer=self._nexus_tokenizer,
+                                taxon_namespace=taxon_symbol_mapper.taxon_namespace,
+                                taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+                    else:
+                        tree = self._build_tree_from_newick_tree_string(
+                                tree_factory=self.tree_factory,
+                                taxon_symbol_mapper=taxon_symbol_mapper)
                     if tree is None:
                         break
                     yield tree
@@ -160,10 +191,16 @@ class NexusTreeDataYielder(
                     ## statement. Typically, this will be
                     ## 'TREE' if there is another tree, or
                     ## 'END'/'ENDBLOCK'.
-                    tree = self._parse_tree_statement(
-                            tree_factory=tree_factory,
-                            taxon_symbol_mapper=taxon_symbol_mapper)
-                    yield tree
+                    if self._num_trees_to_skip:
+                        self._skip_tree_statement(taxon_symbol_mapper)
+                        self._num_trees_to_skip -= 1
+                    elif self.splits_only:
+                        yield self._parse_tree_statement_splits(taxon_symbol_mapper)
+                    else:
+                        tree = self._parse_tree_statement(
+                                tree_factory=tree_factory,
+                                taxon_symbol_mapper=taxon_symbol_mapper)
+                        yield tree
                     if self._nexus_tokenizer.is_eof() or not self._nexus_tokenizer.current_token:
                         break
                     if self._nexus_tokenizer.cast_current_token_to_ucase() != "TREE":
@@ -181,10 +218,12 @@ class NexusNewickTreeDataYielder(NexusTreeDataYielder):
             files=None,
             taxon_namespace=None,
             tree_type=None,
+            tree_offset=None,
             **kwargs):
         kwargs["assume_newick_if_not_nexus"] = kwargs.get("assume_newick_if_not_nexus", True)
         NexusTreeDataYielder.__init__(self,
                 files=files,
                 taxon_namespace=taxon_namespace,
                 tree_type=tree_type,
+                tree_offset=tree_offset,
                 **kwargs)
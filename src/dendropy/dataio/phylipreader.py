@@ -86,6 +86,10 @@ class PhylipReader(ioservice.DataReader):
         ignore_invalid_chars : bool
             If |True| then any invalid characters in sequences will be ignored.
             Default is |False|: invalid characters result in errors.
+        byte_coded: bool
+            If |True|, then sequences of fixed-alphabet data types (e.g.,
+            "dna" or "protein") are stored compactly as arrays of state codes
+            (see :attr:`CharacterMatrix.is_byte_coded`). Default is |False|.
         ignore_unrecognized_keyword_arguments : boolean, default: |False|
             If |True|, then unsupported or unrecognized keyword arguments will
             not result in an error. Default is |False|: unsupported keyword
@@ -114,6 +118,7 @@ class PhylipReader(ioservice.DataReader):
         self.underscores_to_spaces = kwargs.pop("underscores_to_spaces", False)
         self.ignore_invalid_chars = kwargs.pop("ignore_invalid_chars", False)
         self.default_state_alphabet = kwargs.pop("default_state_alphabet", None)
+        self.byte_coded = kwargs.pop("byte_coded", False)
         if self.default_state_alphabet is not None:
             if self.data_type is None:
                 self.data_type = "standard"
@@ -175,6 +180,8 @@ class PhylipReader(ioservice.DataReader):
                     gap_symbol="-",
                     case_sensitive=False)
                 self.char_matrix.state_alphabets.append(state_alphabet)
+        if self.byte_coded and self.char_matrix.byte_coded_character_sequence_type is not None:
+            self.char_matrix.is_byte_coded = True
         lines = filesys.get_lines(stream)
         if len(lines) == 0:
             raise error.DataSourceError("No data in source", stream=self.stream)
@@ -241,6 +248,8 @@ class PhylipReader(ioservice.DataReader):
                 else:
                     self.char_matrix[current_taxon].append(state)
         else:
+            if self.char_matrix.is_byte_coded and self.char_matrix[current_taxon].extend_symbols(line):
+                return
             for c in line:
                 if c in [' ', '\t']:
                     continue
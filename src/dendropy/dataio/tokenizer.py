@@ -17,6 +17,7 @@
 ##
 ##############################################################################
 
+import re
 import sys
 from dendropy.utility import error
 
@@ -26,8 +27,18 @@ from dendropy.utility import error
 class Tokenizer(object):
     """
     Stream tokenizer.
+
+    The source stream is read in blocks of ``block_size`` characters, and
+    tokens, runs of delimiters and comments are located in each block with
+    precompiled regular expressions or ``str.find()`` rather than by
+    stepping through the stream a character at a time. If the delimiter
+    lists are modified in place after construction, ``_compile_scanners()``
+    must be called for the changes to take effect.
     """
 
+    # Number of characters read from the source stream at a time.
+    block_size = 65536
+
     class TokenizerError(error.DataParseError):
 
         def __init__(self,
@@ -89,33 +100,71 @@ class Tokenizer(object):
         self.comment_end = comment_end
         self.capture_comments = capture_comments
         self.preserve_unquoted_underscores = preserve_unquoted_underscores
+        self._compile_scanners()
 
         # State (internals)
         self.src = src
-        self._cur_char = None
+        self._reset_buffer()
         self.current_token = None
         self.is_token_quoted = False
 
         # Meta-information
         self.captured_comments = []
-        self.current_line_num = 1
-        self.current_column_num = 0
-        self.token_line_num = 0
-        self.token_column_num = 0
+
+    def _compile_scanners(self):
+        """
+        (Re-)builds the character sets and regular expressions used to scan
+        the stream from the current delimiter, quote and comment settings.
+        """
+        def _char_class(chars):
+            return "".join(re.escape(c) for c in chars)
+        self._uncaptured_set = frozenset(self.uncaptured_delimiters)
+        self._captured_set = frozenset(self.captured_delimiters)
+        self._quote_set = frozenset(self.quote_chars)
+        self._comment_begin_set = frozenset(self.comment_begin)
+        self._comment_end_set = frozenset(self.comment_end)
+        if self._uncaptured_set:
+            self._uncaptured_run = re.compile("[{}]*".format(_char_class(self._uncaptured_set)))
+        else:
+            self._uncaptured_run = re.compile("")
+        stop_chars = self._uncaptured_set | self._captured_set | self._comment_begin_set
+        if stop_chars:
+            self._unquoted_run = re.compile("[^{}]*".format(_char_class(stop_chars)))
+        else:
+            self._unquoted_run = re.compile(".*", re.DOTALL)
+        comment_chars = self._comment_begin_set | self._comment_end_set
+        if comment_chars:
+            self._comment_delimiter = re.compile("[{}]".format(_char_class(comment_chars)))
+        else:
+            self._comment_delimiter = None
+        self._delimiter_set = self._uncaptured_set | self._captured_set
+        # built on demand by ``skip_past_delimiter()``
+        self._skip_scanners = {}
+
+    def _reset_buffer(self):
+        self._buffer = ""
+        # index of the current character in the buffer
+        self._pos = 0
+        # stream offset of the first character in the buffer
+        self._buffer_offset = 0
+        # number of newlines, and stream offset of the last newline, in the
+        # part of the stream already discarded from the buffer
+        self._discarded_newline_count = 0
+        self._discarded_last_newline_offset = -1
+        # stream offset of the first character of the current token
+        self._token_offset = None
+        self._is_started = False
+        self._is_src_exhausted = False
 
     def reset(self):
         self.set_stream(src=None)
 
     def set_stream(self, src=None):
         self.src = src
-        self._cur_char = None
+        self._reset_buffer()
         self.current_token = None
         self.is_token_quoted = False
         self.captured_comments = []
-        self.current_line_num = 1
-        self.current_column_num = 0
-        self.token_line_num = 0
-        self.token_column_num = 0
 
     def is_eof(self):
         return self._cur_char == ""
@@ -173,122 +222,295 @@ class Tokenizer(object):
         return self
 
     def __next__(self):
-        self.is_token_quoted = False
-        if self._cur_char is None:
-            self._get_next_char()
-        self._skip_to_significant_char()
-        if self._cur_char == "":
-            raise StopIteration
-        if self._cur_char in self.captured_delimiters:
-            self.current_token = self._cur_char
-            self.token_line_num = self.current_line_num
-            self.token_column_num = self.current_column_num
-            self._get_next_char()
-            return self.current_token
-        elif self._cur_char in self.quote_chars:
-            self.token_line_num = self.current_line_num
-            self.token_column_num = self.current_column_num
-            dest = []
-            self.is_token_quoted = True
-            cur_quote_char = self._cur_char
-            self._get_next_char()
-            while True:
+        self._is_started = True
+        while True:
+            self.is_token_quoted = False
+            buf = self._buffer
+            if self._pos < len(buf) and buf[self._pos] not in self._uncaptured_set:
+                cur_char = buf[self._pos]
+            else:
+                cur_char = self._skip_to_significant_char()
+                if cur_char == "":
+                    raise StopIteration
+            self._token_offset = self._buffer_offset + self._pos
+            if cur_char in self._captured_set:
+                self._pos += 1
+                self.current_token = cur_char
+                return self.current_token
+            elif cur_char in self._quote_set:
+                self.is_token_quoted = True
+                self.current_token = self._read_quoted_token(cur_char)
+                return self.current_token
+            else:
+                self.current_token = self._read_unquoted_token()
+                if self.current_token != "":
+                    return self.current_token
+                # only comments: carry on to the next token, if any
                 if self._cur_char == "":
+                    raise StopIteration
+    next = __next__ # Python 2 legacy support
+
+    def skip_past_delimiter(self, delimiter):
+        """
+        Advances the stream to just past the next occurrence of the captured
+        delimiter ``delimiter`` that is not within a quoted token or a
+        comment, without assembling the intervening tokens or capturing the
+        intervening comments. This is much faster than calling
+        ``next_token()`` until ``delimiter`` is returned, and is used to skip
+        over entire statements (e.g., tree statements) that are not needed.
+        The stream must be positioned at a token boundary (i.e., not in the
+        middle of a token). On success, ``delimiter`` becomes the current
+        token and |True| is returned; otherwise the stream is exhausted and
+        |False| is returned.
+        """
+        scanner = self._skip_scanners.get(delimiter)
+        if scanner is None:
+            special_chars = self._quote_set | self._comment_begin_set | set([delimiter])
+            scanner = re.compile("[{}]".format("".join(re.escape(c) for c in special_chars)))
+            self._skip_scanners[delimiter] = scanner
+        self._is_started = True
+        self.is_token_quoted = False
+        # nothing before the current position needs to be retained
+        self._token_offset = None
+        # a quote character only opens a quoted token at the start of a token
+        is_token_start = True
+        while True:
+            buf = self._buffer
+            m = scanner.search(buf, self._pos)
+            if m is None:
+                if self._pos < len(buf):
+                    is_token_start = buf[-1] in self._delimiter_set
+                self._pos = len(buf)
+                if not self._fill_buffer():
+                    self.current_token = None
+                    return False
+                continue
+            idx = m.start()
+            if idx > self._pos:
+                is_token_start = buf[idx-1] in self._delimiter_set
+            cur_char = buf[idx]
+            if cur_char == delimiter:
+                self._token_offset = self._buffer_offset + idx
+                self._pos = idx + 1
+                self.current_token = delimiter
+                return True
+            self._pos = idx
+            if cur_char in self._quote_set:
+                if is_token_start:
+                    self._read_quoted_token(cur_char)
+                else:
+                    self._pos += 1
+            else:
+                m = self._comment_delimiter.search(buf, idx + 1)
+                if m is not None and buf[m.start()] in self._comment_end_set:
+                    # fast path: comment without nested comments
+                    self._pos = m.end()
+                else:
+                    self._handle_comment(is_captured=False)
+                # as in ``_read_unquoted_token()``, a token can continue
+                # after a comment
+                is_token_start = False
+
+    def _read_quoted_token(self, cur_quote_char):
+        dest = []
+        self._pos += 1
+        while True:
+            buf = self._buffer
+            idx = buf.find(cur_quote_char, self._pos)
+            if idx < 0:
+                dest.append(buf[self._pos:])
+                self._pos = len(buf)
+                if not self._fill_buffer():
                     raise Tokenizer.UnterminatedQuoteError(
                             quote_char=cur_quote_char,
                             line_num=self.current_line_num,
                             col_num=self.current_column_num,
-                            stream=src)
-                if self._cur_char == cur_quote_char:
-                    self._get_next_char()
-                    if self.escape_quote_by_doubling:
-                        if self._cur_char == cur_quote_char:
-                            # dest.write(cur_quote_char)
-                            dest.append(cur_quote_char)
-                            self._get_next_char()
-                        else:
-                            break
-                    else:
-                        self._get_next_char()
-                        break
+                            stream=self.src)
+                continue
+            dest.append(buf[self._pos:idx])
+            self._pos = idx + 1
+            next_char = self._cur_char
+            if self.escape_quote_by_doubling:
+                if next_char == cur_quote_char:
+                    dest.append(cur_quote_char)
+                    self._pos += 1
                 else:
-                    # dest.write(self._cur_char)
-                    dest.append(self._cur_char)
-                    self._get_next_char()
-            # self.current_token = dest.getvalue()
-            self.current_token = "".join(dest)
-            return self.current_token
-        else:
-            # unquoted
-            self.token_line_num = self.current_line_num
-            self.token_column_num = self.current_column_num
-            dest = []
-            self.is_token_quoted = False
-            while self._cur_char != "":
-                if self._cur_char in self.uncaptured_delimiters:
-                    self._get_next_char()
                     break
-                elif self._cur_char in self.captured_delimiters:
+            else:
+                if next_char != "":
+                    self._pos += 1
+                break
+        return "".join(dest)
+
+    def _read_unquoted_token(self):
+        # fast path: token ends with a delimiter within the buffer
+        buf = self._buffer
+        pos = self._pos
+        end = self._unquoted_run.match(buf, pos).end()
+        if end < len(buf):
+            cur_char = buf[end]
+            if cur_char in self._uncaptured_set:
+                self._pos = end + 1
+            elif cur_char in self._captured_set:
+                self._pos = end
+            else:
+                cur_char = None
+            if cur_char is not None:
+                token = buf[pos:end]
+                if not self.preserve_unquoted_underscores:
+                    token = token.replace("_", " ")
+                return token
+        dest = []
+        while True:
+            buf = self._buffer
+            end = self._unquoted_run.match(buf, self._pos).end()
+            if end > self._pos:
+                dest.append(buf[self._pos:end])
+                self._pos = end
+            if end >= len(buf):
+                if not self._fill_buffer():
                     break
-                elif self._cur_char in self.comment_begin:
-                    self._handle_comment()
-                    if self._cur_char == "":
-                        break
-                else:
-                    if self._cur_char == "_" and not self.preserve_unquoted_underscores:
-                        self._cur_char = " "
-                    dest.append(self._cur_char)
-                    self._get_next_char()
-            # self.current_token = dest.getvalue()
-            self.current_token = "".join(dest)
-            if self.current_token == "":
-                if self._cur_char != "":
-                    self.__next__()
-                else:
-                    raise StopIteration
-            return self.current_token
-    next = __next__ # Python 2 legacy support
+                continue
+            cur_char = buf[end]
+            if cur_char in self._uncaptured_set:
+                self._pos += 1
+                break
+            elif cur_char in self._captured_set:
+                break
+            else:
+                self._handle_comment()
+        token = "".join(dest)
+        if not self.preserve_unquoted_underscores:
+            token = token.replace("_", " ")
+        return token
 
     def _skip_to_significant_char(self):
-        if self._cur_char == "":
-            return
-        if self._cur_char is None:
-            self._get_next_char()
-        if self._cur_char not in self.uncaptured_delimiters:
-            return
-        while self._cur_char != "" and self._cur_char in self.uncaptured_delimiters:
-            self._get_next_char()
-        return
-
-    def _get_next_char(self):
-        self._cur_char = self.src.read(1)
-        if self._cur_char != "":
-            if self._cur_char == "\n":
-                self.current_line_num += 1
-                self.current_column_num = 1
-            else:
-                # print("@@@ {}: {}".format(self.current_column_num, self._cur_char))
-                self.current_column_num += 1
-        return self._cur_char
+        while True:
+            buf = self._buffer
+            self._pos = self._uncaptured_run.match(buf, self._pos).end()
+            if self._pos < len(buf):
+                return buf[self._pos]
+            if not self._fill_buffer():
+                return ""
 
-    def _handle_comment(self):
+    def _handle_comment(self, is_captured=True):
+        is_captured = is_captured and self.capture_comments
         dest = []
         nesting = 0
-        comment_complete = False
-        while self._cur_char != "":
-            if self._cur_char in self.comment_end:
+        while True:
+            buf = self._buffer
+            m = self._comment_delimiter.search(buf, self._pos)
+            if m is None:
+                if is_captured:
+                    dest.append(buf[self._pos:])
+                self._pos = len(buf)
+                if not self._fill_buffer():
+                    break
+                continue
+            idx = m.start()
+            if is_captured:
+                dest.append(buf[self._pos:idx])
+            cur_char = buf[idx]
+            self._pos = idx + 1
+            if cur_char in self._comment_end_set:
                 nesting -= 1
                 if nesting <= 0:
-                    comment_complete = True
-                    self._get_next_char()
                     break
-            elif self._cur_char in self.comment_begin:
+            else:
                 nesting += 1
-            elif self.capture_comments:
-                # dest.write(self._cur_char)
-                dest.append(self._cur_char)
-            self._get_next_char()
-        if self.capture_comments:
-            # self.captured_comments.append(dest.getvalue())
+        if is_captured:
             self.captured_comments.append("".join(dest))
 
+    def _fill_buffer(self):
+        """
+        Reads the next block from the source stream into the buffer,
+        discarding the part of the buffer before both the current character
+        and the start of the current token. Returns |False| if the source
+        stream is exhausted.
+        """
+        if self._is_src_exhausted or self.src is None:
+            return False
+        block = self.src.read(self.block_size)
+        if not block:
+            self._is_src_exhausted = True
+            return False
+        discard = self._pos
+        if self._token_offset is not None:
+            discard = min(discard, self._token_offset - self._buffer_offset)
+        if discard > 0:
+            buf = self._buffer
+            self._discarded_newline_count += buf.count("\n", 0, discard)
+            idx = buf.rfind("\n", 0, discard)
+            if idx >= 0:
+                self._discarded_last_newline_offset = self._buffer_offset + idx
+            self._buffer = buf[discard:] + block
+            self._buffer_offset += discard
+            self._pos -= discard
+        else:
+            self._buffer += block
+        return True
+
+    def _get_cur_char(self):
+        if not self._is_started:
+            return None
+        if self._pos >= len(self._buffer) and not self._fill_buffer():
+            return ""
+        return self._buffer[self._pos]
+    _cur_char = property(_get_cur_char)
+
+    ###########################################################################
+    ## Position in stream (computed on demand)
+
+    def _line_and_column_num(self, offset):
+        # Lines are counted from 1, and a newline character is treated as
+        # the first column of the line it starts.
+        if offset < 0:
+            return 1, 0
+        buf = self._buffer
+        idx = offset - self._buffer_offset
+        line_num = 1 + self._discarded_newline_count + buf.count("\n", 0, idx + 1)
+        if buf[idx] == "\n":
+            return line_num, 1
+        newline_idx = buf.rfind("\n", 0, idx)
+        if newline_idx >= 0:
+            last_newline_offset = self._buffer_offset + newline_idx
+        else:
+            last_newline_offset = self._discarded_last_newline_offset
+        if last_newline_offset < 0:
+            return line_num, offset + 1
+        return line_num, offset - last_newline_offset + 1
+
+    def _current_line_and_column_num(self):
+        cur_char = self._cur_char
+        if cur_char is None:
+            return 1, 0
+        offset = self._buffer_offset + self._pos
+        if cur_char == "":
+            # end of stream: position of the last character read
+            offset -= 1
+        return self._line_and_column_num(offset)
+
+    def _get_current_line_num(self):
+        return self._current_line_and_column_num()[0]
+    current_line_num = property(_get_current_line_num)
+
+    def _get_current_column_num(self):
+        return self._current_line_and_column_num()[1]
+    current_column_num = property(_get_current_column_num)
+
+    def _get_token_offset(self):
+        # In characters, from the start of the stream.
+        return self._token_offset
+    token_offset = property(_get_token_offset)
+
+    def _get_token_line_num(self):
+        if self._token_offset is None:
+            return 0
+        return self._line_and_column_num(self._token_offset)[0]
+    token_line_num = property(_get_token_line_num)
+
+    def _get_token_column_num(self):
+        if self._token_offset is None:
+            return 0
+        return self._line_and_column_num(self._token_offset)[1]
+    token_column_num = property(_get_token_column_num)
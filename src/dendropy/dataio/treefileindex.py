@@ -0,0 +1,746 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Random access to the trees of a NEWICK or NEXUS file, through an index of the
+positions of the tree statements in the file.
+"""
+
+import io
+import os
+import gc
+import json
+import math
+import mmap
+import pickle
+import multiprocessing
+from dendropy import dataio
+from dendropy.utility import error
+from dendropy.utility import textprocessing
+from dendropy.utility import filesys
+from dendropy.utility import GLOBAL_RNG
+from dendropy.dataio import nexusprocessing
+from dendropy.dataio import nexusreader
+from dendropy.dataio import newickreader
+from dendropy.datamodel import taxonmodel
+from dendropy.datamodel import treemodel
+from dendropy.datamodel import treecollectionmodel
+
+INDEX_FILE_EXTENSION = ".dpidx"
+_INDEX_FORMAT = "dendropy-tree-file-index"
+_INDEX_FORMAT_VERSION = 1
+
+# Sources are scanned with an encoding that maps every byte to a single
+# character, so that character offsets into the scanned stream are byte
+# offsets into the file.
+_SCAN_ENCODING = "latin-1"
+
+class _SavedIndexUnavailableError(Exception):
+    pass
+
+class _NexusTreeStatementIndexer(nexusreader.NexusReader):
+    """
+    Reads a NEXUS source, skipping over every tree statement (without parsing
+    it) while recording its extent in the stream and the TRANSLATE table that
+    applies to it.
+    """
+
+    def __init__(self, **kwargs):
+        nexusreader.NexusReader.__init__(self, **kwargs)
+        # for each collection, a list of [start, stop] stream offsets of its
+        # tree statements, with a ``stop`` of |None| meaning the end of the
+        # stream
+        self.tree_offsets = []
+        # for each collection, a list of (token, |Taxon|) pairs
+        self.translate_tables = []
+        self._translate_table = []
+
+    def _parse_trees_block(self):
+        self._translate_table = []
+        nexusreader.NexusReader._parse_trees_block(self)
+
+    def _parse_translate_statement(self, taxon_namespace, taxon_symbol_mapper=None):
+        taxon_symbol_mapper = nexusreader.NexusReader._parse_translate_statement(self,
+                taxon_namespace=taxon_namespace,
+                taxon_symbol_mapper=taxon_symbol_mapper)
+        self._translate_table = list(taxon_symbol_mapper.token_taxon_map.items())
+        return taxon_symbol_mapper
+
+    def _is_tree_skipped(self, collection_index, tree_index):
+        if collection_index == len(self.tree_offsets):
+            self.tree_offsets.append([])
+            self.translate_tables.append(self._translate_table)
+        # current token is "TREE"
+        self.tree_offsets[collection_index].append([self._nexus_tokenizer.token_offset, None])
+        return True
+
+    def _skip_tree_statement(self, taxon_symbol_mapper=None):
+        # only the extent of the statement is needed
+        nexusreader.NexusReader._skip_tree_statement(self)
+        # the statement extends up to the token following it
+        if self._nexus_tokenizer.current_token is not None:
+            self.tree_offsets[-1][-1][1] = self._nexus_tokenizer.token_offset
+
+def _index_newick_tree_statements(stream, terminating_semicolon_required=True):
+    """
+    Returns a list of [start, stop] stream offsets of the tree statements in
+    NEWICK-formatted ``stream``, with a ``stop`` of |None| meaning the end of
+    the stream. Each statement extends from just after the semi-colon of the
+    one before it, so as to include any leading comments (e.g. "[&R]").
+    """
+    nexus_tokenizer = nexusprocessing.NexusTokenizer(stream,
+            preserve_unquoted_underscores=True)
+    nexus_tokenizer.capture_comments = False
+    tree_offsets = []
+    start = 0
+    while True:
+        token = nexus_tokenizer.next_token()
+        while token == ";":
+            start = nexus_tokenizer.token_offset + 1
+            token = nexus_tokenizer.next_token()
+        # as with ``NewickReader``, a single token at the end of the stream
+        # is not a tree statement
+        if token is None or nexus_tokenizer.is_eof():
+            break
+        if nexus_tokenizer.skip_past_delimiter(";"):
+            stop = nexus_tokenizer.token_offset + 1
+        elif terminating_semicolon_required:
+            raise newickreader.NewickReader.NewickReaderIncompleteTreeStatementError(
+                    message="Incomplete or improperly-terminated tree statement (end of stream reached instead of a semi-colon ';')",
+                    line_num=nexus_tokenizer.current_line_num,
+                    col_num=nexus_tokenizer.current_column_num,
+                    stream=stream)
+        else:
+            stop = None
+        tree_offsets.append([start, stop])
+        if stop is None:
+            break
+        start = stop
+    return tree_offsets
+
+class TreeFileIndex(object):
+    """
+    Provides random access to the trees in a NEWICK or NEXUS file.
+
+    The file is scanned once to locate each tree statement (without parsing
+    any of them), and the locations, together with the taxon definitions and
+    any TRANSLATE tables, are saved alongside the file (as the file path with
+    ".dpidx" appended) so that subsequent instances for the same file, as long
+    as it has not changed, do not need to scan it again. Trees are then
+    retrieved by index, slice, or random sample, by parsing only the requested
+    tree statements straight from a memory map of the file::
+
+        index = dendropy.TreeFileIndex("mcmc.trees", schema="nexus")
+        tree = index[-1]
+        post_burnin = index[1000:]
+        trees = index.sample(100, rng=random.Random(1))
+
+    Once an index has been saved, ``Tree.get()`` and ``TreeList.get()`` (given
+    ``tree_offset``) will use it when reading from the file by path.
+    """
+
+    supported_schemas = ("newick", "nexus")
+
+    @staticmethod
+    def get_index_path(path):
+        """
+        Returns the path of the file in which the index of the trees in the
+        file given by ``path`` is saved.
+        """
+        return path + INDEX_FILE_EXTENSION
+
+    @classmethod
+    def load(cls, path, schema, **kwargs):
+        """
+        Returns a |TreeFileIndex| for the file given by ``path`` if an index
+        for the file has been saved and is up to date, or |None| otherwise.
+        Keyword arguments are as for the constructor.
+        """
+        if schema not in cls.supported_schemas:
+            return None
+        if not os.path.exists(cls.get_index_path(path)):
+            return None
+        kwargs["is_persistent"] = True
+        kwargs["_is_saved_index_required"] = True
+        try:
+            return cls(path, schema, **kwargs)
+        except _SavedIndexUnavailableError:
+            return None
+
+    def __init__(self,
+            path,
+            schema,
+            collection_offset=None,
+            taxon_namespace=None,
+            tree_type=None,
+            encoding="utf-8",
+            is_persistent=True,
+            **kwargs):
+        """
+        Parameters
+        ----------
+        path : string
+            Path to a NEWICK or NEXUS file, which must not be compressed.
+        schema : string
+            "newick" or "nexus".
+        collection_offset : integer or None
+            0-based index of the collection of trees (e.g. NEXUS "TREES"
+            block) to provide access to; negative values work like negative
+            list indexes. If |None| (default), then the trees of all
+            collections are treated as a single sequence.
+        taxon_namespace : |TaxonNamespace|
+            The namespace of the trees returned. If not given, a new one is
+            created. The operational taxonomic units defined in the file
+            (including those in TRANSLATE tables) are added to it straight
+            away; those only referenced by tree statements are added as those
+            trees are retrieved.
+        tree_type : type
+            Type of the trees returned. Defaults to |Tree|.
+        encoding : string
+            Encoding of the file. Defaults to "utf-8".
+        is_persistent : bool
+            If |True| (default), then a saved index is used if up to date,
+            and otherwise the index is saved after the file has been
+            scanned. If the index cannot be saved (e.g. for lack of
+            permission), it is just not saved.
+        \*\*kwargs : keyword arguments
+            Passed to the reader for ``schema`` used to parse the trees
+            (e.g. "rooting", "preserve_underscores").
+        """
+        is_saved_index_required = kwargs.pop("_is_saved_index_required", False)
+        # given to the indexes of worker processes, which do not need to read
+        # or scan anything
+        index_data = kwargs.pop("_index_data", None)
+        if schema not in self.supported_schemas:
+            raise error.UnsupportedSchemaError("'{}' trees cannot be indexed".format(schema))
+        compression = filesys.get_compression(path)
+        if compression is not None:
+            raise ValueError("'{}': {}-compressed files cannot be indexed".format(path, compression))
+        self.path = path
+        self.schema = schema
+        self.encoding = encoding
+        if taxon_namespace is None:
+            taxon_namespace = taxonmodel.TaxonNamespace()
+        self.taxon_namespace = taxon_namespace
+        if tree_type is None:
+            tree_type = treemodel.Tree
+        self.tree_type = tree_type
+        self._reader = dataio.get_reader(schema, **kwargs)
+        if schema == "nexus":
+            self._preserve_underscores = self._reader.preserve_underscores
+        else:
+            self._preserve_underscores = self._reader.preserve_unquoted_underscores
+        self._reader_kwargs = kwargs
+        self._file = None
+        self._mmap = None
+        self._tree_locations = None
+        stat = os.stat(path)
+        self._source_signature = {
+                "format": _INDEX_FORMAT,
+                "version": _INDEX_FORMAT_VERSION,
+                "schema": schema,
+                "encoding": encoding,
+                "preserve_underscores": self._preserve_underscores,
+                "size": stat.st_size,
+                "mtime": stat.st_mtime,
+                }
+        if index_data is None and is_persistent:
+            index_data = self._read_index_file()
+        if index_data is None:
+            if is_saved_index_required:
+                raise _SavedIndexUnavailableError()
+            index_data = self._scan()
+            if is_persistent:
+                self._write_index_file(index_data)
+        self._index_data = index_data
+        self._collection_offset = collection_offset
+        self._set_up(index_data, collection_offset)
+
+    def __del__(self):
+        self.close()
+
+    def close(self):
+        """
+        Releases the memory map of (and closes) the file.
+        """
+        if getattr(self, "_mmap", None) is not None:
+            self._mmap.close()
+            self._mmap = None
+        if getattr(self, "_file", None) is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    ###########################################################################
+    ## Index Construction and Persistence
+
+    def _scan(self):
+        """
+        Scans the file to locate the tree statements, and returns the index
+        as a dictionary of JSON-serializable values.
+        """
+        with io.open(self.path, "r", encoding=_SCAN_ENCODING, newline="") as src:
+            if self.schema == "nexus":
+                scan_namespace = taxonmodel.TaxonNamespace()
+                kwargs = dict(self._reader_kwargs)
+                kwargs["attached_taxon_namespace"] = scan_namespace
+                kwargs["exclude_chars"] = True
+                indexer = _NexusTreeStatementIndexer(**kwargs)
+                tree_lists = indexer.read_tree_lists(
+                        stream=src,
+                        taxon_namespace_factory=lambda label: scan_namespace,
+                        tree_list_factory=treecollectionmodel.TreeList,
+                        global_annotations_target=None)
+                taxon_indexes = dict((id(taxon), idx) for idx, taxon in enumerate(scan_namespace))
+                taxon_labels = [self._decode(taxon.label) for taxon in scan_namespace]
+                collections = []
+                for tree_list, translate_table, tree_offsets in zip(
+                        tree_lists,
+                        indexer.translate_tables,
+                        indexer.tree_offsets):
+                    collections.append({
+                        "label": self._decode(tree_list.label),
+                        "translate": [[self._decode(token), taxon_indexes[id(taxon)]] for token, taxon in translate_table],
+                        "trees": tree_offsets,
+                        })
+            else:
+                taxon_labels = []
+                collections = [{
+                        "label": None,
+                        "translate": [],
+                        "trees": _index_newick_tree_statements(src,
+                            terminating_semicolon_required=self._reader.terminating_semicolon_required),
+                        }]
+        index_data = dict(self._source_signature)
+        index_data["taxon_labels"] = taxon_labels
+        index_data["collections"] = collections
+        return index_data
+
+    def _decode(self, s):
+        # undo the scanning encoding
+        if s is None:
+            return None
+        return s.encode(_SCAN_ENCODING).decode(self.encoding)
+
+    def _read_index_file(self):
+        try:
+            with open(self.get_index_path(self.path), "r") as src:
+                index_data = json.load(src)
+        except (IOError, OSError, ValueError):
+            return None
+        for key, value in self._source_signature.items():
+            if index_data.get(key) != value:
+                return None
+        return index_data
+
+    def _write_index_file(self, index_data):
+        try:
+            with open(self.get_index_path(self.path), "w") as dest:
+                json.dump(index_data, dest)
+        except (IOError, OSError):
+            pass
+
+    def _set_up(self, index_data, collection_offset):
+        collections = index_data["collections"]
+        if collection_offset is not None:
+            if collection_offset < 0:
+                collection_offset = len(collections) + collection_offset
+            if collection_offset < 0 or collection_offset >= len(collections):
+                raise IndexError("Collection offset out of range: {} (number of collections = {}, maximum valid collection offset = {})".format(collection_offset, len(collections), len(collections)-1))
+        case_sensitive = self._reader.case_sensitive_taxon_labels
+        taxa = []
+        for label in index_data["taxon_labels"]:
+            taxon = self.taxon_namespace.get_taxon(label, is_case_sensitive=case_sensitive)
+            if taxon is None:
+                taxon = self.taxon_namespace.new_taxon(label)
+            taxa.append(taxon)
+        self._translate_tables = []
+        self._tree_locations = []
+        for collection_index, collection in enumerate(collections):
+            self._translate_tables.append([(token, taxa[taxon_index]) for token, taxon_index in collection["translate"]])
+            if collection_offset is None or collection_offset == collection_index:
+                for start, stop in collection["trees"]:
+                    self._tree_locations.append((collection_index, start, stop))
+        if index_data["size"] > 0:
+            self._file = open(self.path, "rb")
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    ###########################################################################
+    ## Tree Access
+
+    def __len__(self):
+        return len(self._tree_locations)
+
+    def __iter__(self):
+        return self._parse_trees(range(len(self._tree_locations)), self._new_tree)
+
+    def __getitem__(self, index):
+        """
+        Returns the tree at ``index`` as a |Tree|, or the trees in slice
+        ``index`` as a |TreeList|.
+        """
+        if isinstance(index, slice):
+            return self.get_trees(range(len(self._tree_locations))[index])
+        if index < 0:
+            index += len(self._tree_locations)
+        if index < 0 or index >= len(self._tree_locations):
+            raise IndexError("Tree index out of range: {} ({} trees)".format(index, len(self._tree_locations)))
+        for tree in self._parse_trees([index], self._new_tree):
+            return tree
+
+    def get_trees(self, indexes, tree_list=None, num_processes=None):
+        """
+        Returns a |TreeList| of the trees at the (0-based, non-negative)
+        positions given by ``indexes``, in that order. If ``tree_list`` is
+        given, then the trees are added to it instead of a new |TreeList|.
+
+        If ``num_processes`` is greater than 1, then the trees are parsed in
+        up to that many processes, each taking a contiguous run of tree
+        statements at a time, with the trees then being pickled to be passed
+        back to this process.
+        """
+        if tree_list is None:
+            tree_list = treecollectionmodel.TreeList(
+                    taxon_namespace=self.taxon_namespace,
+                    tree_type=self.tree_type)
+        elif tree_list.taxon_namespace is not self.taxon_namespace:
+            raise error.TaxonNamespaceIdentityError(tree_list, self)
+        indexes = list(indexes)
+        if num_processes is None or num_processes <= 1 or len(indexes) < 2:
+            for tree in self._parse_trees(indexes, tree_list.new_tree):
+                pass
+            return tree_list
+        for trees in self._map_over_processes(indexes, num_processes):
+            tree_list._trees.extend(trees)
+        return tree_list
+
+    def read_into_tree_array(self, tree_array, indexes=None, num_processes=None):
+        """
+        Adds the trees at the (0-based, non-negative) positions given by
+        ``indexes`` (or all the trees, if not given) to |TreeArray|
+        ``tree_array``, which must reference the same |TaxonNamespace|.
+
+        If ``num_processes`` is greater than 1, then the trees are parsed and
+        their splits counted in up to that many processes, each taking a
+        contiguous run of tree statements at a time and adding them to a
+        |TreeArray| of its own, with these then being merged in order into
+        ``tree_array``. As the split bitmasks depend on the order of the taxa
+        in the namespace, the taxa of the trees need to be known in advance:
+        the first tree is read in this process to pick up the taxa of sources
+        (e.g. NEWICK) that do not define them, and if a process comes across
+        a tree referencing any other taxon, then the trees from the start of
+        its run onwards are read in this process instead, so that the result
+        is always the same as with a single process.
+        """
+        if tree_array.taxon_namespace is not self.taxon_namespace:
+            raise error.TaxonNamespaceIdentityError(tree_array, self)
+        if indexes is None:
+            indexes = range(len(self._tree_locations))
+        indexes = list(indexes)
+        if num_processes is None or num_processes <= 1 or len(indexes) < 2:
+            self._add_to_tree_array(tree_array, indexes)
+            return
+        self._add_to_tree_array(tree_array, indexes[:1])
+        split_distribution = tree_array.split_distribution
+        tree_array_kwargs = {
+                "is_rooted_trees": tree_array.is_rooted_trees,
+                "ignore_edge_lengths": tree_array.ignore_edge_lengths,
+                "ignore_node_ages": tree_array.ignore_node_ages,
+                "use_tree_weights": tree_array.use_tree_weights,
+                "ultrametricity_precision": split_distribution.ultrametricity_precision,
+                "is_force_max_age": split_distribution.is_force_max_age,
+                "taxon_label_age_map": tree_array.taxon_label_age_map,
+                }
+        num_trees_read = 1
+        for worker_tree_array in self._map_over_processes(indexes[1:], num_processes, tree_array_kwargs):
+            if worker_tree_array is None:
+                # a tree references a taxon not in the namespace yet
+                self._add_to_tree_array(tree_array, indexes[num_trees_read:])
+                break
+            tree_array.update(worker_tree_array)
+            num_trees_read += len(worker_tree_array)
+
+    def add_taxa(self, indexes):
+        """
+        Adds the taxa referenced by the trees at the (0-based, non-negative)
+        positions given by ``indexes`` to the taxon namespace, in the same
+        order as if these trees were retrieved, but without constructing
+        them. Used when trees are skipped over (e.g., as burn-in) so that the
+        namespace still ends up the same as if they had been read.
+        """
+        for tree in self._parse_trees(indexes, None):
+            pass
+
+    def sample(self, k, rng=None):
+        """
+        Returns a |TreeList| of ``k`` distinct trees sampled at random,
+        using random number generator ``rng`` (the module-level one if not
+        given). Only the sampled trees are parsed.
+        """
+        if rng is None:
+            rng = GLOBAL_RNG
+        return self.get_trees(rng.sample(range(len(self._tree_locations)), k))
+
+    def _new_tree(self):
+        return self.tree_type(taxon_namespace=self.taxon_namespace)
+
+    def _parse_trees(self, indexes, tree_factory):
+        return self._parse_tree_locations(
+                (self._tree_locations[index] for index in indexes),
+                tree_factory)
+
+    def _add_to_tree_array(self, tree_array, indexes):
+        self._add_tree_locations_to_tree_array(tree_array,
+                (self._tree_locations[index] for index in indexes))
+
+    def _add_tree_locations_to_tree_array(self, tree_array, tree_locations):
+        # As with ``TreeArray.read_from_files()``, only the bipartitions of
+        # the trees are parsed unless node ages are needed.
+        if tree_array.ignore_node_ages and self._reader_kwargs.get("finish_node_fn") is None:
+            for tree_splits in self._parse_tree_locations(tree_locations, None, splits_only=True):
+                tree_array.add_tree_splits(tree_splits)
+        else:
+            for tree in self._parse_tree_locations(tree_locations, self._new_tree):
+                tree_array.add_tree(tree=tree, is_bipartitions_updated=False)
+
+    def _parse_tree_locations(self, tree_locations, tree_factory, splits_only=False):
+        # The symbol mapper locks the taxon namespace, so there is only ever
+        # one, covering a run of trees from the same collection.
+        taxon_symbol_mapper = None
+        mapper_collection_index = None
+        try:
+            for collection_index, start, stop in tree_locations:
+                if taxon_symbol_mapper is None or mapper_collection_index != collection_index:
+                    if taxon_symbol_mapper is not None:
+                        taxon_symbol_mapper.restore_taxon_namespace_mutability()
+                    taxon_symbol_mapper = self._new_taxon_symbol_mapper(collection_index)
+                    mapper_collection_index = collection_index
+                yield self._parse_tree(start, stop, tree_factory, taxon_symbol_mapper, splits_only)
+        finally:
+            if taxon_symbol_mapper is not None:
+                taxon_symbol_mapper.restore_taxon_namespace_mutability()
+
+    def _new_taxon_symbol_mapper(self, collection_index):
+        taxon_symbol_mapper = nexusprocessing.NexusTaxonSymbolMapper(
+                taxon_namespace=self.taxon_namespace,
+                enable_lookup_by_taxon_number=self.schema == "nexus",
+                case_sensitive=self._reader.case_sensitive_taxon_labels)
+        for token, taxon in self._translate_tables[collection_index]:
+            taxon_symbol_mapper.add_translate_token(token, taxon)
+        return taxon_symbol_mapper
+
+    def _parse_tree(self, start, stop, tree_factory, taxon_symbol_mapper, splits_only=False):
+        # With ``splits_only``, a ``NewickReader.TreeSplits`` record is
+        # returned instead of a tree; otherwise, with no ``tree_factory``,
+        # only the taxa of the tree are mapped.
+        if stop is None:
+            stop = len(self._mmap)
+        src = textprocessing.StringIO(self._mmap[start:stop].decode(self.encoding))
+        nexus_tokenizer = nexusprocessing.NexusTokenizer(src,
+                preserve_unquoted_underscores=self._preserve_underscores)
+        if self.schema == "nexus":
+            self._reader._nexus_tokenizer = nexus_tokenizer
+            nexus_tokenizer.next_token() # "TREE"
+            if splits_only:
+                return self._reader._parse_tree_statement_splits(taxon_symbol_mapper)
+            if tree_factory is None:
+                self._reader._skip_tree_statement(taxon_symbol_mapper)
+                return None
+            return self._reader._parse_tree_statement(
+                    tree_factory=tree_factory,
+                    taxon_symbol_mapper=taxon_symbol_mapper)
+        else:
+            if splits_only:
+                return self._reader._parse_tree_statement_splits(
+                        nexus_tokenizer=nexus_tokenizer,
+                        taxon_namespace=taxon_symbol_mapper.taxon_namespace,
+                        taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+            if tree_factory is None:
+                self._reader._skip_tree_statement(nexus_tokenizer,
+                        taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+                return None
+            return self._reader._parse_tree_statement(
+                    nexus_tokenizer=nexus_tokenizer,
+                    tree_factory=tree_factory,
+                    taxon_symbol_map_fn=taxon_symbol_mapper.require_taxon_for_symbol)
+
+    ###########################################################################
+    ## Multiprocessing
+
+    def _map_over_processes(self, indexes, num_processes, tree_array_kwargs=None):
+        """
+        Parses the trees at ``indexes`` in a pool of ``num_processes``
+        processes, yielding, in order, a list of the trees (or, if
+        ``tree_array_kwargs`` is given, a |TreeArray| constructed with these,
+        or |None| if any of them references a taxon not in the namespace)
+        for each run of trees handed to a process. These reference the taxon
+        namespace and taxa of this index, not copies of them. After a |None|,
+        the remaining runs are abandoned, and nothing more is yielded.
+        """
+        # Workers get everything except the locations of the tree statements
+        # just once, and then only the locations of the trees in each task.
+        index_data = dict(self._index_data)
+        index_data["collections"] = [dict(collection, trees=[]) for collection in index_data["collections"]]
+        index_kwargs = dict(self._reader_kwargs)
+        index_kwargs["tree_type"] = self.tree_type
+        index_kwargs["encoding"] = self.encoding
+        index_kwargs["_index_data"] = index_data
+        taxa = list(self.taxon_namespace)
+        taxon_labels = [taxon.label for taxon in taxa]
+        # several tasks per process, to even out the load
+        chunk_size = int(math.ceil(len(indexes) / float(num_processes * 4)))
+        tasks = []
+        for idx in range(0, len(indexes), chunk_size):
+            tree_locations = [self._tree_locations[index] for index in indexes[idx:idx+chunk_size]]
+            tasks.append((tree_locations, tree_array_kwargs))
+        is_abandoned = multiprocessing.Event()
+        pool = multiprocessing.Pool(
+                processes=min(num_processes, len(tasks)),
+                initializer=_initialize_worker,
+                initargs=(self.path, self.schema, taxon_labels, index_kwargs, is_abandoned))
+        try:
+            for result in pool.imap(_parse_tree_locations_in_worker, tasks):
+                if result is None:
+                    # The workers skip the remaining tasks, and are then left
+                    # to exit: terminating a worker that is sending back a
+                    # result can leave the pool deadlocked.
+                    is_abandoned.set()
+                    pool.close()
+                    pool.join()
+                    yield None
+                    return
+                yield _unpickle(result, self.taxon_namespace, taxa)
+            pool.close()
+        finally:
+            pool.terminate()
+            pool.join()
+
+# The index of the source in each worker process, the number of taxa in its
+# namespace that are also in that of the main process, and the event set by
+# the main process when the remaining tasks are no longer needed.
+_worker_tree_file_index = None
+_worker_num_shared_taxa = 0
+_worker_is_abandoned = None
+
+def _initialize_worker(path, schema, taxon_labels, index_kwargs, is_abandoned):
+    global _worker_tree_file_index
+    global _worker_num_shared_taxa
+    global _worker_is_abandoned
+    _worker_num_shared_taxa = len(taxon_labels)
+    _worker_is_abandoned = is_abandoned
+    _worker_tree_file_index = TreeFileIndex(path,
+            schema,
+            taxon_namespace=taxonmodel.TaxonNamespace(taxon_labels),
+            is_persistent=False,
+            **index_kwargs)
+
+def _parse_tree_locations_in_worker(task):
+    tree_locations, tree_array_kwargs = task
+    index = _worker_tree_file_index
+    if tree_array_kwargs is None:
+        tree_list = treecollectionmodel.TreeList(
+                taxon_namespace=index.taxon_namespace,
+                tree_type=index.tree_type)
+        for tree in index._parse_tree_locations(tree_locations, tree_list.new_tree):
+            # cached traversals are only valid in this process
+            tree.clear_traversal_cache()
+        result = tree_list._trees
+    else:
+        if _worker_is_abandoned.is_set():
+            return None
+        index.taxon_namespace.is_mutable = False
+        result = treecollectionmodel.TreeArray(
+                taxon_namespace=index.taxon_namespace,
+                **tree_array_kwargs)
+        try:
+            index._add_tree_locations_to_tree_array(result, tree_locations)
+        except error.ImmutableTaxonNamespaceError:
+            # left to the main process
+            return None
+    dest = io.BytesIO()
+    _TaxonReferencePickler(dest, index.taxon_namespace).dump(result)
+    return dest.getvalue()
+
+class _TaxonReferencePickler(pickle.Pickler):
+    """
+    Pickles the taxon namespace and taxa of a worker process as references to
+    the taxon namespace and taxa of the main process, by position in the
+    namespace (the taxa a worker starts off with being the same as those of
+    the main process) or, for taxa added by the worker, by label.
+    """
+
+    def __init__(self, dest, taxon_namespace):
+        pickle.Pickler.__init__(self, dest, pickle.HIGHEST_PROTOCOL)
+        self.taxon_namespace = taxon_namespace
+        self.taxon_positions = dict((taxon, idx) for idx, taxon in enumerate(taxon_namespace))
+        self.num_shared_taxa = _worker_num_shared_taxa
+
+    def persistent_id(self, obj):
+        if obj is self.taxon_namespace:
+            return ("taxon_namespace",)
+        if isinstance(obj, taxonmodel.Taxon):
+            idx = self.taxon_positions.get(obj)
+            if idx is None:
+                # added to the namespace since
+                self.taxon_positions = dict((taxon, idx) for idx, taxon in enumerate(self.taxon_namespace))
+                idx = self.taxon_positions[obj]
+            if idx < self.num_shared_taxa:
+                return ("taxon", idx)
+            return ("taxon_label", obj.label)
+        return None
+
+class _TaxonReferenceUnpickler(pickle.Unpickler):
+
+    def __init__(self, src, taxon_namespace, taxa):
+        pickle.Unpickler.__init__(self, src)
+        self.taxon_namespace = taxon_namespace
+        self.taxa = taxa
+        self.label_taxon_map = {}
+
+    def persistent_load(self, pid):
+        if pid[0] == "taxon_namespace":
+            return self.taxon_namespace
+        if pid[0] == "taxon":
+            return self.taxa[pid[1]]
+        label = pid[1]
+        taxon = self.label_taxon_map.get(label)
+        if taxon is None:
+            taxon = self.taxon_namespace.get_taxon(label, is_case_sensitive=True)
+            if taxon is None:
+                taxon = self.taxon_namespace.new_taxon(label)
+            self.label_taxon_map[label] = taxon
+        return taxon
+
+def _unpickle(data, taxon_namespace, taxa):
+    # Pickling is done explicitly by the workers so that unpickling can be
+    # done here with the cyclic garbage collector paused: otherwise it runs
+    # over and over again as the many objects of the trees are created,
+    # taking up most of the time.
+    is_gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _TaxonReferenceUnpickler(io.BytesIO(data), taxon_namespace, taxa).load()
+    finally:
+        if is_gc_enabled:
+            gc.enable()
@@ -0,0 +1,166 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Writing of trees one at a time, as they are produced.
+"""
+
+import os
+from dendropy import dataio
+from dendropy.utility import error
+from dendropy.utility import textprocessing
+from dendropy.utility import filesys
+from dendropy.datamodel import treecollectionmodel
+
+class TreeStreamWriter(object):
+    """
+    Writes trees to a file one at a time, as they are produced, so that
+    large numbers of trees (e.g., from a simulation) can be written without
+    all of them being kept in memory::
+
+        taxa = dendropy.TaxonNamespace(["A", "B", "C", "D"])
+        with dendropy.TreeStreamWriter("trees.nex", "nexus", taxon_namespace=taxa) as writer:
+            for i in range(100000):
+                writer.write(treesim.pure_kingman_tree(taxon_namespace=taxa))
+
+    Whatever precedes the trees in the schema (e.g., the NEXUS header, "TAXA"
+    block and "TRANSLATE" statement) is written when the first tree is
+    written, and whatever follows them (e.g., the end of the NEXUS "TREES"
+    block) when the writer is closed. All the trees must reference the same
+    |TaxonNamespace|; for NEXUS, all of its taxa must be present by the time
+    the first tree is written.
+
+    The label, metadata annotations and comments of the collection of trees
+    (where the schema supports these) are taken from ``tree_list``, an empty
+    |TreeList| standing for the trees written, and so should be set on it
+    before the first tree is written.
+
+    Trees are streamed for the "newick" and "nexus" schemas. For other
+    schemas, the trees are collected and written when the writer is closed.
+    """
+
+    def __init__(self,
+            dest,
+            schema,
+            taxon_namespace=None,
+            label=None,
+            compression=None,
+            **kwargs):
+        """
+        Parameters
+        ----------
+        dest : str or file-like object
+            Path of the file to write (which is compressed as given by
+            ``compression``), or a file-like object opened for writing, which
+            will not be closed by the writer.
+        schema : str
+            Identifier of the format of the data, e.g. "newick" or "nexus".
+        taxon_namespace : |TaxonNamespace|
+            The |TaxonNamespace| of the trees. If not specified, that of the
+            first tree written is used.
+        label : str
+            Label of the collection of trees (e.g., written as the title of
+            the NEXUS "TREES" block, if block titles are written).
+        compression : str
+            "gzip", "bz2", "xz" or "none". If not specified, then this is
+            inferred from the extension of ``dest``, if a path.
+        \*\*kwargs : keyword arguments, optional
+            Keyword arguments will be passed directly to the writer for the
+            specified schema. See documentation for details on keyword
+            arguments supported by writers of various schemas.
+        """
+        if schema is None:
+            raise error.UnspecifiedSchemaError("Schema must be specified")
+        self.writer = dataio.get_writer(schema, **kwargs)
+        self.tree_list = treecollectionmodel.TreeList(
+                label=label,
+                taxon_namespace=taxon_namespace)
+        self._is_taxon_namespace_set = taxon_namespace is not None
+        self.num_trees_written = 0
+        self._is_opened = False
+        if textprocessing.is_str_type(dest):
+            self.stream = filesys.open_file(
+                    os.path.expandvars(os.path.expanduser(dest)),
+                    "w",
+                    compression=compression)
+            self._is_stream_owned = True
+        else:
+            self.stream = dest
+            self._is_stream_owned = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _open(self):
+        if self.writer.is_tree_streaming_supported:
+            self.writer._write_tree_stream_open(self.stream, self.tree_list)
+        self._is_opened = True
+
+    def write(self, tree):
+        """
+        Writes ``tree``.
+        """
+        if self.stream is None:
+            raise ValueError("Write to closed TreeStreamWriter")
+        if not self._is_taxon_namespace_set:
+            self.tree_list.taxon_namespace = tree.taxon_namespace
+            self._is_taxon_namespace_set = True
+        elif tree.taxon_namespace is not self.tree_list.taxon_namespace:
+            raise error.TaxonNamespaceIdentityError(self.tree_list, tree)
+        if not self._is_opened:
+            self._open()
+        if self.writer.is_tree_streaming_supported:
+            self.writer._write_tree_stream_tree(self.stream,
+                    self.tree_list,
+                    tree,
+                    self.num_trees_written)
+        else:
+            self.tree_list.append(tree)
+        self.num_trees_written += 1
+
+    def write_trees(self, trees):
+        """
+        Writes each of the trees of the iterable ``trees`` (e.g., a
+        generator) in turn.
+        """
+        for tree in trees:
+            self.write(tree)
+
+    def close(self):
+        """
+        Writes whatever follows the trees, and closes the file if opened by
+        the writer.
+        """
+        if self.stream is None:
+            return
+        try:
+            if not self._is_opened:
+                self._open()
+            if self.writer.is_tree_streaming_supported:
+                self.writer._write_tree_stream_close(self.stream, self.tree_list)
+            else:
+                self.writer.write_tree_list(self.tree_list, self.stream)
+                self.tree_list.clear()
+        finally:
+            if self._is_stream_owned:
+                self.stream.close()
+            self.stream = None
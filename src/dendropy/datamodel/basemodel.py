@@ -31,6 +31,7 @@ if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
 from dendropy.utility import container
 from dendropy.utility import bibtex
 from dendropy.utility import textprocessing
+from dendropy.utility import filesys
 from dendropy.utility import urlio
 from dendropy.utility import error
 from dendropy.utility import deprecate
@@ -54,6 +55,19 @@ def _extract_serialization_target_keyword(kwargs, target_type):
     schema = kwargs.pop("schema")
     return found_kw[0], target, schema
 
+def _slot_attribute_names(cls):
+    """
+    Returns the names of all ``__slots__``-backed attributes defined by ``cls``
+    and its bases (excluding the special ``__dict__`` and ``__weakref__``
+    slots).
+    """
+    names = []
+    for c in cls.__mro__:
+        for name in c.__dict__.get("__slots__", ()):
+            if name not in ("__dict__", "__weakref__") and name not in names:
+                names.append(name)
+    return names
+
 ##############################################################################
 ## DataObject
 
@@ -198,7 +212,8 @@ class Deserializable(object):
         Parameters
         ----------
         src : string
-            Full file path to source of data.
+            Full file path to source of data. Files compressed with gzip,
+            bzip2 or xz are decompressed on the fly.
         schema : string
             Specification of data format (e.g., "nexus").
         \*\*kwargs : keyword arguments, optional
@@ -213,7 +228,7 @@ class Deserializable(object):
             New instance of object, constructed and populated from data given
             in source.
         """
-        with open(src, "r", newline=None) as fsrc:
+        with filesys.open_file(src, "r", newline=None) as fsrc:
             return cls._parse_and_create_from_stream(stream=fsrc,
                     schema=schema,
                     **kwargs)
@@ -410,7 +425,7 @@ class MultiReadable(object):
                 - |CharacterMatrix|: number of sequences
                 - |DataSet|: ``tuple`` (number of taxon namespaces, number of tree lists, number of matrices)
         """
-        with open(src, "r", newline=None) as fsrc:
+        with filesys.open_file(src, "r", newline=None) as fsrc:
             return self._parse_and_add_from_stream(stream=fsrc, schema=schema, **kwargs)
 
     def read_from_string(self, src, schema, **kwargs):
@@ -559,7 +574,10 @@ class Serializable(object):
         **Mandatory Destination-Specification Keyword Argument (Exactly One of the Following Required):**
 
             - **file** (*file*) -- File or file-like object opened for writing.
-            - **path** (*str*) -- Path to file to which to write.
+            - **path** (*str*) -- Path to file to which to write. If the
+              path ends with ".gz", ".bz2" or ".xz", then the file is written
+              compressed accordingly, unless a ``compression`` keyword
+              argument ("gzip", "bz2", "xz" or "none") says otherwise.
 
         **Mandatory Schema-Specification Keyword Argument:**
 
@@ -598,8 +616,14 @@ class Serializable(object):
     def write_to_path(self, dest, schema, **kwargs):
         """
         Writes to file specified by ``dest``.
+
+        The file is compressed as given by the keyword argument
+        ``compression`` ("gzip", "bz2", "xz" or "none"); if this is not given,
+        then it is inferred from the extension of ``dest``, so that, e.g.,
+        "trees.nex.gz" is written gzip-compressed.
         """
-        with open(os.path.expandvars(os.path.expanduser(dest)), "w") as f:
+        compression = kwargs.pop("compression", None)
+        with filesys.open_file(os.path.expandvars(os.path.expanduser(dest)), "w", compression=compression) as f:
             return self._format_and_write_to_stream(stream=f, schema=schema, **kwargs)
 
     def as_string(self, schema, **kwargs):
@@ -632,9 +656,28 @@ class Annotable(object):
     or other information as metadata should subclass.
     """
 
+    # Copy-on-write annotations (see
+    # :meth:`Annotable.defer_annotations_copy_from()`): the |Annotation|
+    # objects of a source element are shared, through a "``[annotations,
+    # owner]``" list held as ``_shared_annotations`` by the source and as
+    # ``_deferred_annotations`` by each copy, until the ``annotations`` of
+    # either side are first accessed. A copy then clones the shared objects
+    # for itself (remapping bound attributes of ``owner`` to itself), while
+    # the source leaves clones of them to be shared by the copies instead.
+
     def _get_annotations(self):
         if not hasattr(self, "_annotations"):
             self._annotations = AnnotationSet(self)
+            if hasattr(self, "_deferred_annotations"):
+                shared_annotations, owner = self._deferred_annotations
+                del self._deferred_annotations
+                for a1 in shared_annotations:
+                    a2 = a1.clone()
+                    if a2.is_attribute and a2._value[0] is owner:
+                        a2._value = (self, a2._value[1])
+                    self._annotations.add(a2)
+        elif hasattr(self, "_shared_annotations"):
+            self._unshare_annotations()
         return self._annotations
     def _set_annotations(self, annotations):
         if hasattr(self, "_annotations") \
@@ -643,7 +686,13 @@ class Annotable(object):
             return
         if not isinstance(annotations, AnnotationSet):
             raise ValueError("Cannot set 'annotations' to object of type '{}'".format(type(annotations)))
+        if hasattr(self, "_shared_annotations"):
+            self._unshare_annotations()
+        if hasattr(self, "_deferred_annotations"):
+            del self._deferred_annotations
         old_target = annotations.target
+        if hasattr(old_target, "_shared_annotations"):
+            old_target._unshare_annotations()
         self._annotations = annotations
         self._annotations.target = self
         for a in self._annotations:
@@ -652,9 +701,53 @@ class Annotable(object):
     annotations = property(_get_annotations, _set_annotations)
 
     def _has_annotations(self):
+        if hasattr(self, "_deferred_annotations"):
+            return len(self._deferred_annotations[0]) > 0
         return hasattr(self, "_annotations") and len(self._annotations) > 0
     has_annotations = property(_has_annotations)
 
+    def _unshare_annotations(self):
+        shared = self._shared_annotations
+        del self._shared_annotations
+        shared[0] = tuple(a.clone() for a in shared[0])
+
+    def defer_annotations_copy_from(self, other):
+        """
+        Replaces the annotations of ``self`` with copies of those of
+        ``other`` (as by :meth:`Annotable.copy_annotations_from()`, with
+        references to ``other`` in bound-attribute annotations remapped to
+        ``self``), copied on write.
+
+        No |Annotation| objects are copied here: ``self`` and ``other`` share
+        those of ``other`` until the ``annotations`` of either are first
+        accessed, when the side accessed copies them. Subsequent changes to
+        the annotations of ``other`` are therefore not reflected in ``self``,
+        and vice versa, provided that they are made through
+        the ``annotations`` property (and not through references to
+        |AnnotationSet| or |Annotation| objects obtained before this call).
+
+        Parameters
+        ----------
+
+        ``other`` : |Annotable|
+            Source of annotations to copy.
+        """
+        if hasattr(self, "_shared_annotations"):
+            self._unshare_annotations()
+        if hasattr(self, "_annotations"):
+            del self._annotations
+        if hasattr(other, "_deferred_annotations"):
+            # share the annotations that ``other`` is yet to copy
+            shared = other._deferred_annotations
+        elif hasattr(other, "_shared_annotations"):
+            shared = other._shared_annotations
+        elif hasattr(other, "_annotations") and len(other._annotations) > 0:
+            shared = [tuple(other._annotations), other]
+            other._shared_annotations = shared
+        else:
+            shared = [(), other]
+        self._deferred_annotations = shared
+
     def copy_annotations_from(self,
             other,
             attribute_object_mapper=None):
@@ -703,6 +796,8 @@ class Annotable(object):
             instead.
 
         """
+        if hasattr(other, "_deferred_annotations"):
+            other.annotations
         if hasattr(other, "_annotations"):
             if attribute_object_mapper is None:
                 attribute_object_mapper = {id(object):self}
@@ -720,6 +815,8 @@ class Annotable(object):
         (i.e., a reference to a particular entity may be absolute regardless of
         context).
         """
+        if hasattr(other, "_deferred_annotations"):
+            other.annotations
         if hasattr(other, "_annotations"):
             # if not isinstance(self, other.__class__) or not isinstance(other, self.__class__):
             if type(self) is not type(other):
@@ -757,7 +854,7 @@ class Annotable(object):
         other = self.__class__()
         memo[id(self)] = other
         for k in self.__dict__:
-            if k == "_annotations":
+            if k == "_annotations" or k == "_shared_annotations":
                 continue
             other.__dict__[k] = copy.copy(self.__dict__[k])
             memo[id(self.__dict__[k])] = other.__dict__[k]
@@ -778,13 +875,25 @@ class Annotable(object):
             memo[id(self)] = other
         # copy other attributes first, skipping annotations
         for k in self.__dict__:
-            if k == "_annotations":
+            if k in ("_annotations", "_deferred_annotations", "_shared_annotations"):
                 continue
             if k in other.__dict__:
                 continue
             other.__dict__[k] = copy.deepcopy(self.__dict__[k], memo)
             memo[id(self.__dict__[k])] = other.__dict__[k]
             # assert id(self.__dict__[k]) in memo
+        # copy attributes stored in slots (e.g., compact tree components)
+        for k in _slot_attribute_names(self.__class__):
+            if k == "_annotations":
+                continue
+            try:
+                v = getattr(self, k)
+            except AttributeError:
+                continue
+            if hasattr(other, k):
+                continue
+            setattr(other, k, copy.deepcopy(v, memo))
+            memo[id(v)] = getattr(other, k)
         # create annotations
         other.deep_copy_annotations_from(self, memo)
         # return
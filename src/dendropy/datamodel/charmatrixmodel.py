@@ -24,6 +24,7 @@ Character and character-sequence data structures.
 import warnings
 import copy
 import math
+import itertools
 import collections
 from dendropy.utility.textprocessing import StringIO
 from dendropy.utility import textprocessing
@@ -132,6 +133,11 @@ class CharacterDataSequence(
 
     """
 
+    # Incremented by every method that changes the values of a sequence, so
+    # that results derived from these, such as the site patterns of a matrix,
+    # can be cached and rebuilt only when the values have changed.
+    _values_version = 0
+
     ###############################################################################
     ## Life-cycle
 
@@ -213,6 +219,7 @@ class CharacterDataSequence(
         self._character_values.append(character_value)
         self._character_types.append(character_type)
         self._character_annotations.append(character_annotations)
+        self._values_version += 1
 
     def extend(self, character_values, character_types=None, character_annotations=None):
         """
@@ -238,6 +245,7 @@ class CharacterDataSequence(
         else:
             assert len(character_annotations) == len(character_values)
             self._character_annotations.extend(character_annotations)
+        self._values_version += 1
 
     def __len__(self):
         return len(self._character_values)
@@ -247,6 +255,7 @@ class CharacterDataSequence(
 
     def __setitem__(self, idx, value):
         self._character_values[idx] = value
+        self._values_version += 1
 
     def __iter__(self):
         return self.__next__()
@@ -269,6 +278,7 @@ class CharacterDataSequence(
         del self._character_values[idx]
         del self._character_types[idx]
         del self._character_annotations[idx]
+        self._values_version += 1
 
     def set_at(self, idx, character_value, character_type=None, character_annotations=None):
         """
@@ -293,6 +303,7 @@ class CharacterDataSequence(
         self._character_values[idx] = character_value
         self._character_types[idx] = character_type
         self._character_annotations[idx] = character_annotations
+        self._values_version += 1
 
     def insert(self, idx, character_value, character_type=None, character_annotations=None):
         """
@@ -313,6 +324,7 @@ class CharacterDataSequence(
         self._character_values.insert(idx, character_value)
         self._character_types.insert(idx, character_type)
         self._character_annotations.insert(idx, character_annotations)
+        self._values_version += 1
 
     def value_at(self, idx):
         """
@@ -500,6 +512,7 @@ class CharacterMatrix(
 
     data_type = None
     character_sequence_type = CharacterDataSequence
+    byte_coded_character_sequence_type = None
 
     ###########################################################################
     ### Factory (Class) Methods
@@ -546,7 +559,8 @@ class CharacterMatrix(
         **Mandatory Source-Specification Keyword Argument (Exactly One of the Following Required):**
 
             - **file** (*file*) -- File or file-like object of data opened for reading.
-            - **path** (*str*) -- Path to file of data.
+            - **path** (*str*) -- Path to file of data (which may be
+              compressed with gzip, bzip2 or xz).
             - **url** (*str*) -- URL of data.
             - **data** (*str*) -- Data given directly.
 
@@ -764,11 +778,14 @@ class CharacterMatrix(
     ### Lifecycle and Identity
 
     def __init__(self, *args, **kwargs):
+        byte_coded = kwargs.pop("byte_coded", None)
         if len(args) > 1:
             # only allow 1 positional argument
             raise error.TooManyArgumentsError(func_name=self.__class__.__name__, max_args=1, args=args)
         elif len(args) == 1 and isinstance(args[0], CharacterMatrix):
             self._clone_from(args[0], kwargs)
+            if byte_coded is not None:
+                self.is_byte_coded = byte_coded
         else:
             basemodel.DataObject.__init__(self, label=kwargs.pop("label", None))
             taxonmodel.TaxonNamespaceAssociated.__init__(self,
@@ -777,6 +794,8 @@ class CharacterMatrix(
             self.character_types = []
             self.comments = []
             self.character_subsets = container.OrderedCaselessDict()
+            if byte_coded:
+                self.is_byte_coded = byte_coded
             if len(args) == 1:
                 # takes care of all possible initializations, including. e.g.,
                 # tuples and so on
@@ -812,6 +831,7 @@ class CharacterMatrix(
     def __copy__(self):
         other = self.__class__(label=self.label,
             taxon_namespace=self.taxon_namespace)
+        other.character_sequence_type = self.character_sequence_type
         for taxon in self._taxon_sequence_map:
             # other._taxon_sequence_map[taxon] = self.__class__.character_sequence_type(self._taxon_sequence_map[taxon])
             other._taxon_sequence_map[taxon] = self._taxon_sequence_map[taxon]
@@ -831,6 +851,47 @@ class CharacterMatrix(
     def __deepcopy__(self, memo=None):
         return basemodel.Annotable.__deepcopy__(self, memo=memo)
 
+    def _get_is_byte_coded(self):
+        """
+        |True| if the sequences of this matrix are stored compactly as arrays
+        of single-byte state codes (see `ByteCodedCharacterDataSequence`),
+        which is supported by `FixedAlphabetCharacterMatrix` types (e.g.,
+        |DnaCharacterMatrix| or |ProteinCharacterMatrix|), or |False| if the
+        sequences are stored as lists of values. Setting this converts the
+        sequences of the matrix as needed. Byte-coded matrices can also be
+        created directly by passing ``byte_coded=True`` to the constructor or
+        to the ``get()`` method (for the "fasta", "phylip" and "nexus"
+        schemas).
+        """
+        return (self.byte_coded_character_sequence_type is not None
+                and self.character_sequence_type is self.byte_coded_character_sequence_type)
+    def _set_is_byte_coded(self, value):
+        if not value:
+            sequence_type = self.__class__.character_sequence_type
+        elif self.byte_coded_character_sequence_type is None:
+            raise TypeError("Byte-coded sequences are not supported by {}".format(self.__class__.__name__))
+        else:
+            sequence_type = self.byte_coded_character_sequence_type
+        if sequence_type is self.character_sequence_type:
+            return
+        self.character_sequence_type = sequence_type
+        is_byte_coded = sequence_type is self.byte_coded_character_sequence_type
+        for taxon in self._taxon_sequence_map:
+            s = self._taxon_sequence_map[taxon]
+            if (isinstance(s, sequence_type)
+                    and isinstance(s, ByteCodedCharacterDataSequence) == is_byte_coded):
+                continue
+            s2 = sequence_type(s)
+            for idx, (value, character_type, character_annotations) in enumerate(s.cell_iter()):
+                if character_type is not None:
+                    s2.set_character_type_at(idx, character_type)
+                if character_annotations is not None:
+                    s2.set_annotations_at(idx, character_annotations)
+            if s.has_annotations:
+                s2.annotations = s.annotations
+            self._taxon_sequence_map[taxon] = s2
+    is_byte_coded = property(_get_is_byte_coded, _set_is_byte_coded)
+
     ###########################################################################
     ### Data I/O
 
@@ -993,7 +1054,7 @@ class CharacterMatrix(
             raise ValueError("Character values vector for taxon {} already exists".format(repr(taxon)))
         if taxon not in self.taxon_namespace:
             raise ValueError("Taxon {} is not in object taxon namespace".format(repr(taxon)))
-        cv = self.__class__.character_sequence_type(values)
+        cv = self.character_sequence_type(values)
         self._taxon_sequence_map[taxon] = cv
         return cv
 
@@ -1055,8 +1116,8 @@ class CharacterMatrix(
         taxon = self._resolve_key(key)
         if taxon not in self.taxon_namespace:
             raise ValueError(repr(key))
-        if not isinstance(values, self.__class__.character_sequence_type):
-            values = self.__class__.character_sequence_type(values)
+        if not isinstance(values, self.character_sequence_type):
+            values = self.character_sequence_type(values)
         self._taxon_sequence_map[taxon] = values
 
     def __contains__(self, key):
@@ -1342,7 +1403,7 @@ class CharacterMatrix(
             raise error.TaxonNamespaceIdentityError(self, other_matrix)
         for taxon in other_matrix._taxon_sequence_map:
             if taxon not in self._taxon_sequence_map:
-                self._taxon_sequence_map[taxon] = self.__class__.character_sequence_type(other_matrix._taxon_sequence_map[taxon])
+                self._taxon_sequence_map[taxon] = self.character_sequence_type(other_matrix._taxon_sequence_map[taxon])
 
     def replace_sequences(self, other_matrix):
         """
@@ -1367,7 +1428,7 @@ class CharacterMatrix(
             raise error.TaxonNamespaceIdentityError(self, other_matrix)
         for taxon in other_matrix._taxon_sequence_map:
             if taxon in self._taxon_sequence_map:
-                self._taxon_sequence_map[taxon] = self.__class__.character_sequence_type(other_matrix._taxon_sequence_map[taxon])
+                self._taxon_sequence_map[taxon] = self.character_sequence_type(other_matrix._taxon_sequence_map[taxon])
 
     def update_sequences(self, other_matrix):
         """
@@ -1393,7 +1454,7 @@ class CharacterMatrix(
         if other_matrix.taxon_namespace is not self.taxon_namespace:
             raise error.TaxonNamespaceIdentityError(self, other_matrix)
         for taxon in other_matrix._taxon_sequence_map:
-            self._taxon_sequence_map[taxon] = self.__class__.character_sequence_type(other_matrix._taxon_sequence_map[taxon])
+            self._taxon_sequence_map[taxon] = self.character_sequence_type(other_matrix._taxon_sequence_map[taxon])
 
     def extend_sequences(self, other_matrix):
         """
@@ -1451,7 +1512,7 @@ class CharacterMatrix(
             if taxon in self._taxon_sequence_map:
                 self._taxon_sequence_map[taxon].extend(other_matrix._taxon_sequence_map[taxon])
             else:
-                self._taxon_sequence_map[taxon]= self.__class__.character_sequence_type(other_matrix._taxon_sequence_map[taxon])
+                self._taxon_sequence_map[taxon]= self.character_sequence_type(other_matrix._taxon_sequence_map[taxon])
 
     def remove_sequences(self, taxa):
         """
@@ -1708,6 +1769,68 @@ class ContinuousCharacterMatrix(CharacterMatrix):
 
 ### Discrete Characters ##################################################
 
+class SitePatterns(object):
+    """
+    The distinct site patterns (columns) of a |DiscreteCharacterMatrix|, as
+    returned by :meth:`DiscreteCharacterMatrix.compress_site_patterns()`.
+
+    Attributes
+    ----------
+    taxa : tuple of |Taxon|
+        The taxa of the matrix, in the order of the states of each pattern.
+    patterns : tuple of tuples of |StateIdentity|
+        The distinct columns of the matrix, in order of first occurrence,
+        each given by the states of ``taxa`` at the site.
+    weights : tuple of ints
+        The number of sites showing each pattern.
+    site_pattern_indexes : tuple of ints
+        The index (in ``patterns``) of the pattern of each site.
+    """
+
+    def __init__(self, taxa, patterns, weights, site_pattern_indexes):
+        self.taxa = tuple(taxa)
+        self.patterns = tuple(patterns)
+        self.weights = tuple(weights)
+        self.site_pattern_indexes = tuple(site_pattern_indexes)
+
+    def __len__(self):
+        return len(self.patterns)
+
+    def _get_num_sites(self):
+        return len(self.site_pattern_indexes)
+    num_sites = property(_get_num_sites)
+
+    def sequences(self):
+        """
+        Returns the states of each taxon across the patterns, i.e., the rows
+        of the compressed matrix.
+
+        Returns
+        -------
+        s : list of lists of |StateIdentity|
+            List of the states of each taxon at each pattern, in the order
+            of ``taxa``.
+        """
+        if not self.patterns:
+            return [[] for taxon in self.taxa]
+        return [list(row) for row in zip(*self.patterns)]
+
+    def expand(self, pattern_values):
+        """
+        Maps values calculated for each pattern back to the sites.
+
+        Parameters
+        ----------
+        pattern_values : list
+            A value for each pattern.
+
+        Returns
+        -------
+        v : list
+            The value of the pattern of each site.
+        """
+        return [pattern_values[idx] for idx in self.site_pattern_indexes]
+
 class DiscreteCharacterDataSequence(CharacterDataSequence):
     pass
 
@@ -1721,6 +1844,7 @@ class DiscreteCharacterMatrix(CharacterMatrix):
         CharacterMatrix.__init__(self, *args, **kwargs)
         self.state_alphabets = []
         self._default_state_alphabet = None
+        self._site_patterns_cache = None
 
     def _get_default_state_alphabet(self):
         if self._default_state_alphabet is not None:
@@ -1781,11 +1905,79 @@ class DiscreteCharacterMatrix(CharacterMatrix):
                 state_alphabet=self.default_state_alphabet,
                 purge_other_state_alphabets=purge_other_state_alphabets)
 
+    def compress_site_patterns(self):
+        """
+        Returns the distinct site patterns (columns) of this matrix, together
+        with the number of sites showing each pattern and the pattern of each
+        site. Calculations in which sites contribute independently, e.g.
+        parsimony scores (see :func:`dendropy.model.parsimony.parsimony_score`)
+        or the number of segregating sites (see
+        :mod:`dendropy.calculate.popgenstat`), can then be carried out once
+        per pattern, weighted by the pattern counts, rather than once per site.
+
+        The result is cached, and is only rebuilt if sequences have been
+        added, removed or reordered, or their values changed, since it was
+        last calculated. Note that changes made directly to the list returned
+        by `CharacterDataSequence.values()` are not detected.
+
+        Returns
+        -------
+        p : `SitePatterns`
+            The site patterns of this matrix.
+
+        Raises
+        ------
+        ValueError
+            If the sequences of this matrix are not all of the same length.
+        """
+        taxa = []
+        sequences = []
+        cache_key = []
+        for taxon, seq in self.items():
+            taxa.append(taxon)
+            sequences.append(seq)
+            cache_key.append((taxon, seq, seq._values_version))
+        if self._site_patterns_cache is not None and self._site_patterns_cache[0] == cache_key:
+            return self._site_patterns_cache[1]
+        if len(set(len(seq) for seq in sequences)) > 1:
+            raise ValueError("Cannot compress site patterns of sequences of unequal length")
+        if sequences and all(
+                isinstance(seq, ByteCodedCharacterDataSequence)
+                    and seq.state_alphabet is sequences[0].state_alphabet
+                for seq in sequences):
+            # columns of state codes are cheaper to hash than columns of
+            # |StateIdentity| objects; decoded once for each distinct column
+            columns = zip(*[seq._state_codes for seq in sequences])
+            states = sequences[0]._get_state_coding().states
+        else:
+            columns = zip(*sequences)
+            states = None
+        pattern_indexes = {}
+        site_pattern_indexes = [pattern_indexes.setdefault(column, len(pattern_indexes))
+                for column in columns]
+        patterns = [None] * len(pattern_indexes)
+        for column, idx in pattern_indexes.items():
+            if states is None:
+                patterns[idx] = column
+            else:
+                patterns[idx] = tuple(states[code] for code in column)
+        weights = [0] * len(patterns)
+        for idx in site_pattern_indexes:
+            weights[idx] += 1
+        site_patterns = SitePatterns(
+                taxa=taxa,
+                patterns=patterns,
+                weights=weights,
+                site_pattern_indexes=site_pattern_indexes)
+        self._site_patterns_cache = (cache_key, site_patterns)
+        return site_patterns
+
     def taxon_state_sets_map(self,
             char_indices=None,
             gaps_as_missing=True,
             gap_state=None,
-            no_data_state=None):
+            no_data_state=None,
+            site_patterns=None):
         """
         Returns a dictionary that maps taxon objects to lists of sets of
         fundamental state indices.
@@ -1796,12 +1988,20 @@ class DiscreteCharacterMatrix(CharacterMatrix):
         char_indices : iterable of ints
             An iterable of indexes of characters to include (by column). If not
             given or |None| [default], then all characters are included.
+            If ``site_patterns`` is given, these are indexes of patterns.
 
         gaps_as_missing : boolean
             If |True| [default] then gap characters will be treated as missing
             data values. If |False|, then they will be treated as an additional
             (fundamental) state.`
 
+        site_patterns : `SitePatterns`
+            If given, the site patterns of this matrix as returned by
+            :meth:`DiscreteCharacterMatrix.compress_site_patterns()`, in which
+            case the lists of state sets are given for each pattern rather
+            than for each site, for use with the pattern weights, ``weights``,
+            of ``site_patterns``.
+
         Returns
         -------
         d : dict
@@ -1841,8 +2041,11 @@ class DiscreteCharacterMatrix(CharacterMatrix):
 
         """
         taxon_to_state_indices = {}
-        for t in self:
-            cdv = self[t]
+        if site_patterns is None:
+            taxon_sequences = self.items()
+        else:
+            taxon_sequences = zip(site_patterns.taxa, site_patterns.sequences())
+        for t, cdv in taxon_sequences:
             if char_indices is None:
                 ci = range(len(cdv))
             else:
@@ -1907,6 +2110,505 @@ class DiscreteCharacterMatrix(CharacterMatrix):
 class FixedAlphabetCharacterDataSequence(CharacterDataSequence):
     pass
 
+class _StateByteCoding(object):
+    """
+    Assigns to each of the states of a |StateAlphabet| the single-byte code
+    with which it is stored by `ByteCodedCharacterDataSequence` objects.
+
+    Codes are assigned in the order of the states in the alphabet and, once
+    assigned, never change: states added to the alphabet later (e.g.,
+    ambiguous states defined in a NEXUS file) are assigned the next codes
+    available, even though their addition may change the indexes of the
+    existing states in the alphabet.
+    """
+
+    MAX_STATES = 255
+    INVALID_CODE = 255
+    INVALID_CODE_BYTES = b"\xff"
+
+    def __init__(self, state_alphabet):
+        self.state_alphabet = state_alphabet
+        self.states = []
+        self.state_codes = {}
+        self._alphabet_states = None
+        self._symbol_state_map = None
+        self._symbol_code_table = None
+        self._code_symbol_table = None
+        self._code_symbol_table_num_states = None
+        self.update()
+
+    def update(self):
+        """
+        Assigns codes to the states added to the alphabet since last updated.
+        """
+        alphabet_states = self.state_alphabet.states
+        if alphabet_states is self._alphabet_states:
+            return
+        for state in alphabet_states:
+            if state not in self.state_codes:
+                if len(self.states) == self.MAX_STATES:
+                    raise ValueError("Cannot code more than {} states of state alphabet '{}' as bytes".format(
+                        self.MAX_STATES,
+                        self.state_alphabet.label))
+                self.state_codes[state] = len(self.states)
+                self.states.append(state)
+        self._alphabet_states = alphabet_states
+
+    def code_for_value(self, value):
+        """
+        Returns the code of ``value``, which can be a |StateIdentity| of the
+        alphabet, a symbol of a state of the alphabet, or |None| (for the
+        no-data state of the alphabet).
+        """
+        try:
+            return self.state_codes[value]
+        except (KeyError, TypeError):
+            pass
+        self.update()
+        if value is None or textprocessing.is_str_type(value):
+            value = self.state_alphabet.full_symbol_state_map.get(value, value)
+        try:
+            return self.state_codes[value]
+        except (KeyError, TypeError):
+            raise ValueError("'{}' is not a state of state alphabet '{}'".format(
+                value,
+                self.state_alphabet.label))
+
+    def codes_for_values(self, values):
+        """
+        Returns a ``bytearray`` of the codes of ``values``.
+        """
+        state_codes = self.state_codes
+        try:
+            return bytearray([state_codes[v] for v in values])
+        except (KeyError, TypeError):
+            code_for_value = self.code_for_value
+            return bytearray([code_for_value(v) for v in values])
+
+    def symbol_code_table(self):
+        """
+        Returns a table (as used by ``bytes.translate()``) mapping each ASCII
+        symbol of the alphabet to the code of the corresponding state, and
+        any other byte to ``INVALID_CODE``.
+        """
+        self.update()
+        symbol_state_map = self.state_alphabet.full_symbol_state_map
+        if symbol_state_map is not self._symbol_state_map:
+            table = bytearray([self.INVALID_CODE]) * 256
+            for symbol, state in symbol_state_map.items():
+                if symbol is not None and len(symbol) == 1 and ord(symbol) < 128:
+                    table[ord(symbol)] = self.state_codes[state]
+            self._symbol_code_table = bytes(table)
+            self._symbol_state_map = symbol_state_map
+        return self._symbol_code_table
+
+    def code_symbol_table(self):
+        """
+        Returns a table (as used by ``bytes.translate()``) mapping each code
+        to the ASCII symbol of the corresponding state, or |None| if not all
+        states are represented by single ASCII characters.
+        """
+        if self._code_symbol_table_num_states != len(self.states):
+            table = bytearray(256)
+            for code, state in enumerate(self.states):
+                symbol = str(state)
+                if len(symbol) != 1 or ord(symbol) >= 128:
+                    table = None
+                    break
+                table[code] = ord(symbol)
+            if table is None:
+                self._code_symbol_table = None
+            else:
+                self._code_symbol_table = bytes(table)
+            self._code_symbol_table_num_states = len(self.states)
+        return self._code_symbol_table
+
+_state_byte_codings = {}
+
+def _get_state_byte_coding(state_alphabet):
+    try:
+        return _state_byte_codings[state_alphabet]
+    except KeyError:
+        coding = _StateByteCoding(state_alphabet)
+        _state_byte_codings[state_alphabet] = coding
+        return coding
+
+class ByteCodedCharacterDataSequence(FixedAlphabetCharacterDataSequence):
+    """
+    A `CharacterDataSequence` of states of a fixed |StateAlphabet| (given by
+    the class attribute ``state_alphabet``), stored compactly as a
+    ``bytearray`` of single-byte state codes rather than as a list of
+    references to |StateIdentity| objects. The lists of character types and
+    metadata annotations of the elements are only allocated when any of these
+    are set.
+
+    Otherwise, objects of this class behave as `CharacterDataSequence`
+    objects, with indexing and iteration returning the |StateIdentity|
+    objects represented by the codes. Values stored must be states of
+    ``state_alphabet`` or symbols of these, with |None| being stored as the
+    no-data state of the alphabet.
+
+    Sequences of this type are used by `FixedAlphabetCharacterMatrix` objects
+    (e.g., |DnaCharacterMatrix| or |ProteinCharacterMatrix|) that are
+    byte-coded: see :attr:`CharacterMatrix.is_byte_coded`.
+    """
+
+    state_alphabet = None
+
+    def __init__(self,
+            character_values=None,
+            character_types=None,
+            character_annotations=None):
+        """
+        Parameters
+        ----------
+        character_values : iterable of values
+            A set of values for this sequence.
+        """
+        self._state_codes = bytearray()
+        self._character_types = None
+        self._character_annotations = None
+        if character_values:
+            self.extend(
+                    character_values=character_values,
+                    character_types=character_types,
+                    character_annotations=character_annotations)
+
+    def _get_state_coding(self):
+        return _get_state_byte_coding(self.state_alphabet)
+
+    def _require_character_types(self):
+        if self._character_types is None:
+            self._character_types = [None] * len(self._state_codes)
+        return self._character_types
+
+    def _require_character_annotations(self):
+        if self._character_annotations is None:
+            self._character_annotations = [None] * len(self._state_codes)
+        return self._character_annotations
+
+    def values(self):
+        """
+        Returns list of values of this vector. Unlike
+        `CharacterDataSequence.values()`, this is a new list, changes to which
+        are not reflected in this vector.
+
+        Returns
+        -------
+        v : list
+            List of values making up this vector.
+        """
+        return list(self)
+
+    def symbols_as_list(self):
+        """
+        Returns list of string representation of values of this vector.
+
+        Returns
+        -------
+        v : list
+            List of string representation of values making up this vector.
+        """
+        return [str(cs) for cs in self]
+
+    def symbols_as_string(self, sep=""):
+        """
+        Returns values of this vector as a single string, with individual value
+        elements separated by ``sep``.
+
+        Returns
+        -------
+        s : string
+            String representation of values making up this vector.
+        """
+        if not sep:
+            table = self._get_state_coding().code_symbol_table()
+            if table is not None:
+                return self._state_codes.translate(table).decode("ascii")
+        return sep.join(str(cs) for cs in self)
+
+    def extend_symbols(self, symbols):
+        """
+        Extends ``self`` with the states represented by the string of
+        single-character symbols ``symbols``, ignoring any whitespace, if all
+        the symbols are recognized.
+
+        Parameters
+        ----------
+        symbols : str
+            String of state symbols.
+
+        Returns
+        -------
+        b : bool
+            |True| if ``self`` was extended, or |False| (with ``self`` left
+            unchanged) if any symbol was not recognized.
+        """
+        coding = self._get_state_coding()
+        try:
+            encoded = symbols.encode("ascii")
+        except UnicodeError:
+            return False
+        codes = encoded.translate(coding.symbol_code_table(), b" \t\r\n")
+        if coding.INVALID_CODE_BYTES in codes:
+            return False
+        if self._character_types is not None:
+            self._character_types.extend([None] * len(codes))
+        if self._character_annotations is not None:
+            self._character_annotations.extend([None] * len(codes))
+        self._state_codes.extend(codes)
+        self._values_version += 1
+        return True
+
+    def append(self, character_value, character_type=None, character_annotations=None):
+        """
+        Adds a value to ``self``.
+
+        Parameters
+        ----------
+        character_value : object
+            Value to be stored.
+        character_type : |CharacterType|
+            Description of character value.
+        character_annotations : |AnnotationSet|
+            Metadata annotations associated with this character.
+        """
+        code = self._get_state_coding().code_for_value(character_value)
+        if character_type is not None or self._character_types is not None:
+            self._require_character_types().append(character_type)
+        if character_annotations is not None or self._character_annotations is not None:
+            self._require_character_annotations().append(character_annotations)
+        self._state_codes.append(code)
+        self._values_version += 1
+
+    def extend(self, character_values, character_types=None, character_annotations=None):
+        """
+        Extends ``self`` with values.
+
+        Parameters
+        ----------
+        character_values : iterable of objects
+            Values to be stored.
+        character_types : iterable of |CharacterType| objects
+            Descriptions of character values.
+        character_annotations : iterable |AnnotationSet| objects
+            Metadata annotations associated with characters.
+        """
+        if (isinstance(character_values, ByteCodedCharacterDataSequence)
+                and character_values.state_alphabet is self.state_alphabet):
+            codes = character_values._state_codes
+        else:
+            codes = self._get_state_coding().codes_for_values(character_values)
+        if character_types is None:
+            if self._character_types is not None:
+                self._character_types.extend( [None] * len(codes) )
+        else:
+            assert len(character_types) == len(codes)
+            self._require_character_types().extend(character_types)
+        if character_annotations is None:
+            if self._character_annotations is not None:
+                self._character_annotations.extend( [None] * len(codes) )
+        else:
+            assert len(character_annotations) == len(codes)
+            self._require_character_annotations().extend(character_annotations)
+        self._state_codes.extend(codes)
+        self._values_version += 1
+
+    def __len__(self):
+        return len(self._state_codes)
+
+    def __getitem__(self, idx):
+        states = self._get_state_coding().states
+        if isinstance(idx, slice):
+            return [states[code] for code in self._state_codes[idx]]
+        return states[self._state_codes[idx]]
+
+    def __setitem__(self, idx, value):
+        coding = self._get_state_coding()
+        if isinstance(idx, slice):
+            self._state_codes[idx] = coding.codes_for_values(value)
+        else:
+            self._state_codes[idx] = coding.code_for_value(value)
+        self._values_version += 1
+
+    def __iter__(self):
+        return iter(map(self._get_state_coding().states.__getitem__, self._state_codes))
+
+    def __next__(self):
+        return self.__iter__()
+
+    next = __next__ # Python 2 legacy support
+
+    def cell_iter(self):
+        """
+        Iterate over triplets of character values and associated
+        |CharacterType| and |AnnotationSet| instances.
+        """
+        character_types = self._character_types
+        if character_types is None:
+            character_types = itertools.repeat(None)
+        character_annotations = self._character_annotations
+        if character_annotations is None:
+            character_annotations = itertools.repeat(None)
+        return zip(self, character_types, character_annotations)
+
+    def __delitem__(self, idx):
+        del self._state_codes[idx]
+        if self._character_types is not None:
+            del self._character_types[idx]
+        if self._character_annotations is not None:
+            del self._character_annotations[idx]
+        self._values_version += 1
+
+    def set_at(self, idx, character_value, character_type=None, character_annotations=None):
+        """
+        Set value and associated character type and metadata annotations for
+        element at ``idx``. Elements added to reach ``idx`` are set to the
+        no-data state.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element to set.
+        character_value : object
+            Value to be stored.
+        character_type : |CharacterType|
+            Description of character value.
+        character_annotations : |AnnotationSet|
+            Metadata annotations associated with this character.
+        """
+        to_add = (idx+1) - len(self._state_codes)
+        while to_add > 0:
+            self.append(None)
+            to_add -= 1
+        code = self._get_state_coding().code_for_value(character_value)
+        self._state_codes[idx] = code
+        self._values_version += 1
+        if character_type is not None or self._character_types is not None:
+            self._require_character_types()[idx] = character_type
+        if character_annotations is not None or self._character_annotations is not None:
+            self._require_character_annotations()[idx] = character_annotations
+
+    def insert(self, idx, character_value, character_type=None, character_annotations=None):
+        """
+        Insert value and associated character type and metadata annotations for
+        element at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element to set.
+        character_value : object
+            Value to be stored.
+        character_type : |CharacterType|
+            Description of character value.
+        character_annotations : |AnnotationSet|
+            Metadata annotations associated with this character.
+        """
+        code = self._get_state_coding().code_for_value(character_value)
+        if character_type is not None or self._character_types is not None:
+            self._require_character_types().insert(idx, character_type)
+        if character_annotations is not None or self._character_annotations is not None:
+            self._require_character_annotations().insert(idx, character_annotations)
+        self._state_codes.insert(idx, code)
+        self._values_version += 1
+
+    def value_at(self, idx):
+        """
+        Return value of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element value to return.
+
+        Returns
+        -------
+        c : object
+            Value of character at index ``idx``.
+        """
+        return self._get_state_coding().states[self._state_codes[idx]]
+
+    def character_type_at(self, idx):
+        """
+        Return type of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element character type to return.
+
+        Returns
+        -------
+        c : |CharacterType|
+            |CharacterType| associated with character index ``idx``.
+        """
+        if self._character_types is None:
+            self._state_codes[idx] # raises IndexError if out of range
+            return None
+        return self._character_types[idx]
+
+    def annotations_at(self, idx):
+        """
+        Return metadata annotations of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element annotations to return.
+
+        Returns
+        -------
+        c : |AnnotationSet|
+            |AnnotationSet| representing metadata annotations of character at index ``idx``.
+        """
+        character_annotations = self._require_character_annotations()
+        if character_annotations[idx] is None:
+            character_annotations[idx] = basemodel.AnnotationSet(self.character_type_at(idx))
+        return character_annotations[idx]
+
+    def has_annotations_at(self, idx):
+        """
+        Return |True| if character at ``idx`` has metadata annotations.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element annotations to check.
+
+        Returns
+        -------
+        b : bool
+            |True| if character at ``idx`` has metadata annotations, |False|
+            otherwise.
+        """
+        if self._character_annotations is None:
+            self._state_codes[idx] # raises IndexError if out of range
+            return False
+        return not self._character_annotations[idx] is None
+
+    def set_character_type_at(self, idx, character_type):
+        """
+        Set type of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element character type to set.
+        """
+        self._require_character_types()[idx] = character_type
+
+    def set_annotations_at(self, idx, annotations):
+        """
+        Set metadata annotations of character at ``idx``.
+
+        Parameters
+        ----------
+        idx : integer
+            Index of element annotations to set.
+        """
+        self._require_character_annotations()[idx] = annotations
+
 class FixedAlphabetCharacterMatrix(DiscreteCharacterMatrix):
 
     character_sequence_type = FixedAlphabetCharacterDataSequence
@@ -1930,11 +2632,17 @@ class FixedAlphabetCharacterMatrix(DiscreteCharacterMatrix):
 class DnaCharacterDataSequence(FixedAlphabetCharacterDataSequence):
     pass
 
+class ByteCodedDnaCharacterDataSequence(
+        ByteCodedCharacterDataSequence,
+        DnaCharacterDataSequence):
+    state_alphabet = DNA_STATE_ALPHABET
+
 class DnaCharacterMatrix(FixedAlphabetCharacterMatrix):
     """
     Specializes |CharacterMatrix| for DNA data.
     """
     character_sequence_type = DnaCharacterDataSequence
+    byte_coded_character_sequence_type = ByteCodedDnaCharacterDataSequence
     data_type = "dna"
     datatype_alphabet = DNA_STATE_ALPHABET
 
@@ -1943,11 +2651,17 @@ class DnaCharacterMatrix(FixedAlphabetCharacterMatrix):
 class RnaCharacterDataSequence(FixedAlphabetCharacterDataSequence):
     pass
 
+class ByteCodedRnaCharacterDataSequence(
+        ByteCodedCharacterDataSequence,
+        RnaCharacterDataSequence):
+    state_alphabet = RNA_STATE_ALPHABET
+
 class RnaCharacterMatrix(FixedAlphabetCharacterMatrix):
     """
     Specializes |CharacterMatrix| for DNA data.
     """
     character_sequence_type = RnaCharacterDataSequence
+    byte_coded_character_sequence_type = ByteCodedRnaCharacterDataSequence
     data_type = "rna"
     datatype_alphabet = RNA_STATE_ALPHABET
 
@@ -1956,11 +2670,17 @@ class RnaCharacterMatrix(FixedAlphabetCharacterMatrix):
 class NucleotideCharacterDataSequence(FixedAlphabetCharacterDataSequence):
     pass
 
+class ByteCodedNucleotideCharacterDataSequence(
+        ByteCodedCharacterDataSequence,
+        NucleotideCharacterDataSequence):
+    state_alphabet = NUCLEOTIDE_STATE_ALPHABET
+
 class NucleotideCharacterMatrix(FixedAlphabetCharacterMatrix):
     """
     Specializes |CharacterMatrix| for RNA data.
     """
     character_sequence_type = NucleotideCharacterDataSequence
+    byte_coded_character_sequence_type = ByteCodedNucleotideCharacterDataSequence
     data_type = "nucleotide"
     datatype_alphabet = NUCLEOTIDE_STATE_ALPHABET
 
@@ -1969,11 +2689,17 @@ class NucleotideCharacterMatrix(FixedAlphabetCharacterMatrix):
 class ProteinCharacterDataSequence(FixedAlphabetCharacterDataSequence):
     pass
 
+class ByteCodedProteinCharacterDataSequence(
+        ByteCodedCharacterDataSequence,
+        ProteinCharacterDataSequence):
+    state_alphabet = PROTEIN_STATE_ALPHABET
+
 class ProteinCharacterMatrix(FixedAlphabetCharacterMatrix):
     """
     Specializes |CharacterMatrix| for protein or amino acid data.
     """
     character_sequence_type = ProteinCharacterDataSequence
+    byte_coded_character_sequence_type = ByteCodedProteinCharacterDataSequence
     data_type = "protein"
     datatype_alphabet = PROTEIN_STATE_ALPHABET
 
@@ -1982,11 +2708,17 @@ class ProteinCharacterMatrix(FixedAlphabetCharacterMatrix):
 class RestrictionSitesCharacterDataSequence(FixedAlphabetCharacterDataSequence):
     pass
 
+class ByteCodedRestrictionSitesCharacterDataSequence(
+        ByteCodedCharacterDataSequence,
+        RestrictionSitesCharacterDataSequence):
+    state_alphabet = RESTRICTION_SITES_STATE_ALPHABET
+
 class RestrictionSitesCharacterMatrix(FixedAlphabetCharacterMatrix):
     """
     Specializes |CharacterMatrix| for restriction site data.
     """
     character_sequence_type = RestrictionSitesCharacterDataSequence
+    byte_coded_character_sequence_type = ByteCodedRestrictionSitesCharacterDataSequence
     data_type = "restriction"
     datatype_alphabet = RESTRICTION_SITES_STATE_ALPHABET
 
@@ -1995,11 +2727,17 @@ class RestrictionSitesCharacterMatrix(FixedAlphabetCharacterMatrix):
 class InfiniteSitesCharacterDataSequence(FixedAlphabetCharacterDataSequence):
     pass
 
+class ByteCodedInfiniteSitesCharacterDataSequence(
+        ByteCodedCharacterDataSequence,
+        InfiniteSitesCharacterDataSequence):
+    state_alphabet = INFINITE_SITES_STATE_ALPHABET
+
 class InfiniteSitesCharacterMatrix(FixedAlphabetCharacterMatrix):
     """
     Specializes |CharacterMatrix| for infinite sites data.
     """
     character_sequence_type = InfiniteSitesCharacterDataSequence
+    byte_coded_character_sequence_type = ByteCodedInfiniteSitesCharacterDataSequence
     data_type = "infinite"
     datatype_alphabet = INFINITE_SITES_STATE_ALPHABET
 
@@ -139,7 +139,8 @@ class DataSet(
         **Mandatory Source-Specification Keyword Argument (Exactly One Required):**
 
             - **file** (*file*) -- File or file-like object of data opened for reading.
-            - **path** (*str*) -- Path to file of data.
+            - **path** (*str*) -- Path to file of data (which may be
+              compressed with gzip, bzip2 or xz).
             - **url** (*str*) -- URL of data.
             - **data** (*str*) -- Data given directly.
 
@@ -289,7 +290,8 @@ class DataSet(
         **Mandatory Source-Specification Keyword Argument (Exactly One Required):**
 
             - **file** (*file*) -- File or file-like object of data opened for reading.
-            - **path** (*str*) -- Path to file of data.
+            - **path** (*str*) -- Path to file of data (which may be
+              compressed with gzip, bzip2 or xz).
             - **url** (*str*) -- URL of data.
             - **data** (*str*) -- Data given directly.
 
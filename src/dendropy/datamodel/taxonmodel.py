@@ -79,6 +79,7 @@ be related through correct interpretation of their taxon labels.
 import warnings
 import collections
 import copy
+import weakref
 from dendropy.utility.textprocessing import StringIO
 from dendropy.datamodel import basemodel
 from dendropy.utility import bitprocessing
@@ -545,6 +546,11 @@ class TaxonNamespace(
         self._taxon_bitmask_map = {}
         # self._split_bitmask_taxon_map = {}
         self._current_accession_count = 0
+        # (label => taxa, lower-cased label => taxa), built on demand by
+        # ``_get_label_index()``
+        self._label_indexes = None
+        # incremented whenever the label of a member taxon is changed
+        self._label_version = 0
         if len(args) > 1:
             raise TypeError("TaxonNamespace() takes at most 1 non-keyword argument ({} given)".format(len(args)))
         elif len(args) == 1:
@@ -561,7 +567,7 @@ class TaxonNamespace(
                 for t1, t2 in zip(self._taxa, other._taxa):
                     memo[id(t2)] = t1
                 for k in other.__dict__:
-                    if k == "_annotations" or k == "_taxa":
+                    if k == "_annotations" or k == "_taxa" or k == "_label_indexes":
                         continue
                     self.__dict__[k] = copy.deepcopy(other.__dict__[k], memo)
                 self.deep_copy_annotations_from(other, memo=memo)
@@ -589,15 +595,23 @@ class TaxonNamespace(
         o._taxa = []
         memo[id(self._taxa)] = o._taxa
         for t in self._taxa:
-            o._taxa.append(copy.deepcopy(t, memo))
+            t = copy.deepcopy(t, memo)
+            o._taxa.append(t)
+            t._add_to_namespace(o)
         for k in self.__dict__:
-            if k == "_annotations" or k == "_taxa":
+            if k == "_annotations" or k == "_taxa" or k == "_label_indexes":
                 continue
             o.__dict__[k] = copy.deepcopy(self.__dict__[k], memo)
+        o._label_indexes = None
         o.deep_copy_annotations_from(self, memo=memo)
         # o.copy_annotations_from(self, attribute_object_mapper=memo)
         return o
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        for taxon in self._taxa:
+            taxon._add_to_namespace(self)
+
     def populate_memo_for_taxon_namespace_scoped_copy(self, memo):
         if memo is not None:
             memo[id(self)] = self
@@ -709,28 +723,60 @@ class TaxonNamespace(
             `first_match_only==False`, a list of one or more |Taxon|
             instances with a ``label`` attribute matching the ``label`` argument.
         """
-        taxa = []
         if is_case_sensitive is True or (is_case_sensitive is None and self.is_case_sensitive):
-            for taxon in self._taxa:
-                if label == taxon.label:
-                    if first_match_only:
-                        return taxon
-                    else:
-                        taxa.append(taxon)
+            taxa = self._get_label_index(is_case_sensitive=True).get(label)
         else:
             label = str(label).lower()
-            for taxon in self._taxa:
-                if label == taxon.lower_cased_label:
-                    if first_match_only:
-                        return taxon
-                    else:
-                        taxa.append(taxon)
-        if len(taxa) == 0:
+            taxa = self._get_label_index(is_case_sensitive=False).get(label)
+        if not taxa:
             if error_if_not_found:
                 raise LookupError(label)
             else:
                 return None
-        return taxa
+        if first_match_only:
+            return taxa[0]
+        return list(taxa)
+
+    def _get_label_index(self, is_case_sensitive):
+        """
+        Returns dictionary mapping labels (lower-cased, if
+        ``is_case_sensitive`` is |False|) to lists of |Taxon| objects with
+        that label, in collection order.
+
+        The indexes are built on first use and then kept up to date as taxa
+        are added and removed. Changing the label of a member |Taxon| object
+        invalidates them (see :meth:`TaxonNamespace._note_taxon_label_changed()`),
+        in which case they are rebuilt here.
+        """
+        if self._label_indexes is None:
+            label_taxa_map = {}
+            lower_cased_label_taxa_map = {}
+            for taxon in self._taxa:
+                self._index_taxon_label(taxon, label_taxa_map, lower_cased_label_taxa_map)
+            self._label_indexes = (label_taxa_map, lower_cased_label_taxa_map)
+        if is_case_sensitive:
+            return self._label_indexes[0]
+        else:
+            return self._label_indexes[1]
+
+    def _note_taxon_label_changed(self):
+        """
+        Called by member |Taxon| objects when their labels are changed.
+        """
+        self._label_version += 1
+        self._label_indexes = None
+
+    def _index_taxon_label(self, taxon, label_taxa_map, lower_cased_label_taxa_map):
+        try:
+            label_taxa_map[taxon.label].append(taxon)
+        except KeyError:
+            label_taxa_map[taxon.label] = [taxon]
+        lower_cased_label = taxon.lower_cased_label
+        if lower_cased_label is not None:
+            try:
+                lower_cased_label_taxa_map[lower_cased_label].append(taxon)
+            except KeyError:
+                lower_cased_label_taxa_map[lower_cased_label] = [taxon]
 
     ### Adding Taxa
 
@@ -772,6 +818,9 @@ class TaxonNamespace(
         self._accession_index_taxon_map[self._current_accession_count] = taxon
         self._taxon_accession_index_map[taxon] = self._current_accession_count
         self._current_accession_count += 1
+        taxon._add_to_namespace(self)
+        if self._label_indexes is not None:
+            self._index_taxon_label(taxon, self._label_indexes[0], self._label_indexes[1])
 
     def append(self, taxon):
         """
@@ -878,6 +927,16 @@ class TaxonNamespace(
         # assert taxon not in self._taxa
         while taxon in self._taxa:
             self._taxa.remove(taxon)
+        taxon._remove_from_namespace(self)
+        if self._label_indexes is not None:
+            for label_taxa_map, label in (
+                    (self._label_indexes[0], taxon.label),
+                    (self._label_indexes[1], taxon.lower_cased_label)):
+                taxa = label_taxa_map.get(label)
+                if taxa is not None and taxon in taxa:
+                    taxa.remove(taxon)
+                    if not taxa:
+                        del label_taxa_map[label]
         idx = self._taxon_accession_index_map.pop(taxon, None)
         if idx is not None:
             self._accession_index_taxon_map.pop(idx, None)
@@ -990,11 +1049,14 @@ class TaxonNamespace(
         Removes all |Taxon| objects from this namespace.
         """
         # self._taxa.clear() # Python 2 ``list`` class does not have `clear()` method
+        for taxon in self._taxa:
+            taxon._remove_from_namespace(self)
         del self._taxa[:]
         self._accession_index_taxon_map.clear()
         self._taxon_accession_index_map.clear()
         self._taxon_bitmask_map.clear()
         # self._split_bitmask_taxon_map.clear()
+        self._label_indexes = None
 
     ### Look-up and Retrieval of Taxa
 
@@ -1256,12 +1318,14 @@ class TaxonNamespace(
         if key is None:
             key = lambda x: x.label
         self._taxa.sort(key=key, reverse=reverse)
+        self._label_indexes = None
 
     def reverse(self):
         """
         Reverses order of |Taxon| objects in collection.
         """
         self._taxa.reverse()
+        self._label_indexes = None
 
     ### Summarization of Collection
 
@@ -1648,6 +1712,11 @@ class Taxon(
     A taxon associated with a sequence or a node on a tree.
     """
 
+    # Weak references to the namespaces this taxon is a member of, which are
+    # notified when its label is changed; created when it is first added to a
+    # namespace.
+    _namespace_refs = None
+
     def __init__(self, label=None):
         """
         Parameters
@@ -1664,12 +1733,14 @@ class Taxon(
             label = other_taxon.label
             memo={id(other_taxon):self}
             for k in other_taxon.__dict__:
-                if k != "_annotations":
+                if k != "_annotations" and k != "_namespace_refs":
                     self.__dict__[k] = copy.deepcopy(other_taxon.__dict__[k], memo=memo)
             self.deep_copy_annotations_from(other_taxon, memo=memo)
             # self.copy_annotations_from(other_taxon, attribute_object_mapper=memo)
         else:
-            basemodel.DataObject.__init__(self, label=label)
+            basemodel.DataObject.__init__(self)
+            # assigned directly: a new taxon cannot be in any label index yet
+            self._label = label
             self._lower_cased_label = None
         self.comments = []
 
@@ -1678,8 +1749,26 @@ class Taxon(
     def _set_label(self, v):
         self._label = v
         self._lower_cased_label = None
+        if self._namespace_refs is not None:
+            for namespace_ref in self._namespace_refs:
+                taxon_namespace = namespace_ref()
+                if taxon_namespace is not None:
+                    taxon_namespace._note_taxon_label_changed()
     label = property(_get_label, _set_label)
 
+    def _add_to_namespace(self, taxon_namespace):
+        namespace_ref = weakref.ref(taxon_namespace)
+        if self._namespace_refs is None:
+            self._namespace_refs = [namespace_ref]
+        elif namespace_ref not in self._namespace_refs:
+            self._namespace_refs = [r for r in self._namespace_refs if r() is not None]
+            self._namespace_refs.append(namespace_ref)
+
+    def _remove_from_namespace(self, taxon_namespace):
+        if self._namespace_refs is not None:
+            self._namespace_refs = [r for r in self._namespace_refs
+                    if r() is not None and r() is not taxon_namespace]
+
     def _get_lower_cased_label(self):
         if self._label is None:
             return None
@@ -1707,12 +1796,18 @@ class Taxon(
             o = self.__class__.__new__(self.__class__)
             memo[id(self)] = o
         for k in self.__dict__:
-            if k != "_annotations":
+            if k != "_annotations" and k != "_namespace_refs":
                 o.__dict__[k] = copy.deepcopy(self.__dict__[k], memo)
         o.deep_copy_annotations_from(self, memo)
         # o.copy_annotations_from(self, attribute_object_mapper=memo)
         return o
 
+    def __getstate__(self):
+        # the namespaces are notified of the taxon when they are restored
+        state = dict(self.__dict__)
+        state.pop("_namespace_refs", None)
+        return state
+
     def __hash__(self):
         return id(self)
 
@@ -31,11 +31,14 @@ from dendropy.utility import error
 from dendropy.utility import bitprocessing
 from dendropy.utility import deprecate
 from dendropy.utility import constants
+from dendropy.utility import textprocessing
+from dendropy.utility import filesys
 from dendropy.calculate import statistics
 from dendropy.datamodel import basemodel
 from dendropy.datamodel import taxonmodel
 from dendropy.datamodel import treemodel
 from dendropy import dataio
+from dendropy.dataio import binaryprocessing
 
 ##############################################################################
 ### TreeList
@@ -69,6 +72,9 @@ class TreeList(
         in the |TaxonNamespace| object associated with the new
         |TreeList| object and its contained |Tree| objects, even those
         not associated with trees or the particular trees being retrieved.
+        The exception is taxa that are only referenced by trees skipped over
+        using ``collection_offset`` or ``tree_offset`` (e.g., in a NEWICK
+        source, with no separate definition of taxa), which are not included.
 
         Parameters
         ----------
@@ -134,14 +140,16 @@ class TreeList(
 
         Notes
         -----
-        Note that in most cases, even if ``collection_offset`` and ``tree_offset``
-        are specified to restrict the trees returned, the *entire* data source
-        is still parsed and processed. So this is not more efficient than
-        reading all the trees and then manually-extracting them later; just
-        more convenient. If you need just a single subset of trees from a data
-        source, there is no gain in efficiency. If you need multiple trees or
-        subsets of trees from the same data source, it would be much more
-        efficient to read the entire data source, and extract trees as needed.
+        With NEWICK and NEXUS data sources, the trees excluded by
+        ``collection_offset`` and ``tree_offset`` are skipped over without
+        being parsed, so, e.g., discarding a burn-in is much faster than
+        reading all the trees and then discarding some of them. A negative
+        ``tree_offset`` requires the trees in the source to be counted first,
+        which is only done for seekable sources (e.g., files; otherwise all
+        trees are parsed). With other data sources, the *entire* data source
+        is still parsed and processed. If you need multiple trees or subsets
+        of trees from the same data source, it would be much more efficient to
+        read the entire data source, and extract trees as needed.
 
         Returns
         -------
@@ -151,6 +159,8 @@ class TreeList(
         # these must be pulled before passing the kwargs
         # down to the reader
         tree_list = kwargs.pop("tree_list", None)
+        # only used when reading from a path (see ``get_from_path()``)
+        kwargs.pop("num_processes", None)
         taxon_namespace = taxonmodel.process_kwargs_dict_for_taxon_namespace(kwargs, None)
         label = kwargs.pop("label", None)
 
@@ -173,27 +183,19 @@ class TreeList(
                         tree_list_factory=tree_list._tree_list_pseudofactory,
                         global_annotations_target=None)
         else:
+            # trees before ``tree_offset`` or in other collections are skipped
+            # by the reader (without being parsed, if it supports this)
             tree_lists = reader.read_tree_lists(
                         stream=stream,
                         taxon_namespace_factory=tree_list._taxon_namespace_pseudofactory,
                         tree_list_factory=tree_list.__class__,
-                        global_annotations_target=None)
-            # if collection_offset < 0:
-            #     raise IndexError("Collection offset out of range: {} (minimum valid tree offset = 0)".format(collection_offset))
-            if collection_offset >= len(tree_lists):
-                raise IndexError("Collection offset out of range: {} (number of collections = {}, maximum valid collection offset = {})".format(collection_offset, len(tree_lists), len(tree_lists)-1))
+                        global_annotations_target=None,
+                        collection_offset=collection_offset,
+                        tree_offset=tree_offset)
             target_tree_list = tree_lists[collection_offset]
             tree_list.copy_annotations_from(target_tree_list)
-            if tree_offset is not None:
-                # if tree_offset < 0:
-                #     raise IndexError("Tree offset out of range: {} (minimum offset = 0)".format(tree_offset))
-                if tree_offset >= len(target_tree_list):
-                    raise IndexError("Tree offset out of range: {} (number of trees in source = {}, maximum valid tree offset = {})".format(tree_offset, len(target_tree_list), len(target_tree_list)-1))
-                for tree in target_tree_list[tree_offset:]:
-                    tree_list._trees.append(tree)
-            else:
-                for tree in target_tree_list:
-                    tree_list._trees.append(tree)
+            for tree in target_tree_list:
+                tree_list._trees.append(tree)
         return tree_list
         # taxon_namespace = taxonmodel.process_kwargs_dict_for_taxon_namespace(kwargs, None)
         # label = kwargs.pop("label", None)
@@ -208,6 +210,84 @@ class TreeList(
         # return tree_list
     _parse_and_create_from_stream = classmethod(_parse_and_create_from_stream)
 
+    def get_from_path(cls, src, schema, **kwargs):
+        """
+        Factory method to return a new |TreeList| from the file specified by
+        string ``src``.
+
+        If ``num_processes`` is given and greater than 1, then the NEWICK or
+        NEXUS tree statements in the file are located with a
+        |TreeFileIndex| (using the saved one, if up to date), and parsed in
+        up to that many processes. Otherwise, if ``tree_offset`` is given and
+        the trees in the file have been indexed by a |TreeFileIndex| (that is
+        up to date), then only the requested trees are parsed, straight from
+        their positions in the file. Otherwise, the file is read as by
+        ``get_from_stream()``. Note that when an index is used, operational
+        taxonomic unit concepts only referenced by the trees of other
+        collections are not included in the |TaxonNamespace| of the trees
+        (those of the trees skipped over by ``tree_offset`` still are), and
+        metadata given in comments associated with the tree collection are
+        not read.
+
+        Parameters
+        ----------
+        src : string
+            Full file path to source of data.
+        schema : string
+            Specification of data format (e.g., "nexus").
+        \*\*kwargs : keyword arguments, optional
+            As for ``get_from_stream()``.
+
+        Returns
+        -------
+        |TreeList|
+            The trees read from the source.
+        """
+        from dendropy.dataio.treefileindex import TreeFileIndex
+        num_processes = kwargs.pop("num_processes", None)
+        is_multiprocessing = (num_processes is not None
+                and num_processes > 1
+                and schema in TreeFileIndex.supported_schemas
+                and filesys.get_compression(src) is None)
+        tree_offset = kwargs.get("tree_offset", None)
+        index = None
+        if (tree_offset is not None or is_multiprocessing) and "tree_list" not in kwargs:
+            index_kwargs = dict(kwargs)
+            collection_offset = index_kwargs.pop("collection_offset", None)
+            index_kwargs.pop("tree_offset", None)
+            label = index_kwargs.pop("label", None)
+            index_kwargs["taxon_namespace"] = taxonmodel.process_kwargs_dict_for_taxon_namespace(index_kwargs, None)
+            if collection_offset is None and tree_offset is not None:
+                collection_offset = 0
+            index = TreeFileIndex.load(src,
+                    schema=schema,
+                    collection_offset=collection_offset,
+                    **index_kwargs)
+            if index is None and is_multiprocessing:
+                index = TreeFileIndex(src,
+                        schema=schema,
+                        collection_offset=collection_offset,
+                        is_persistent=False,
+                        **index_kwargs)
+        if index is None:
+            with filesys.open_file(src, "r", newline=None) as fsrc:
+                return cls._parse_and_create_from_stream(stream=fsrc,
+                        schema=schema,
+                        **kwargs)
+        with index:
+            num_trees = len(index)
+            if tree_offset is None:
+                tree_offset = 0
+            elif tree_offset >= num_trees:
+                raise IndexError("Tree offset out of range: {} (number of trees in source = {}, maximum valid tree offset = {})".format(tree_offset, num_trees, num_trees-1))
+            tree_list = cls(label=label, taxon_namespace=index.taxon_namespace)
+            index.add_taxa(range(num_trees)[:tree_offset])
+            index.get_trees(range(num_trees)[tree_offset:],
+                    tree_list=tree_list,
+                    num_processes=num_processes)
+        return tree_list
+    get_from_path = classmethod(get_from_path)
+
     @classmethod
     def get(cls, **kwargs):
         """
@@ -216,7 +296,8 @@ class TreeList(
         **Mandatory Source-Specification Keyword Argument (Exactly One Required):**
 
             - **file** (*file*) -- File or file-like object of data opened for reading.
-            - **path** (*str*) -- Path to file of data.
+            - **path** (*str*) -- Path to file of data (which may be
+              compressed with gzip, bzip2 or xz).
             - **url** (*str*) -- URL of data.
             - **data** (*str*) -- Data given directly.
 
@@ -245,6 +326,10 @@ class TreeList(
               specified, then the first tree (offset = 0) is assumed (i.e., no
               trees within the specified collection will be skipped). Use this
               to specify, e.g. a burn-in.
+            - **num_processes** (*int*) -- If greater than 1, then NEWICK or
+              NEXUS trees given by "``path``" are parsed in up to this many
+              processes (see :meth:`TreeList.get_from_path()`). Ignored for
+              other sources.
             - **ignore_unrecognized_keyword_arguments** (*bool*) -- If |True|,
               then unsupported or unrecognized keyword arguments will not
               result in an error. Default is |False|: unsupported keyword
@@ -373,10 +458,8 @@ class TreeList(
                              store_tree_weights=False,
                              preserve_underscores=True)
 
-            # Subsets of trees can be read. Note that in most cases, the entire
-            # data source is parsed, so this is not more efficient than reading
-            # all the trees and then manually-extracting them later; just more
-            # convenient
+            # Subsets of trees can be read. With NEWICK and NEXUS sources, the
+            # trees that are not wanted are skipped over without being parsed
 
             # skip the *first* 100 trees in the *first* (offset=0) collection of trees
             trees = TreeList.get(
@@ -525,6 +608,9 @@ class TreeList(
         in the |TaxonNamespace| object associated with the new
         |TreeList| object and its contained |Tree| objects, even those
         not associated with trees or the particular trees being retrieved.
+        The exception is taxa that are only referenced by trees skipped over
+        using ``collection_offset`` or ``tree_offset`` (e.g., in a NEWICK
+        source, with no separate definition of taxa), which are not included.
 
         Parameters
         ----------
@@ -582,14 +668,12 @@ class TreeList(
 
         Notes
         -----
-        Note that in most cases, even if ``collection_offset`` and ``tree_offset``
-        are specified to restrict the trees read, the *entire* data source
-        is still parsed and processed. So this is not more efficient than
-        reading all the trees and then manually-extracting them later; just
-        more convenient. If you need just a single subset of trees from a data
-        source, there is no gain in efficiency. If you need multiple trees or
-        subsets of trees from the same data source, it would be much more
-        efficient to read the entire data source, and extract trees as needed.
+        With NEWICK and NEXUS data sources, the trees excluded by
+        ``collection_offset`` and ``tree_offset`` are skipped over without
+        being parsed. With other data sources, the *entire* data source is
+        still parsed and processed. If you need multiple trees or subsets of
+        trees from the same data source, it would be much more efficient to
+        read the entire data source, and extract trees as needed.
 
         Returns
         -------
@@ -619,7 +703,8 @@ class TreeList(
         **Mandatory Source-Specification Keyword Argument (Exactly One Required):**
 
             - **file** (*file*) -- File or file-like object of data opened for reading.
-            - **path** (*str*) -- Path to file of data.
+            - **path** (*str*) -- Path to file of data (which may be
+              compressed with gzip, bzip2 or xz).
             - **url** (*str*) -- URL of data.
             - **data** (*str*) -- Data given directly.
 
@@ -1218,12 +1303,81 @@ class TreeList(
                 )
         return self.frequency_of_bipartition(**kwargs)
 
+###############################################################################
+### Binary Serialization Support
+
+def _write_binary_taxon_namespace(encoder, taxon_namespace):
+    """
+    Writes ``taxon_namespace`` to the "dendropy-bin" encoder ``encoder``, and
+    returns the bit map (see :func:`binaryprocessing.get_bit_map()`) from the
+    bitmasks of ``taxon_namespace`` to the bitmasks as stored, in which bit
+    ``i`` corresponds to the ``i``-th taxon written.
+    """
+    binaryprocessing.write_taxon_namespace(encoder, taxon_namespace)
+    return binaryprocessing.get_bit_map(
+            [taxon_namespace.accession_index(taxon) for taxon in taxon_namespace],
+            range(len(taxon_namespace)))
+
+def _read_binary_taxon_namespace(decoder, taxon_namespace=None, case_sensitive_taxon_labels=False):
+    """
+    Reads the taxa stored by :func:`_write_binary_taxon_namespace()` into
+    ``taxon_namespace`` (a new |TaxonNamespace| if |None|), and returns a
+    tuple, (``taxon_namespace``, bit map), where the bit map is that from
+    the bitmasks as stored to the bitmasks of ``taxon_namespace``.
+    """
+    label = decoder.read_string()
+    taxon_labels = decoder.read_strings()
+    if taxon_namespace is None:
+        taxon_namespace = taxonmodel.TaxonNamespace(label=label)
+    taxa = binaryprocessing.get_taxa(taxon_namespace,
+            taxon_labels,
+            is_case_sensitive=case_sensitive_taxon_labels)
+    bit_map = binaryprocessing.get_bit_map(
+            range(len(taxa)),
+            [taxon_namespace.accession_index(taxon) for taxon in taxa])
+    return taxon_namespace, bit_map
+
+def _remap_bitmasks(bitmasks, bit_map):
+    if bit_map is None:
+        return bitmasks
+    return [binaryprocessing.remap_bitmask(bitmask, bit_map) for bitmask in bitmasks]
+
+def _remap_unrooted_split_bitmasks(split_bitmasks, bit_map, tree_leafset_bitmask):
+    # splits of unrooted trees are normalized with respect to the lowest
+    # taxon of the tree, which may change on remapping
+    split_bitmasks = _remap_bitmasks(split_bitmasks, bit_map)
+    if bit_map is None:
+        return split_bitmasks
+    tree_leafset_bitmask = binaryprocessing.remap_bitmask(tree_leafset_bitmask, bit_map)
+    lowest_relevant_bit = tree_leafset_bitmask & -tree_leafset_bitmask
+    return [treemodel.Bipartition.normalize_bitmask(
+                bitmask=split_bitmask,
+                fill_bitmask=tree_leafset_bitmask,
+                lowest_relevant_bit=lowest_relevant_bit)
+            for split_bitmask in split_bitmasks]
+
+def _check_binary_deserialization_kwargs(kwargs):
+    taxon_namespace = taxonmodel.process_kwargs_dict_for_taxon_namespace(kwargs, None)
+    case_sensitive_taxon_labels = kwargs.pop("case_sensitive_taxon_labels", False)
+    if kwargs:
+        raise TypeError("Unsupported keyword arguments for 'dendropy-bin' data: {}".format(", ".join(sorted(kwargs))))
+    return taxon_namespace, case_sensitive_taxon_labels
+
 ###############################################################################
 ### SplitDistribution
 
-class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
+class SplitDistribution(
+        taxonmodel.TaxonNamespaceAssociated,
+        basemodel.Deserializable,
+        basemodel.Serializable,
+        ):
     """
     Collects information regarding splits over multiple trees.
+
+    The state of a split distribution can be saved with, e.g.,
+    ``split_distribution.write(path="splits.bin", schema="dendropy-bin")``
+    and restored with ``SplitDistribution.get(path="splits.bin",
+    schema="dendropy-bin")``.
     """
 
     SUMMARY_STATS_FIELDNAMES = ('mean', 'median', 'sd', 'hpd95', 'quant_5_95', 'range')
@@ -1406,6 +1560,61 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
                 sna = None
         return splits, edge_lengths, node_ages
 
+    def count_tree_splits(self,
+            tree_splits,
+            default_edge_length_value=None):
+        """
+        Counts the splits of a tree given as a record of its bipartitions
+        (e.g., as yielded by :meth:`Tree.yield_from_files()` with
+        ``splits_only=True``) and adds them to the totals, as
+        :meth:`SplitDistribution.count_splits_on_tree()` does for a |Tree|.
+        As the records do not include node ages, this requires
+        ``ignore_node_ages`` to be |True|.
+
+        Parameters
+        ----------
+        tree_splits : ``NewickReader.TreeSplits``
+            The split bitmasks and edge lengths (in corresponding order),
+            weight and rooting state of the tree, with split bitmasks
+            relating to the taxon namespace of ``self``.
+        default_edge_length_value : numeric
+            The edge length value to use for edges without lengths.
+
+        Returns
+        --------
+        s : iterable of splits
+            A list of split bitmasks from ``tree_splits``.
+        e :
+            A list of edge length values from ``tree_splits``.
+        a :
+            An empty list, as node ages are not counted.
+        """
+        if not self.ignore_node_ages:
+            raise ValueError("Node ages cannot be counted from the bipartitions of a tree: 'ignore_node_ages' must be True")
+        self.total_trees_counted += 1
+        if tree_splits.weight is not None and self.use_tree_weights:
+            weight_to_use = float(tree_splits.weight)
+        else:
+            weight_to_use = 1.0
+        self.sum_of_tree_weights += weight_to_use
+        if tree_splits.is_rooted:
+            self.tree_rooting_types_counted.add(True)
+        else:
+            self.tree_rooting_types_counted.add(False)
+        splits = list(tree_splits.split_bitmasks)
+        edge_lengths = []
+        split_counts = self.split_counts
+        for split in splits:
+            split_counts[split] += weight_to_use
+        if not self.ignore_edge_lengths:
+            split_edge_lengths = self.split_edge_lengths
+            for split, elen in zip(splits, tree_splits.edge_lengths):
+                if elen is None:
+                    elen = default_edge_length_value
+                split_edge_lengths.setdefault(split, []).append(elen)
+                edge_lengths.append(elen)
+        return splits, edge_lengths, []
+
     def splits_considered(self):
         """
         Returns 4 values:
@@ -1799,6 +2008,134 @@ class SplitDistribution(taxonmodel.TaxonNamespaceAssociated):
                 is_bipartitions_updated=is_bipartitions_updated)
         return tree
 
+    ###########################################################################
+    ### Binary Serialization
+
+    @classmethod
+    def get(cls, **kwargs):
+        """
+        Instantiate and return a *new* |SplitDistribution| object as saved
+        by :meth:`SplitDistribution.write()` in the "dendropy-bin" format.
+
+        **Mandatory Source-Specification Keyword Argument (Exactly One of the Following Required):**
+
+            - **file** (*file*) -- File or file-like object of data opened
+              for reading (in binary mode).
+            - **path** (*str*) -- Path to file of data (which may be
+              compressed with gzip, bzip2 or xz).
+
+        **Mandatory Schema-Specification Keyword Argument:**
+
+            - **schema** (*str*) -- Must be "dendropy-bin".
+
+        **Optional Keyword Arguments:**
+
+            - **taxon_namespace** (|TaxonNamespace|) -- The |TaxonNamespace|
+              instance to use to :doc:`manage the taxon names </primer/taxa>`.
+              If not specified, a new one will be created. Split bitmasks are
+              mapped onto the taxa of this namespace by label.
+            - **case_sensitive_taxon_labels** (*bool*) -- If |True|, then
+              case is respected when matching stored taxon labels to those of
+              the taxa of ``taxon_namespace``. Default is |False|.
+
+        **Examples:**
+
+        ::
+
+            sd = dendropy.SplitDistribution.get(
+                    path="splits.bin",
+                    schema="dendropy-bin")
+        """
+        return cls._get_from(**kwargs)
+
+    @classmethod
+    def _parse_and_create_from_stream(cls, stream, schema, **kwargs):
+        if schema != "dendropy-bin":
+            raise error.UnsupportedSchemaError("SplitDistribution can only be read from 'dendropy-bin' data, not '{}'".format(schema))
+        taxon_namespace, case_sensitive_taxon_labels = _check_binary_deserialization_kwargs(kwargs)
+        decoder = binaryprocessing.BinaryDecoder(stream)
+        try:
+            decoder.read_header(binaryprocessing.SPLIT_DISTRIBUTION_CONTENT)
+            taxon_namespace, bit_map = _read_binary_taxon_namespace(decoder,
+                    taxon_namespace=taxon_namespace,
+                    case_sensitive_taxon_labels=case_sensitive_taxon_labels)
+            split_distribution = cls(taxon_namespace=taxon_namespace)
+            split_distribution._read_binary_state(decoder, bit_map)
+        finally:
+            decoder.close()
+        return split_distribution
+
+    def _format_and_write_to_stream(self, stream, schema, **kwargs):
+        if schema != "dendropy-bin":
+            raise error.UnsupportedSchemaError("SplitDistribution can only be written as 'dendropy-bin' data, not '{}'".format(schema))
+        if kwargs:
+            raise TypeError("Unsupported keyword arguments for 'dendropy-bin' data: {}".format(", ".join(sorted(kwargs))))
+        encoder = binaryprocessing.BinaryEncoder(stream)
+        encoder.write_header(binaryprocessing.SPLIT_DISTRIBUTION_CONTENT)
+        bit_map = _write_binary_taxon_namespace(encoder, self.taxon_namespace)
+        self._write_binary_state(encoder, bit_map)
+
+    def _write_binary_state(self, encoder, bit_map):
+        # ``taxon_label_age_map`` is not stored: it is only consulted when
+        # counting further trees
+        encoder.write_flag(self.ignore_edge_lengths)
+        encoder.write_flag(self.ignore_node_ages)
+        encoder.write_flag(self.use_tree_weights)
+        encoder.write_flag(self.is_force_max_age)
+        encoder.write_flag(self.is_force_min_age)
+        encoder.write_flag(self._is_rooted)
+        encoder.write_float(self.ultrametricity_precision)
+        encoder.write_uint(self.total_trees_counted)
+        encoder.write_float(self.sum_of_tree_weights)
+        encoder.write_array("b", [binaryprocessing.FLAG_VALUES[rooting] for rooting in self.tree_rooting_types_counted])
+        splits = list(self.split_counts)
+        encoder.write_bitmasks(_remap_bitmasks(splits, bit_map))
+        encoder.write_array("d", [self.split_counts[split] for split in splits])
+        for split_values in (self.split_edge_lengths, self.split_node_ages):
+            splits = list(split_values)
+            encoder.write_bitmasks(_remap_bitmasks(splits, bit_map))
+            encoder.write_array("q", [len(split_values[split]) for split in splits])
+            encoder.write_array("d", [binaryprocessing.float_or_nan(value)
+                for split in splits for value in split_values[split]])
+
+    def _read_binary_state(self, decoder, bit_map):
+        self.ignore_edge_lengths = decoder.read_flag()
+        self.ignore_node_ages = decoder.read_flag()
+        self.use_tree_weights = decoder.read_flag()
+        self.is_force_max_age = decoder.read_flag()
+        self.is_force_min_age = decoder.read_flag()
+        self._is_rooted = decoder.read_flag()
+        self.ultrametricity_precision = decoder.read_float()
+        self.total_trees_counted = decoder.read_uint()
+        self.sum_of_tree_weights = decoder.read_float()
+        self.tree_rooting_types_counted = set(binaryprocessing.FLAGS[value] for value in decoder.read_array("b"))
+        if self.is_all_counted_trees_treated_as_unrooted() and bit_map is not None:
+            # the leaf sets of the individual trees are not stored, so the
+            # splits are normalized with respect to all the taxa stored
+            all_taxa_bitmask = (1 << len(bit_map)) - 1
+            remap_splits = lambda splits: _remap_unrooted_split_bitmasks(splits, bit_map, all_taxa_bitmask)
+        else:
+            remap_splits = lambda splits: _remap_bitmasks(splits, bit_map)
+        splits = remap_splits(decoder.read_bitmasks())
+        self.split_counts = collections.defaultdict(float, zip(splits, decoder.read_array("d")))
+        split_values_dicts = []
+        for idx in range(2):
+            splits = remap_splits(decoder.read_bitmasks())
+            num_values = decoder.read_array("q")
+            values = [binaryprocessing.float_or_none(value) for value in decoder.read_array("d")]
+            split_values = collections.defaultdict(list)
+            offset = 0
+            for split, count in zip(splits, num_values):
+                split_values[split] = values[offset:offset+count]
+                offset += count
+            split_values_dicts.append(split_values)
+        self.split_edge_lengths, self.split_node_ages = split_values_dicts
+        self._split_freqs = None
+        self._trees_counted_for_freqs = 0
+        self._split_edge_length_summaries = None
+        self._split_node_age_summaries = None
+        self._trees_counted_for_summaries = 0
+
     ###########################################################################
     ### legacy
 
@@ -2102,6 +2439,8 @@ class SplitDistributionSummarizer(object):
 class TreeArray(
         taxonmodel.TaxonNamespaceAssociated,
         basemodel.MultiReadable,
+        basemodel.Deserializable,
+        basemodel.Serializable,
         ):
     """
     High-performance collection of tree structures.
@@ -2340,6 +2679,64 @@ class TreeArray(
         return index, splits, edge_lengths, weight_to_use
 
 
+    def add_tree_splits(self,
+            tree_splits,
+            index=None):
+        """
+        Adds the structure of a tree given as a record of its bipartitions
+        (e.g., as yielded by :meth:`Tree.yield_from_files()` with
+        ``splits_only=True``) to the collection, as
+        :meth:`TreeArray.add_tree()` does for a |Tree|. As the records do
+        not include node ages, this requires ``ignore_node_ages`` to be
+        |True|.
+
+        Parameters
+        ----------
+        tree_splits : ``NewickReader.TreeSplits``
+            The split bitmasks and edge lengths (in corresponding order),
+            weight, rooting state and leafset bitmask of the tree, with
+            bitmasks relating to the taxon namespace of ``self``. The tree
+            must have the same rooting state as all the other trees
+            accessioned into this collection as well as that of
+            ``self.is_rooted_trees``.
+        index : integer
+            Insert before index.
+
+        Returns
+        -------
+        index : int
+            The index of the accession.
+        s : iterable of splits
+            A list of split bitmasks from ``tree_splits``.
+        e :
+            A list of edge length values from ``tree_splits``.
+        """
+        self.validate_rooting(tree_splits.is_rooted)
+        splits, edge_lengths, node_ages = self._split_distribution.count_tree_splits(
+                tree_splits=tree_splits,
+                default_edge_length_value=self.default_edge_length_value)
+        splits = tuple(splits)
+        if self.ignore_edge_lengths:
+            edge_lengths = tuple( None for x in range(len(splits)) )
+        else:
+            edge_lengths = tuple(edge_lengths)
+        if tree_splits.weight is not None and self.use_tree_weights:
+            weight_to_use = float(tree_splits.weight)
+        else:
+            weight_to_use = 1.0
+        if index is None:
+            index = len(self._tree_split_bitmasks)
+            self._tree_split_bitmasks.append(splits)
+            self._tree_leafset_bitmasks.append(tree_splits.leafset_bitmask)
+            self._tree_edge_lengths.append(edge_lengths)
+            self._tree_weights.append(weight_to_use)
+        else:
+            self._tree_split_bitmasks.insert(index, splits)
+            self._tree_leafset_bitmasks.insert(index, tree_splits.leafset_bitmask)
+            self._tree_edge_lengths.insert(index, edge_lengths)
+            self._tree_weights.insert(index, weight_to_use)
+        return index, splits, edge_lengths, weight_to_use
+
     def add_trees(self, trees, is_bipartitions_updated=False):
         """
         Adds multiple structures represneted by an iterator over or iterable of
@@ -2372,6 +2769,11 @@ class TreeArray(
         Adds multiple structures from one or more external file sources to the
         collection.
 
+        With NEWICK and NEXUS sources, unless node ages are needed (i.e.,
+        ``ignore_node_ages`` is |False|), the trees are not constructed: only
+        their bipartitions are computed as they are parsed (see
+        :meth:`TreeArray.add_tree_splits()`).
+
         Parameters
         ----------
         files : iterable of strings and/or file objects
@@ -2381,6 +2783,18 @@ class TreeArray(
             objects opened for reading).
         schema : string
             The data format of the source. E.g., "nexus", "newick", "nexml".
+        tree_offset : integer, optional
+            Number of trees to skip at the start of *each* source (e.g., as
+            burn-in). With NEWICK and NEXUS sources, these trees are skipped
+            over without being constructed, but the taxa they reference are
+            still added to the namespace.
+        num_processes : integer, optional
+            If greater than 1, then the trees of each NEWICK or NEXUS source
+            given as a path are parsed and added in up to this many
+            processes, with the tree statements located using a
+            |TreeFileIndex| (see :meth:`TreeFileIndex.read_into_tree_array()`).
+            Trees are added in the same order as when read in a single
+            process.
         \*\*kwargs : keyword arguments
             These will be passed directly to the underlying schema-specific
             reader implementation.
@@ -2389,29 +2803,71 @@ class TreeArray(
             if kwargs["taxon_namespace"] is not self.taxon_namespace:
                 raise ValueError("TaxonNamespace object passed as keyword argument is not the same as self's TaxonNamespace reference")
             kwargs.pop("taxon_namespace")
-        target_tree_offset = kwargs.pop("tree_offset", 0)
+        num_processes = kwargs.pop("num_processes", None)
+        if num_processes is not None and num_processes > 1:
+            from dendropy.dataio.treefileindex import TreeFileIndex
+            if schema in TreeFileIndex.supported_schemas:
+                for f in files:
+                    if textprocessing.is_str_type(f) and filesys.get_compression(f) is None:
+                        self._read_from_path_in_processes(f, schema, num_processes, **kwargs)
+                    else:
+                        self.read_from_files(files=[f], schema=schema, **kwargs)
+                return
         tree_yielder = self.tree_type.yield_from_files(
                 files=files,
                 schema=schema,
                 taxon_namespace=self.taxon_namespace,
                 **kwargs)
-        current_source_index = None
-        current_tree_offset = None
-        for tree_idx, tree in enumerate(tree_yielder):
-            current_yielder_index = tree_yielder.current_file_index
-            if current_source_index != current_yielder_index:
-                current_source_index = current_yielder_index
-                current_tree_offset = 0
-            if current_tree_offset >= target_tree_offset:
+        if (tree_yielder.is_splits_only_supported
+                and self.ignore_node_ages
+                and kwargs.get("finish_node_fn") is None):
+            # only the bipartitions of the trees are needed
+            tree_yielder.splits_only = True
+            for tree_splits in tree_yielder:
+                self.add_tree_splits(tree_splits)
+        else:
+            for tree in tree_yielder:
                 self.add_tree(tree=tree, is_bipartitions_updated=False)
-            current_tree_offset += 1
+
+    def _read_from_path_in_processes(self, path, schema, num_processes, **kwargs):
+        from dendropy.dataio.treefileindex import TreeFileIndex
+        tree_offset = kwargs.pop("tree_offset", None)
+        index = TreeFileIndex.load(path,
+                schema=schema,
+                taxon_namespace=self.taxon_namespace,
+                tree_type=self.tree_type,
+                **kwargs)
+        if index is None:
+            index = TreeFileIndex(path,
+                    schema=schema,
+                    taxon_namespace=self.taxon_namespace,
+                    tree_type=self.tree_type,
+                    is_persistent=False,
+                    **kwargs)
+        with index:
+            indexes = range(len(index))
+            if tree_offset:
+                # the taxa of skipped trees are still added, as when reading
+                # serially
+                index.add_taxa(indexes[:tree_offset])
+                indexes = indexes[tree_offset:]
+            index.read_into_tree_array(self,
+                    indexes=indexes,
+                    num_processes=num_processes)
 
     def _parse_and_add_from_stream(self,
             stream,
             schema,
             **kwargs):
         cur_size = len(self._tree_split_bitmasks)
-        self.read_from_files(files=[stream], schema=schema, **kwargs)
+        if (schema == "dendropy-bin"
+                and binaryprocessing.peek_content_type(stream) == binaryprocessing.TREE_ARRAY_CONTENT):
+            self.update(TreeArray._parse_and_create_from_stream(stream,
+                    schema,
+                    taxon_namespace=self.taxon_namespace,
+                    **kwargs))
+        else:
+            self.read_from_files(files=[stream], schema=schema, **kwargs)
         new_size = len(self._tree_split_bitmasks)
         return new_size - cur_size
 
@@ -2423,7 +2879,8 @@ class TreeArray(
         **Mandatory Source-Specification Keyword Argument (Exactly One Required):**
 
             - **file** (*file*) -- File or file-like object of data opened for reading.
-            - **path** (*str*) -- Path to file of data.
+            - **path** (*str*) -- Path to file of data (which may be
+              compressed with gzip, bzip2 or xz).
             - **url** (*str*) -- URL of data.
             - **data** (*str*) -- Data given directly.
 
@@ -2433,7 +2890,9 @@ class TreeArray(
               "``file``", "``path``", "``data``", or "``url``" argument
               specified above: ":doc:`newick </schemas/newick>`", ":doc:`nexus
               </schemas/nexus>`", or ":doc:`nexml </schemas/nexml>`". See
-              "|Schemas|" for more details.
+              "|Schemas|" for more details. "dendropy-bin" data may hold
+              either trees or a |TreeArray| saved by
+              :meth:`TreeArray.write()`, which is added as a whole.
 
         **Optional General Keyword Arguments:**
 
@@ -2482,6 +2941,125 @@ class TreeArray(
         """
         return basemodel.MultiReadable._read_from(self, **kwargs)
 
+    @classmethod
+    def get(cls, **kwargs):
+        """
+        Instantiate and return a *new* |TreeArray| object as saved by
+        :meth:`TreeArray.write()` in the "dendropy-bin" format.
+
+        **Mandatory Source-Specification Keyword Argument (Exactly One of the Following Required):**
+
+            - **file** (*file*) -- File or file-like object of data opened
+              for reading (in binary mode).
+            - **path** (*str*) -- Path to file of data (which may be
+              compressed with gzip, bzip2 or xz).
+
+        **Mandatory Schema-Specification Keyword Argument:**
+
+            - **schema** (*str*) -- Must be "dendropy-bin".
+
+        **Optional Keyword Arguments:**
+
+            - **taxon_namespace** (|TaxonNamespace|) -- The |TaxonNamespace|
+              instance to use to :doc:`manage the taxon names </primer/taxa>`.
+              If not specified, a new one will be created. Split bitmasks are
+              mapped onto the taxa of this namespace by label.
+            - **case_sensitive_taxon_labels** (*bool*) -- If |True|, then
+              case is respected when matching stored taxon labels to those of
+              the taxa of ``taxon_namespace``. Default is |False|.
+
+        To accumulate trees from tree files, use :meth:`TreeArray.read()`
+        or :meth:`TreeArray.read_from_files()` instead.
+
+        **Examples:**
+
+        ::
+
+            tree_array = dendropy.TreeArray()
+            tree_array.read(path="trees.nex", schema="nexus")
+            tree_array.write(path="trees.bin", schema="dendropy-bin")
+            tree_array2 = dendropy.TreeArray.get(
+                    path="trees.bin",
+                    schema="dendropy-bin")
+        """
+        return cls._get_from(**kwargs)
+
+    @classmethod
+    def _parse_and_create_from_stream(cls, stream, schema, **kwargs):
+        if schema != "dendropy-bin":
+            raise error.UnsupportedSchemaError("TreeArray can only be instantiated from 'dendropy-bin' data, not '{}': use 'TreeArray.read()' to read trees in other formats".format(schema))
+        taxon_namespace, case_sensitive_taxon_labels = _check_binary_deserialization_kwargs(kwargs)
+        decoder = binaryprocessing.BinaryDecoder(stream)
+        try:
+            decoder.read_header(binaryprocessing.TREE_ARRAY_CONTENT)
+            taxon_namespace, bit_map = _read_binary_taxon_namespace(decoder,
+                    taxon_namespace=taxon_namespace,
+                    case_sensitive_taxon_labels=case_sensitive_taxon_labels)
+            tree_array = cls(taxon_namespace=taxon_namespace)
+            tree_array._read_binary_state(decoder, bit_map)
+        finally:
+            decoder.close()
+        return tree_array
+
+    def _format_and_write_to_stream(self, stream, schema, **kwargs):
+        """
+        Writes out ``self`` to a destination given by file-like object
+        ``stream`` (opened in binary mode). ``schema`` must be
+        "dendropy-bin": the structures of the trees, as well as the split
+        distribution, are stored, to be restored by :meth:`TreeArray.get()`
+        or added to another |TreeArray| by :meth:`TreeArray.read()`.
+        """
+        if schema != "dendropy-bin":
+            raise error.UnsupportedSchemaError("TreeArray can only be written as 'dendropy-bin' data, not '{}'".format(schema))
+        if kwargs:
+            raise TypeError("Unsupported keyword arguments for 'dendropy-bin' data: {}".format(", ".join(sorted(kwargs))))
+        encoder = binaryprocessing.BinaryEncoder(stream)
+        encoder.write_header(binaryprocessing.TREE_ARRAY_CONTENT)
+        bit_map = _write_binary_taxon_namespace(encoder, self.taxon_namespace)
+        self._write_binary_state(encoder, bit_map)
+
+    def _write_binary_state(self, encoder, bit_map):
+        encoder.write_flag(self._is_rooted_trees)
+        encoder.write_flag(self.ignore_edge_lengths)
+        encoder.write_flag(self.ignore_node_ages)
+        encoder.write_flag(self.use_tree_weights)
+        encoder.write_float(self.default_edge_length_value)
+        encoder.write_array("q", [len(splits) for splits in self._tree_split_bitmasks])
+        encoder.write_bitmasks(_remap_bitmasks(
+            [split for splits in self._tree_split_bitmasks for split in splits],
+            bit_map))
+        encoder.write_array("d", [binaryprocessing.float_or_nan(edge_length)
+            for edge_lengths in self._tree_edge_lengths for edge_length in edge_lengths])
+        encoder.write_bitmasks(_remap_bitmasks(self._tree_leafset_bitmasks, bit_map))
+        encoder.write_array("d", self._tree_weights)
+        self._split_distribution._write_binary_state(encoder, bit_map)
+
+    def _read_binary_state(self, decoder, bit_map):
+        self._is_rooted_trees = decoder.read_flag()
+        self.ignore_edge_lengths = decoder.read_flag()
+        self.ignore_node_ages = decoder.read_flag()
+        self.use_tree_weights = decoder.read_flag()
+        self.default_edge_length_value = decoder.read_float()
+        num_splits = decoder.read_array("q")
+        splits = decoder.read_bitmasks()
+        edge_lengths = [binaryprocessing.float_or_none(edge_length) for edge_length in decoder.read_array("d")]
+        leafset_bitmasks = decoder.read_bitmasks()
+        self._tree_split_bitmasks = []
+        self._tree_edge_lengths = []
+        offset = 0
+        for count, leafset_bitmask in zip(num_splits, leafset_bitmasks):
+            tree_splits = splits[offset:offset+count]
+            if self._is_rooted_trees:
+                tree_splits = _remap_bitmasks(tree_splits, bit_map)
+            else:
+                tree_splits = _remap_unrooted_split_bitmasks(tree_splits, bit_map, leafset_bitmask)
+            self._tree_split_bitmasks.append(tuple(tree_splits))
+            self._tree_edge_lengths.append(tuple(edge_lengths[offset:offset+count]))
+            offset += count
+        self._tree_leafset_bitmasks = _remap_bitmasks(leafset_bitmasks, bit_map)
+        self._tree_weights = list(decoder.read_array("d"))
+        self._split_distribution._read_binary_state(decoder, bit_map)
+
     ##############################################################################
     ## Container (List) Interface
 
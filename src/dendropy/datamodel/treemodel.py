@@ -22,6 +22,7 @@ This module handles the core definition of tree data structure class,
 as well as all the structural classes that make up a tree.
 """
 
+import array
 import collections
 import math
 from dendropy.utility.textprocessing import StringIO
@@ -35,6 +36,7 @@ from dendropy.utility import bitprocessing
 from dendropy.utility import deprecate
 from dendropy.utility import constants
 from dendropy.utility import textprocessing
+from dendropy.utility import filesys
 from dendropy.datamodel import basemodel
 from dendropy.datamodel import taxonmodel
 from dendropy import dataio
@@ -726,6 +728,28 @@ class Edge(
     An :term:``edge`` on a :term:``tree``.
     """
 
+    def bipartition_factory(cls, **kwargs):
+        """
+        Creates and returns a |Bipartition| object.
+
+        Derived classes can override this method to provide support for
+        specialized or different types of bipartitions on the tree.
+
+        Parameters
+        ----------
+
+        \*\*kwargs : keyword arguments
+            Passed directly to constructor of |Bipartition|.
+
+        Returns
+        -------
+        |Bipartition|
+            A new |Bipartition| object.
+
+        """
+        return Bipartition(**kwargs)
+    bipartition_factory = classmethod(bipartition_factory)
+
     ###########################################################################
     ### Life-cycle and Identity
 
@@ -866,6 +890,7 @@ class Edge(
         old_tail_node = self.tail_node
         new_head_node = old_tail_node
         grandparent = old_tail_node._parent_node
+        old_tail_node._note_structure_changed()
         if grandparent is not None:
             for idx, ch in enumerate(grandparent._child_nodes):
                 if ch is old_tail_node:
@@ -887,7 +912,7 @@ class Edge(
 
     def _get_bipartition(self):
         if self._bipartition is None:
-            self._bipartition = Bipartition(
+            self._bipartition = self.bipartition_factory(
                     edge=self,
                     is_mutable=True,
                     )
@@ -980,6 +1005,17 @@ class Node(
     A :term:|Node| on a :term:|Tree|.
     """
 
+    # Set when the parent/child links of this node or of any of its
+    # descendants are changed, and cleared by the |Tree| seeded at (or above)
+    # this node when it next caches traversal orders. (Changes to the labels
+    # and taxa of nodes instead update the node indexes and |LCAIndex| in the
+    # cache; see :meth:`Node._note_index_keys_changed()`.)
+    # ``_structure_cache`` is the cache of a |Tree| seeded at this node, if
+    # any, which is discarded by such a change. See
+    # :meth:`Tree._get_traversal_cache()`.
+    _structure_changed = True
+    _structure_cache = None
+
     def edge_factory(cls, **kwargs):
         """
         Creates and returns a |Edge| object.
@@ -1037,6 +1073,13 @@ class Node(
         raise TypeError("Cannot directly copy Node")
 
     def __deepcopy__(self, memo=None):
+        if memo is None:
+            memo = {}
+        if self._structure_cache is not None:
+            # unless the tree is being copied with this node (in which case
+            # the copy of the tree has mapped it to its own, empty, cache),
+            # the copy is not the seed node of any tree
+            memo.setdefault(id(self._structure_cache), None)
         return basemodel.Annotable.__deepcopy__(self, memo=memo)
         # if memo is None:
         #     memo = {}
@@ -1055,6 +1098,54 @@ class Node(
         # return other
         # return super(Node, self).__deepcopy__(memo=memo)
 
+    ###########################################################################
+    ### Label and Taxon
+
+    def _set_label(self, v):
+        if not self._structure_changed and v != self._label:
+            self._note_index_keys_changed(old_label=self._label, new_label=v)
+        self._label = v
+    label = property(basemodel.DataObject._get_label, _set_label)
+
+    def _get_taxon(self):
+        return self._taxon
+    def _set_taxon(self, taxon):
+        if not self._structure_changed and taxon is not self._taxon:
+            self._note_index_keys_changed(old_taxon=self._taxon, new_taxon=taxon)
+        self._taxon = taxon
+    taxon = property(_get_taxon, _set_taxon)
+
+    def _note_index_keys_changed(self,
+            old_label=None,
+            new_label=None,
+            old_taxon=None,
+            new_taxon=None):
+        # Updates the node indexes and |LCAIndex| cached by any tree seeded at
+        # this node or an ancestor for a change of the label or taxon of this
+        # node, which leaves the traversal orders in the cache unchanged. Only
+        # called if this node is not flagged as changed, as otherwise no cache
+        # can be current.
+        nd = self
+        while nd is not None:
+            cache = nd._structure_cache
+            if cache is not None:
+                node_indexes = cache.get("node_indexes", None)
+                if node_indexes is not None:
+                    if old_label is not None or new_label is not None:
+                        Tree._update_node_index(node_indexes, "label",
+                                self, old_label, new_label)
+                    if old_taxon is not None or new_taxon is not None:
+                        Tree._update_node_index(node_indexes, "taxon",
+                                self, old_taxon, new_taxon)
+                        Tree._update_node_index(node_indexes, "taxon_label",
+                                self,
+                                None if old_taxon is None else old_taxon.label,
+                                None if new_taxon is None else new_taxon.label)
+                lca_index = cache.get("lca_index", None)
+                if lca_index is not None and (old_taxon is not None or new_taxon is not None):
+                    lca_index._note_node_taxon_changed(self, old_taxon, new_taxon)
+            nd = nd._parent_node
+
     ###########################################################################
     ### Identity
 
@@ -1638,6 +1729,8 @@ class Node(
         """
         assert node is not self, "Cannot add node as child of itself"
         assert self._parent_node is not node, "Cannot add a node's parent as its child: remove the node from its parent's child set first"
+        node._note_structure_changed()
+        self._note_structure_changed()
         node._parent_node = self
         if node not in self._child_nodes:
             self._child_nodes.append(node)
@@ -1664,6 +1757,8 @@ class Node(
         |Node|
             The node that was added.
         """
+        node._note_structure_changed()
+        self._note_structure_changed()
         node._parent_node = self
         try:
             cur_index = self._child_nodes.index(node)
@@ -1748,6 +1843,7 @@ class Node(
             raise ValueError("Tried to remove an non-existing or null node")
         children = self._child_nodes
         if node in children:
+            node._note_structure_changed()
             node._parent_node = None
             node.edge.tail_node = None
             index = children.index(node)
@@ -1793,6 +1889,7 @@ class Node(
         """
         Removes all child nodes.
         """
+        self._note_structure_changed()
         del self._child_nodes[:] # list.clear() is not in Python 2.7
 
     def reversible_remove_child(self, node, suppress_unifurcations=False):
@@ -1816,6 +1913,7 @@ class Node(
         except:
             raise ValueError("Tried to remove a node that is not listed as a child")
         removed = [(node, self, pos, [], None)]
+        node._note_structure_changed()
         node._parent_node = None
         node.edge.tail_node = None
         children.remove(node)
@@ -1944,6 +2042,7 @@ class Node(
         if new_edge is self._edge:
             return
         if self._parent_node is not None:
+            self._note_structure_changed()
             try:
                 self._parent_node._child_nodes.remove(self)
             except ValueError:
@@ -2008,11 +2107,27 @@ class Node(
     ###########################################################################
     ### Parent Access and Manipulation
 
+    def _note_structure_changed(self):
+        # Flags this node and its ancestors as changed, up to the first one
+        # already flagged, discarding the cache of any tree seeded at them.
+        # Called *before* the links of this node are changed, so that the
+        # tree the node belongs to (until then) is reached.
+        nd = self
+        while nd is not None and not nd._structure_changed:
+            nd._structure_changed = True
+            if nd._structure_cache is not None:
+                nd._structure_cache.clear()
+                nd._structure_cache = None
+            nd = nd._parent_node
+
     def _get_parent_node(self):
         """Returns the parent node of this node."""
         return self._parent_node
     def _set_parent_node(self, parent):
         """Sets the parent node of this node."""
+        self._note_structure_changed()
+        if parent is not None:
+            parent._note_structure_changed()
         if self._parent_node is not None:
             try:
                 self._parent_node._child_nodes.remove(self)
@@ -2445,34 +2560,42 @@ class Node(
         """
         edge_lengths = not kwargs.get('suppress_edge_lengths', False)
         edge_lengths = kwargs.get('edge_lengths', edge_lengths)
-        child_nodes = self.child_nodes()
-        if child_nodes:
-            out.write('(')
-            f_child = child_nodes[0]
-            for child in child_nodes:
-                if child is not f_child:
+        fmt = kwargs.get('edge_length_formatter', None)
+        # Explicit stack of (node, is_first_child, is_closing) entries in
+        # place of recursion, so that very deep trees do not exhaust the
+        # interpreter stack.
+        stack = [(self, True, False)]
+        while stack:
+            node, is_first_child, is_closing = stack.pop()
+            if is_closing:
+                out.write(')')
+            else:
+                if not is_first_child:
                     out.write(',')
-                child._write_newick(out, **kwargs)
-            out.write(')')
-
-        out.write(self._get_node_token(**kwargs))
-        if edge_lengths:
-            e = self.edge
-            if e:
-                sel = e.length
-                if sel is not None:
-                    fmt = kwargs.get('edge_length_formatter', None)
-                    if fmt:
-                        out.write(":%s" % fmt(sel))
-                    else:
-                        s = ""
-                        try:
-                            s = float(sel)
-                            s = str(s)
-                        except ValueError:
-                            s = str(sel)
-                        if s:
-                            out.write(":%s" % s)
+                child_nodes = node._child_nodes
+                if child_nodes:
+                    out.write('(')
+                    stack.append((node, True, True))
+                    for idx in range(len(child_nodes)-1, -1, -1):
+                        stack.append((child_nodes[idx], idx == 0, False))
+                    continue
+            out.write(node._get_node_token(**kwargs))
+            if edge_lengths:
+                e = node.edge
+                if e:
+                    sel = e.length
+                    if sel is not None:
+                        if fmt:
+                            out.write(":%s" % fmt(sel))
+                        else:
+                            s = ""
+                            try:
+                                s = float(sel)
+                                s = str(s)
+                            except ValueError:
+                                s = str(sel)
+                            if s:
+                                out.write(":%s" % s)
 
     def _get_node_token(self, **kwargs):
         """returns a string that is an identifier for the node.  This is called
@@ -2671,6 +2794,55 @@ class Tree(
         return tree
     _parse_and_create_from_stream = classmethod(_parse_and_create_from_stream)
 
+    def get_from_path(cls, src, schema, **kwargs):
+        """
+        Factory method to return a new |Tree| from the file specified by
+        string ``src``.
+
+        If the trees in the file have been indexed by a |TreeFileIndex| (that
+        is up to date), then only the requested tree is parsed, straight from
+        its position in the file. Otherwise, the file is read as by
+        ``get_from_stream()``. Note that in the former case, operational
+        taxonomic unit concepts only referenced by the other trees in the
+        file are not included in the |TaxonNamespace| of the tree.
+
+        Parameters
+        ----------
+        src : string
+            Full file path to source of data.
+        schema : string
+            Specification of data format (e.g., "nexus").
+        \*\*kwargs : keyword arguments, optional
+            As for ``get_from_stream()``.
+
+        Returns
+        -------
+        |Tree|
+            The tree read from the source.
+        """
+        from dendropy.dataio.treefileindex import TreeFileIndex
+        index_kwargs = dict(kwargs)
+        collection_offset = index_kwargs.pop("collection_offset", None)
+        tree_offset = index_kwargs.pop("tree_offset", None)
+        label = index_kwargs.pop("label", None)
+        taxon_namespace = taxonmodel.process_kwargs_dict_for_taxon_namespace(index_kwargs, None)
+        index = TreeFileIndex.load(src,
+                schema=schema,
+                collection_offset=collection_offset if collection_offset is not None else 0,
+                taxon_namespace=taxon_namespace,
+                tree_type=cls,
+                **index_kwargs)
+        if index is None:
+            with filesys.open_file(src, "r", newline=None) as fsrc:
+                return cls._parse_and_create_from_stream(stream=fsrc,
+                        schema=schema,
+                        **kwargs)
+        with index:
+            tree = index[tree_offset if tree_offset is not None else 0]
+        tree.label = label
+        return tree
+    get_from_path = classmethod(get_from_path)
+
     @classmethod
     def get(cls, **kwargs):
         """
@@ -2679,7 +2851,8 @@ class Tree(
         **Mandatory Source-Specification Keyword Argument (Exactly One of the Following Required):**
 
             - **file** (*file*) -- File or file-like object of data opened for reading.
-            - **path** (*str*) -- Path to file of data.
+            - **path** (*str*) -- Path to file of data (which may be
+              compressed with gzip, bzip2 or xz).
             - **url** (*str*) -- URL of data.
             - **data** (*str*) -- Data given directly.
 
@@ -2788,6 +2961,11 @@ class Tree(
         taxon_namespace : |TaxonNamespace| instance
             The operational taxonomic unit concept namespace to use to manage
             taxon definitions.
+        tree_offset : integer, optional
+            Number of trees to skip at the start of *each* file (e.g., as
+            burn-in). With NEWICK and NEXUS sources, these trees are skipped
+            over without being parsed. Negative offsets work like negative
+            list indexes.
         \*\*kwargs : keyword arguments
             These will be passed directly to the schema-parser implementation.
 
@@ -2830,8 +3008,6 @@ class Tree(
                 taxon_namespace = taxonmodel.TaxonNamespace()
         else:
             assert "taxon_set" not in kwargs
-        if "tree_offset" in kwargs:
-            raise TypeError("'tree_offset' is not supported: trees should be skipped/discarded on the client code side")
         tree_yielder = dataio.get_tree_yielder(
                 files,
                 schema,
@@ -2984,7 +3160,7 @@ class Tree(
                     assert cecm != split_to_add
                     new_mask |= cecm
                     new_node_children.append(child)
-                    new_edge.bipartition = Bipartition(
+                    new_edge.bipartition = new_edge.bipartition_factory(
                             leafset_bitmask=new_mask,
                             tree_leafset_bitmask=all_taxa_bitmask,
                             is_mutable=False,
@@ -3182,9 +3358,12 @@ class Tree(
             self._is_rooted = kwargs.pop("is_rooted", None)
             self.weight = None
             self.length_type = None
+            self._traversal_cache = {}
+            self._structure_version = 0
             self._seed_node = None
             self.seed_node = None
             self.bipartition_encoding = None
+            self._bipartition_encoding_positions = None
             self._split_bitmask_edge_map = None
             self._bipartition_edge_map = None
             seed_node = kwargs.pop("seed_node", None)
@@ -3262,6 +3441,13 @@ class Tree(
         return self.__deepcopy__(memo=memo)
 
     def __deepcopy__(self, memo=None):
+        if memo is None:
+            memo = {}
+        # cached traversal orders and positions of bipartitions are not
+        # copied, but rebuilt on demand
+        memo[id(self._traversal_cache)] = {}
+        if self._bipartition_encoding_positions is not None:
+            memo[id(self._bipartition_encoding_positions)] = None
         # ensure clone map
         return basemodel.Annotable.__deepcopy__(self, memo=memo)
         # if memo is None:
@@ -3289,6 +3475,85 @@ class Tree(
         # # return
         # return other
 
+    def __getstate__(self):
+        # positions of bipartitions are keyed by object identity, which does
+        # not survive pickling
+        state = dict(self.__dict__)
+        state["_bipartition_encoding_positions"] = None
+        return state
+
+    def clone_structure(self,
+            copy_annotations=False,
+            copy_on_write=False):
+        """
+        Returns a copy of this tree built in a single (non-recursive)
+        pre-order pass, without going through ``copy.deepcopy()``.
+
+        The copy has the same topology, edge lengths, node and edge labels,
+        rooting state, weight and label as this tree. Nodes reference the same
+        |Taxon| objects, and the copy the same |TaxonNamespace|, as this tree.
+        Nodes are created by the :meth:`Tree.node_factory()` of the class of
+        this tree. Comments and other attributes are not copied.
+
+        Parameters
+        ----------
+        copy_annotations : bool
+            If |True|, then the annotations of the tree, nodes and edges are
+            copied as well (see :meth:`Annotable.copy_annotations_from()`).
+        copy_on_write : bool
+            If |True| (and ``copy_annotations`` is |True|), then each element
+            of the copy shares the |Annotation| objects of the corresponding
+            element of this tree until the annotations of either are first
+            accessed, when they are copied for the side accessed (see
+            :meth:`Annotable.defer_annotations_copy_from()`). This saves time
+            and memory when few of the annotations of either tree will be
+            used again.
+
+        Returns
+        -------
+        t : |Tree|
+            A new tree with the same structure as this one.
+        """
+        other = self.__class__(taxon_namespace=self.taxon_namespace)
+        other._is_rooted = self._is_rooted
+        other.weight = self.weight
+        other.length_type = self.length_type
+        other.label = self.label
+        if copy_annotations:
+            if copy_on_write:
+                copy_annotations_fn = lambda dest, src: dest.defer_annotations_copy_from(src)
+            else:
+                copy_annotations_fn = lambda dest, src: dest.copy_annotations_from(src,
+                        attribute_object_mapper={id(src): dest})
+            if self.has_annotations:
+                copy_annotations_fn(other, self)
+        else:
+            copy_annotations_fn = None
+        node_factory = other.node_factory
+        stack = [(self.seed_node, None)]
+        while stack:
+            nd0, parent = stack.pop()
+            nd1 = node_factory()
+            nd1.label = nd0.label
+            nd1.taxon = nd0.taxon
+            edge0 = nd0.edge
+            edge1 = nd1.edge
+            edge1.length = edge0.length
+            edge1.label = edge0.label
+            if copy_annotations_fn is not None:
+                if nd0.has_annotations:
+                    copy_annotations_fn(nd1, nd0)
+                if edge0.has_annotations:
+                    copy_annotations_fn(edge1, edge0)
+            if parent is None:
+                other.seed_node = nd1
+            else:
+                nd1._parent_node = parent
+                parent._child_nodes.append(nd1)
+            for ch in reversed(nd0._child_nodes):
+                stack.append((ch, nd1))
+        return other
+
     ###########################################################################
     ### Extracting Trees and Subtrees
 
@@ -3461,7 +3726,8 @@ class Tree(
             A new tree based on this one, with nodes filtered out if specified.
 
         """
-        node_filter_fn = lambda nd: nd.taxon is None or nd.taxon in set(taxa)
+        taxa = set(taxa)
+        node_filter_fn = lambda nd: nd.taxon is None or nd.taxon in taxa
         return self.extract_tree(
                 node_filter_fn=node_filter_fn,
                 extraction_source_reference_attr_name=extraction_source_reference_attr_name,
@@ -3525,7 +3791,8 @@ class Tree(
             A new tree based on this one, with nodes filtered out if specified.
 
         """
-        node_filter_fn = lambda nd: nd.taxon is None or nd.taxon.label in set(labels)
+        labels = set(labels)
+        node_filter_fn = lambda nd: nd.taxon is None or nd.taxon.label in labels
         return self.extract_tree(
                 node_filter_fn=node_filter_fn,
                 extraction_source_reference_attr_name=extraction_source_reference_attr_name,
@@ -3589,7 +3856,8 @@ class Tree(
             A new tree based on this one, with nodes filtered out if specified.
 
         """
-        node_filter_fn = lambda nd: nd.taxon is None or nd.taxon not in set(taxa)
+        taxa = set(taxa)
+        node_filter_fn = lambda nd: nd.taxon is None or nd.taxon not in taxa
         return self.extract_tree(
                 node_filter_fn=node_filter_fn,
                 extraction_source_reference_attr_name=extraction_source_reference_attr_name,
@@ -3653,7 +3921,8 @@ class Tree(
             A new tree based on this one, with nodes filtered out if specified.
 
         """
-        node_filter_fn = lambda nd: nd.taxon is None or nd.taxon.label not in set(labels)
+        labels = set(labels)
+        node_filter_fn = lambda nd: nd.taxon is None or nd.taxon.label not in labels
         return self.extract_tree(
                 node_filter_fn=node_filter_fn,
                 extraction_source_reference_attr_name=extraction_source_reference_attr_name,
@@ -3875,10 +4144,12 @@ class Tree(
             given in ``label``, or |None| if no such node is found.
 
         """
-        for node in self.preorder_node_iter():
-            if node.label == label:
-                return node
-        return None
+        if label is None:
+            for node in self.preorder_node_iter():
+                if node.label is None:
+                    return node
+            return None
+        return self._find_indexed_node("label", label)
 
     def find_node_for_taxon(self, taxon):
         """
@@ -3896,13 +4167,12 @@ class Tree(
             Returns first |Node| object with ``taxon`` attribute referencing same
             object as ``taxon`` argument, or |None| if no such node exists.
         """
-        for node in self.postorder_node_iter():
-            try:
-                if node.taxon is taxon:
+        if taxon is None:
+            for node in self.postorder_node_iter():
+                if node.taxon is None:
                     return node
-            except AttributeError:
-                pass
-        return None
+            return None
+        return self._find_indexed_node("taxon", taxon)
 
     def find_node_with_taxon(self, taxon_filter_fn=None):
         """
@@ -3944,7 +4214,7 @@ class Tree(
             ``label``, or|None| if no such node is found.
 
         """
-        return self.find_node_with_taxon(lambda x: x.label == label)
+        return self._find_indexed_node("taxon_label", label)
         # taxon = self.taxon_namespace.get_taxon(label=label)
         # if taxon is None:
         #     return None
@@ -4008,9 +4278,19 @@ class Tree(
             taxa = kwargs.get("taxa", None)
             if taxa is None:
                 if "taxon_labels" in kwargs:
-                    taxa = self.taxon_namespace.get_taxa(labels=kwargs["taxon_labels"])
-                    if len(taxa) != len(kwargs["taxon_labels"]):
-                        raise KeyError("Not all labels matched to taxa")
+                    taxa = []
+                    unindexed_labels = []
+                    for label in kwargs["taxon_labels"]:
+                        node = self.find_node_with_taxon_label(label)
+                        if node is None:
+                            unindexed_labels.append(label)
+                        else:
+                            taxa.append(node.taxon)
+                    if unindexed_labels:
+                        unindexed_taxa = self.taxon_namespace.get_taxa(labels=unindexed_labels)
+                        if len(unindexed_taxa) != len(unindexed_labels):
+                            raise KeyError("Not all labels matched to taxa")
+                        taxa.extend(unindexed_taxa)
                 else:
                     raise TypeError("Must specify one of: 'leafset_bitmask', 'taxa' or 'taxon_labels'")
             if taxa is None:
@@ -4053,6 +4333,170 @@ class Tree(
             #   leaves that have not been encoded with leafset_bitmasks.
             return last_match
 
+    ###########################################################################
+    ### Traversal Caching
+
+    def _get_traversal_cache(self):
+        """
+        Returns the dictionary in which traversal orders and indexes of
+        ``self`` are cached, emptied if the structure of the tree may have
+        changed since they were cached.
+
+        The dictionary is registered with the seed node, and every node of the
+        tree is flagged as unchanged. Changing the parent/child links of a node
+        (through :meth:`Node.add_child()`, :meth:`Node.remove_child()`,
+        rerooting, pruning, etc.) flags it and its ancestors as changed, up to
+        the first one already flagged, and empties the dictionary registered
+        with any of them. The cost of a change is thus bounded by the number of
+        nodes of the tree between validations, and changes to one tree do not
+        affect the caches of others.
+        """
+        seed_node = self._seed_node
+        if seed_node._structure_cache is not self._traversal_cache:
+            self._traversal_cache.clear()
+            for nd in seed_node.preorder_iter():
+                nd._structure_changed = False
+            seed_node._structure_cache = self._traversal_cache
+            self._structure_version += 1
+        return self._traversal_cache
+
+    def _get_structure_version(self):
+        """
+        Returns a number that changes whenever the cached traversal orders and
+        indexes of ``self`` are discarded, i.e., when the structure of the tree
+        may have changed.
+        """
+        self._get_traversal_cache()
+        return self._structure_version
+
+    def _cached_traversal_node_iter(self, order, node_iter_fn, filter_fn):
+        """
+        Iterates over the nodes of ``self`` in the traversal order identified
+        by ``order``, recorded in a list by ``node_iter_fn`` (the corresponding
+        generator of the seed node, called without a filter) unless a list
+        recorded since the structure of the tree last changed is available.
+
+        The iteration is always over such a list, i.e., a snapshot of the
+        tree when the iteration begins: nodes added or removed during the
+        iteration do not change the nodes visited.
+        """
+        cache = self._get_traversal_cache()
+        try:
+            nodes = cache[order]
+        except KeyError:
+            nodes = list(node_iter_fn())
+            cache[order] = nodes
+        if filter_fn is None:
+            return iter(nodes)
+        return (nd for nd in nodes if filter_fn(nd))
+
+    def build_node_indexes(self):
+        """
+        Builds the dictionaries used by :meth:`Tree.find_node_for_taxon()`,
+        :meth:`Tree.find_node_with_label()`,
+        :meth:`Tree.find_node_with_taxon_label()` and
+        :meth:`Tree.mrca()` (with ``taxon_labels``) to look up nodes by taxon,
+        by label and by taxon label.
+
+        The indexes are otherwise built on the first lookup, and rebuilt on a
+        lookup after the structure of the tree, or (for lookups by taxon label)
+        the label of any taxon in :attr:`Tree.taxon_namespace`, has changed.
+        Assigning the ``label`` or ``taxon`` of a node updates the indexes in
+        place instead, so that the nodes of a tree can be looked up and
+        relabeled in turn without rebuilding them. Otherwise, a lookup of a
+        key that is not in the index returns |None| straight away.
+        """
+        taxon_index = {}
+        for node in self.postorder_node_iter():
+            if node.taxon is not None and node.taxon not in taxon_index:
+                taxon_index[node.taxon] = node
+        label_index = {}
+        taxon_label_index = {}
+        for node in self.preorder_node_iter():
+            if node.label is not None and node.label not in label_index:
+                label_index[node.label] = node
+            if node.taxon is not None and node.taxon.label not in taxon_label_index:
+                taxon_label_index[node.taxon.label] = node
+        node_indexes = {
+                "taxon": taxon_index,
+                "label": label_index,
+                "taxon_label": taxon_label_index,
+                "taxon_label_version": self._taxon_label_version(),
+                # keys that may map to a node other than the one indexed
+                # (if any), after the label or taxon of a node has changed
+                "stale_keys": {
+                    "taxon": set(),
+                    "label": set(),
+                    "taxon_label": set(),
+                    },
+                }
+        self._get_traversal_cache()["node_indexes"] = node_indexes
+        return node_indexes
+
+    def _taxon_label_version(self):
+        # changes when a taxon of the namespace of the tree is relabeled
+        return (self.taxon_namespace, self.taxon_namespace._label_version)
+
+    def _find_indexed_node(self, index_name, key):
+        node_indexes = self._get_traversal_cache().get("node_indexes", None)
+        if node_indexes is None or (index_name == "taxon_label"
+                and node_indexes["taxon_label_version"] != self._taxon_label_version()):
+            node_indexes = self.build_node_indexes()
+        stale_keys = node_indexes["stale_keys"][index_name]
+        if stale_keys and key in stale_keys:
+            self._reindex_node_key(node_indexes, index_name, key)
+        return node_indexes[index_name].get(key, None)
+
+    @staticmethod
+    def _update_node_index(node_indexes, index_name, node, old_key, new_key):
+        # Called by :meth:`Node._note_index_keys_changed()`: each key indexed
+        # maps to the first node with the key in the order of the index,
+        # unless it is stale, i.e. may map to another node.
+        index = node_indexes[index_name]
+        stale_keys = node_indexes["stale_keys"][index_name]
+        if old_key is not None and index.get(old_key, None) is node:
+            # another node may also have the key
+            del index[old_key]
+            stale_keys.add(old_key)
+        if new_key is not None and new_key not in stale_keys:
+            other_node = index.get(new_key, None)
+            if other_node is None:
+                index[new_key] = node
+            elif other_node is not node:
+                # either may come first
+                stale_keys.add(new_key)
+
+    def _reindex_node_key(self, node_indexes, index_name, key):
+        if index_name == "taxon":
+            nodes = (nd for nd in self.postorder_node_iter() if nd.taxon is key)
+        elif index_name == "label":
+            nodes = (nd for nd in self.preorder_node_iter() if nd.label == key)
+        else:
+            nodes = (nd for nd in self.preorder_node_iter()
+                    if nd.taxon is not None and nd.taxon.label == key)
+        node = next(nodes, None)
+        if node is None:
+            node_indexes[index_name].pop(key, None)
+        else:
+            node_indexes[index_name][key] = node
+        node_indexes["stale_keys"][index_name].discard(key)
+
+    def clear_traversal_cache(self):
+        """
+        Discards the node lists recorded for repeated traversals of ``self``,
+        as well as the index returned by :meth:`Tree.lca_index()` and the
+        indexes built by :meth:`Tree.build_node_indexes()`.
+
+        Recorded traversal orders are invalidated automatically when the tree
+        structure is modified through the |Node| and |Tree| API; this method
+        is only needed if the ``_child_nodes`` or ``_parent_node`` attributes
+        of nodes have been manipulated directly.
+        """
+        seed_node = self._seed_node
+        if seed_node is not None and seed_node._structure_cache is self._traversal_cache:
+            seed_node._structure_cache = None
+        self._traversal_cache.clear()
+
     ###########################################################################
     ### Node iterators
 
@@ -4084,6 +4528,9 @@ class Tree(
         ``filter_fn`` returns |True| when called with the node as an argument are
         yielded.
 
+        The nodes visited are those of the tree when the iteration begins:
+        nodes added or removed while iterating do not change the sequence.
+
         Parameters
         ----------
         filter_fn : function object, optional
@@ -4097,7 +4544,9 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding nodes in ``self`` in pre-order sequence.
         """
-        return self.seed_node.preorder_iter(filter_fn=filter_fn)
+        return self._cached_traversal_node_iter("preorder",
+                self.seed_node.preorder_iter,
+                filter_fn=filter_fn)
 
     def preorder_internal_node_iter(self, filter_fn=None, exclude_seed_node=False):
         """
@@ -4138,6 +4587,9 @@ class Tree(
         for which ``filter_fn`` returns |True| when called with the node as an
         argument are yielded.
 
+        The nodes visited are those of the tree when the iteration begins:
+        nodes added or removed while iterating do not change the sequence.
+
         Parameters
         ----------
         filter_fn : function object, optional
@@ -4151,7 +4603,9 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding the nodes in ``self`` in post-order sequence.
         """
-        return self.seed_node.postorder_iter(filter_fn=filter_fn)
+        return self._cached_traversal_node_iter("postorder",
+                self.seed_node.postorder_iter,
+                filter_fn=filter_fn)
 
     def postorder_internal_node_iter(self, filter_fn=None, exclude_seed_node=False):
         """
@@ -4249,6 +4703,9 @@ class Tree(
         ``filter_fn``: only nodes for which ``filter_fn`` returns |True| when
         called with the node as an argument are yielded.
 
+        The nodes visited are those of the tree when the iteration begins:
+        nodes added or removed while iterating do not change the sequence.
+
         Parameters
         ----------
         filter_fn : function object, optional
@@ -4262,7 +4719,9 @@ class Tree(
         :py:class:`collections.Iterator` [|Node|]
             An iterator yielding leaf nodes in ``self``.
         """
-        return self.seed_node.leaf_iter(filter_fn=filter_fn)
+        return self._cached_traversal_node_iter("leaf",
+                self.seed_node.leaf_iter,
+                filter_fn=filter_fn)
 
     def leaf_iter(self, filter_fn=None):
         """
@@ -4836,6 +5295,7 @@ class Tree(
     def _get_seed_node(self):
         return self._seed_node
     def _set_seed_node(self, node):
+        self.clear_traversal_cache()
         self._seed_node = node
         if self._seed_node is not None:
             self._seed_node.parent_node = None
@@ -5020,61 +5480,64 @@ class Tree(
         Reroots the tree at the the mid-point of the longest distance between
         two taxa in a tree.
         Sets the rooted flag on the tree to True.
+        The longest path is found in linear time, by finding the leaf farthest
+        from an arbitrary leaf, and then the leaf farthest from that one.
         If ``update_bipartitions`` is True, then the edges' ``bipartition`` and the tree's
-        ``bipartition_encoding`` attributes will be updated.
+        ``bipartition_encoding`` attributes will be updated. If the tree was
+        already encoded as rooted, only the bipartitions of edges on the path
+        between the old and the new seed node are recalculated (see
+        :meth:`Tree.update_bipartitions_on_paths()`).
         If the *old* root of the tree had an outdegree of 2, then after this
         operation, it will have an outdegree of one. In this case, unless
         ``suppress_unifurcations`` is False, then it will be
         removed from the tree.
         """
-        from dendropy.calculate.phylogeneticdistance import PhylogeneticDistanceMatrix
-        pdm = PhylogeneticDistanceMatrix.from_tree(self)
-
-        ## ugly, ugly, ugly code to find two nodes that span the midpoint
-        maxtax1, maxtax2 = pdm.max_pairwise_distance_taxa()
-        spanning_nodes = [None, None]
-        found = 0
-        for nd in self.leaf_node_iter():
-            for tax in (maxtax1, maxtax2):
-                if nd.taxon is tax:
-                    spanning_nodes[found] = nd
-                    found +=1
-                    break
-            if found == 2:
-                break
-        if spanning_nodes[0].distance_from_root() < spanning_nodes[1].distance_from_root():
-            n1 = spanning_nodes[1]
-            n2 = spanning_nodes[0]
-        else:
-            n1 = spanning_nodes[0]
-            n2 = spanning_nodes[1]
-
-        plen = float(pdm.patristic_distance(maxtax1, maxtax2)) / 2
-        mrca_node = pdm.mrca(n1.taxon, n2.taxon)
-        #assert mrca_node is self.mrca(taxa=[n1.taxon, n2.taxon])
-        #mrca_node = self.mrca(taxa=[n1.taxon, n2.taxon])
-        cur_node = n1
+        # Two sweeps: the leaf farthest from any leaf is one end of a longest
+        # path, and the leaf farthest from that is the other end.
+        start_node = next(self.leaf_node_iter())
+        n1, max_dist, predecessors = self._find_farthest_leaf(start_node)
+        n2, max_dist, predecessors = self._find_farthest_leaf(n1)
+        plen = float(max_dist) / 2
 
         break_on_node = None # populated *iff* midpoint is exactly at an existing node
         target_edge = None
         head_node_edge_len = None
 
-        # going up ...
-        while cur_node is not mrca_node:
-            if cur_node.edge.length > plen:
-                target_edge = cur_node.edge
-                head_node_edge_len = plen #cur_node.edge.length - plen
-                plen = 0
+        # walk from n2 back along the path to n1
+        cur_node = n2
+        while True:
+            if plen == 0:
+                break_on_node = cur_node
                 break
-            elif cur_node.edge.length < plen:
-                plen -= cur_node.edge.length
-                cur_node = cur_node._parent_node
+            next_node = predecessors[cur_node]
+            if next_node is cur_node._parent_node:
+                # going up ...
+                edge = cur_node.edge
             else:
-                break_on_node = cur_node
+                # ... or down
+                edge = next_node.edge
+            edge_length = edge.length or 0.0
+            if edge_length > plen:
+                target_edge = edge
+                if edge.head_node is cur_node:
+                    head_node_edge_len = plen
+                else:
+                    head_node_edge_len = edge_length - plen
                 break
+            plen -= edge_length
+            cur_node = next_node
 
         assert break_on_node is not None or target_edge is not None
 
+        # only the edges on the path between the old and the new seed node
+        # change their bipartitions
+        if break_on_node:
+            modified_nodes = [break_on_node]
+        else:
+            modified_nodes = [target_edge.tail_node]
+        while modified_nodes[-1]._parent_node is not None:
+            modified_nodes.append(modified_nodes[-1]._parent_node)
+
         if break_on_node:
             self.reseed_at(break_on_node, update_bipartitions=False, suppress_unifurcations=suppress_unifurcations)
             new_seed_node = break_on_node
@@ -5091,11 +5554,41 @@ class Tree(
             old_tail_node.add_child(new_seed_node)
             new_seed_node.edge.length = tail_node_edge_len
             self.reseed_at(new_seed_node, update_bipartitions=False, suppress_unifurcations=suppress_unifurcations)
+            modified_nodes.append(new_seed_node)
         self.is_rooted = True
         if update_bipartitions:
-            self.update_bipartitions(suppress_unifurcations=False)
+            self.update_bipartitions_on_paths(modified_nodes)
         return self.seed_node
 
+    def _find_farthest_leaf(self, start_node):
+        """
+        Returns the leaf farthest (by edge length, with |None| taken as 0) from
+        ``start_node``, its distance, and a dictionary mapping each node
+        visited to the next node on the path back to ``start_node``.
+        """
+        predecessors = {start_node: None}
+        distances = {start_node: 0.0}
+        farthest_leaf = start_node
+        max_dist = 0.0
+        stack = [start_node]
+        while stack:
+            node = stack.pop()
+            dist = distances[node]
+            if not node._child_nodes and dist > max_dist:
+                farthest_leaf = node
+                max_dist = dist
+            for ch in node._child_nodes:
+                if ch not in predecessors:
+                    predecessors[ch] = node
+                    distances[ch] = dist + (ch.edge.length or 0.0)
+                    stack.append(ch)
+            parent = node._parent_node
+            if parent is not None and parent not in predecessors:
+                predecessors[parent] = node
+                distances[parent] = dist + (node.edge.length or 0.0)
+                stack.append(parent)
+        return farthest_leaf, max_dist, predecessors
+
     def suppress_unifurcations(self, update_bipartitions=False):
         """
         Delete all nodes of outdegree-one from this tree.
@@ -5235,6 +5728,106 @@ class Tree(
         if update_bipartitions:
             self.update_bipartitions()
 
+    def _prune_in_single_pass(self,
+            leaf_filter_fn,
+            emptied_node_filter_fn,
+            internal_node_filter_fn=None,
+            suppress_unifurcations=True,
+            update_bipartitions=False,
+            in_place=True):
+        """
+        Reduces the tree to the nodes retained by the given filters in a single
+        post-order pass.
+
+        ``leaf_filter_fn`` is applied to the leaves of the tree, and
+        ``emptied_node_filter_fn`` to internal nodes all of whose children have
+        been removed: nodes for which these return |False| are removed. If
+        given, ``internal_node_filter_fn`` is applied to internal nodes, and
+        those for which it returns |False| are removed along with all their
+        descendents. The child list of each retained node is built once and, if
+        ``suppress_unifurcations`` is |True|, nodes left with a single child
+        are bypassed, with their edge lengths added to that of the child.
+
+        If ``in_place`` is |True|, this tree is modified and the list of nodes
+        removed by ``leaf_filter_fn`` or ``emptied_node_filter_fn`` is
+        returned. Otherwise, this tree is left unchanged, and a new tree is
+        returned that, as with :meth:`Tree.extract_tree()`, only includes the
+        basic structure and minimal attributes (edge lengths, node and edge
+        labels, and taxon associations).
+        """
+        if in_place:
+            other = self
+        else:
+            other = self.__class__(taxon_namespace=self.taxon_namespace)
+            other._is_rooted = self._is_rooted
+            other.weight = self.weight
+            other.length_type = self.length_type
+            other.label = self.label
+        excluded_node_ids = set()
+        if internal_node_filter_fn is not None:
+            for nd in self.preorder_node_iter():
+                if (id(nd._parent_node) in excluded_node_ids
+                        or (nd._child_nodes and not internal_node_filter_fn(nd))):
+                    excluded_node_ids.add(id(nd))
+        nodes_removed = []
+        # maps id of node of this tree to the node standing in for it
+        retained_nodes = {}
+        for nd in list(self.postorder_node_iter()):
+            if id(nd) in excluded_node_ids:
+                continue
+            new_children = []
+            if nd._child_nodes:
+                for ch in nd._child_nodes:
+                    new_ch = retained_nodes.pop(id(ch), None)
+                    if new_ch is not None:
+                        new_children.append(new_ch)
+                    elif in_place:
+                        ch._parent_node = None
+                if not new_children:
+                    if not emptied_node_filter_fn(nd):
+                        nodes_removed.append(nd)
+                        continue
+                elif len(new_children) == 1 and suppress_unifurcations:
+                    child = new_children[0]
+                    if nd.edge.length is not None:
+                        if child.edge.length is None:
+                            child.edge.length = nd.edge.length
+                        else:
+                            child.edge.length += nd.edge.length
+                    if in_place:
+                        nd._child_nodes = []
+                        nd._parent_node = None
+                    retained_nodes[id(nd)] = child
+                    continue
+            elif not leaf_filter_fn(nd):
+                nodes_removed.append(nd)
+                continue
+            if in_place:
+                new_nd = nd
+            else:
+                new_nd = other.node_factory()
+                new_nd.label = nd.label
+                new_nd.taxon = nd.taxon
+                new_nd.edge.length = nd.edge.length
+                new_nd.edge.label = nd.edge.label
+            new_nd._child_nodes = new_children
+            for ch in new_children:
+                ch._parent_node = new_nd
+            retained_nodes[id(nd)] = new_nd
+        new_seed_node = retained_nodes.get(id(self.seed_node), None)
+        if new_seed_node is None:
+            raise error.SeedNodeDeletionException("Attempting to remove seed node or node without parent")
+        if in_place:
+            # the links of nodes have been changed directly
+            self.clear_traversal_cache()
+        new_seed_node._parent_node = None
+        other.seed_node = new_seed_node
+        if update_bipartitions:
+            other.update_bipartitions()
+        if in_place:
+            return nodes_removed
+        return other
+
     def filter_leaf_nodes(
             self,
             filter_fn,
@@ -5270,24 +5863,15 @@ class Tree(
         nds : list[|Node|]
             List of nodes removed.
         """
-        nodes_removed = []
-        while True:
-            is_nodes_deleted = False
-            nodes_to_remove = [nd for nd in self.leaf_node_iter() if not filter_fn(nd)]
-            for nd in nodes_to_remove:
-                if nd.edge.tail_node is None:
-                    raise error.SeedNodeDeletionException("Attempting to remove seed node or node without parent")
-                nd.edge.tail_node.remove_child(nd)
-            if nodes_to_remove:
-                nodes_removed += nodes_to_remove
-                is_nodes_deleted = True
-            if not is_nodes_deleted or not recursive:
-                break
-        if suppress_unifurcations:
-            self.suppress_unifurcations()
-        if update_bipartitions:
-            self.update_bipartitions()
-        return nodes_removed
+        if recursive:
+            emptied_node_filter_fn = filter_fn
+        else:
+            emptied_node_filter_fn = lambda nd: True
+        return self._prune_in_single_pass(
+                leaf_filter_fn=filter_fn,
+                emptied_node_filter_fn=emptied_node_filter_fn,
+                suppress_unifurcations=suppress_unifurcations,
+                update_bipartitions=update_bipartitions)
 
     def prune_leaves_without_taxa(self,
             recursive=True,
@@ -5297,22 +5881,11 @@ class Tree(
         Removes all terminal nodes that have their ``taxon`` attribute set to
         |None|.
         """
-        nodes_removed = []
-        while True:
-            nodes_to_remove = []
-            for nd in self.leaf_node_iter():
-                if nd.taxon is None:
-                    nodes_to_remove.append(nd)
-            for nd in nodes_to_remove:
-                nd.edge.tail_node.remove_child(nd)
-            nodes_removed += nodes_to_remove
-            if not nodes_to_remove or not recursive:
-                break
-        if suppress_unifurcations:
-            self.suppress_unifurcations()
-        if update_bipartitions:
-            self.update_bipartitions()
-        return nodes_removed
+        return self.filter_leaf_nodes(
+                filter_fn=lambda nd: nd.taxon is not None,
+                recursive=recursive,
+                update_bipartitions=update_bipartitions,
+                suppress_unifurcations=suppress_unifurcations)
 
     def prune_nodes(self, nodes, prune_leaves_without_taxa=False, update_bipartitions=False, suppress_unifurcations=True):
         for nd in nodes:
@@ -5328,66 +5901,94 @@ class Tree(
             update_bipartitions=False,
             suppress_unifurcations=True,
             is_apply_filter_to_leaf_nodes=True,
-            is_apply_filter_to_internal_nodes=False):
+            is_apply_filter_to_internal_nodes=False,
+            in_place=True):
         """
         Removes terminal nodes associated with Taxon objects given by the container
         ``taxa`` (which can be any iterable, including a TaxonNamespace object) from ``self``.
+
+        Leaves left without taxa are removed as well, and the tree is rebuilt
+        in a single pass. If ``in_place`` is |False|, then ``self`` is left
+        unchanged and the pruned tree is returned as a new |Tree| (see
+        :meth:`Tree.extract_tree()`).
         """
         taxa = set(taxa)
-        nodes_to_remove = []
-        for nd in self.postorder_node_iter():
-            if (
-                ((is_apply_filter_to_internal_nodes and nd._child_nodes)
-                or (is_apply_filter_to_leaf_nodes and not nd._child_nodes))
-                and (nd.taxon and nd.taxon in taxa)
-                ):
-                    nd.edge.tail_node.remove_child(nd)
-        self.prune_leaves_without_taxa(update_bipartitions=update_bipartitions,
-                suppress_unifurcations=suppress_unifurcations)
+        if is_apply_filter_to_leaf_nodes:
+            leaf_filter_fn = lambda nd: nd.taxon is not None and nd.taxon not in taxa
+        else:
+            leaf_filter_fn = lambda nd: nd.taxon is not None
+        if is_apply_filter_to_internal_nodes:
+            internal_node_filter_fn = lambda nd: nd.taxon is None or nd.taxon not in taxa
+        else:
+            internal_node_filter_fn = None
+        result = self._prune_in_single_pass(
+                leaf_filter_fn=leaf_filter_fn,
+                emptied_node_filter_fn=leaf_filter_fn,
+                internal_node_filter_fn=internal_node_filter_fn,
+                suppress_unifurcations=suppress_unifurcations,
+                update_bipartitions=update_bipartitions,
+                in_place=in_place)
+        if not in_place:
+            return result
 
     def prune_taxa_with_labels(self,
             labels,
             update_bipartitions=False,
             suppress_unifurcations=True,
             is_apply_filter_to_leaf_nodes=True,
-            is_apply_filter_to_internal_nodes=False):
+            is_apply_filter_to_internal_nodes=False,
+            in_place=True):
         """
         Removes terminal nodes that are associated with Taxon objects with
         labels given by ``labels``.
         """
         taxa = self.taxon_namespace.get_taxa(labels=labels)
-        self.prune_taxa(taxa=taxa,
+        return self.prune_taxa(taxa=taxa,
                 update_bipartitions=update_bipartitions,
                 suppress_unifurcations=suppress_unifurcations,
                 is_apply_filter_to_leaf_nodes=is_apply_filter_to_leaf_nodes,
-                is_apply_filter_to_internal_nodes=is_apply_filter_to_internal_nodes)
+                is_apply_filter_to_internal_nodes=is_apply_filter_to_internal_nodes,
+                in_place=in_place)
 
     def retain_taxa(self,
             taxa,
             update_bipartitions=False,
-            suppress_unifurcations=True):
+            suppress_unifurcations=True,
+            in_place=True):
         """
         Removes terminal nodes that are not associated with any
         of the Taxon objects given by ``taxa`` (which can be any iterable, including a
         TaxonNamespace object) from the ``self``.
+
+        The tree is rebuilt in a single pass. If ``in_place`` is |False|, then
+        ``self`` is left unchanged and the pruned tree is returned as a new
+        |Tree| (see :meth:`Tree.extract_tree()`).
         """
-        to_prune = [t for t in self.taxon_namespace if t not in taxa]
-        self.prune_taxa(to_prune,
+        taxa = set(taxa)
+        leaf_filter_fn = lambda nd: nd.taxon is not None and nd.taxon in taxa
+        result = self._prune_in_single_pass(
+                leaf_filter_fn=leaf_filter_fn,
+                emptied_node_filter_fn=leaf_filter_fn,
+                suppress_unifurcations=suppress_unifurcations,
                 update_bipartitions=update_bipartitions,
-                suppress_unifurcations=suppress_unifurcations)
+                in_place=in_place)
+        if not in_place:
+            return result
 
     def retain_taxa_with_labels(self,
             labels,
             update_bipartitions=False,
-            suppress_unifurcations=True):
+            suppress_unifurcations=True,
+            in_place=True):
         """
         Removes terminal nodes that are not associated with Taxon objects with
         labels given by ``labels``.
         """
         taxa = self.taxon_namespace.get_taxa(labels=labels)
-        self.retain_taxa(taxa=taxa,
+        return self.retain_taxa(taxa=taxa,
                 update_bipartitions=update_bipartitions,
-                suppress_unifurcations=suppress_unifurcations)
+                suppress_unifurcations=suppress_unifurcations,
+                in_place=in_place)
 
     def randomly_reorient(self, rng=None, update_bipartitions=False):
         """
@@ -5462,6 +6063,7 @@ class Tree(
                     total += node_desc_counts[child]
                 total += len(nd._child_nodes)
                 node_desc_counts[nd] = total
+                nd._note_structure_changed()
                 nd._child_nodes.sort(key=lambda n: node_desc_counts[n], reverse=not ascending)
 
     def truncate_from_root(self, distance_from_root):
@@ -5544,6 +6146,33 @@ class Tree(
         from dendropy.calculate.phylogeneticdistance import NodeDistanceMatrix
         return NodeDistanceMatrix.from_tree(tree=self)
 
+    def lca_index(self):
+        """
+        Returns a |LCAIndex| instance for constant-time MRCA and distance
+        queries on the tree.
+
+        The index is kept with the tree and only rebuilt if the structure of
+        the tree may have changed since it was last requested. Changes to edge
+        lengths alone are not detected: call
+        :meth:`Tree.clear_traversal_cache()` after modifying edge lengths to
+        force the index to be rebuilt.
+
+        Returns
+        -------
+        lca_index : a |LCAIndex| instance
+            A |LCAIndex| instance corresponding to the tree in its current
+            state.
+        """
+        from dendropy.calculate.phylogeneticdistance import LCAIndex
+        cache = self._get_traversal_cache()
+        try:
+            return cache["lca_index"]
+        except KeyError:
+            pass
+        lca_index = LCAIndex.from_tree(tree=self)
+        cache["lca_index"] = lca_index
+        return lca_index
+
     def calc_node_ages(self,
             ultrametricity_precision=constants.DEFAULT_ULTRAMETRICITY_PRECISION,
             is_force_max_age=False,
@@ -5885,7 +6514,7 @@ class Tree(
                     tree_edges.append(edge)
                     for child in child_nodes:
                         leafset_bitmask |= child.edge.bipartition._leafset_bitmask
-                edge.bipartition = Bipartition(compile_bipartition=False, is_mutable=True)
+                edge.bipartition = edge.bipartition_factory(compile_bipartition=False, is_mutable=True)
                 edge.bipartition._leafset_bitmask = leafset_bitmask
                 edge.bipartition._is_rooted = self._is_rooted
         # Create normalized bitmasks, where the full (self) bipartition mask is *not*
@@ -5911,6 +6540,211 @@ class Tree(
         """
         self.encode_bipartitions(*args, **kwargs)
 
+    def update_bipartitions_on_paths(self, nodes, is_bipartitions_mutable=False):
+        """
+        Recalculates the bipartitions of edges on the paths between each of
+        ``nodes`` and the seed node, after a local edit of a tree that was
+        previously encoded.
+
+        Only the leafset bitmasks of the edges subtending ``nodes`` and their
+        ancestors are recomputed: the bipartitions of all other edges are
+        assumed to be still valid. ``nodes`` should thus include the
+        parent(s) of every node whose child set was changed, e.g. the old and
+        new parents of a subtree that was moved in a subtree-prune-and-regraft
+        (SPR) move, or the two nodes at either end of the edge across which
+        subtrees were swapped in a nearest-neighbor interchange (NNI). Nodes
+        that were removed from the tree must be included in ``nodes`` as well.
+        Any newly-created node must either be included in ``nodes`` or be an
+        ancestor of one of them, and any subtrees that are added to the tree
+        must have been encoded.
+
+        Unlike :meth:`Tree.encode_bipartitions()`, nodes of outdegree one are
+        not suppressed and unrooted basal bifurcations are not collapsed. If
+        the tree has not been encoded, if the set of leaves of the tree has
+        changed, or if the rooting state of the tree has changed since it was
+        encoded, then the whole tree is re-encoded.
+
+        :attr:`Tree.bipartition_encoding` is updated in place: the new
+        bipartition of each edge on the paths takes the position of its old
+        one, the bipartitions of new edges are appended, and those of edges no
+        longer in the tree are dropped, so that the list is no longer in
+        post-order. If previously built, the entries of these edges in
+        :attr:`Tree.bipartition_edge_map` and
+        :attr:`Tree.split_bitmask_edge_map` are updated likewise. None of the
+        other edges of the tree are visited.
+
+        Parameters
+        ----------
+        nodes : collections.Iterable[|Node|]
+            Nodes at which the structure of the tree was modified, as well as
+            any nodes that were removed from the tree.
+        is_bipartitions_mutable : bool
+            By default, the |Bipartition| instances coded will be locked
+            or frozen, allowing their use in hashing containers such as
+            dictionary (keys) and sets. To allow modification of values, the
+            ``is_mutable`` attribute must be set to |True|.
+
+        Returns
+        -------
+        list[|Bipartition|]
+            A list of |Bipartition| objects of this |Tree|
+            representing the structure of this tree.
+        """
+        seed_node = self.seed_node
+        encoding = self.bipartition_encoding
+        if (not encoding
+                or encoding[0]._is_rooted != self._is_rooted
+                or not encoding[0]._tree_leafset_bitmask):
+            return self.encode_bipartitions(
+                    suppress_unifurcations=False,
+                    collapse_unrooted_basal_bifurcation=False,
+                    is_bipartitions_mutable=is_bipartitions_mutable)
+        old_tree_leafset_bitmask = encoding[0]._tree_leafset_bitmask
+
+        # collect nodes on the paths to the seed node, with their depth, and
+        # nodes that have been removed from the tree
+        node_depths = {}
+        removed_nodes = []
+        for node in nodes:
+            path = []
+            current_node = node
+            while current_node is not None and current_node not in node_depths:
+                path.append(current_node)
+                current_node = current_node._parent_node
+            if current_node is None:
+                if not path or path[-1] is not seed_node:
+                    removed_nodes.append(node)
+                    continue
+                depth = 0
+            else:
+                depth = node_depths[current_node] + 1
+            for path_node in reversed(path):
+                node_depths[path_node] = depth
+                depth += 1
+        path_nodes = sorted(node_depths, key=node_depths.get, reverse=True)
+
+        taxon_namespace = self._taxon_namespace
+        leafset_bitmasks = {}
+        for node in path_nodes:
+            leafset_bitmask = 0
+            if node._child_nodes:
+                for child in node._child_nodes:
+                    try:
+                        leafset_bitmask |= leafset_bitmasks[child]
+                    except KeyError:
+                        leafset_bitmask |= child.edge.bipartition._leafset_bitmask
+            elif node.taxon:
+                leafset_bitmask = taxon_namespace.taxon_bitmask(node.taxon)
+            leafset_bitmasks[node] = leafset_bitmask
+        if leafset_bitmasks.get(seed_node, old_tree_leafset_bitmask) != old_tree_leafset_bitmask:
+            return self.encode_bipartitions(
+                    suppress_unifurcations=False,
+                    collapse_unrooted_basal_bifurcation=False,
+                    is_bipartitions_mutable=is_bipartitions_mutable)
+
+        # positions of the bipartitions in the encoding, kept across calls
+        # for as long as the encoding list itself is not replaced
+        if (self._bipartition_encoding_positions is None
+                or self._bipartition_encoding_positions[0] is not encoding):
+            self._bipartition_encoding_positions = (encoding,
+                    dict((id(b), idx) for idx, b in enumerate(encoding)))
+        positions = self._bipartition_encoding_positions[1]
+        bipartition_edge_map = self._bipartition_edge_map
+        split_bitmask_edge_map = self._split_bitmask_edge_map
+        if not bipartition_edge_map:
+            bipartition_edge_map = None
+            split_bitmask_edge_map = None
+            self._bipartition_edge_map = None
+            self._split_bitmask_edge_map = None
+        # split bitmasks whose entry in the edge maps may have to change hands
+        stale_split_bitmasks = set()
+
+        for node in removed_nodes:
+            edge = node.edge
+            bipartition = edge._bipartition
+            idx = positions.pop(id(bipartition), None)
+            if idx is None or encoding[idx] is not bipartition:
+                continue
+            last_bipartition = encoding.pop()
+            if last_bipartition is not bipartition:
+                encoding[idx] = last_bipartition
+                positions[id(last_bipartition)] = idx
+            if (split_bitmask_edge_map is not None
+                    and split_bitmask_edge_map.get(bipartition._split_bitmask) is edge):
+                del split_bitmask_edge_map[bipartition._split_bitmask]
+                del bipartition_edge_map[bipartition]
+                stale_split_bitmasks.add(bipartition._split_bitmask)
+
+        for node in path_nodes:
+            edge = node.edge
+            old_bipartition = edge._bipartition
+            bipartition = edge.bipartition_factory(compile_bipartition=False, is_mutable=True)
+            bipartition._leafset_bitmask = leafset_bitmasks[node]
+            bipartition._is_rooted = self._is_rooted
+            bipartition.compile_split_bitmask(
+                    tree_leafset_bitmask=old_tree_leafset_bitmask,
+                    is_mutable=is_bipartitions_mutable)
+            edge.bipartition = bipartition
+            idx = positions.pop(id(old_bipartition), None)
+            if idx is None or encoding[idx] is not old_bipartition:
+                positions[id(bipartition)] = len(encoding)
+                encoding.append(bipartition)
+            else:
+                positions[id(bipartition)] = idx
+                encoding[idx] = bipartition
+            if split_bitmask_edge_map is not None:
+                if (old_bipartition is not None
+                        and split_bitmask_edge_map.get(old_bipartition._split_bitmask) is edge):
+                    del split_bitmask_edge_map[old_bipartition._split_bitmask]
+                    del bipartition_edge_map[old_bipartition]
+                    stale_split_bitmasks.add(old_bipartition._split_bitmask)
+                stale_split_bitmasks.add(bipartition._split_bitmask)
+
+        if not stale_split_bitmasks:
+            return encoding
+
+        # Re-assign the entries of the changed split bitmasks. Besides the
+        # edges on the paths, the only edges that can share one of these are
+        # their children (through a node of outdegree one) or the children of
+        # the seed node (through the complementary split on an unrooted
+        # tree). Later edges in post-order win, as in a full rebuild: the
+        # ancestor on a chain of nodes of outdegree one, or else the later
+        # child of the seed node.
+        candidate_nodes = list(path_nodes)
+        for node in path_nodes:
+            candidate_nodes.extend(node._child_nodes)
+        for node in removed_nodes:
+            candidate_nodes.extend(node._child_nodes)
+        candidate_nodes.extend(seed_node._child_nodes)
+        ranked_edges = []
+        seen_nodes = set()
+        for node in candidate_nodes:
+            if node in seen_nodes:
+                continue
+            seen_nodes.add(node)
+            bipartition = node.edge._bipartition
+            if (bipartition is None
+                    or bipartition._split_bitmask not in stale_split_bitmasks
+                    or encoding[positions.get(id(bipartition), -1)] is not bipartition):
+                continue
+            top_node = node
+            chain_length = 0
+            while top_node._parent_node is not None and len(top_node._parent_node._child_nodes) == 1:
+                top_node = top_node._parent_node
+                chain_length += 1
+            if top_node._parent_node is seed_node:
+                top_idx = seed_node._child_nodes.index(top_node)
+            else:
+                top_idx = -1
+            ranked_edges.append(((top_idx, -chain_length), node.edge))
+        ranked_edges.sort(key=lambda x: x[0])
+        for rank, edge in ranked_edges:
+            bipartition = edge._bipartition
+            bipartition_edge_map.pop(bipartition, None)
+            bipartition_edge_map[bipartition] = edge
+            split_bitmask_edge_map[bipartition._split_bitmask] = edge
+        return encoding
+
     def encode_splits(self, *args, **kwargs):
         """
         Recalculates bipartition hashes for tree.
@@ -6200,6 +7034,17 @@ class Tree(
     ###########################################################################
     ### Representation
 
+    def as_flat_tree(self):
+        """
+        Returns an array-backed snapshot of the structure of this tree.
+
+        Returns
+        -------
+        |FlatTree|
+            A new |FlatTree| object representing this tree.
+        """
+        return FlatTree.from_tree(self)
+
     def as_ascii_plot(self, **kwargs):
         """
         Returns a string representation a graphic of this tree using ASCII
@@ -6406,6 +7251,595 @@ class Tree(
                 width=width,
                 )
 
+###############################################################################
+### Compact Tree Components
+
+class CompactBipartition(Bipartition):
+    """
+    A |Bipartition| with its state held in ``__slots__``, used by
+    |CompactTree| to reduce the memory footprint of large trees.
+    """
+
+    __slots__ = (
+            "_split_bitmask",
+            "_leafset_bitmask",
+            "_tree_leafset_bitmask",
+            "_lowest_relevant_bit",
+            "_is_rooted",
+            "is_mutable",
+            )
+
+class CompactEdge(Edge):
+    """
+    An |Edge| with its state held in ``__slots__``, with the comments list
+    and annotations allocated only when first accessed. Used by
+    |CompactTree| to reduce the memory footprint of large trees.
+    """
+
+    __slots__ = (
+            "_label",
+            "_head_node",
+            "rootedge",
+            "length",
+            "_bipartition",
+            "_comments",
+            "_annotations",
+            )
+
+    def bipartition_factory(cls, **kwargs):
+        """
+        Creates and returns a |CompactBipartition| object.
+        """
+        return CompactBipartition(**kwargs)
+    bipartition_factory = classmethod(bipartition_factory)
+
+    def __init__(self, **kwargs):
+        basemodel.DataObject.__init__(self, label=kwargs.pop("label", None))
+        self._head_node = kwargs.pop("head_node", None)
+        if "tail_node" in kwargs:
+            raise TypeError("Setting the tail node directly is no longer supported: instead, set the parent node of the head node")
+        self.rootedge = kwargs.pop("rootedge", None)
+        self.length = kwargs.pop("length", None)
+        if kwargs:
+            raise TypeError("Unsupported keyword arguments: {}".format(kwargs))
+        self._bipartition = None
+
+    def _get_comments(self):
+        try:
+            return self._comments
+        except AttributeError:
+            self._comments = []
+            return self._comments
+    def _set_comments(self, comments):
+        self._comments = comments
+    comments = property(_get_comments, _set_comments)
+
+class CompactNode(Node):
+    """
+    A |Node| with its state held in ``__slots__``, with the comments list
+    and annotations allocated only when first accessed, and subtended by a
+    |CompactEdge|. Used by |CompactTree| to reduce the memory footprint of
+    large trees.
+
+    Note that, as with |Node|, arbitrary attributes can still be assigned to
+    instances of this class, but doing so will forfeit much of the memory
+    savings for the instance in question.
+    """
+
+    __slots__ = (
+            "_label",
+            "_taxon",
+            "age",
+            "_edge",
+            "_child_nodes",
+            "_parent_node",
+            "_comments",
+            "_annotations",
+            "_structure_changed",
+            "_structure_cache",
+            )
+
+    def edge_factory(cls, **kwargs):
+        """
+        Creates and returns a |CompactEdge| object.
+        """
+        return CompactEdge(**kwargs)
+    edge_factory = classmethod(edge_factory)
+
+    def __init__(self, **kwargs):
+        self._structure_changed = True
+        self._structure_cache = None
+        basemodel.DataObject.__init__(self, label=kwargs.pop("label", None))
+        self.taxon = kwargs.pop("taxon", None)
+        self.age = None
+        self._edge = None
+        self._child_nodes = []
+        self._parent_node = None
+        self.edge = self.edge_factory(head_node=self,
+                length=kwargs.pop("edge_length", None))
+        if kwargs:
+            raise TypeError("Unsupported keyword arguments: {}".format(kwargs))
+
+    def _get_comments(self):
+        try:
+            return self._comments
+        except AttributeError:
+            self._comments = []
+            return self._comments
+    def _set_comments(self, comments):
+        self._comments = comments
+    comments = property(_get_comments, _set_comments)
+
+class CompactTree(Tree):
+    """
+    A |Tree| built out of |CompactNode|, |CompactEdge|, and
+    |CompactBipartition| objects, trading the per-instance attribute
+    dictionaries of the standard components for ``__slots__`` and lazily
+    allocating comments and annotations. This substantially reduces the memory
+    footprint of very large trees while retaining the full |Tree| API.
+
+    Trees of this type can be read directly from data sources::
+
+        tree = dendropy.CompactTree.get(path="big.tre", schema="newick")
+        trees = dendropy.TreeList(tree_type=dendropy.CompactTree)
+        trees.read(path="big.trees", schema="nexus")
+
+    """
+
+    def node_factory(cls, **kwargs):
+        """
+        Creates and returns a |CompactNode| object.
+        """
+        return CompactNode(**kwargs)
+    node_factory = classmethod(node_factory)
+
+###############################################################################
+### FlatTree
+
+class FlatTree(object):
+    """
+    An array-backed snapshot of the structure of a |Tree|.
+
+    Nodes are identified by their 0-based index in a pre-order traversal of
+    the source tree, so that the seed node has index 0 and every node has a
+    larger index than its parent. The topology and node data are stored in the
+    following parallel arrays, indexed by node:
+
+        ``parent_indexes``
+            Index of the parent node, or -1 for the seed node.
+        ``first_child_indexes``
+            Index of the first child node, or -1 for leaves.
+        ``next_sibling_indexes``
+            Index of the next sibling node, or -1 for last children.
+        ``num_child_nodes``
+            Number of child nodes.
+        ``edge_lengths``
+            Length of the subtending edge as a float, with NaN representing
+            an edge length of |None|.
+        ``taxon_indexes``
+            Accession index of the associated |Taxon| in ``taxon_namespace``
+            (see :meth:`TaxonNamespace.accession_index()`), or -1 if no taxon
+            is associated with the node.
+
+    In addition, ``postorder_indexes`` gives the node indexes in post-order
+    sequence, and the lists ``node_labels`` and ``edge_labels`` give the node
+    and edge labels. Annotations and comments are not carried over.
+
+    As children always have larger indexes than their parents, iterating
+    over the node indexes in reverse (``range(len(flat_tree)-1, -1, -1)``)
+    visits every node after all of its descendants, which is the fastest way
+    to accumulate values from the tips towards the root.
+
+    A |FlatTree| is a snapshot: it is not updated to reflect subsequent
+    changes to the |Tree| from which it was created.
+
+    Examples
+    --------
+
+    ::
+
+        tree = dendropy.Tree.get(path="big.tre", schema="newick")
+        flat_tree = tree.as_flat_tree()
+        ages = flat_tree.calc_node_ages()
+        pdm = dendropy.PhylogeneticDistanceMatrix.from_tree(flat_tree)
+        b1 = treemeasure.B1(flat_tree)
+        tree2 = flat_tree.as_tree()
+
+    """
+
+    def from_tree(cls, tree):
+        """
+        Creates and returns a |FlatTree| representing the structure of
+        ``tree``.
+
+        Parameters
+        ----------
+        tree : |Tree|
+            The source tree.
+
+        Returns
+        -------
+        |FlatTree|
+            A new |FlatTree| object.
+        """
+        flat_tree = cls(taxon_namespace=tree.taxon_namespace,
+                is_rooted=tree.is_rooted,
+                label=tree.label)
+        flat_tree._populate_from_seed_node(tree.seed_node)
+        return flat_tree
+    from_tree = classmethod(from_tree)
+
+    ###########################################################################
+    ### Life-cycle
+
+    def __init__(self, taxon_namespace=None, is_rooted=None, label=None):
+        """
+        Creates an empty |FlatTree|: use :meth:`FlatTree.from_tree()` or
+        :meth:`Tree.as_flat_tree()` to create a populated instance.
+        """
+        self.taxon_namespace = taxon_namespace
+        self.is_rooted = is_rooted
+        self.label = label
+        self.parent_indexes = array.array("l")
+        self.first_child_indexes = array.array("l")
+        self.next_sibling_indexes = array.array("l")
+        self.num_child_nodes = array.array("l")
+        self.edge_lengths = array.array("d")
+        self.taxon_indexes = array.array("l")
+        self.postorder_indexes = array.array("l")
+        self.node_labels = []
+        self.edge_labels = []
+        self.node_ages = None
+        self._accession_index_taxon_map = None
+
+    def _populate_from_seed_node(self, seed_node):
+        taxon_namespace = self.taxon_namespace
+        parent_indexes = self.parent_indexes
+        first_child_indexes = self.first_child_indexes
+        next_sibling_indexes = self.next_sibling_indexes
+        num_child_nodes = self.num_child_nodes
+        edge_lengths = self.edge_lengths
+        taxon_indexes = self.taxon_indexes
+        node_labels = self.node_labels
+        edge_labels = self.edge_labels
+        nan = float("nan")
+        node_index_map = {}
+        last_child_indexes = []
+        for index, node in enumerate(seed_node.preorder_iter()):
+            node_index_map[node] = index
+            if index == 0:
+                parent_indexes.append(-1)
+            else:
+                parent_index = node_index_map[node._parent_node]
+                parent_indexes.append(parent_index)
+                prev_sibling_index = last_child_indexes[parent_index]
+                if prev_sibling_index < 0:
+                    first_child_indexes[parent_index] = index
+                else:
+                    next_sibling_indexes[prev_sibling_index] = index
+                last_child_indexes[parent_index] = index
+            last_child_indexes.append(-1)
+            first_child_indexes.append(-1)
+            next_sibling_indexes.append(-1)
+            num_child_nodes.append(len(node._child_nodes))
+            edge = node._edge
+            if edge.length is None:
+                edge_lengths.append(nan)
+            else:
+                edge_lengths.append(edge.length)
+            if node.taxon is None:
+                taxon_indexes.append(-1)
+            else:
+                taxon_indexes.append(taxon_namespace.accession_index(node.taxon))
+            node_labels.append(node.label)
+            edge_labels.append(edge.label)
+        self._compile_postorder_indexes()
+
+    def _compile_postorder_indexes(self):
+        # As the subtree of a node occupies a contiguous block of the
+        # post-order sequence ending with the node itself, the post-order
+        # position of each node can be assigned in a single pre-order pass
+        # once the subtree sizes are known.
+        num_nodes = len(self.parent_indexes)
+        parent_indexes = self.parent_indexes
+        first_child_indexes = self.first_child_indexes
+        next_sibling_indexes = self.next_sibling_indexes
+        subtree_sizes = [1] * num_nodes
+        for index in range(num_nodes-1, 0, -1):
+            subtree_sizes[parent_indexes[index]] += subtree_sizes[index]
+        positions = [0] * num_nodes
+        postorder_indexes = array.array("l", [0] * num_nodes)
+        if num_nodes:
+            positions[0] = num_nodes - 1
+        for index in range(num_nodes):
+            postorder_indexes[positions[index]] = index
+            slot = positions[index] - subtree_sizes[index] + 1
+            ch = first_child_indexes[index]
+            while ch >= 0:
+                slot += subtree_sizes[ch]
+                positions[ch] = slot - 1
+                ch = next_sibling_indexes[ch]
+        self.postorder_indexes = postorder_indexes
+
+    def as_tree(self, tree_factory=None, taxon_namespace=None):
+        """
+        Reconstructs and returns a |Tree| from this |FlatTree|.
+
+        Parameters
+        ----------
+        tree_factory : function object
+            A function that takes a ``taxon_namespace`` keyword argument and
+            returns a new |Tree| (or derived) object. If |None|, then |Tree|
+            is used.
+        taxon_namespace : |TaxonNamespace|
+            Taxon namespace of the new tree. If |None| (default), then
+            the taxon namespace of this |FlatTree| is used.
+
+        Returns
+        -------
+        |Tree|
+            A new tree with the same structure, edge lengths, labels, and
+            taxa as this |FlatTree|.
+        """
+        if tree_factory is None:
+            tree_factory = Tree
+        if taxon_namespace is None:
+            taxon_namespace = self.taxon_namespace
+        tree = tree_factory(taxon_namespace=taxon_namespace)
+        tree.is_rooted = self.is_rooted
+        tree.label = self.label
+        node_factory = tree.node_factory
+        parent_indexes = self.parent_indexes
+        edge_lengths = self.edge_lengths
+        edge_labels = self.edge_labels
+        nodes = []
+        for index, label in enumerate(self.node_labels):
+            taxon = self.taxon(index)
+            if taxon is not None and taxon_namespace is not self.taxon_namespace:
+                taxon = taxon_namespace.require_taxon(label=taxon.label)
+            if index == 0:
+                node = tree.seed_node
+                node.label = label
+                node.taxon = taxon
+            else:
+                node = node_factory(label=label, taxon=taxon)
+                nodes[parent_indexes[index]].add_child(node)
+            edge_length = edge_lengths[index]
+            if edge_length == edge_length:
+                node.edge.length = edge_length
+            if edge_labels[index] is not None:
+                node.edge.label = edge_labels[index]
+            nodes.append(node)
+        return tree
+
+    def __len__(self):
+        return len(self.parent_indexes)
+
+    ###########################################################################
+    ### Access
+
+    def taxon(self, index):
+        """
+        Returns the |Taxon| associated with the node at ``index``, or |None|
+        if there is no taxon associated with the node.
+        """
+        accession_index = self.taxon_indexes[index]
+        if accession_index < 0:
+            return None
+        if self._accession_index_taxon_map is None:
+            self._accession_index_taxon_map = {}
+            for taxon in self.taxon_namespace:
+                self._accession_index_taxon_map[self.taxon_namespace.accession_index(taxon)] = taxon
+        return self._accession_index_taxon_map[accession_index]
+
+    def edge_length(self, index):
+        """
+        Returns the length of the edge subtending the node at ``index``,
+        or |None| if the length is not defined.
+        """
+        edge_length = self.edge_lengths[index]
+        if edge_length != edge_length:
+            return None
+        return edge_length
+
+    def is_leaf(self, index):
+        """
+        Returns |True| if the node at ``index`` has no children.
+        """
+        return self.num_child_nodes[index] == 0
+
+    def child_index_iter(self, index):
+        """
+        Iterates over the indexes of the child nodes of the node at ``index``.
+        """
+        ch = self.first_child_indexes[index]
+        next_sibling_indexes = self.next_sibling_indexes
+        while ch >= 0:
+            yield ch
+            ch = next_sibling_indexes[ch]
+
+    def child_indexes(self, index):
+        """
+        Returns list of indexes of child nodes of the node at ``index``.
+        """
+        return list(self.child_index_iter(index))
+
+    def preorder_index_iter(self):
+        """
+        Iterates over node indexes in pre-order sequence.
+        """
+        return iter(range(len(self.parent_indexes)))
+
+    def postorder_index_iter(self):
+        """
+        Iterates over node indexes in post-order sequence.
+        """
+        return iter(self.postorder_indexes)
+
+    def leaf_index_iter(self):
+        """
+        Iterates over the indexes of the leaf nodes, in pre-order sequence.
+        """
+        num_child_nodes = self.num_child_nodes
+        return (index for index in range(len(num_child_nodes)) if not num_child_nodes[index])
+
+    ###########################################################################
+    ### Calculations
+
+    def length(self):
+        """
+        Returns sum of defined edge lengths on the tree.
+        """
+        return sum(v for v in self.edge_lengths if v == v)
+
+    def leafset_bitmasks(self):
+        """
+        Returns a list of the leafset bitmasks (see
+        :attr:`Bipartition.leafset_bitmask`) of the edges subtending each
+        node, indexed by node.
+        """
+        taxon_indexes = self.taxon_indexes
+        parent_indexes = self.parent_indexes
+        num_child_nodes = self.num_child_nodes
+        leafset_bitmasks = [0] * len(parent_indexes)
+        for index in range(len(parent_indexes)-1, -1, -1):
+            if not num_child_nodes[index] and taxon_indexes[index] >= 0:
+                leafset_bitmasks[index] |= 1 << taxon_indexes[index]
+            if index:
+                leafset_bitmasks[parent_indexes[index]] |= leafset_bitmasks[index]
+        return leafset_bitmasks
+
+    def encode_bipartitions(self, is_bipartitions_mutable=False):
+        """
+        Calculates and returns the bipartitions of the edges subtending each
+        node, in post-order sequence (as with :meth:`Tree.encode_bipartitions()`).
+
+        Unlike :meth:`Tree.encode_bipartitions()`, the structure is never
+        modified, i.e., nodes of outdegree one are not suppressed and
+        basal bifurcations of unrooted trees are not collapsed.
+
+        Parameters
+        ----------
+        is_bipartitions_mutable : bool
+            By default, the |Bipartition| instances created will be locked or
+            frozen, allowing their use in hashing containers. To allow
+            modification of values, the ``is_mutable`` attribute must be set
+            to |True|.
+
+        Returns
+        -------
+        list[|Bipartition|]
+            The bipartitions of the edges subtending each node, in
+            post-order sequence.
+        """
+        leafset_bitmasks = self.leafset_bitmasks()
+        if not leafset_bitmasks:
+            return []
+        tree_leafset_bitmask = leafset_bitmasks[0]
+        is_rooted = self.is_rooted
+        bipartitions = []
+        for index in self.postorder_indexes:
+            bipartitions.append(Bipartition(
+                leafset_bitmask=leafset_bitmasks[index],
+                tree_leafset_bitmask=tree_leafset_bitmask,
+                is_rooted=is_rooted,
+                is_mutable=is_bipartitions_mutable))
+        return bipartitions
+
+    def calc_node_ages(self,
+            ultrametricity_precision=constants.DEFAULT_ULTRAMETRICITY_PRECISION,
+            is_force_max_age=False,
+            is_force_min_age=False,
+            is_return_internal_node_ages_only=False):
+        """
+        Calculates the age of each node (the sum of edge lengths from the node
+        to the tips), as with :meth:`Tree.calc_node_ages()`. Undefined edge
+        lengths are treated as 0.0.
+
+        The ages are stored in the ``node_ages`` array, indexed by node.
+
+        Parameters
+        ----------
+        ultrametricity_precision : numeric or bool or None
+            If the lengths of different paths to the node differ by more than
+            ``ultrametricity_precision``, then a ValueError exception will be
+            raised indicating deviation from ultrametricity. If
+            ``ultrametricity_precision`` is negative or False, then this check
+            will be skipped.
+        is_force_max_age: bool
+            If |True|, each node will be set to the oldest age given its child
+            set and the subtending edge lengths.
+        is_force_min_age: bool
+            If |True|, each node will be set to the youngest age given its
+            child set and the subtending edge lengths.
+        is_return_internal_node_ages_only : bool
+            If |True|, only the ages of internal nodes are returned.
+
+        Returns
+        -------
+        a : iterable[numeric]
+            Returns collection of node ages, in post-order sequence.
+        """
+        if is_force_max_age and is_force_min_age:
+            raise ValueError("Cannot specify both 'is_force_max_age' and 'is_force_min_age'")
+        is_check_ultrametricity = not (is_force_max_age
+                or is_force_min_age
+                or ultrametricity_precision is None
+                or ultrametricity_precision is False
+                or ultrametricity_precision < 0)
+        num_nodes = len(self.parent_indexes)
+        edge_lengths = self.edge_lengths
+        num_child_nodes = self.num_child_nodes
+        first_child_indexes = self.first_child_indexes
+        next_sibling_indexes = self.next_sibling_indexes
+        node_ages = array.array("d", [0.0] * num_nodes)
+        for index in range(num_nodes-1, -1, -1):
+            if not num_child_nodes[index]:
+                continue
+            ch = first_child_indexes[index]
+            age = None
+            while ch >= 0:
+                edge_length = edge_lengths[ch]
+                if edge_length != edge_length:
+                    edge_length = 0.0
+                ch_age = node_ages[ch] + edge_length
+                if age is None:
+                    age = ch_age
+                elif is_force_max_age:
+                    age = max(age, ch_age)
+                elif is_force_min_age:
+                    age = min(age, ch_age)
+                elif is_check_ultrametricity and abs(age - ch_age) > ultrametricity_precision:
+                    raise error.UltrametricityError(
+                            "Tree is not ultrametric within threshold of {}: {}.\nEncountered at node with index {} (label: {})".format(
+                                ultrametricity_precision,
+                                abs(age - ch_age),
+                                index,
+                                self.node_labels[index]))
+                ch = next_sibling_indexes[ch]
+            node_ages[index] = age
+        self.node_ages = node_ages
+        if is_return_internal_node_ages_only:
+            return [node_ages[index] for index in self.postorder_indexes if num_child_nodes[index]]
+        else:
+            return [node_ages[index] for index in self.postorder_indexes]
+
+    def calc_node_root_distances(self):
+        """
+        Returns an array of the sum of (defined) edge lengths from each node
+        to the root, indexed by node.
+        """
+        num_nodes = len(self.parent_indexes)
+        parent_indexes = self.parent_indexes
+        edge_lengths = self.edge_lengths
+        root_distances = array.array("d", [0.0] * num_nodes)
+        for index in range(1, num_nodes):
+            edge_length = edge_lengths[index]
+            if edge_length != edge_length:
+                edge_length = 0.0
+            root_distances[index] = root_distances[parent_indexes[index]] + edge_length
+        return root_distances
+
 ###############################################################################
 ### AsciiTreePlot
 
@@ -6553,20 +7987,15 @@ class AsciiTreePlot(object):
         First pass through tree, post-order traversal to calculate
         coordinates of each node.
         """
-        child_nodes = node.child_nodes()
-        if child_nodes:
-            for n in child_nodes:
-                self.calc_plot(n, edge_scale_factor)
-            ys = [self.node_row[n] for n in child_nodes]
-            self.node_row[node] = int(float((max(ys)-min(ys)) / 2) + min(ys))
-        else:
-            self.node_row[node] = self.current_leaf_row
-            self.current_leaf_row = self.current_leaf_row + self.leaf_spacing_factor
-        if node.edge.length is None:
-            self.node_col[node] = 1
-        else:
-            self.node_col[node] = int(float(self.node_offset[node]) * edge_scale_factor)
-        self.node_col[node] = int(float(self.node_offset[node]) * edge_scale_factor)
+        for nd in node.postorder_iter():
+            child_nodes = nd._child_nodes
+            if child_nodes:
+                ys = [self.node_row[n] for n in child_nodes]
+                self.node_row[nd] = int(float((max(ys)-min(ys)) / 2) + min(ys))
+            else:
+                self.node_row[nd] = self.current_leaf_row
+                self.current_leaf_row = self.current_leaf_row + self.leaf_spacing_factor
+            self.node_col[nd] = int(float(self.node_offset[nd]) * edge_scale_factor)
 
     def draw_label(self, label, row, start_col):
         if label:
@@ -6578,35 +8007,50 @@ class AsciiTreePlot(object):
         """
         Second pass through tree, plotting nodes onto given self.grid.
         """
-        child_nodes = node.child_nodes()
-        if child_nodes:
-            for i, child_node in enumerate(child_nodes):
-                start_row = min([self.node_row[node], self.node_row[child_node]])
-                end_row = max([self.node_row[node], self.node_row[child_node]])
+        # Explicit stack of (step, node, child index) entries in place of
+        # recursion, replaying the drawing steps in the same order (later
+        # steps may overwrite cells drawn by earlier ones).
+        stack = [("enter", node, None)]
+        while stack:
+            step, nd, i = stack.pop()
+            if step == "enter":
+                child_nodes = nd._child_nodes
+                if child_nodes:
+                    stack.append(("exit", nd, None))
+                    for i in range(len(child_nodes)-1, -1, -1):
+                        stack.append(("connect", nd, i))
+                        stack.append(("enter", child_nodes[i], None))
+                        stack.append(("mark", nd, i))
+                else:
+                    label = self.get_label_for_node(nd)
+                    self.draw_label(label, self.node_row[nd], self.node_col[nd]+1)
+            elif step == "mark":
+                child_nodes = nd._child_nodes
+                child_node = child_nodes[i]
                 if i == 0:
-                    self.grid[self.node_row[child_node]][self.node_col[node]] = '/'
-                    start_row = start_row+1
-                    edge_row = self.node_row[child_node]
+                    ch = '/'
                 elif i == len(child_nodes)-1:
-                    self.grid[self.node_row[child_node]][self.node_col[node]] = '\\'
-                    edge_row = self.node_row[child_node]
+                    ch = '\\'
                 else:
-                    self.grid[self.node_row[child_node]][self.node_col[node]] = '+'
-                    edge_row = self.node_row[child_node]
-                self.draw_node(child_node)
-                for x in range(self.node_col[node]+1, self.node_col[child_node]):
+                    ch = '+'
+                self.grid[self.node_row[child_node]][self.node_col[nd]] = ch
+            elif step == "connect":
+                child_node = nd._child_nodes[i]
+                start_row = min([self.node_row[nd], self.node_row[child_node]])
+                end_row = max([self.node_row[nd], self.node_row[child_node]])
+                if i == 0:
+                    start_row = start_row+1
+                edge_row = self.node_row[child_node]
+                for x in range(self.node_col[nd]+1, self.node_col[child_node]):
                     self.grid[edge_row][x] = '-'
                 for y in range(start_row, end_row):
-                    self.grid[y][self.node_col[node]] = '|'
-            label = []
-            if self.show_internal_node_labels:
-                label = self.get_label_for_node(node)
-                self.draw_internal_text(label, self.node_row[node], self.node_col[node])
+                    self.grid[y][self.node_col[nd]] = '|'
             else:
-                self.grid[self.node_row[node]][self.node_col[node]]='+'
-        else:
-            label = self.get_label_for_node(node)
-            self.draw_label(label, self.node_row[node], self.node_col[node]+1)
+                if self.show_internal_node_labels:
+                    label = self.get_label_for_node(nd)
+                    self.draw_internal_text(label, self.node_row[nd], self.node_col[nd])
+                else:
+                    self.grid[self.node_row[nd]][self.node_col[nd]]='+'
 
     def draw_internal_text(self, label, r, c):
         row = self.grid[r]
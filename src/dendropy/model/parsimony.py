@@ -22,8 +22,11 @@ Models, modeling and model-fitting of parsimony.
 """
 
 from functools import reduce
+import math
 import operator
+import multiprocessing
 import dendropy
+from dendropy.utility import bitprocessing
 from dendropy.utility.error import TaxonNamespaceIdentityError
 
 class _NodeStateSetMap(dict):
@@ -305,6 +308,296 @@ def fitch_up_pass(
             result.append(final_ss)
         setattr(nd, state_sets_attr_name, result)
 
+def _set_bit_indexes(mask):
+    # ``bin(mask)[:1:-1]`` is the binary representation of ``mask`` with the
+    # least-significant bit first and without the "0b" prefix
+    return [idx for idx, bit in enumerate(bin(mask)[:1:-1]) if bit == "1"]
+
+class BitPackedFitch(object):
+    """
+    Fitch's (1971) unordered parsimony algorithm, carried out for all
+    characters at once with bitwise operations on state sets packed into
+    integers, rather than character-by-character with operations on ``set``
+    objects as in :func:`fitch_down_pass()` and :func:`fitch_up_pass()`.
+
+    The state sets of all the characters of a node are packed "bit-sliced"
+    into a tuple with an (arbitrarily large) integer for each state in
+    ``states``, in which bit ``i`` is set if the state is in the state set
+    of character ``i``. The intersections and unions of the state sets of
+    all the characters are then given by a bitwise AND or OR for each state,
+    and the characters requiring a change by the bits not set in any of the
+    intersections, the weighted number of which is given by counting set
+    bits.
+
+    An object of this class is prepared once from a map of taxa to state
+    sets, as returned by
+    :meth:`DiscreteCharacterMatrix.taxon_state_sets_map()` or used by
+    :func:`fitch_down_pass()`, and can then be used to score any number of
+    trees with its :meth:`fitch_down_pass()` and :meth:`fitch_up_pass()`
+    methods, which correspond to the functions of the same name. The state
+    sets of leaves are always given by their taxa.
+
+    Examples
+    --------
+
+    ::
+
+        taxon_state_sets_map = data.taxon_state_sets_map(gaps_as_missing=True)
+        fitch = BitPackedFitch(taxon_state_sets_map)
+        score = fitch.fitch_down_pass(tree.postorder_node_iter())
+        fitch.fitch_up_pass(tree.preorder_node_iter())
+        for nd in tree:
+            print(fitch.unpack(nd.state_sets))
+
+    """
+
+    def __init__(self, taxon_state_sets_map, weights=None):
+        """
+        Parameters
+        ----------
+        taxon_state_sets_map : dict[taxon] = state sets
+            A dictionary that takes a taxon object as a key and returns a
+            state set list as a value.
+        weights : iterable
+            A list of weights for each pattern.
+        """
+        num_characters = None
+        states = set()
+        for state_sets in taxon_state_sets_map.values():
+            if num_characters is None:
+                num_characters = len(state_sets)
+            elif len(state_sets) != num_characters:
+                raise ValueError("State set lists of unequal length")
+            for ss in state_sets:
+                states.update(ss)
+        self.num_characters = num_characters or 0
+        self.states = sorted(states)
+        self.weights = None if weights is None else list(weights)
+        if self.weights is not None and len(self.weights) != self.num_characters:
+            raise ValueError("Expecting {} weights but found {}".format(self.num_characters, len(self.weights)))
+        self._all_characters_mask = (1 << self.num_characters) - 1
+        if self.weights is None:
+            self._weight_masks = None
+        else:
+            # characters of each weight, so that the weighted score of a set
+            # of characters can be given by counting set bits
+            weight_indexes = {}
+            for idx, weight in enumerate(self.weights):
+                weight_indexes.setdefault(weight, []).append(idx)
+            self._weight_masks = []
+            for weight, indexes in weight_indexes.items():
+                if weight:
+                    self._weight_masks.append((weight, reduce(operator.or_, (1 << idx for idx in indexes))))
+        self.taxon_packed_state_sets_map = {}
+        for taxon, state_sets in taxon_state_sets_map.items():
+            self.taxon_packed_state_sets_map[taxon] = self.pack(state_sets)
+
+    def pack(self, state_sets):
+        """
+        Returns a list of the state sets of each character packed into
+        integers.
+
+        Parameters
+        ----------
+        state_sets : list of sets
+            The state set of each character.
+
+        Returns
+        -------
+        p : tuple of ints
+            An integer for each state in ``states``, in which bit ``i`` is set
+            if the state is in ``state_sets[i]``.
+        """
+        if len(state_sets) != self.num_characters:
+            raise ValueError("Expecting {} state sets but found {}".format(self.num_characters, len(state_sets)))
+        if not state_sets:
+            return tuple(0 for state in self.states)
+        reversed_state_sets = state_sets[::-1]
+        packed = []
+        for state in self.states:
+            bits = "".join("1" if state in ss else "0" for ss in reversed_state_sets)
+            packed.append(int(bits, 2))
+        return tuple(packed)
+
+    def unpack(self, packed_state_sets):
+        """
+        Returns the list of state sets of each character packed into
+        ``packed_state_sets``.
+
+        Parameters
+        ----------
+        packed_state_sets : tuple of ints
+            An integer for each state in ``states``, as returned by
+            :meth:`pack()` or stored on nodes by :meth:`fitch_down_pass()`
+            or :meth:`fitch_up_pass()`.
+
+        Returns
+        -------
+        s : list of sets
+            The state set of each character.
+        """
+        state_sets = [set() for idx in range(self.num_characters)]
+        for state, mask in zip(self.states, packed_state_sets):
+            for idx in _set_bit_indexes(mask):
+                state_sets[idx].add(state)
+        return state_sets
+
+    def _child_state_sets(self, node, node_state_sets_map, state_sets_attr_name):
+        if node.is_leaf():
+            return self.taxon_packed_state_sets_map[node.taxon]
+        try:
+            return node_state_sets_map[node]
+        except KeyError:
+            if state_sets_attr_name is None:
+                raise
+            return getattr(node, state_sets_attr_name)
+
+    def fitch_down_pass(self,
+            postorder_nodes,
+            state_sets_attr_name="state_sets",
+            score_by_character_list=None):
+        """
+        Returns the parsimony score given a list of nodes in postorder.
+
+        Parameters
+        ----------
+        postorder_nodes : iterable of/over |Node| objects
+            An iterable of |Node| objects in in order of post-order
+            traversal of the tree.
+        state_sets_attr_name : str
+            Name of attribute on |Node| objects in which the packed state sets
+            will stored/accessed. If |None|, then state sets will not be
+            stored on the tree.
+        score_by_character_list : None or list
+            If not |None|, should be a reference to a list object.
+            This list will be populated by the scores on a character-by-character
+            basis.
+
+        Returns
+        -------
+        s : int
+            Parismony score of tree.
+        """
+        if score_by_character_list is not None:
+            assert len(score_by_character_list) == 0
+        change_masks = None if score_by_character_list is None else []
+        node_state_sets_map = {}
+        score = 0
+        for nd in postorder_nodes:
+            c = nd.child_nodes()
+            if not c:
+                result = self.taxon_packed_state_sets_map[nd.taxon]
+            else:
+                result = self._child_state_sets(c[0], node_state_sets_map, state_sets_attr_name)
+                for ch in c[1:]:
+                    result, num_changes = self._combine(
+                            result,
+                            self._child_state_sets(ch, node_state_sets_map, state_sets_attr_name),
+                            change_masks)
+                    score += num_changes
+                node_state_sets_map[nd] = result
+            if state_sets_attr_name is not None:
+                setattr(nd, state_sets_attr_name, result)
+        if score_by_character_list is not None:
+            score_by_character_list.extend(self._score_by_character(change_masks))
+        return score
+
+    def _topology_down_pass(self, topology, score_by_character_list=None):
+        # As `fitch_down_pass()`, but over a tree given by `_postorder_topology()`
+        # and with the packed state sets of leaves keyed by the taxon indexes
+        # used in it.
+        change_masks = None if score_by_character_list is None else []
+        node_state_sets = []
+        score = 0
+        for entry in topology:
+            if isinstance(entry, tuple):
+                result = node_state_sets[entry[0]]
+                for idx in entry[1:]:
+                    result, num_changes = self._combine(result, node_state_sets[idx], change_masks)
+                    score += num_changes
+            else:
+                result = self.taxon_packed_state_sets_map[entry]
+            node_state_sets.append(result)
+        if score_by_character_list is not None:
+            score_by_character_list.extend(self._score_by_character(change_masks))
+        return score
+
+    def _combine(self, left_ssl, right_ssl, change_masks):
+        # Returns the down-pass packed state sets of a node given those of two
+        # of its children, and the (weighted) number of changes required.
+        inters = [left_ss & right_ss for left_ss, right_ss in zip(left_ssl, right_ssl)]
+        no_inter = self._all_characters_mask ^ reduce(operator.or_, inters, 0)
+        if not no_inter:
+            return tuple(inters), 0
+        result = tuple(inter | ((left_ss | right_ss) & no_inter)
+                for inter, left_ss, right_ss in zip(inters, left_ssl, right_ssl))
+        if change_masks is not None:
+            change_masks.append(no_inter)
+        if self._weight_masks is None:
+            return result, bitprocessing.num_set_bits(no_inter)
+        num_changes = 0
+        for weight, weight_mask in self._weight_masks:
+            num_changes += weight * bitprocessing.num_set_bits(no_inter & weight_mask)
+        return result, num_changes
+
+    def _score_by_character(self, change_masks):
+        scores = [0] * self.num_characters
+        for mask in change_masks:
+            for idx in _set_bit_indexes(mask):
+                scores[idx] += 1 if self.weights is None else self.weights[idx]
+        return scores
+
+    def fitch_up_pass(self,
+            preorder_node_list,
+            state_sets_attr_name="state_sets"):
+        """
+        Finalizes the packed state sets associated with each node by a
+        previous call to :meth:`fitch_down_pass()` using the "final phase" of
+        Fitch's (1971) unordered parsimony algorithm.
+
+        Parameters
+        ----------
+        preorder_node_list : iterable of/over |Node| objects
+            An iterable of |Node| objects in in order of pre-order
+            traversal of the tree.
+        state_sets_attr_name : str
+            Name of attribute on |Node| objects in which the packed state sets
+            are stored.
+
+        Notes
+        -----
+        Currently this requires a bifurcating tree (even at the root).
+        """
+        all_characters_mask = self._all_characters_mask
+        for nd in preorder_node_list:
+            c = nd.child_nodes()
+            p = nd.parent_node
+            if (not c) or (not p):
+                continue
+            assert(len(c) == 2)
+            left_ssl, right_ssl = [self._child_state_sets(ch, {}, state_sets_attr_name) for ch in c]
+            par_ssl = getattr(p, state_sets_attr_name)
+            curr_ssl = getattr(nd, state_sets_attr_name)
+            # characters for which the parent state set is not a subset of
+            # the down-pass state set of this node
+            not_in_curr = 0
+            for par_ss, curr_ss in zip(par_ssl, curr_ssl):
+                not_in_curr |= par_ss & ~curr_ss
+            if not not_in_curr:
+                setattr(nd, state_sets_attr_name, par_ssl)
+                continue
+            in_left_and_right = 0
+            for left_ss, right_ss in zip(left_ssl, right_ssl):
+                in_left_and_right |= left_ss & right_ss
+            in_curr = all_characters_mask ^ not_in_curr
+            union_chars = not_in_curr & ~in_left_and_right
+            merge_chars = not_in_curr & in_left_and_right
+            result = tuple(
+                    (par_ss & in_curr)
+                    | ((par_ss | curr_ss) & union_chars)
+                    | (((par_ss & (left_ss | right_ss)) | curr_ss) & merge_chars)
+                    for par_ss, curr_ss, left_ss, right_ss in zip(par_ssl, curr_ssl, left_ssl, right_ssl))
+            setattr(nd, state_sets_attr_name, result)
 
 def parsimony_score(
         tree,
@@ -312,6 +605,8 @@ def parsimony_score(
         gaps_as_missing=True,
         weights=None,
         score_by_character_list=None,
+        compress_site_patterns=False,
+        bit_packed=False,
         ):
     """
     Calculates the score of a tree, ``tree``, given some character data,
@@ -334,6 +629,20 @@ def parsimony_score(
         If not |None|, should be a reference to a list object.
         This list will be populated by the scores on a character-by-character
         basis.
+    compress_site_patterns : bool
+        If |True|, then the tree is scored once for each distinct site
+        pattern of ``chars`` (see
+        :meth:`DiscreteCharacterMatrix.compress_site_patterns()`), with the
+        scores of the patterns weighted by the number of sites showing them,
+        rather than once for each site. The score and the scores by character
+        are the same, but the state sets are not stored on the nodes of
+        ``tree``.
+    bit_packed : bool
+        If |True|, then the tree is scored by a `BitPackedFitch` object,
+        with the state sets of all characters packed into integers, rather
+        than with a ``set`` object for each character and node. The score and
+        the scores by character are the same, but the state sets are not
+        stored on the nodes of ``tree``.
 
     Returns
     -------
@@ -393,12 +702,49 @@ def parsimony_score(
     If the same data is going to be used to score multiple trees or multiple times,
     it is probably better to generate the 'taxon_state_sets_map' once and call
     "fitch_down_pass" directly yourself, as this function generates a new map
-    each time.
+    each time. The map can be generated for the site patterns of the data,
+    with the number of sites of each pattern passed as the weights::
+
+        site_patterns = chars.compress_site_patterns()
+        taxon_state_sets_map = chars.taxon_state_sets_map(
+                gaps_as_missing=False,
+                site_patterns=site_patterns)
+        score = fitch_down_pass(
+                tree.postorder_node_iter(),
+                taxon_state_sets_map=taxon_state_sets_map,
+                weights=site_patterns.weights)
 
     """
     if tree.taxon_namespace is not chars.taxon_namespace:
-        raise TaxonNamespaceIdentityError(tree, data)
+        raise TaxonNamespaceIdentityError(tree, chars)
+    def down_pass(taxon_state_sets_map, weights, score_by_character_list):
+        if bit_packed:
+            fitch = BitPackedFitch(taxon_state_sets_map, weights=weights)
+            return fitch.fitch_down_pass(tree.postorder_node_iter(),
+                    state_sets_attr_name=None,
+                    score_by_character_list=score_by_character_list)
+        return fitch_down_pass(tree.postorder_node_iter(),
+                state_sets_attr_name=None,
+                taxon_state_sets_map=taxon_state_sets_map,
+                weights=weights,
+                score_by_character_list=score_by_character_list)
+    if compress_site_patterns:
+        site_patterns = chars.compress_site_patterns()
+        taxon_state_sets_map = chars.taxon_state_sets_map(
+                gaps_as_missing=gaps_as_missing,
+                site_patterns=site_patterns)
+        if weights is None and score_by_character_list is None:
+            return down_pass(taxon_state_sets_map, site_patterns.weights, None)
+        pattern_scores = []
+        down_pass(taxon_state_sets_map, None, pattern_scores)
+        pscore, site_scores = _expand_pattern_scores(site_patterns, pattern_scores, weights)
+        if score_by_character_list is not None:
+            assert len(score_by_character_list) == 0
+            score_by_character_list.extend(site_scores)
+        return pscore
     taxon_state_sets_map = chars.taxon_state_sets_map(gaps_as_missing=gaps_as_missing)
+    if bit_packed:
+        return down_pass(taxon_state_sets_map, weights, score_by_character_list)
     nodes = tree.postorder_node_iter()
     pscore = fitch_down_pass(nodes,
             taxon_state_sets_map=taxon_state_sets_map,
@@ -406,3 +752,165 @@ def parsimony_score(
             score_by_character_list=score_by_character_list)
     return pscore
 
+def parsimony_scores(
+        trees,
+        chars,
+        gaps_as_missing=True,
+        weights=None,
+        score_by_character_lists=None,
+        num_processes=None,
+        ):
+    """
+    Calculates the scores of a collection of trees, ``trees``, given some
+    character data, ``chars``, under the parsimony model using the Fitch
+    algorithm, as :func:`parsimony_score()` does for a single tree. The data
+    is prepared just once for all the trees: the site patterns of ``chars``
+    are compressed, and their state sets packed into integers for scoring by
+    a `BitPackedFitch` object.
+
+    Parameters
+    ----------
+    trees : |TreeList|, |TreeArray| or iterable of |Tree| instances
+        The trees to be scored. Must reference the same |TaxonNamespace| as
+        ``chars``. The trees of a |TreeArray| are restored one at a time.
+    chars : a |CharacterMatrix| instance
+        A |CharacterMatrix|-derived object with data to be scored. Must have
+        the same |TaxonNamespace| as ``trees``.
+    gap_as_missing : bool
+        If |True| [default], then gaps will be treated as missing data.
+        If |False|, then gaps will be treated as a new/additional state.
+    weights : iterable
+        A list of weights for each column in the matrix.
+    score_by_character_lists : None or list
+        If not |None|, should be a reference to a list object.
+        This list will be populated by a list of the scores on a
+        character-by-character basis for each tree.
+    num_processes : int
+        If greater than 1, then the trees are scored in a pool of this many
+        processes.
+
+    Returns
+    -------
+    pscores : list
+        The parsimony score of each tree given the data.
+
+    Examples
+    --------
+
+    ::
+
+        taxon_namespace = dendropy.TaxonNamespace()
+        chars = dendropy.DnaCharacterMatrix.get(
+                path="pythonidae.chars.nexus",
+                schema="nexus",
+                taxon_namespace=taxon_namespace)
+        trees = dendropy.TreeList.get(
+                path="pythonidae.random.bd0301.tre",
+                schema="nexus",
+                taxon_namespace=taxon_namespace)
+        scores = treescore.parsimony_scores(trees, chars, num_processes=4)
+
+    """
+    if isinstance(trees, dendropy.TreeArray):
+        tree_array = trees
+        trees = (tree_array.restore_tree(idx) for idx in range(len(tree_array)))
+    site_patterns = chars.compress_site_patterns()
+    taxon_indexes = dict((taxon, idx) for idx, taxon in enumerate(site_patterns.taxa))
+    taxon_state_sets_map = chars.taxon_state_sets_map(
+            gaps_as_missing=gaps_as_missing,
+            site_patterns=site_patterns)
+    index_state_sets_map = dict((taxon_indexes[taxon], state_sets)
+            for taxon, state_sets in taxon_state_sets_map.items())
+    # The scores of each pattern are only needed to give the scores of each
+    # site, or to weight sites with the same pattern differently.
+    is_scored_by_pattern = weights is not None or score_by_character_lists is not None
+    if is_scored_by_pattern:
+        fitch = BitPackedFitch(index_state_sets_map)
+    else:
+        fitch = BitPackedFitch(index_state_sets_map, weights=site_patterns.weights)
+    topologies = _postorder_topologies(trees, chars, taxon_indexes)
+    if num_processes is not None and num_processes > 1:
+        topologies = list(topologies)
+        if len(topologies) > 1:
+            results = _map_over_processes(fitch, topologies, is_scored_by_pattern, num_processes)
+        else:
+            results = (_score_topology(fitch, topology, is_scored_by_pattern) for topology in topologies)
+    else:
+        results = (_score_topology(fitch, topology, is_scored_by_pattern) for topology in topologies)
+    pscores = []
+    for result in results:
+        if is_scored_by_pattern:
+            pscore, site_scores = _expand_pattern_scores(site_patterns, result, weights)
+            if score_by_character_lists is not None:
+                score_by_character_lists.append(site_scores)
+        else:
+            pscore = result
+        pscores.append(pscore)
+    return pscores
+
+def _expand_pattern_scores(site_patterns, pattern_scores, weights):
+    # Returns the total score and the score of each site given the unweighted
+    # score of each site pattern and the weight of each site.
+    site_scores = site_patterns.expand(pattern_scores)
+    if weights is None:
+        return sum(s * w for s, w in zip(pattern_scores, site_patterns.weights)), site_scores
+    site_scores = [s * w for s, w in zip(site_scores, weights)]
+    return sum(site_scores), site_scores
+
+def _postorder_topologies(trees, chars, taxon_indexes):
+    # Yields each tree as a list of its nodes in postorder, each given by the
+    # index of its taxon if a leaf or by a tuple of the positions of its
+    # children in the list otherwise: a compact form of the tree that can be
+    # passed to other processes.
+    for tree in trees:
+        if tree.taxon_namespace is not chars.taxon_namespace:
+            raise TaxonNamespaceIdentityError(tree, chars)
+        node_positions = {}
+        topology = []
+        for nd in tree.postorder_node_iter():
+            child_nodes = nd.child_nodes()
+            if child_nodes:
+                topology.append(tuple(node_positions[ch] for ch in child_nodes))
+            else:
+                topology.append(taxon_indexes[nd.taxon])
+            node_positions[nd] = len(topology) - 1
+        yield topology
+
+def _score_topology(fitch, topology, is_scored_by_pattern):
+    if is_scored_by_pattern:
+        pattern_scores = []
+        fitch._topology_down_pass(topology, pattern_scores)
+        return pattern_scores
+    return fitch._topology_down_pass(topology)
+
+def _map_over_processes(fitch, topologies, is_scored_by_pattern, num_processes):
+    # Scores ``topologies`` in a pool of ``num_processes`` processes, each
+    # given ``fitch`` just once, yielding the results in order.
+    # several tasks per process, to even out the load
+    chunk_size = int(math.ceil(len(topologies) / float(num_processes * 4)))
+    tasks = []
+    for idx in range(0, len(topologies), chunk_size):
+        tasks.append((topologies[idx:idx+chunk_size], is_scored_by_pattern))
+    pool = multiprocessing.Pool(
+            processes=min(num_processes, len(tasks)),
+            initializer=_initialize_worker,
+            initargs=(fitch,))
+    try:
+        for results in pool.imap(_score_topologies_in_worker, tasks):
+            for result in results:
+                yield result
+        pool.close()
+    finally:
+        pool.terminate()
+        pool.join()
+
+# The `BitPackedFitch` object of each worker process.
+_worker_fitch = None
+
+def _initialize_worker(fitch):
+    global _worker_fitch
+    _worker_fitch = fitch
+
+def _score_topologies_in_worker(task):
+    topologies, is_scored_by_pattern = task
+    return [_score_topology(_worker_fitch, topology, is_scored_by_pattern) for topology in topologies]
@@ -21,6 +21,7 @@
 Various utilities in support of filesystem interaction.
 """
 
+import io
 import fnmatch
 import time
 import os
@@ -60,6 +61,99 @@ def pre_py34_open(file,
             mode=mode,
             buffering=buffering)
 
+###############################################################################
+## Compressed Files
+
+# Compression formats recognized, as (name, magic bytes, file extensions).
+COMPRESSION_FORMATS = (
+        ("gzip", b"\x1f\x8b", (".gz", ".gzip")),
+        ("bz2", b"BZh", (".bz2",)),
+        ("xz", b"\xfd7zXZ\x00", (".xz", ".lzma")),
+        )
+
+# Size of the buffers used when reading or writing compressed files, which
+# is much larger than the default so that the (de)compressor works on large
+# blocks of data.
+COMPRESSED_FILE_BUFFER_SIZE = 1 << 20
+
+def get_compression(path, is_detect_from_content=True):
+    """
+    Returns the name of the compression format ("gzip", "bz2" or "xz") of the
+    file at ``path``, or |None| if it is not compressed.
+
+    If ``is_detect_from_content`` is |True| (default) and ``path`` is an
+    existing regular file, then the format is identified by the "magic bytes"
+    at the start of the file. Otherwise (e.g., for a file yet to be written,
+    or a named pipe, which cannot be peeked into), the format is inferred
+    from the extension of ``path``.
+    """
+    if is_detect_from_content and os.path.isfile(path):
+        with open(path, "rb") as src:
+            head = src.read(8)
+        for name, magic, extensions in COMPRESSION_FORMATS:
+            if head.startswith(magic):
+                return name
+        return None
+    ext = os.path.splitext(path)[1].lower()
+    for name, magic, extensions in COMPRESSION_FORMATS:
+        if ext in extensions:
+            return name
+    return None
+
+def _open_compressed_binary_file(path, mode, compression):
+    if compression == "gzip":
+        import gzip
+        return gzip.GzipFile(path, mode)
+    elif compression == "bz2":
+        import bz2
+        return bz2.BZ2File(path, mode)
+    elif compression == "xz":
+        import lzma
+        return lzma.LZMAFile(path, mode)
+    raise ValueError("Unsupported compression format: '{}' (supported formats: {})".format(
+        compression,
+        ", ".join("'{}'".format(c[0]) for c in COMPRESSION_FORMATS)))
+
+def open_file(path, mode="r", compression=None, newline=None):
+    """
+    Opens the file at ``path`` as a text stream, (de)compressing it on the
+    fly if it is (to be) compressed.
+
+    Parameters
+    ----------
+    path : string
+        Path to the file.
+    mode : string
+        "r" (default), "w" or "a".
+    compression : string or |None|
+        Compression format of the file: "gzip", "bz2", "xz" or "none". If
+        |None| (default), then, for reading, this is detected from the
+        content of the file (see :func:`get_compression()`), and, for
+        writing, inferred from the extension of ``path`` (".gz", ".bz2",
+        ".xz", etc.).
+    newline : string or |None|
+        As for the built-in ``open()``.
+
+    Returns
+    -------
+    s : file-like object
+        Text stream reading from or writing to the file.
+    """
+    if compression is None:
+        compression = get_compression(path, is_detect_from_content=mode.startswith("r"))
+    elif compression == "none":
+        compression = None
+    if compression is None:
+        if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
+            return pre_py34_open(path, mode, newline=newline)
+        return open(path, mode, newline=newline)
+    binary_file = _open_compressed_binary_file(path, mode[0] + "b", compression)
+    if mode.startswith("r"):
+        buffered_file = io.BufferedReader(binary_file, buffer_size=COMPRESSED_FILE_BUFFER_SIZE)
+    else:
+        buffered_file = io.BufferedWriter(binary_file, buffer_size=COMPRESSED_FILE_BUFFER_SIZE)
+    return io.TextIOWrapper(buffered_file, newline=newline)
+
 ###############################################################################
 ## LineReadingThread
 
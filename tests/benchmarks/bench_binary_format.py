@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Times reading and writing a synthetic posterior sample of trees as NEXUS,
+NEWICK and "dendropy-bin" data, and saving and restoring a |TreeArray| of the
+trees in the "dendropy-bin" format as opposed to rebuilding it from the
+NEXUS file.
+
+Usage::
+
+    python bench_binary_format.py [NUM_TREES [NUM_TIPS]]
+"""
+
+import os
+import sys
+import random
+import shutil
+import tempfile
+import timeit
+import dendropy
+from bench_tree_offset import posterior_sample
+
+def main():
+    num_trees = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    num_tips = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    tempdir = tempfile.mkdtemp()
+    try:
+        nexus_path = os.path.join(tempdir, "trees.nex")
+        with open(nexus_path, "w") as dest:
+            dest.write(posterior_sample(num_trees, num_tips, random.Random(1)))
+        trees = dendropy.TreeList.get(path=nexus_path, schema="nexus")
+        sys.stdout.write("{} trees of {} tips\n".format(num_trees, num_tips))
+        for schema, filename in (
+                ("nexus", "trees.nex"),
+                ("newick", "trees.tre"),
+                ("dendropy-bin", "trees.bin"),
+                ):
+            path = os.path.join(tempdir, filename)
+            t_write = timeit.timeit(lambda: trees.write(path=path, schema=schema), number=1)
+            t_read = timeit.timeit(lambda: dendropy.TreeList.get(path=path, schema=schema), number=1)
+            sys.stdout.write("    {:<12} ({:>6.2f} MB): write {:>7.3f} s, read {:>7.3f} s\n".format(
+                schema, os.path.getsize(path) / 1e6, t_write, t_read))
+        tree_array = dendropy.TreeArray()
+        t_build = timeit.timeit(lambda: tree_array.read(path=nexus_path, schema="nexus"), number=1)
+        array_path = os.path.join(tempdir, "tree-array.bin")
+        t_write = timeit.timeit(lambda: tree_array.write(path=array_path, schema="dendropy-bin"), number=1)
+        t_read = timeit.timeit(lambda: dendropy.TreeArray.get(path=array_path, schema="dendropy-bin"), number=1)
+        sys.stdout.write("    TreeArray: build from NEXUS {:.3f} s; dendropy-bin ({:.2f} MB): write {:.3f} s, read {:.3f} s\n".format(
+            t_build, os.path.getsize(array_path) / 1e6, t_write, t_read))
+    finally:
+        shutil.rmtree(tempdir)
+
+if __name__ == "__main__":
+    main()
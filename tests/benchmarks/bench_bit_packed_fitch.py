@@ -0,0 +1,88 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Compares the time taken by the Fitch down and up passes over random trees
+for alignments in the test data, with a ``set`` object for each character
+and node and with the state sets of all characters packed into integers by
+``BitPackedFitch``. The time taken by the latter includes packing the state
+sets of the alignment.
+
+Usage::
+
+    python bench_bit_packed_fitch.py [NUM_TREES]
+"""
+
+import os
+import sys
+import random
+import gc
+import timeit
+import dendropy
+from dendropy.model import parsimony
+from dendropy.simulate import treesim
+
+CHARS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "chars")
+ALIGNMENTS = (
+        "apternodus.chars.nexus",
+        "caenophidia_mos.chars.nexus",
+        "COII_Apes.nex",
+        "orti.nex",
+        "primates.chars.nexus",
+        "pythonidae.chars.nexus",
+        )
+
+def set_based_passes(trees, taxon_state_sets_map):
+    for tree in trees:
+        parsimony.fitch_down_pass(tree.postorder_node_iter(),
+                taxon_state_sets_map=taxon_state_sets_map)
+        parsimony.fitch_up_pass(tree.preorder_node_iter(),
+                taxon_state_sets_map=taxon_state_sets_map)
+
+def bit_packed_passes(trees, taxon_state_sets_map):
+    fitch = parsimony.BitPackedFitch(taxon_state_sets_map)
+    for tree in trees:
+        fitch.fitch_down_pass(tree.postorder_node_iter(), state_sets_attr_name="packed_state_sets")
+        fitch.fitch_up_pass(tree.preorder_node_iter(), state_sets_attr_name="packed_state_sets")
+
+def main():
+    num_trees = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    rng = random.Random(1)
+    sys.stdout.write("down and up passes over {} random trees:\n".format(num_trees))
+    for filename in ALIGNMENTS:
+        char_matrix = dendropy.DataSet.get(
+                path=os.path.join(CHARS_DIR, filename),
+                schema="nexus").char_matrices[0]
+        taxon_state_sets_map = char_matrix.taxon_state_sets_map(gaps_as_missing=False)
+        trees = [treesim.pure_kingman_tree(taxon_namespace=char_matrix.taxon_namespace, rng=rng)
+                for idx in range(num_trees)]
+        sys.stdout.write("{} ({} sequences of {} sites):\n".format(
+            filename, len(char_matrix), char_matrix.max_sequence_size))
+        for description, fn in (
+                ("sets", set_based_passes),
+                ("bit-packed", bit_packed_passes),
+                ):
+            gc.collect()
+            start = timeit.default_timer()
+            fn(trees, taxon_state_sets_map)
+            t = timeit.default_timer() - start
+            sys.stdout.write("    {:<12}: {:>7.3f} s\n".format(description, t))
+
+if __name__ == "__main__":
+    main()
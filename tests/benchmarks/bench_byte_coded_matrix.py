@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Compares the time taken to read a random DNA alignment, and the memory taken
+by the resulting |DnaCharacterMatrix|, with sequences stored as lists of
+|StateIdentity| objects and as byte-coded arrays.
+
+Usage::
+
+    python bench_byte_coded_matrix.py [NUM_SEQUENCES [NUM_SITES]]
+"""
+
+import sys
+import random
+import gc
+import timeit
+import tracemalloc
+import dendropy
+
+def random_alignment(schema, num_sequences, num_sites):
+    rng = random.Random(1)
+    char_matrix = dendropy.DnaCharacterMatrix(byte_coded=True)
+    for idx in range(num_sequences):
+        taxon = char_matrix.taxon_namespace.new_taxon(label="s{}".format(idx))
+        char_matrix[taxon].extend_symbols("".join(rng.choice("ACGT") for i in range(num_sites)))
+    return char_matrix.as_string(schema)
+
+def main():
+    num_sequences = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    num_sites = int(sys.argv[2]) if len(sys.argv) > 2 else 20000
+    sys.stdout.write("{} sequences of {} sites\n".format(num_sequences, num_sites))
+    for schema in ("fasta", "phylip", "nexus"):
+        data = random_alignment(schema, num_sequences, num_sites)
+        sys.stdout.write("{}:\n".format(schema))
+        for description, byte_coded in (
+                ("lists", False),
+                ("byte-coded", True),
+                ):
+            gc.collect()
+            tracemalloc.start()
+            start = timeit.default_timer()
+            char_matrix = dendropy.DnaCharacterMatrix.get(
+                    data=data,
+                    schema=schema,
+                    byte_coded=byte_coded)
+            t = timeit.default_timer() - start
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            sys.stdout.write("    {:<12}: {:>7.3f} s, {:>8.1f} MB\n".format(
+                description, t, size / 1e6))
+            del char_matrix
+
+if __name__ == "__main__":
+    main()
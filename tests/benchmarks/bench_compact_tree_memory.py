@@ -0,0 +1,94 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Compares the per-node memory footprint of |Tree| and |CompactTree|.
+
+Usage::
+
+    python bench_compact_tree_memory.py [NUM_TIPS]
+"""
+
+import sys
+import gc
+import tracemalloc
+import dendropy
+
+def balanced_newick(num_tips):
+    labels = ["T{}".format(i) for i in range(num_tips)]
+    subtrees = ["{}:1.0".format(label) for label in labels]
+    while len(subtrees) > 1:
+        paired = []
+        for i in range(0, len(subtrees) - 1, 2):
+            paired.append("({},{}):1.0".format(subtrees[i], subtrees[i+1]))
+        if len(subtrees) % 2:
+            paired.append(subtrees[-1])
+        subtrees = paired
+    return subtrees[0] + ";"
+
+def measure(tree_type, tree_str, taxon_namespace, encode_bipartitions):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tree = tree_type.get(
+            data=tree_str,
+            schema="newick",
+            taxon_namespace=taxon_namespace)
+    if encode_bipartitions:
+        tree.encode_bipartitions()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    num_nodes = len(tree.nodes())
+    return (after - before) / float(num_nodes), num_nodes
+
+def main():
+    if len(sys.argv) > 1:
+        num_tips = int(sys.argv[1])
+    else:
+        num_tips = 20000
+    tree_str = balanced_newick(num_tips)
+    taxon_namespace = dendropy.TaxonNamespace()
+    # populate the taxon namespace (and its bitmask cache) so that taxa are
+    # not counted
+    dendropy.Tree.get(
+            data=tree_str,
+            schema="newick",
+            taxon_namespace=taxon_namespace).encode_bipartitions()
+    for encode_bipartitions in (False, True):
+        if encode_bipartitions:
+            sys.stdout.write("With bipartitions encoded:\n")
+        else:
+            sys.stdout.write("Structure only:\n")
+        results = []
+        for tree_type in (dendropy.Tree, dendropy.CompactTree):
+            bytes_per_node, num_nodes = measure(
+                    tree_type,
+                    tree_str,
+                    taxon_namespace,
+                    encode_bipartitions)
+            results.append(bytes_per_node)
+            sys.stdout.write("    {:<12} {:>8} nodes: {:>8.1f} bytes/node\n".format(
+                tree_type.__name__,
+                num_nodes,
+                bytes_per_node))
+        sys.stdout.write("    Reduction: {:.1%}\n".format(1.0 - results[1]/results[0]))
+
+if __name__ == "__main__":
+    main()
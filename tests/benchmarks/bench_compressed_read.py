@@ -0,0 +1,68 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Times reading a synthetic NEXUS posterior sample of trees from an
+uncompressed file and from gzip-, bzip2- and xz-compressed copies of it, along
+with the time taken just to decompress each copy.
+
+Usage::
+
+    python bench_compressed_read.py [NUM_TREES [NUM_TIPS]]
+"""
+
+import os
+import sys
+import random
+import shutil
+import tempfile
+import timeit
+import dendropy
+from dendropy.utility import filesys
+from bench_tree_offset import posterior_sample
+
+def decompress(path):
+    with filesys.open_file(path) as src:
+        while src.read(1 << 20):
+            pass
+
+def main():
+    num_trees = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    num_tips = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    tempdir = tempfile.mkdtemp()
+    try:
+        plain_path = os.path.join(tempdir, "trees.nex")
+        with open(plain_path, "w") as dest:
+            dest.write(posterior_sample(num_trees, num_tips, random.Random(1)))
+        sys.stdout.write("{} trees of {} tips ({:.1f} MB)\n".format(
+            num_trees, num_tips, os.path.getsize(plain_path) / 1e6))
+        for compression in ("none", "gzip", "bz2", "xz"):
+            path = os.path.join(tempdir, "trees.nex." + compression)
+            with open(plain_path, "r") as src:
+                with filesys.open_file(path, "w", compression=compression) as dest:
+                    shutil.copyfileobj(src, dest)
+            t_decompress = timeit.timeit(lambda: decompress(path), number=1)
+            t_read = timeit.timeit(lambda: dendropy.TreeList.get(path=path, schema="nexus"), number=1)
+            sys.stdout.write("    {:<6} ({:>6.1f} MB): decompress {:>7.3f} s, read {:>7.3f} s\n".format(
+                compression, os.path.getsize(path) / 1e6, t_decompress, t_read))
+    finally:
+        shutil.rmtree(tempdir)
+
+if __name__ == "__main__":
+    main()
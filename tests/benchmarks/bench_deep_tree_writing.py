@@ -0,0 +1,85 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Times NEWICK serialization (through :class:`NewickWriter` and the native
+:meth:`Tree._as_newick_string()` printer) and ASCII plotting of a very deep
+caterpillar tree and a large balanced tree. With the recursive
+implementations, the caterpillar tree could not be written or plotted at all.
+
+Usage::
+
+    python bench_deep_tree_writing.py [NUM_LEVELS [NUM_BALANCED_TIPS]]
+"""
+
+import sys
+import timeit
+import dendropy
+
+def caterpillar_tree(num_levels):
+    taxon_namespace = dendropy.TaxonNamespace()
+    tree = dendropy.Tree(taxon_namespace=taxon_namespace)
+    nd = tree.seed_node
+    for i in range(num_levels):
+        nd.new_child(taxon=taxon_namespace.new_taxon("T{}".format(i)), edge_length=1.0)
+        nd = nd.new_child(edge_length=1.0)
+    nd.taxon = taxon_namespace.new_taxon("T{}".format(num_levels))
+    return tree
+
+def balanced_tree(num_tips):
+    taxon_namespace = dendropy.TaxonNamespace()
+    nodes = [dendropy.Node(taxon=taxon_namespace.new_taxon("T{}".format(i)), edge_length=1.0)
+            for i in range(num_tips)]
+    while len(nodes) > 1:
+        parents = []
+        for i in range(0, len(nodes) - 1, 2):
+            nd = dendropy.Node(edge_length=1.0)
+            nd.add_child(nodes[i])
+            nd.add_child(nodes[i+1])
+            parents.append(nd)
+        if len(nodes) % 2:
+            parents.append(nodes[-1])
+        nodes = parents
+    return dendropy.Tree(taxon_namespace=taxon_namespace, seed_node=nodes[0])
+
+def run(label, tree, plot):
+    sys.stdout.write("{}:\n".format(label))
+    tasks = [
+        ("NewickWriter", lambda: tree.as_string("newick")),
+        ("Native NEWICK", lambda: tree._as_newick_string()),
+    ]
+    if plot:
+        tasks.append(("ASCII plot", lambda: tree.as_ascii_plot(plot_metric="level", width=80)))
+    for task_label, task in tasks:
+        t = timeit.timeit(task, number=1)
+        sys.stdout.write("    {:<14} {:>8.3f} s\n".format(task_label + ":", t))
+
+def main():
+    num_levels = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    num_balanced_tips = int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+    run("Caterpillar tree, {} levels".format(num_levels),
+            caterpillar_tree(num_levels),
+            plot=True)
+    # the plot grid alone would take several gigabytes for the balanced tree
+    run("Balanced tree, {} tips".format(num_balanced_tips),
+            balanced_tree(num_balanced_tips),
+            plot=False)
+
+if __name__ == "__main__":
+    main()
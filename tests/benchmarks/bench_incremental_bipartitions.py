@@ -0,0 +1,126 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Compares full re-encoding of bipartitions (:meth:`Tree.encode_bipartitions()`)
+with incremental re-encoding (:meth:`Tree.update_bipartitions_on_paths()`)
+after each of a series of random NNI and SPR moves on a large random tree.
+
+Usage::
+
+    python bench_incremental_bipartitions.py [NUM_TIPS [NUM_MOVES]]
+"""
+
+import sys
+import random
+import timeit
+import dendropy
+
+def random_tree(num_tips, rng):
+    taxon_namespace = dendropy.TaxonNamespace(["T{}".format(i) for i in range(num_tips)])
+    nodes = [dendropy.Node(taxon=t) for t in taxon_namespace]
+    while len(nodes) > 1:
+        i = rng.randrange(len(nodes))
+        nodes[i], nodes[-1] = nodes[-1], nodes[i]
+        n1 = nodes.pop()
+        i = rng.randrange(len(nodes))
+        nodes[i], nodes[-1] = nodes[-1], nodes[i]
+        n2 = nodes.pop()
+        nd = dendropy.Node()
+        nd.add_child(n1)
+        nd.add_child(n2)
+        nodes.append(nd)
+    tree = dendropy.Tree(taxon_namespace=taxon_namespace, seed_node=nodes[0])
+    tree.is_rooted = True
+    return tree
+
+def nni(tree, rng):
+    internal_nodes = [nd for nd in tree.preorder_internal_node_iter(exclude_seed_node=True)]
+    node = rng.choice(internal_nodes)
+    parent = node.parent_node
+    sibling = rng.choice([ch for ch in parent.child_nodes() if ch is not node])
+    child = rng.choice(node.child_nodes())
+    parent.remove_child(sibling)
+    node.remove_child(child)
+    parent.add_child(child)
+    node.add_child(sibling)
+    return [node, parent]
+
+def spr(tree, rng):
+    nodes = [nd for nd in tree.preorder_node_iter() if nd.parent_node is not None]
+    while True:
+        subtree_node = rng.choice(nodes)
+        old_parent = subtree_node.parent_node
+        if old_parent.parent_node is None:
+            continue
+        excluded = set(subtree_node.preorder_iter())
+        excluded.add(old_parent)
+        excluded.update(old_parent.child_nodes())
+        target_node = rng.choice(nodes)
+        if target_node not in excluded:
+            break
+    # prune, suppressing the unifurcation left behind
+    grandparent = old_parent.parent_node
+    old_parent.remove_child(subtree_node)
+    sibling = old_parent.child_nodes()[0]
+    old_parent.remove_child(sibling)
+    grandparent.insert_child(grandparent.child_nodes().index(old_parent), sibling)
+    grandparent.remove_child(old_parent)
+    # regraft, reusing the old parent node
+    target_parent = target_node.parent_node
+    target_parent.insert_child(target_parent.child_nodes().index(target_node), old_parent)
+    target_parent.remove_child(target_node)
+    old_parent.add_child(target_node)
+    old_parent.add_child(subtree_node)
+    return [grandparent, old_parent]
+
+def run_moves(tree, move_fn, num_moves, is_incremental, seed):
+    rng = random.Random(seed)
+    for i in range(num_moves):
+        modified_nodes = move_fn(tree, rng)
+        if is_incremental:
+            tree.update_bipartitions_on_paths(modified_nodes)
+        else:
+            tree.encode_bipartitions(
+                    suppress_unifurcations=False,
+                    collapse_unrooted_basal_bifurcation=False)
+        tree.split_bitmask_edge_map
+
+def main():
+    num_tips = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    num_moves = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    sys.stdout.write("{} tips, {} moves of each kind\n".format(num_tips, num_moves))
+    for move_name, move_fn in (("NNI", nni), ("SPR", spr)):
+        results = []
+        for is_incremental in (False, True):
+            tree = random_tree(num_tips, random.Random(1))
+            tree.encode_bipartitions(
+                    suppress_unifurcations=False,
+                    collapse_unrooted_basal_bifurcation=False)
+            results.append(timeit.timeit(
+                lambda: run_moves(tree, move_fn, num_moves, is_incremental, 2),
+                number=1))
+        t_full, t_incremental = results
+        sys.stdout.write("{}:\n".format(move_name))
+        sys.stdout.write("    Full:        {:>8.3f} s\n".format(t_full))
+        sys.stdout.write("    Incremental: {:>8.3f} s\n".format(t_incremental))
+        sys.stdout.write("    Speedup:     {:>8.2f}x\n".format(t_full / t_incremental))
+
+if __name__ == "__main__":
+    main()
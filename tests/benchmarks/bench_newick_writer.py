@@ -0,0 +1,61 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Times writing a large balanced tree as NEWICK and NEXUS through the single-string fast
+path of :class:`NewickWriter` and through the general, node-by-node, path
+(which is what is used if there are annotations or comments to be written).
+The general path includes the other changes made since, so to compare against
+an earlier version of DendroPy, run this with that version first on the
+``PYTHONPATH``: if it has no fast path, then only its writing times are
+reported.
+
+Usage::
+
+    python bench_newick_writer.py [NUM_TIPS]
+"""
+
+import sys
+import timeit
+from dendropy.dataio import newickwriter
+from bench_deep_tree_writing import balanced_tree
+
+def main():
+    num_tips = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    tree = balanced_tree(num_tips)
+    sys.stdout.write("Tree of {} tips\n".format(num_tips))
+    compose_tree_body = getattr(newickwriter.NewickWriter, "_compose_tree_body", None)
+    if compose_tree_body is None:
+        paths = (("no fast path", None),)
+    else:
+        paths = (("fast path", compose_tree_body),
+                ("general path", lambda self, tree: None))
+    for schema in ("newick", "nexus"):
+        for description, fn in paths:
+            if fn is not None:
+                newickwriter.NewickWriter._compose_tree_body = fn
+            try:
+                t = min(timeit.repeat(lambda: tree.as_string(schema), number=1, repeat=25))
+            finally:
+                if fn is not None:
+                    newickwriter.NewickWriter._compose_tree_body = compose_tree_body
+            sys.stdout.write("    {:<6} {:<12}: {:>7.3f} s\n".format(schema, description, t))
+
+if __name__ == "__main__":
+    main()
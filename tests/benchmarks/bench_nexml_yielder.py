@@ -0,0 +1,72 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Times iterating over the trees of synthetic NeXML documents with
+:meth:`Tree.yield_from_files()`, and reports the peak memory (as traced by
+``tracemalloc``) used while doing so, which should stay roughly the same
+however many trees the document holds, as only one ``<tree>`` element is held
+in memory at a time.
+
+Usage::
+
+    python bench_nexml_yielder.py [NUM_TREES [NUM_TIPS]]
+"""
+
+import os
+import sys
+import random
+import tempfile
+import timeit
+import tracemalloc
+import dendropy
+from bench_tree_offset import posterior_sample
+
+def write_nexml(path, num_trees, num_tips):
+    trees = dendropy.TreeList.get(
+            data=posterior_sample(num_trees, num_tips, random.Random(1)),
+            schema="nexus")
+    trees.write(path=path, schema="nexml")
+
+def iterate_trees(path):
+    num_trees = 0
+    for tree in dendropy.Tree.yield_from_files([path], schema="nexml"):
+        num_trees += 1
+    return num_trees
+
+def main():
+    num_trees = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    num_tips = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    for n in (num_trees // 4, num_trees):
+        fd, path = tempfile.mkstemp(suffix=".xml")
+        os.close(fd)
+        try:
+            write_nexml(path, n, num_tips)
+            t = timeit.timeit(lambda: iterate_trees(path), number=1)
+            tracemalloc.start()
+            iterate_trees(path)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            sys.stdout.write("{:>6} trees of {} tips ({:.1f} MB): {:>8.3f} s, peak memory {:.1f} MB\n".format(
+                n, num_tips, os.path.getsize(path) / 1e6, t, peak / 1e6))
+        finally:
+            os.remove(path)
+
+if __name__ == "__main__":
+    main()
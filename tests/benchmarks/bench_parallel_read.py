@@ -0,0 +1,80 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Times reading a synthetic NEXUS posterior sample of trees into a |TreeList|
+and counting its splits in a |TreeArray|, parsing the trees in a single
+process and in ``NUM_PROCESSES`` processes (``num_processes``). The speed-up
+is bounded by the number of CPUs available. The splits are also counted for
+the same sample with a last tree that references a taxon none of the others
+do, which is then read in the main process.
+
+Usage::
+
+    python bench_parallel_read.py [NUM_TREES [NUM_TIPS [NUM_PROCESSES]]]
+"""
+
+import os
+import sys
+import random
+import tempfile
+import timeit
+import dendropy
+from bench_tree_offset import posterior_sample
+
+def read_tree_array(path, num_processes):
+    tree_array = dendropy.TreeArray(taxon_namespace=dendropy.TaxonNamespace())
+    tree_array.read_from_files([path], schema="nexus", num_processes=num_processes)
+    return tree_array
+
+def add_new_taxon(data):
+    # last tree with "T0" relabeled
+    idx = data.rindex("TREE ")
+    return data[:idx] + data[idx:].replace("T0[", "NEW[", 1)
+
+def main():
+    num_trees = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    num_tips = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    num_processes = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    fd, path = tempfile.mkstemp(suffix=".nex")
+    new_taxon_fd, new_taxon_path = tempfile.mkstemp(suffix=".nex")
+    try:
+        data = posterior_sample(num_trees, num_tips, random.Random(1))
+        with os.fdopen(fd, "w") as dest:
+            dest.write(data)
+        with os.fdopen(new_taxon_fd, "w") as dest:
+            dest.write(add_new_taxon(data))
+        sys.stdout.write("{} trees of {} tips, {} processes, {} CPUs\n".format(
+            num_trees, num_tips, num_processes, os.cpu_count() if hasattr(os, "cpu_count") else "?"))
+        for label, fn in (
+                ("TreeList, 1 process", lambda: dendropy.TreeList.get(path=path, schema="nexus")),
+                ("TreeList, N processes", lambda: dendropy.TreeList.get(path=path, schema="nexus", num_processes=num_processes)),
+                ("TreeArray, 1 process", lambda: read_tree_array(path, 1)),
+                ("TreeArray, N processes", lambda: read_tree_array(path, num_processes)),
+                ("New taxon, 1 process", lambda: read_tree_array(new_taxon_path, 1)),
+                ("New taxon, N processes", lambda: read_tree_array(new_taxon_path, num_processes)),
+                ):
+            t = timeit.timeit(fn, number=1)
+            sys.stdout.write("    {:<24} {:>8.3f} s\n".format(label + ":", t))
+    finally:
+        os.remove(path)
+        os.remove(new_taxon_path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Compares the time taken to calculate the parsimony scores of a collection of
+trees one at a time with ``parsimony_score`` and all together with
+``parsimony_scores``, in one and in several processes.
+
+Usage::
+
+    python bench_parsimony_scores.py [NUM_REPEATS] [NUM_PROCESSES]
+"""
+
+import os
+import sys
+import gc
+import timeit
+import dendropy
+from dendropy.calculate import treescore
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+def score_trees_one_at_a_time(trees, chars):
+    return [treescore.parsimony_score(tree, chars) for tree in trees]
+
+def timed(fn, *args, **kwargs):
+    gc.collect()
+    start = timeit.default_timer()
+    result = fn(*args, **kwargs)
+    return timeit.default_timer() - start, result
+
+def main():
+    num_repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 1
+    num_processes = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    taxon_namespace = dendropy.TaxonNamespace()
+    chars = dendropy.DnaCharacterMatrix.get(
+            path=os.path.join(DATA_DIR, "chars", "pythonidae.chars.nexus"),
+            schema="nexus",
+            taxon_namespace=taxon_namespace)
+    trees = dendropy.TreeList.get(
+            path=os.path.join(DATA_DIR, "trees", "pythonidae.random.bd0301.tre"),
+            schema="nexus",
+            taxon_namespace=taxon_namespace)
+    trees = list(trees) * num_repeats
+    sys.stdout.write("parsimony scores of {} trees:\n".format(len(trees)))
+    t, expected_scores = timed(score_trees_one_at_a_time, trees, chars)
+    sys.stdout.write("    {:<16}: {:>7.3f} s\n".format("one at a time", t))
+    for description, kwargs in (
+            ("batch", {}),
+            ("batch, {} procs".format(num_processes), {"num_processes": num_processes}),
+            ):
+        t, scores = timed(treescore.parsimony_scores, trees, chars, **kwargs)
+        assert scores == expected_scores
+        sys.stdout.write("    {:<16}: {:>7.3f} s\n".format(description, t))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Compares the time taken to calculate parsimony scores and population genetic
+statistics over every site of an alignment and over its distinct site
+patterns, weighted by the number of sites showing each pattern.
+
+Usage::
+
+    python bench_site_patterns.py [NUM_REPEATS]
+"""
+
+import os
+import sys
+import gc
+import timeit
+import dendropy
+from dendropy.calculate import treescore
+from dendropy.calculate import popgenstat
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+def score_trees(trees, chars, compress_site_patterns):
+    for tree in trees:
+        treescore.parsimony_score(
+                tree,
+                chars,
+                gaps_as_missing=False,
+                compress_site_patterns=compress_site_patterns)
+
+def popgen_stats_by_site(chars):
+    sequences = chars.sequences()
+    state_alphabet = chars.default_state_alphabet
+    popgenstat._average_number_of_pairwise_differences(sequences, state_alphabet)
+    popgenstat._num_segregating_sites(sequences, state_alphabet)
+
+def popgen_stats_by_pattern(chars):
+    popgenstat.average_number_of_pairwise_differences(chars)
+    popgenstat.num_segregating_sites(chars)
+
+def timed(fn, *args):
+    gc.collect()
+    start = timeit.default_timer()
+    fn(*args)
+    return timeit.default_timer() - start
+
+def main():
+    num_repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    taxon_namespace = dendropy.TaxonNamespace()
+    chars = dendropy.DnaCharacterMatrix.get(
+            path=os.path.join(DATA_DIR, "chars", "pythonidae.chars.nexus"),
+            schema="nexus",
+            taxon_namespace=taxon_namespace)
+    trees = dendropy.TreeList.get(
+            path=os.path.join(DATA_DIR, "trees", "pythonidae.mle.nex"),
+            schema="nexus",
+            taxon_namespace=taxon_namespace)
+    trees = list(trees) * num_repeats
+    site_patterns = chars.compress_site_patterns()
+    sys.stdout.write("{} sequences of {} sites, {} site patterns\n".format(
+        len(chars), site_patterns.num_sites, len(site_patterns)))
+    sys.stdout.write("parsimony scores of {} trees:\n".format(len(trees)))
+    for description, compress_site_patterns in (
+            ("sites", False),
+            ("patterns", True),
+            ):
+        t = timed(score_trees, trees, chars, compress_site_patterns)
+        sys.stdout.write("    {:<10}: {:>7.3f} s\n".format(description, t))
+    popgen_data = dendropy.DnaCharacterMatrix.get(
+            path=os.path.join(DATA_DIR, "chars", "COII_Apes.nex"),
+            schema="nexus")
+    site_patterns = popgen_data.compress_site_patterns()
+    sys.stdout.write("{} sequences of {} sites, {} site patterns\n".format(
+        len(popgen_data), site_patterns.num_sites, len(site_patterns)))
+    sys.stdout.write("pairwise differences and segregating sites:\n")
+    for description, fn in (
+            ("sites", popgen_stats_by_site),
+            ("patterns", popgen_stats_by_pattern),
+            ):
+        popgen_data._site_patterns_cache = None
+        t = timed(fn, popgen_data)
+        sys.stdout.write("    {:<10}: {:>7.3f} s\n".format(description, t))
+
+if __name__ == "__main__":
+    main()
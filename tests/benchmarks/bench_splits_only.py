@@ -0,0 +1,71 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Times counting the splits of a synthetic NEXUS posterior sample of trees in a
+|TreeArray|, with each tree being constructed and then encoded (as
+:meth:`TreeArray.add_tree()` does), compared to computing only the
+bipartitions of each tree as it is parsed (as
+:meth:`TreeArray.read_from_files()` does).
+
+Usage::
+
+    python bench_splits_only.py [NUM_TREES [NUM_TIPS]]
+"""
+
+import os
+import sys
+import random
+import tempfile
+import timeit
+import dendropy
+from bench_tree_offset import posterior_sample
+
+def add_trees(path):
+    tree_array = dendropy.TreeArray()
+    for tree in dendropy.Tree.yield_from_files([path],
+            schema="nexus",
+            taxon_namespace=tree_array.taxon_namespace):
+        tree_array.add_tree(tree)
+    return tree_array
+
+def read_splits(path):
+    tree_array = dendropy.TreeArray()
+    tree_array.read_from_files([path], schema="nexus")
+    return tree_array
+
+def main():
+    num_trees = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    num_tips = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    fd, path = tempfile.mkstemp(suffix=".nex")
+    try:
+        with os.fdopen(fd, "w") as dest:
+            dest.write(posterior_sample(num_trees, num_tips, random.Random(1)))
+        sys.stdout.write("{} trees of {} tips\n".format(num_trees, num_tips))
+        for label, fn in (
+                ("Trees", lambda: add_trees(path)),
+                ("Splits only", lambda: read_splits(path)),
+                ):
+            t = timeit.timeit(fn, number=1)
+            sys.stdout.write("    {:<20} {:>8.3f} s\n".format(label + ":", t))
+    finally:
+        os.remove(path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Measures the throughput (in MB/s) of :class:`NexusTokenizer` on a
+synthetic posterior sample of trees, with branch lengths and per-node
+comment metadata of the kind written by BEAST and MrBayes, both for
+tokenization alone and for reading the trees into a |TreeList|.
+
+Usage::
+
+    python bench_tokenizer.py [NUM_TREES [NUM_TIPS]]
+"""
+
+import sys
+import random
+import timeit
+import dendropy
+from dendropy.dataio import nexusprocessing
+from dendropy.utility.textprocessing import StringIO
+
+def posterior_sample(num_trees, num_tips, rng):
+    lines = []
+    for tree_idx in range(num_trees):
+        subtrees = ["T{}".format(i) for i in range(num_tips)]
+        while len(subtrees) > 1:
+            i = rng.randrange(len(subtrees))
+            subtrees[i], subtrees[-1] = subtrees[-1], subtrees[i]
+            s1 = subtrees.pop()
+            i = rng.randrange(len(subtrees))
+            s2 = subtrees[i]
+            subtrees[i] = "({}[&rate={:.6f}]:{:.8f},{}[&rate={:.6f}]:{:.8f})".format(
+                    s1, rng.random(), rng.random(),
+                    s2, rng.random(), rng.random())
+        lines.append("[&R] {};\n".format(subtrees[0]))
+    return "".join(lines)
+
+def tokenize(data):
+    for token in nexusprocessing.NexusTokenizer(src=StringIO(data)):
+        pass
+
+def main():
+    num_trees = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    num_tips = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    data = posterior_sample(num_trees, num_tips, random.Random(1))
+    size_mb = len(data) / float(1 << 20)
+    sys.stdout.write("{} trees of {} tips, {:.1f} MB\n".format(num_trees, num_tips, size_mb))
+    for label, fn in (
+            ("Tokenize", lambda: tokenize(data)),
+            ("Read trees", lambda: dendropy.TreeList.get(data=data, schema="newick")),
+            ):
+        t = timeit.timeit(fn, number=1)
+        sys.stdout.write("    {:<11} {:>8.3f} s {:>8.2f} MB/s\n".format(label + ":", t, size_mb / t))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Compares repeated pre-order, post-order and leaf traversals of unchanged
+trees with and without the traversal orders cached by |Tree|.
+
+Usage::
+
+    python bench_traversal_cache.py [NUM_REPEATS]
+"""
+
+import os
+import sys
+import glob
+import timeit
+import dendropy
+
+TREES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "trees")
+
+def load_trees():
+    trees = []
+    for path in sorted(glob.glob(os.path.join(TREES_DIR, "*.newick"))):
+        try:
+            trees.extend(dendropy.TreeList.get(path=path, schema="newick"))
+        except Exception:
+            continue
+    return trees
+
+def traverse_uncached(trees, num_repeats):
+    for tree in trees:
+        seed_node = tree.seed_node
+        for i in range(num_repeats):
+            for nd in seed_node.preorder_iter():
+                pass
+            for nd in seed_node.postorder_iter():
+                pass
+            for nd in seed_node.leaf_iter():
+                pass
+
+def traverse_cached(trees, num_repeats):
+    for tree in trees:
+        for i in range(num_repeats):
+            for nd in tree.preorder_node_iter():
+                pass
+            for nd in tree.postorder_node_iter():
+                pass
+            for nd in tree.leaf_node_iter():
+                pass
+
+def main():
+    if len(sys.argv) > 1:
+        num_repeats = int(sys.argv[1])
+    else:
+        num_repeats = 10
+    trees = load_trees()
+    num_nodes = sum(len(tree.nodes()) for tree in trees)
+    sys.stdout.write("{} trees, {} nodes, {} repeats of each traversal\n".format(
+        len(trees), num_nodes, num_repeats))
+    for tree in trees:
+        tree.clear_traversal_cache()
+    t_uncached = min(timeit.repeat(lambda: traverse_uncached(trees, num_repeats), number=1, repeat=3))
+    t_cached = min(timeit.repeat(lambda: traverse_cached(trees, num_repeats), number=1, repeat=3))
+    sys.stdout.write("    Uncached: {:>8.3f} s\n".format(t_uncached))
+    sys.stdout.write("    Cached:   {:>8.3f} s\n".format(t_cached))
+    sys.stdout.write("    Speedup:  {:>8.2f}x\n".format(t_uncached / t_cached))
+
+if __name__ == "__main__":
+    main()
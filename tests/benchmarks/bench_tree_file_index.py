@@ -0,0 +1,91 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Times random access to the trees of a synthetic NEXUS posterior sample of
+trees through a |TreeFileIndex|, compared to reading from the file without an
+index, for retrieving a single tree with ``Tree.get()`` and for drawing a
+random sample of trees.
+
+Usage::
+
+    python bench_tree_file_index.py [NUM_TREES [NUM_TIPS [SAMPLE_SIZE]]]
+"""
+
+import os
+import sys
+import random
+import tempfile
+import timeit
+import dendropy
+
+def posterior_sample(num_trees, num_tips, rng):
+    lines = ["#NEXUS\n", "BEGIN TREES;\n", "    TRANSLATE\n"]
+    lines.append(",\n".join("        {} T{}".format(i+1, i) for i in range(num_tips)))
+    lines.append(";\n")
+    for tree_idx in range(num_trees):
+        subtrees = [str(i+1) for i in range(num_tips)]
+        while len(subtrees) > 1:
+            i = rng.randrange(len(subtrees))
+            subtrees[i], subtrees[-1] = subtrees[-1], subtrees[i]
+            s1 = subtrees.pop()
+            i = rng.randrange(len(subtrees))
+            s2 = subtrees[i]
+            subtrees[i] = "({}[&rate={:.6f}]:{:.8f},{}[&rate={:.6f}]:{:.8f})".format(
+                    s1, rng.random(), rng.random(),
+                    s2, rng.random(), rng.random())
+        lines.append("    TREE STATE_{} = [&R] {};\n".format(tree_idx, subtrees[0]))
+    lines.append("END;\n")
+    return "".join(lines)
+
+def sample_without_index(path, sample_size, rng):
+    trees = dendropy.TreeList.get(path=path, schema="nexus")
+    return rng.sample(list(trees), sample_size)
+
+def sample_with_index(path, sample_size, rng):
+    with dendropy.TreeFileIndex(path, schema="nexus") as index:
+        return index.sample(sample_size, rng=rng)
+
+def main():
+    num_trees = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    num_tips = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    sample_size = int(sys.argv[3]) if len(sys.argv) > 3 else 100
+    fd, path = tempfile.mkstemp(suffix=".nex")
+    index_path = dendropy.TreeFileIndex.get_index_path(path)
+    try:
+        with os.fdopen(fd, "w") as dest:
+            dest.write(posterior_sample(num_trees, num_tips, random.Random(1)))
+        sys.stdout.write("{} trees of {} tips, sampling {}\n".format(
+            num_trees, num_tips, sample_size))
+        for label, fn in (
+                ("Last tree, no index", lambda: dendropy.Tree.get(path=path, schema="nexus", tree_offset=-1)),
+                ("Sample, no index", lambda: sample_without_index(path, sample_size, random.Random(1))),
+                ("Build index", lambda: dendropy.TreeFileIndex(path, schema="nexus").close()),
+                ("Last tree, index", lambda: dendropy.Tree.get(path=path, schema="nexus", tree_offset=-1)),
+                ("Sample, index", lambda: sample_with_index(path, sample_size, random.Random(1))),
+                ):
+            t = timeit.timeit(fn, number=1)
+            sys.stdout.write("    {:<21} {:>8.3f} s\n".format(label + ":", t))
+    finally:
+        os.remove(path)
+        if os.path.exists(index_path):
+            os.remove(index_path)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Times discarding a burn-in from a synthetic NEXUS posterior sample of trees,
+using ``tree_offset`` (with which the burn-in trees are skipped over without
+being parsed), compared to reading all the trees and then discarding the
+burn-in, both when reading into a |TreeList| and when iterating over the
+trees with :meth:`Tree.yield_from_files()`.
+
+Usage::
+
+    python bench_tree_offset.py [NUM_TREES [NUM_TIPS [BURNIN_FRACTION]]]
+"""
+
+import os
+import sys
+import random
+import tempfile
+import timeit
+import dendropy
+
+def posterior_sample(num_trees, num_tips, rng):
+    lines = ["#NEXUS\n", "BEGIN TREES;\n"]
+    for tree_idx in range(num_trees):
+        subtrees = ["T{}".format(i) for i in range(num_tips)]
+        while len(subtrees) > 1:
+            i = rng.randrange(len(subtrees))
+            subtrees[i], subtrees[-1] = subtrees[-1], subtrees[i]
+            s1 = subtrees.pop()
+            i = rng.randrange(len(subtrees))
+            s2 = subtrees[i]
+            subtrees[i] = "({}[&rate={:.6f}]:{:.8f},{}[&rate={:.6f}]:{:.8f})".format(
+                    s1, rng.random(), rng.random(),
+                    s2, rng.random(), rng.random())
+        lines.append("    TREE STATE_{} = [&R] {};\n".format(tree_idx, subtrees[0]))
+    lines.append("END;\n")
+    return "".join(lines)
+
+def count_trees(path, tree_offset):
+    num_trees = 0
+    for tree_idx, tree in enumerate(dendropy.Tree.yield_from_files([path], schema="nexus")):
+        if tree_idx >= tree_offset:
+            num_trees += 1
+    return num_trees
+
+def main():
+    num_trees = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    num_tips = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    burnin_fraction = float(sys.argv[3]) if len(sys.argv) > 3 else 0.25
+    burnin = int(num_trees * burnin_fraction)
+    fd, path = tempfile.mkstemp(suffix=".nex")
+    try:
+        with os.fdopen(fd, "w") as dest:
+            dest.write(posterior_sample(num_trees, num_tips, random.Random(1)))
+        sys.stdout.write("{} trees of {} tips, discarding {} as burn-in\n".format(
+            num_trees, num_tips, burnin))
+        for label, fn in (
+                ("TreeList, parse all", lambda: dendropy.TreeList.get(path=path, schema="nexus")[burnin:]),
+                ("TreeList, skip", lambda: dendropy.TreeList.get(path=path, schema="nexus", tree_offset=burnin)),
+                ("Yielder, parse all", lambda: count_trees(path, burnin)),
+                ("Yielder, skip", lambda: sum(1 for t in dendropy.Tree.yield_from_files(
+                    [path], schema="nexus", tree_offset=burnin))),
+                ("Last 10, parse all", lambda: dendropy.TreeList.get(path=path, schema="nexus")[-10:]),
+                ("Last 10, skip", lambda: dendropy.TreeList.get(path=path, schema="nexus", tree_offset=-10)),
+                ):
+            t = timeit.timeit(fn, number=1)
+            sys.stdout.write("    {:<20} {:>8.3f} s\n".format(label + ":", t))
+    finally:
+        os.remove(path)
+
+if __name__ == "__main__":
+    main()
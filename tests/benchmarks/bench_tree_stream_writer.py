@@ -0,0 +1,83 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Compares the time taken and the peak memory used in writing simulated
+coalescent trees to a NEXUS file by collecting them in a |TreeList| and by
+writing them as they are generated through a |TreeStreamWriter|.
+
+Usage::
+
+    python bench_tree_stream_writer.py [NUM_TREES [NUM_TIPS]]
+"""
+
+import os
+import sys
+import random
+import shutil
+import tempfile
+import gc
+import timeit
+import tracemalloc
+import dendropy
+from dendropy.simulate import treesim
+
+def simulated_trees(num_trees, taxon_namespace):
+    rng = random.Random(1)
+    for idx in range(num_trees):
+        yield treesim.pure_kingman_tree(taxon_namespace=taxon_namespace, rng=rng)
+
+def write_tree_list(path, num_trees, taxon_namespace):
+    trees = dendropy.TreeList(taxon_namespace=taxon_namespace)
+    for tree in simulated_trees(num_trees, taxon_namespace):
+        trees.append(tree)
+    trees.write(path=path, schema="nexus")
+
+def write_tree_stream(path, num_trees, taxon_namespace):
+    with dendropy.TreeStreamWriter(path, "nexus", taxon_namespace=taxon_namespace) as writer:
+        for tree in simulated_trees(num_trees, taxon_namespace):
+            writer.write(tree)
+
+def main():
+    num_trees = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    num_tips = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    taxon_namespace = dendropy.TaxonNamespace(["t{}".format(i) for i in range(num_tips)])
+    tempdir = tempfile.mkdtemp()
+    try:
+        sys.stdout.write("{} trees of {} tips\n".format(num_trees, num_tips))
+        for description, fn in (
+                ("TreeStreamWriter", write_tree_stream),
+                ("TreeList", write_tree_list),
+                ):
+            path = os.path.join(tempdir, "trees.nex")
+            gc.collect()
+            tracemalloc.start()
+            # not ``timeit.timeit()``, which disables garbage collection
+            start = timeit.default_timer()
+            fn(path, num_trees, taxon_namespace)
+            t = timeit.default_timer() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            sys.stdout.write("    {:<16}: {:>7.3f} s, peak memory {:>7.1f} MB\n".format(
+                description, t, peak / 1e6))
+    finally:
+        shutil.rmtree(tempdir)
+
+if __name__ == "__main__":
+    main()
@@ -25,6 +25,7 @@ import unittest
 import os
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
+import dendropy
 from support import curated_test_tree
 from dendropy.utility.messaging import get_logger
 _LOG = get_logger(__name__)
@@ -51,5 +52,19 @@ class AsciiTreeTest(
     def test_plot_by_length(self):
         _LOG.debug(self.tree.as_ascii_plot(plot_metric='length'))
 
+    def test_plot_deep_tree(self):
+        # deeper than the interpreter recursion limit
+        num_levels = sys.getrecursionlimit() + 100
+        tree = dendropy.Tree()
+        nd = tree.seed_node
+        for i in range(num_levels):
+            nd.new_child(label="T{}".format(i))
+            nd = nd.new_child()
+        nd.label = "T{}".format(num_levels)
+        plot = tree.as_ascii_plot(plot_metric='level', width=80)
+        lines = plot.split("\n")
+        self.assertEqual(len(lines), (num_levels + 1) * 2 + 1)
+        self.assertTrue(lines[0].rstrip().endswith("T0"))
+
 if __name__ == "__main__":
     unittest.main()
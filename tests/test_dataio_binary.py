@@ -0,0 +1,269 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for the "dendropy-bin" binary format.
+"""
+
+import io
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import dendropy
+from dendropy.utility import error
+from dendropy.utility.textprocessing import StringIO
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+
+class BinaryTreeListTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def check_trees(self, trees, expected_trees):
+        self.assertEqual(len(trees), len(expected_trees))
+        for tree, expected_tree in zip(trees, expected_trees):
+            self.assertEqual(tree.label, expected_tree.label)
+            self.assertEqual(tree.is_rooted, expected_tree.is_rooted)
+            self.assertEqual(tree.weight, expected_tree.weight)
+            self.assertEqual(
+                    tree.as_string("newick", suppress_annotations=True, suppress_rooting=True),
+                    expected_tree.as_string("newick", suppress_annotations=True, suppress_rooting=True))
+
+    def test_round_trip(self):
+        for filename, schema in (
+                ("pythonidae.reference-trees.nexus", "nexus"),
+                ("pythonidae.mb.run1.t", "nexus"),
+                ("dendropy-test-trees-n33-unrooted-annotated-x10a.newick", "newick"),
+                ("dendropy-test-trees-multifurcating-rooted-annotated.nexus", "nexus"),
+                ):
+            expected_trees = dendropy.TreeList.get(
+                    path=pathmap.tree_source_path(filename),
+                    schema=schema,
+                    store_tree_weights=True)
+            path = os.path.join(self.tempdir, filename + ".bin")
+            expected_trees.write(path=path, schema="dendropy-bin")
+            trees = dendropy.TreeList.get(path=path, schema="dendropy-bin")
+            self.assertEqual(
+                    [t.label for t in trees.taxon_namespace],
+                    [t.label for t in expected_trees.taxon_namespace])
+            self.check_trees(trees, expected_trees)
+
+    def test_tree_structures(self):
+        data = "\n".join([
+            "[&R] ((a:1,b:2)x:3,((c:4,d:5):6):1.5)root:7;",
+            "[&U] [&W 0.25] (,a,,b,(c,),());",
+            "a:3;",
+            ])
+        expected_trees = dendropy.TreeList.get(data=data, schema="newick", store_tree_weights=True)
+        expected_trees[1].label = "second"
+        dest = io.BytesIO()
+        expected_trees.write(file=dest, schema="dendropy-bin")
+        dest.seek(0)
+        trees = dendropy.TreeList.get(file=dest, schema="dendropy-bin")
+        self.check_trees(trees, expected_trees)
+        self.assertEqual(trees[1].label, "second")
+        self.assertEqual(trees[1].weight, 0.25)
+        self.assertEqual(trees[2].seed_node.edge.length, 3.0)
+        self.assertEqual(trees[0].seed_node.child_nodes()[1].edge.length, 1.5)
+        self.assertIs(trees[1].seed_node.edge.length, None)
+
+    def test_multiple_tree_lists(self):
+        dataset = dendropy.DataSet.get(
+                path=pathmap.tree_source_path("pythonidae.reference-trees.nexus"),
+                schema="nexus")
+        dataset.new_tree_list(
+                label="other",
+                taxon_namespace=dataset.new_taxon_namespace(label="other taxa")).new_tree(
+                        label="other tree").seed_node.new_child(taxon=dataset.taxon_namespaces[1].new_taxon("x"))
+        dest = io.BytesIO()
+        dataset.write(file=dest, schema="dendropy-bin")
+        dest.seek(0)
+        dataset2 = dendropy.DataSet.get(file=dest, schema="dendropy-bin")
+        self.assertEqual(len(dataset2.taxon_namespaces), 2)
+        self.assertEqual([t.label for t in dataset2.tree_lists], [t.label for t in dataset.tree_lists])
+        for tree_list, expected_tree_list in zip(dataset2.tree_lists, dataset.tree_lists):
+            self.assertEqual(tree_list.taxon_namespace.label, expected_tree_list.taxon_namespace.label)
+            self.check_trees(tree_list, expected_tree_list)
+        dest.seek(0)
+        trees = dendropy.TreeList.get(file=dest, schema="dendropy-bin", collection_offset=1)
+        self.check_trees(trees, dataset.tree_lists[1])
+
+    def test_tree_offset_and_yielder(self):
+        expected_trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.mb.run1.t"),
+                schema="nexus")
+        path = os.path.join(self.tempdir, "trees.bin")
+        expected_trees.write(path=path, schema="dendropy-bin")
+        for tree_offset in (0, 5, -3):
+            trees = dendropy.TreeList.get(path=path, schema="dendropy-bin", tree_offset=tree_offset)
+            self.check_trees(trees, expected_trees[tree_offset:])
+            taxon_namespace = dendropy.TaxonNamespace()
+            trees = list(dendropy.Tree.yield_from_files(
+                    [path, path],
+                    schema="dendropy-bin",
+                    taxon_namespace=taxon_namespace,
+                    tree_offset=tree_offset))
+            self.check_trees(trees, list(expected_trees[tree_offset:]) * 2)
+            self.assertEqual(len(taxon_namespace), len(expected_trees.taxon_namespace))
+        tree = dendropy.Tree.get(path=path, schema="dendropy-bin", tree_offset=-1)
+        expected_tree = dendropy.Tree.get(
+                path=pathmap.tree_source_path("pythonidae.mb.run1.t"),
+                schema="nexus",
+                tree_offset=-1)
+        self.check_trees([tree], [expected_tree])
+
+    def test_existing_taxon_namespace(self):
+        expected_trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.reference-trees.nexus"),
+                schema="nexus")
+        dest = io.BytesIO()
+        expected_trees.write(file=dest, schema="dendropy-bin")
+        taxon_namespace = dendropy.TaxonNamespace([t.label.upper() for t in reversed(expected_trees.taxon_namespace)])
+        dest.seek(0)
+        trees = dendropy.TreeList.get(file=dest, schema="dendropy-bin", taxon_namespace=taxon_namespace)
+        self.assertEqual(len(taxon_namespace), len(expected_trees.taxon_namespace))
+        self.assertEqual(
+                [leaf.taxon.label for leaf in trees[0].leaf_node_iter()],
+                [leaf.taxon.label.upper() for leaf in expected_trees[0].leaf_node_iter()])
+        dest.seek(0)
+        dendropy.TreeList.get(file=dest, schema="dendropy-bin", taxon_namespace=taxon_namespace, case_sensitive_taxon_labels=True)
+        self.assertEqual(len(taxon_namespace), 2 * len(expected_trees.taxon_namespace))
+
+    def test_compressed_path(self):
+        expected_trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.reference-trees.nexus"),
+                schema="nexus")
+        path = os.path.join(self.tempdir, "trees.bin.gz")
+        expected_trees.write(path=path, schema="dendropy-bin")
+        self.check_trees(dendropy.TreeList.get(path=path, schema="dendropy-bin"), expected_trees)
+
+    def test_errors(self):
+        trees = dendropy.TreeList.get(data="((a,b),(c,d));", schema="newick")
+        with self.assertRaises(TypeError):
+            trees.write(file=StringIO(), schema="dendropy-bin")
+        with self.assertRaises(error.DataParseError):
+            dendropy.TreeList.get(file=io.BytesIO(b"((a,b),(c,d));"), schema="dendropy-bin")
+        dest = io.BytesIO()
+        dendropy.SplitDistribution(taxon_namespace=trees.taxon_namespace).write(file=dest, schema="dendropy-bin")
+        dest.seek(0)
+        with self.assertRaises(error.DataParseError):
+            dendropy.TreeList.get(file=dest, schema="dendropy-bin")
+
+class BinaryTreeArrayTestCase(unittest.TestCase):
+
+    def get_tree_array(self):
+        tree_array = dendropy.TreeArray(ignore_node_ages=False, is_force_max_age=True)
+        tree_array.read(
+                path=pathmap.tree_source_path("pythonidae.mb.run1.t"),
+                schema="nexus")
+        return tree_array
+
+    def check_split_distribution(self, split_distribution, expected_split_distribution):
+        for attr in (
+                "ignore_edge_lengths",
+                "ignore_node_ages",
+                "use_tree_weights",
+                "is_force_max_age",
+                "ultrametricity_precision",
+                "total_trees_counted",
+                "sum_of_tree_weights",
+                "tree_rooting_types_counted",
+                "split_counts",
+                "split_edge_lengths",
+                "split_node_ages",
+                ):
+            self.assertEqual(getattr(split_distribution, attr), getattr(expected_split_distribution, attr))
+
+    def test_round_trip(self):
+        expected_tree_array = self.get_tree_array()
+        dest = io.BytesIO()
+        expected_tree_array.write(file=dest, schema="dendropy-bin")
+        dest.seek(0)
+        tree_array = dendropy.TreeArray.get(file=dest, schema="dendropy-bin")
+        self.assertEqual(
+                [t.label for t in tree_array.taxon_namespace],
+                [t.label for t in expected_tree_array.taxon_namespace])
+        self.assertEqual(tree_array.is_rooted_trees, expected_tree_array.is_rooted_trees)
+        self.assertEqual(tree_array._tree_split_bitmasks, expected_tree_array._tree_split_bitmasks)
+        self.assertEqual(tree_array._tree_edge_lengths, expected_tree_array._tree_edge_lengths)
+        self.assertEqual(tree_array._tree_leafset_bitmasks, expected_tree_array._tree_leafset_bitmasks)
+        self.assertEqual(tree_array._tree_weights, expected_tree_array._tree_weights)
+        self.check_split_distribution(tree_array.split_distribution, expected_tree_array.split_distribution)
+        self.assertEqual(
+                tree_array.consensus_tree().as_string("newick"),
+                expected_tree_array.consensus_tree().as_string("newick"))
+
+    def test_read_into_existing(self):
+        expected_tree_array = self.get_tree_array()
+        dest = io.BytesIO()
+        expected_tree_array.write(file=dest, schema="dendropy-bin")
+        # taxa in a different order: bitmasks must be remapped
+        taxon_namespace = dendropy.TaxonNamespace([t.label for t in reversed(expected_tree_array.taxon_namespace)])
+        tree_array = dendropy.TreeArray(taxon_namespace=taxon_namespace)
+        for idx in range(2):
+            dest.seek(0)
+            tree_array.read(file=dest, schema="dendropy-bin")
+        self.assertEqual(len(tree_array), 2 * len(expected_tree_array))
+        self.assertEqual(len(taxon_namespace), len(expected_tree_array.taxon_namespace))
+        for idx in (0, len(expected_tree_array) - 1):
+            tree = dendropy.Tree.get(
+                    data=tree_array.restore_tree(idx).as_string("newick"),
+                    schema="newick",
+                    taxon_namespace=expected_tree_array.taxon_namespace)
+            self.assertEqual(dendropy.calculate.treecompare.symmetric_difference(
+                tree, expected_tree_array.restore_tree(idx)), 0)
+        self.assertEqual(
+                tree_array.split_distribution.total_trees_counted,
+                2 * expected_tree_array.split_distribution.total_trees_counted)
+
+    def test_read_trees(self):
+        trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.mb.run1.t"),
+                schema="nexus")
+        dest = io.BytesIO()
+        trees.write(file=dest, schema="dendropy-bin")
+        dest.seek(0)
+        tree_array = dendropy.TreeArray(taxon_namespace=trees.taxon_namespace)
+        tree_array.read(file=dest, schema="dendropy-bin", tree_offset=10)
+        expected_tree_array = dendropy.TreeArray.from_tree_list(trees[10:])
+        self.assertEqual(tree_array._tree_split_bitmasks, expected_tree_array._tree_split_bitmasks)
+        self.assertEqual(tree_array._tree_edge_lengths, expected_tree_array._tree_edge_lengths)
+
+    def test_split_distribution(self):
+        expected_split_distribution = self.get_tree_array().split_distribution
+        dest = io.BytesIO()
+        expected_split_distribution.write(file=dest, schema="dendropy-bin")
+        dest.seek(0)
+        split_distribution = dendropy.SplitDistribution.get(file=dest, schema="dendropy-bin")
+        self.check_split_distribution(split_distribution, expected_split_distribution)
+        self.assertEqual(split_distribution.split_frequencies, expected_split_distribution.split_frequencies)
+        with self.assertRaises(error.UnsupportedSchemaError):
+            split_distribution.write(file=io.BytesIO(), schema="newick")
+        dest.seek(0)
+        with self.assertRaises(error.DataParseError):
+            dendropy.TreeArray.get(file=dest, schema="dendropy-bin")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,140 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for reading from and writing to compressed files.
+"""
+
+import os
+import sys
+import bz2
+import gzip
+import shutil
+import tempfile
+import unittest
+import dendropy
+from dendropy.utility import filesys
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+class CompressedFilesTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.openers = [("gzip", ".gz", gzip.open), ("bz2", ".bz2", bz2.open)]
+        if lzma is not None:
+            self.openers.append(("xz", ".xz", lzma.open))
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def write_compressed(self, source_path, filename, opener):
+        path = os.path.join(self.tempdir, filename)
+        with open(source_path, "rb") as src:
+            with opener(path, "wb") as dest:
+                shutil.copyfileobj(src, dest)
+        return path
+
+    def check_trees(self, trees, expected_trees):
+        self.assertEqual(len(trees), len(expected_trees))
+        for tree, expected_tree in zip(trees, expected_trees):
+            self.assertEqual(tree.label, expected_tree.label)
+            self.assertEqual(tree.as_string("newick"), expected_tree.as_string("newick"))
+
+    def test_get_compression(self):
+        source_path = pathmap.tree_source_path("pythonidae.reference-trees.nexus")
+        self.assertIs(filesys.get_compression(source_path), None)
+        for compression, ext, opener in self.openers:
+            # content, not extension, is used for existing files ...
+            path = self.write_compressed(source_path, "trees" + compression, opener)
+            self.assertEqual(filesys.get_compression(path), compression)
+            # ... and extension otherwise
+            self.assertEqual(filesys.get_compression(os.path.join(self.tempdir, "x.tre" + ext)), compression)
+        path = os.path.join(self.tempdir, "plain.gz")
+        shutil.copy(source_path, path)
+        self.assertIs(filesys.get_compression(path), None)
+
+    def test_read_trees(self):
+        for filename, schema in (
+                ("pythonidae.reference-trees.nexus", "nexus"),
+                ("dendropy-test-trees-n33-unrooted-annotated-x10a.newick", "newick"),
+                ("dendropy-test-trees-n33-unrooted-x10a.nexml", "nexml"),
+                ):
+            source_path = pathmap.tree_source_path(filename)
+            expected_trees = list(dendropy.Tree.yield_from_files([source_path], schema=schema))
+            for compression, ext, opener in self.openers:
+                path = self.write_compressed(source_path, filename + ext, opener)
+                trees = list(dendropy.Tree.yield_from_files([path], schema=schema))
+                self.check_trees(trees, expected_trees)
+                trees = list(dendropy.Tree.yield_from_files([path], schema=schema, tree_offset=-2))
+                self.check_trees(trees, expected_trees[-2:])
+                if schema == "nexml":
+                    continue
+                self.check_trees(dendropy.TreeList.get(path=path, schema=schema), expected_trees)
+                self.check_trees(dendropy.TreeList.get(path=path, schema=schema, tree_offset=3), expected_trees[3:])
+                self.check_trees(dendropy.TreeList.get(path=path, schema=schema, num_processes=2), expected_trees)
+                self.check_trees(
+                        [dendropy.Tree.get(path=path, schema=schema, tree_offset=1)],
+                        [dendropy.Tree.get(path=source_path, schema=schema, tree_offset=1)])
+                tree_array = dendropy.TreeArray(taxon_namespace=dendropy.TaxonNamespace())
+                tree_array.read_from_files([path], schema=schema, num_processes=2)
+                self.assertEqual(len(tree_array), len(expected_trees))
+                with self.assertRaises(ValueError):
+                    dendropy.TreeFileIndex(path, schema)
+
+    def test_read_chars(self):
+        source_path = pathmap.char_source_path("primates.chars.fasta")
+        expected = dendropy.DnaCharacterMatrix.get(path=source_path, schema="fasta")
+        for compression, ext, opener in self.openers:
+            path = self.write_compressed(source_path, "chars.fasta" + ext, opener)
+            char_matrix = dendropy.DnaCharacterMatrix.get(path=path, schema="fasta")
+            self.assertEqual(
+                    [(t.label, str(s)) for t, s in char_matrix.items()],
+                    [(t.label, str(s)) for t, s in expected.items()])
+
+    def test_write(self):
+        trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.reference-trees.nexus"),
+                schema="nexus")
+        expected = trees.as_string("nexus")
+        for compression, ext, opener in self.openers:
+            # inferred from extension
+            path = os.path.join(self.tempdir, "trees.nex" + ext)
+            trees.write(path=path, schema="nexus")
+            with opener(path, "rt") as src:
+                self.assertEqual(src.read(), expected)
+            # given explicitly
+            path = os.path.join(self.tempdir, "trees.nex")
+            trees.write(path=path, schema="nexus", compression=compression)
+            self.assertEqual(filesys.get_compression(path), compression)
+            self.check_trees(dendropy.TreeList.get(path=path, schema="nexus"), trees)
+        path = os.path.join(self.tempdir, "trees.nex.gz")
+        trees.write(path=path, schema="nexus", compression="none")
+        with open(path, "r") as src:
+            self.assertEqual(src.read(), expected)
+        with self.assertRaises(ValueError):
+            trees.write(path=path, schema="nexus", compression="zip")
+
+if __name__ == "__main__":
+    unittest.main()
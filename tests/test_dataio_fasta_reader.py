@@ -50,6 +50,24 @@ class FastaDnaReaderTestCase(
                 check_column_annotations=False,
                 check_cell_annotations=False)
 
+    def test_byte_coded_fasta(self):
+        src_filenames = [
+                "standard-test-chars-dna.fasta",
+                ]
+        for src_filename in src_filenames:
+            src_path = pathmap.char_source_path(src_filename)
+            char_matrix = dendropy.DnaCharacterMatrix.get(
+                    path=src_path,
+                    schema="fasta",
+                    byte_coded=True)
+            self.assertTrue(char_matrix.is_byte_coded)
+            self.verify_char_matrix(char_matrix,
+                    check_taxon_annotations=False,
+                    check_matrix_annotations=False,
+                    check_sequence_annotations=False,
+                    check_column_annotations=False,
+                    check_cell_annotations=False)
+
 class FastaRnaReaderTestCase(
         standard_file_test_chars.RnaTestChecker,
         dendropytest.ExtendedTestCase):
@@ -92,5 +110,23 @@ class FastaProteinReaderTestCase(
                 check_column_annotations=False,
                 check_cell_annotations=False)
 
+    def test_byte_coded_fasta(self):
+        src_filenames = [
+                "standard-test-chars-protein.fasta",
+                ]
+        for src_filename in src_filenames:
+            src_path = pathmap.char_source_path(src_filename)
+            char_matrix = dendropy.ProteinCharacterMatrix.get(
+                    path=src_path,
+                    schema="fasta",
+                    byte_coded=True)
+            self.assertTrue(char_matrix.is_byte_coded)
+            self.verify_char_matrix(char_matrix,
+                    check_taxon_annotations=False,
+                    check_matrix_annotations=False,
+                    check_sequence_annotations=False,
+                    check_column_annotations=False,
+                    check_cell_annotations=False)
+
 if __name__ == "__main__":
     unittest.main()
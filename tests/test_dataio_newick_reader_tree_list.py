@@ -31,6 +31,7 @@ from support import dendropytest
 from support import standard_file_test_trees
 from support import curated_test_tree
 from support import pathmap
+from dendropy.utility.textprocessing import StringIO
 import base_newick_test_cases
 import base_standard_trees_parsing_test_cases
 
@@ -205,5 +206,61 @@ class NewickTreeListReaderTaxonNamespaceTest(dendropytest.ExtendedTestCase):
                 self.assertEqual(len(common_taxon_namespace), expected_ntax)
             prev_expected_ntax = expected_ntax
 
+class NewickTreeListReaderTreeOffsetTest(dendropytest.ExtendedTestCase):
+
+    class UnseekableStringIO(StringIO):
+        def seekable(self):
+            return False
+
+    def setUp(self):
+        self.tree_strings = [
+                "[&R] ((A,'B;1'),[C;]C,(D,E));",
+                "[&U] ((A,B),[(C;]C,'(D'')',E);",
+                "((A,B[x;y[;]z]),C,(D,F));",
+                "((A,B),C,(D,'E;' ));",
+                "((A,B),C,(D,E)) ;;",
+                ]
+        self.data = "\n".join(self.tree_strings)
+        self.reference_trees = [
+                dendropy.Tree.get(data=s, schema="newick", taxon_namespace=dendropy.TaxonNamespace())
+                for s in self.tree_strings]
+
+    def check_trees(self, tree_list, tree_offset):
+        expected = self.reference_trees[tree_offset:]
+        self.assertEqual(len(tree_list), len(expected))
+        for tree, ref_tree in zip(tree_list, expected):
+            self.assertIs(tree.taxon_namespace, tree_list.taxon_namespace)
+            self.assertIs(tree.is_rooted, ref_tree.is_rooted)
+            self.assertEqual(
+                    [nd.taxon.label for nd in tree.leaf_node_iter()],
+                    [nd.taxon.label for nd in ref_tree.leaf_node_iter()])
+
+    def test_skipped_statements_with_quotes_and_comments(self):
+        for tree_offset in range(len(self.tree_strings)):
+            tree_list = dendropy.TreeList.get(data=self.data, schema="newick", tree_offset=tree_offset)
+            self.check_trees(tree_list, tree_offset)
+
+    def test_skipped_trees_not_parsed(self):
+        data = "((A,B),C;\n(A,(X,Y));\n((A,B),(C,D));"
+        with self.assertRaises(dendropy.dataio.newickreader.NewickReader.NewickReaderError):
+            dendropy.TreeList.get(data=data, schema="newick")
+        tree_list = dendropy.TreeList.get(data=data, schema="newick", tree_offset=2)
+        self.assertEqual(len(tree_list), 1)
+        # the taxa of the skipped trees are still added
+        self.assertEqual([t.label for t in tree_list.taxon_namespace], ["A", "B", "C", "X", "Y", "D"])
+
+    def test_negative_offsets_on_unseekable_stream(self):
+        for tree_offset in range(-1, -len(self.tree_strings)-2, -1):
+            tree_list = dendropy.TreeList.get(
+                    file=NewickTreeListReaderTreeOffsetTest.UnseekableStringIO(self.data),
+                    schema="newick",
+                    tree_offset=tree_offset)
+            self.check_trees(tree_list, tree_offset)
+
+    def test_unterminated_skipped_statement(self):
+        data = "((A,B),C,(D,E));\n((A,B),C,(D,E)"
+        with self.assertRaises(dendropy.dataio.newickreader.NewickReader.NewickReaderError):
+            dendropy.TreeList.get(data=data, schema="newick", tree_offset=-1)
+
 if __name__ == "__main__":
     unittest.main()
@@ -32,6 +32,8 @@ from support import pathmap
 from support import standard_file_test_trees
 from support import compare_and_validate
 from support import dendropytest
+from dendropy.dataio import newickwriter
+from dendropy.utility.textprocessing import StringIO
 
 def newick_tree_writer_test_tree(
         has_leaf_node_taxa=True,
@@ -444,5 +446,117 @@ class NewickTreeWriterGeneralOptionsTests(
         for nd in tree2:
             self.assertEqual(nd.edge.length, 1000)
 
+class GeneralPathNewickWriter(newickwriter.NewickWriter):
+
+    def _compose_tree_body(self, tree):
+        return None
+
+class NewickTreeWriterFastPathTests(dendropytest.ExtendedTestCase):
+
+    def write_with(self, writer, trees):
+        stream = StringIO()
+        for tree in trees:
+            writer._write_tree(stream, tree)
+            stream.write("\n")
+        return stream.getvalue()
+
+    def check_fast_path(self, trees, **kwargs):
+        expected = self.write_with(GeneralPathNewickWriter(**kwargs), trees)
+        writer = newickwriter.NewickWriter(**kwargs)
+        self.assertEqual(self.write_with(writer, trees), expected)
+        # again, with the escaped taxon tokens composed for the first trees
+        self.assertEqual(self.write_with(writer, trees), expected)
+
+    def test_node_labeling(self):
+        trees = []
+        for has_leaf_node_taxa in (True, False):
+            for has_leaf_node_labels in (True, False):
+                for has_internal_node_taxa in (True, False):
+                    for has_internal_node_labels in (True, False):
+                        trees.append(newick_tree_writer_test_tree(
+                                has_leaf_node_taxa=has_leaf_node_taxa,
+                                has_leaf_node_labels=has_leaf_node_labels,
+                                has_internal_node_taxa=has_internal_node_taxa,
+                                has_internal_node_labels=has_internal_node_labels,
+                                has_edge_lengths=has_leaf_node_labels,
+                                label_pool=["t {}_'{}".format(i, i) for i in range(20)]))
+        for suppress_leaf_taxon_labels in (True, False):
+            for suppress_leaf_node_labels in (True, False):
+                for suppress_internal_taxon_labels in (True, False):
+                    for suppress_internal_node_labels in (True, False):
+                        for suppress_edge_lengths in (True, False):
+                            self.check_fast_path(trees,
+                                    suppress_leaf_taxon_labels=suppress_leaf_taxon_labels,
+                                    suppress_leaf_node_labels=suppress_leaf_node_labels,
+                                    suppress_internal_taxon_labels=suppress_internal_taxon_labels,
+                                    suppress_internal_node_labels=suppress_internal_node_labels,
+                                    suppress_edge_lengths=suppress_edge_lengths,
+                                    node_label_element_separator="$")
+
+    def test_label_escaping_and_formatting(self):
+        tree = dendropy.Tree.get(
+                data="((a:1,'b c':2.5,'d_e':0.1)x:3,('f''g':1e-5,h,(i)j)'k l':2,,m):0;",
+                schema="newick")
+        tree.taxon_namespace.new_taxon(label=None)
+        tree.seed_node.new_child(taxon=tree.taxon_namespace[-1])
+        single_node_tree = dendropy.Tree.get(data="a:1;", schema="newick")
+        for preserve_spaces in (True, False):
+            for unquoted_underscores in (True, False):
+                for real_value_format_specifier in ("", ".4f"):
+                    self.check_fast_path([tree, single_node_tree],
+                            preserve_spaces=preserve_spaces,
+                            unquoted_underscores=unquoted_underscores,
+                            real_value_format_specifier=real_value_format_specifier)
+        self.check_fast_path([tree],
+                taxon_token_map=dict((t, str(i)) for i, t in enumerate(tree.taxon_namespace[:3])))
+
+    def test_changed_settings(self):
+        tree = dendropy.Tree.get(data="('a_1','b c',d);", schema="newick")
+        writer = newickwriter.NewickWriter()
+        self.assertEqual(self.write_with(writer, [tree]), "('a_1',b_c,d);\n")
+        writer.unquoted_underscores = True
+        writer.preserve_spaces = True
+        self.assertEqual(self.write_with(writer, [tree]), "(a_1,'b c',d);\n")
+        writer.taxon_token_map = {tree.taxon_namespace[2]: "3"}
+        self.assertEqual(self.write_with(writer, [tree]), "(a_1,'b c',3);\n")
+        writer.taxon_token_map = {}
+        self.assertEqual(self.write_with(writer, [tree]), "(a_1,'b c',d);\n")
+        writer.suppress_leaf_taxon_labels = True
+        self.assertEqual(self.write_with(writer, [tree]), "(,,);\n")
+
+    def test_relabeled_taxa(self):
+        tree = dendropy.Tree.get(data="((A,B),C);", schema="newick")
+        writer = newickwriter.NewickWriter()
+        self.assertEqual(self.write_with(writer, [tree]), "((A,B),C);\n")
+        tree.taxon_namespace.get_taxon("A").label = "Z"
+        self.assertEqual(self.write_with(writer, [tree]), "((Z,B),C);\n")
+        tree.taxon_namespace.get_taxon("B").label = "y z"
+        self.assertEqual(self.write_with(writer, [tree]), "((Z,y_z),C);\n")
+        dest = StringIO()
+        with dendropy.TreeStreamWriter(dest, "newick") as stream_writer:
+            stream_writer.write(tree)
+            tree.taxon_namespace.get_taxon("C").label = "X"
+            stream_writer.write(tree)
+        self.assertEqual(dest.getvalue(), "((Z,y_z),C);\n((Z,y_z),X);\n")
+
+    def test_annotated(self):
+        tree_filepath = pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-annotated-x10a.nexus")
+        trees = dendropy.TreeList.get(path=tree_filepath, schema="nexus")
+        for suppress_annotations in (True, False):
+            for suppress_item_comments in (True, False):
+                self.check_fast_path(trees,
+                        suppress_annotations=suppress_annotations,
+                        suppress_item_comments=suppress_item_comments)
+        writer = newickwriter.NewickWriter(suppress_annotations=False)
+        self.assertIs(writer._compose_tree_body(trees[0]), None)
+        tree = dendropy.Tree.get(data="((a,b),c);", schema="newick")
+        self.assertEqual(writer._compose_tree_body(tree), "((a,b),c)")
+        tree.seed_node.edge.annotations.add_new("color", "red")
+        self.assertIs(writer._compose_tree_body(tree), None)
+        writer = newickwriter.NewickWriter(suppress_item_comments=False)
+        self.assertEqual(writer._compose_tree_body(tree), "((a,b),c)")
+        tree.seed_node.comments.append("seed")
+        self.assertIs(writer._compose_tree_body(tree), None)
+
 if __name__ == "__main__":
     unittest.main()
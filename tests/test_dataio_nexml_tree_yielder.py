@@ -0,0 +1,146 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for NEXML tree iteration reading.
+"""
+
+import sys
+import unittest
+import dendropy
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+from support import dendropytest
+from support import standard_file_test_trees
+from dendropy.utility.textprocessing import StringIO
+
+if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
+    from dendropy.utility.filesys import pre_py34_open as open
+
+class NexmlTreeYielderDefaultTestCase(
+        standard_file_test_trees.NexmlTestTreesChecker,
+        dendropytest.ExtendedTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        standard_file_test_trees.NexmlTestTreesChecker.create_class_fixtures(cls)
+
+    def get_tree_files(self, tree_file_titles, tree_offset=None):
+        expected_file_names = []
+        expected_tree_references = []
+        tree_files = []
+        for tree_file_title in tree_file_titles:
+            tree_filepath = self.schema_tree_filepaths[tree_file_title]
+            tree_files.append(tree_filepath)
+            num_trees = self.tree_references[tree_file_title]["num_trees"]
+            for tree_idx in range(num_trees)[tree_offset:]:
+                expected_file_names.append(tree_filepath)
+                expected_tree_references.append(self.tree_references[tree_file_title][str(tree_idx)])
+        return tree_files, expected_file_names, expected_tree_references
+
+    def test_basic(self):
+        tree_files, expected_file_names, expected_tree_references = self.get_tree_files([
+            "dendropy-test-trees-multifurcating-rooted-annotated",
+            "dendropy-test-trees-n12-x2",
+            "dendropy-test-trees-n33-unrooted-x10a",
+            "dendropy-test-trees-n33-unrooted-annotated-x10a",
+        ])
+        collected_trees = []
+        tns = dendropy.TaxonNamespace()
+        tree_sources = dendropy.Tree.yield_from_files(
+                files=tree_files,
+                schema="nexml",
+                taxon_namespace=tns)
+        for tree_idx, tree in enumerate(tree_sources):
+            self.assertEqual(tree_sources.current_file_name, expected_file_names[tree_idx])
+            collected_trees.append(tree)
+        self.assertEqual(len(collected_trees), len(expected_tree_references))
+        for tree, ref_tree in zip(collected_trees, expected_tree_references):
+            self.assertIs(tree.taxon_namespace, tns)
+            self.compare_to_reference_tree(tree, ref_tree)
+
+    def test_tree_offset(self):
+        for tree_offset in (1, 5, -3, -20):
+            tree_files, expected_file_names, expected_tree_references = self.get_tree_files([
+                "dendropy-test-trees-n12-x2",
+                "dendropy-test-trees-n33-unrooted-annotated-x10a",
+                ], tree_offset=tree_offset)
+            tns = dendropy.TaxonNamespace()
+            collected_trees = list(dendropy.Tree.yield_from_files(
+                    files=tree_files,
+                    schema="nexml",
+                    taxon_namespace=tns,
+                    tree_offset=tree_offset))
+            self.assertEqual(len(collected_trees), len(expected_tree_references))
+            for tree, ref_tree in zip(collected_trees, expected_tree_references):
+                self.assertIs(tree.taxon_namespace, tns)
+                self.compare_to_reference_tree(tree, ref_tree)
+
+    def test_multiple_blocks(self):
+        src = StringIO("""\
+<?xml version="1.0" encoding="ISO-8859-1"?>
+<nex:nexml xmlns:nex="http://www.nexml.org/2009" xmlns="http://www.nexml.org/2009"
+    xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" version="0.9">
+    <otus id="t1">
+        <otu id="a1" label="A"/>
+        <otu id="b1" label="B"/>
+        <otu id="c1" label="C"/>
+    </otus>
+    <otus id="t2">
+        <otu id="a2" label="A"/>
+        <otu id="d2" label="D"/>
+        <otu id="e2" label="E"/>
+    </otus>
+    <trees id="trees1" otus="t1">
+        <tree id="tree1" label="one" xsi:type="nex:FloatTree">
+            <node id="n1" root="true"/>
+            <node id="n2" otu="a1"/>
+            <node id="n3"/>
+            <node id="n4" otu="b1"/>
+            <node id="n5" otu="c1"/>
+            <edge id="e2" source="n1" target="n2" length="1.5"/>
+            <edge id="e3" source="n1" target="n3" length="2"/>
+            <edge id="e4" source="n3" target="n4" length="3"/>
+            <edge id="e5" source="n3" target="n5" length="4"/>
+        </tree>
+    </trees>
+    <trees id="trees2" otus="t2">
+        <tree id="tree2" label="two" xsi:type="nex:IntTree">
+            <node id="m1"/>
+            <node id="m2" otu="a2"/>
+            <node id="m3" otu="d2"/>
+            <node id="m4" otu="e2"/>
+            <edge id="f2" source="m1" target="m2" length="1"/>
+            <edge id="f3" source="m1" target="m3" length="2"/>
+            <edge id="f4" source="m1" target="m4" length="3"/>
+        </tree>
+    </trees>
+</nex:nexml>
+""")
+        tns = dendropy.TaxonNamespace()
+        trees = list(dendropy.Tree.yield_from_files([src], schema="nexml", taxon_namespace=tns))
+        self.assertEqual([t.label for t in tns], ["A", "B", "C", "D", "E"])
+        self.assertEqual([t.label for t in trees], ["one", "two"])
+        self.assertEqual(trees[0].as_string("newick", suppress_rooting=True).strip(), "(A:1.5,(B:3.0,C:4.0):2.0);")
+        self.assertTrue(trees[0].is_rooted)
+        self.assertEqual(trees[1].as_string("newick", suppress_rooting=True).strip(), "(A:1,D:2,E:3);")
+        self.assertIs(trees[0].find_node_with_taxon_label("A").taxon, trees[1].find_node_with_taxon_label("A").taxon)
+
+if __name__ == "__main__":
+    unittest.main()
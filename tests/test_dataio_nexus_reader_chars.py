@@ -64,6 +64,28 @@ class NexusCharactersReaderDnaTestCase(
                     check_column_annotations=False,
                     check_cell_annotations=False)
 
+    def test_byte_coded_nexus(self):
+        src_filenames = [
+                "standard-test-chars-dna.simple.nexus",
+                "standard-test-chars-dna.basic.nexus",
+                "standard-test-chars-dna.interleaved.nexus",
+                "standard-test-chars-dna.matchchar.nexus",
+                "standard-test-chars-dna.multi.nexus",
+                ]
+        for src_filename in src_filenames:
+            src_path = pathmap.char_source_path(src_filename)
+            char_matrix = dendropy.DnaCharacterMatrix.get(
+                    path=src_path,
+                    schema="nexus",
+                    byte_coded=True)
+            self.assertTrue(char_matrix.is_byte_coded)
+            self.verify_char_matrix(char_matrix,
+                    check_taxon_annotations=False,
+                    check_matrix_annotations=False,
+                    check_sequence_annotations=False,
+                    check_column_annotations=False,
+                    check_cell_annotations=False)
+
 class NexusCharactersReaderRnaTestCase(
         standard_file_test_chars.RnaTestChecker,
         dendropytest.ExtendedTestCase):
@@ -124,6 +146,28 @@ class NexusCharactersReaderProteinTestCase(
                     check_column_annotations=False,
                     check_cell_annotations=False)
 
+    def test_byte_coded_nexus(self):
+        src_filenames = [
+                "standard-test-chars-protein.simple.nexus",
+                "standard-test-chars-protein.basic.nexus",
+                "standard-test-chars-protein.interleaved.nexus",
+                "standard-test-chars-protein.matchchar.nexus",
+                "standard-test-chars-protein.multi.nexus",
+                ]
+        for src_filename in src_filenames:
+            src_path = pathmap.char_source_path(src_filename)
+            char_matrix = dendropy.ProteinCharacterMatrix.get(
+                    path=src_path,
+                    schema="nexus",
+                    byte_coded=True)
+            self.assertTrue(char_matrix.is_byte_coded)
+            self.verify_char_matrix(char_matrix,
+                    check_taxon_annotations=False,
+                    check_matrix_annotations=False,
+                    check_sequence_annotations=False,
+                    check_column_annotations=False,
+                    check_cell_annotations=False)
+
 class NexusCharactersContinuousTestCase(
         standard_file_test_chars.ContinuousTestChecker,
         dendropytest.ExtendedTestCase):
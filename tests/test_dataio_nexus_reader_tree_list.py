@@ -107,5 +107,23 @@ class NexusStandardTreesWithTranslateBlockButNoTaxaBlockTestCase(
             self.assertEqual(tree.label, label)
             self.verify_curated_tree(tree=tree)
 
+    def test_internal_node_labels_resolved_to_translated_taxa(self):
+        src_filename = "curated-with-translate-block-and-no-taxa-block.nex"
+        src_path = pathmap.tree_source_path(src_filename)
+        tree_list = dendropy.TreeList.get_from_path(src_path, "nexus",
+                suppress_internal_node_taxa=False)
+        taxon_namespace = tree_list.taxon_namespace
+        # one taxon for each TRANSLATE entry: the labels of the internal
+        # nodes refer to these taxa rather than introducing new ones
+        self.assertEqual(len(taxon_namespace), 15)
+        self.assertEqual(len(set(t.label for t in taxon_namespace)), 15)
+        for tree in tree_list:
+            for nd in tree.internal_nodes():
+                self.assertIsNot(nd.taxon, None)
+                self.assertIs(nd.taxon, taxon_namespace.get_taxon(nd.taxon.label))
+            # "a" is translated from "1" and labels the seed node
+            self.assertIs(tree.seed_node.taxon, taxon_namespace[0])
+            self.assertEqual(tree.seed_node.taxon.label, "a")
+
 if __name__ == "__main__":
     unittest.main()
@@ -29,6 +29,7 @@ sys.path.insert(0, os.path.dirname(__file__))
 from support import dendropytest
 from support import standard_file_test_trees
 from support import pathmap
+from dendropy.utility.textprocessing import StringIO
 
 if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
@@ -83,6 +84,38 @@ class NexusTreeYielderDefaultTestCase(
             self.assertIs(tree.taxon_namespace, tns)
             self.compare_to_reference_tree(tree, ref_tree)
 
+    def test_tree_offset(self):
+        tree_file_titles = [
+            "dendropy-test-trees-n12-x2",
+            "dendropy-test-trees-n33-unrooted-x10a",
+            "dendropy-test-trees-n33-unrooted-annotated-x10a",
+        ]
+        for tree_offset in (1, 5, -3, -20):
+            for is_seekable in (True, False):
+                expected_tree_references = []
+                tree_files = []
+                for tree_file_title in tree_file_titles:
+                    tree_filepath = self.schema_tree_filepaths[tree_file_title]
+                    with open(tree_filepath, "r") as src:
+                        stream = StringIO(src.read())
+                    if not is_seekable:
+                        stream.seekable = lambda: False
+                    tree_files.append(stream)
+                    num_trees = self.tree_references[tree_file_title]["num_trees"]
+                    for tree_idx in range(num_trees)[tree_offset:]:
+                        expected_tree_references.append(self.tree_references[tree_file_title][str(tree_idx)])
+                tns = dendropy.TaxonNamespace()
+                tree_sources = dendropy.Tree.yield_from_files(
+                        files=tree_files,
+                        schema="nexus",
+                        taxon_namespace=tns,
+                        tree_offset=tree_offset)
+                collected_trees = list(tree_sources)
+                self.assertEqual(len(collected_trees), len(expected_tree_references))
+                for tree, ref_tree in zip(collected_trees, expected_tree_references):
+                    self.assertIs(tree.taxon_namespace, tns)
+                    self.compare_to_reference_tree(tree, ref_tree)
+
 ## TODO:
 # - test multiple trees blocks
 # - mix of newick/nexus
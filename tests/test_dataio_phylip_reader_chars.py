@@ -61,6 +61,24 @@ class PhylipCharactersReaderDnaTestCase(
                     check_column_annotations=False,
                     check_cell_annotations=False)
 
+    def test_byte_coded_phylip(self):
+        src_filenames = [
+                "standard-test-chars-dna.relaxed.phylip",
+                ]
+        for src_filename in src_filenames:
+            src_path = pathmap.char_source_path(src_filename)
+            char_matrix = dendropy.DnaCharacterMatrix.get(
+                    path=src_path,
+                    schema="phylip",
+                    byte_coded=True)
+            self.assertTrue(char_matrix.is_byte_coded)
+            self.verify_char_matrix(char_matrix,
+                    check_taxon_annotations=False,
+                    check_matrix_annotations=False,
+                    check_sequence_annotations=False,
+                    check_column_annotations=False,
+                    check_cell_annotations=False)
+
 class PhylipCharactersReaderRnaTestCase(
         standard_file_test_chars.RnaTestChecker,
         dendropytest.ExtendedTestCase):
@@ -113,6 +131,24 @@ class PhylipCharactersReaderProteinTestCase(
                     check_column_annotations=False,
                     check_cell_annotations=False)
 
+    def test_byte_coded_phylip(self):
+        src_filenames = [
+                "standard-test-chars-protein.relaxed.phylip",
+                ]
+        for src_filename in src_filenames:
+            src_path = pathmap.char_source_path(src_filename)
+            char_matrix = dendropy.ProteinCharacterMatrix.get(
+                    path=src_path,
+                    schema="phylip",
+                    byte_coded=True)
+            self.assertTrue(char_matrix.is_byte_coded)
+            self.verify_char_matrix(char_matrix,
+                    check_taxon_annotations=False,
+                    check_matrix_annotations=False,
+                    check_sequence_annotations=False,
+                    check_column_annotations=False,
+                    check_cell_annotations=False)
+
 class PhylipStandardCharacters01234TestCase(
         standard_file_test_chars.Standard01234TestChecker,
         dendropytest.ExtendedTestCase):
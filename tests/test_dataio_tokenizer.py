@@ -157,5 +157,83 @@ class NexusTokenizerTestCase(unittest.TestCase):
         self.assertEqual(expected_comments, {})
         self.assertEqual(observed_tokens, expected_tokens)
 
+    def test_small_blocks(self):
+        input_str = "[&R] ('the quick':1,('brown fox''s':2[&x=1],jumps_over)the_lazy[dog]);\n[c1][c2]end"
+        expected_tokens = [
+                "(", "the quick", ":", "1", ",", "(", "brown fox's", ":", "2", ",",
+                "jumps over", ")", "the lazy", ")", ";", "end",
+                ]
+        for block_size in (1, 2, 3, 7, 64):
+            tk = nexusprocessing.NexusTokenizer(src=StringIO(input_str))
+            tk.block_size = block_size
+            observed_tokens = []
+            observed_comments = []
+            for token in tk:
+                observed_tokens.append(token)
+                observed_comments.append(tk.pull_captured_comments())
+            self.assertEqual(observed_tokens, expected_tokens)
+            self.assertEqual(observed_comments[0], ["&R"])
+            self.assertEqual(observed_comments[8], ["&x=1"])
+            self.assertEqual(observed_comments[12], ["dog"])
+            self.assertEqual(observed_comments[15], ["c1", "c2"])
+
+    def test_line_and_column_numbers(self):
+        input_str = "ab cd\n  ef\n\n[x]gh"
+        expected = [
+                ("ab", 1, 1),
+                ("cd", 1, 4),
+                ("ef", 2, 4),
+                ("gh", 4, 2),
+                ]
+        for block_size in (1, 4, 64):
+            tk = nexusprocessing.NexusTokenizer(src=StringIO(input_str))
+            tk.block_size = block_size
+            observed = []
+            for token in tk:
+                observed.append((token, tk.token_line_num, tk.token_column_num))
+            self.assertEqual(observed, expected)
+            self.assertEqual(tk.current_line_num, 4)
+            self.assertEqual(tk.current_column_num, 6)
+
+    def test_unterminated_quote(self):
+        tk = nexusprocessing.NexusTokenizer(src=StringIO("a 'bc\nd"))
+        self.assertEqual(tk.next_token(), "a")
+        with self.assertRaises(nexusprocessing.Tokenizer.UnterminatedQuoteError) as cm:
+            tk.next_token()
+        self.assertEqual(cm.exception.line_num, 2)
+
+    def test_change_delimiters(self):
+        tk = nexusprocessing.NexusTokenizer(src=StringIO("a-b c\nd-e\nf"))
+        self.assertEqual(tk.next_token(), "a-b")
+        tk.set_capture_eol(True)
+        tk.set_hyphens_as_captured_delimiters(True)
+        observed = [tk.next_token() for i in range(5)]
+        self.assertEqual(observed, ["c", "\n", "d", "-", "e"])
+        tk.set_capture_eol(False)
+        self.assertEqual(tk.next_token(), "f")
+        self.assertIs(tk.next_token(), None)
+        self.assertTrue(tk.is_eof())
+
+    def test_skip_past_delimiter(self):
+        input_str = "(a,'b;''c',d[;[;]]e'f;g) ;\n [x] h;i"
+        for block_size in (1, 3, 64):
+            tk = nexusprocessing.NexusTokenizer(src=StringIO(input_str))
+            tk.block_size = block_size
+            self.assertEqual(tk.next_token(), "(")
+            # a quote within an unquoted token is not an opening quote
+            self.assertTrue(tk.skip_past_delimiter(";"))
+            self.assertEqual(tk.current_token, ";")
+            self.assertEqual((tk.token_line_num, tk.token_column_num), (1, 22))
+            self.assertTrue(tk.skip_past_delimiter(";"))
+            self.assertEqual((tk.token_line_num, tk.token_column_num), (1, 26))
+            self.assertFalse(tk.has_captured_comments())
+            self.assertEqual(tk.next_token(), "h")
+            self.assertEqual(tk.captured_comments, ["x"])
+            self.assertTrue(tk.skip_past_delimiter(";"))
+            self.assertEqual(tk.next_token(), "i")
+            self.assertFalse(tk.skip_past_delimiter(";"))
+            self.assertIs(tk.current_token, None)
+            self.assertTrue(tk.is_eof())
+
 if __name__ == "__main__":
     unittest.main()
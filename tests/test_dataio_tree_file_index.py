@@ -0,0 +1,309 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for random access to trees in files through TreeFileIndex.
+"""
+
+import os
+import sys
+import random
+import shutil
+import tempfile
+import unittest
+import dendropy
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+
+class TreeFileIndexTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def copy_tree_source(self, filename):
+        path = os.path.join(self.tempdir, filename)
+        shutil.copy(pathmap.tree_source_path(filename), path)
+        return path
+
+    def write_tree_source(self, filename, data):
+        path = os.path.join(self.tempdir, filename)
+        with open(path, "w") as dest:
+            dest.write(data)
+        return path
+
+    def check_trees(self, trees, expected_trees):
+        self.assertEqual(len(trees), len(expected_trees))
+        for tree, expected_tree in zip(trees, expected_trees):
+            self.assertEqual(tree.label, expected_tree.label)
+            self.assertEqual(tree.is_rooted, expected_tree.is_rooted)
+            self.assertEqual(tree.as_string("newick"), expected_tree.as_string("newick"))
+            # annotation order is not preserved, so compare these separately
+            for item, expected_item in zip(
+                    [tree] + list(tree.preorder_node_iter()),
+                    [expected_tree] + list(expected_tree.preorder_node_iter())):
+                self.assertEqual(
+                        sorted((a.name, str(a.value)) for a in item.annotations),
+                        sorted((a.name, str(a.value)) for a in expected_item.annotations))
+
+    def test_matches_reader(self):
+        for filename, schema in (
+                ("dendropy-test-trees-n33-unrooted-annotated-x10a.nexus", "nexus"),
+                ("dendropy-test-trees-n33-unrooted-annotated-x10a.newick", "newick"),
+                ("dendropy-test-trees-multifurcating-rooted-annotated.nexus", "nexus"),
+                ("pythonidae.mb.run1.t", "nexus"),
+                ):
+            path = pathmap.tree_source_path(filename)
+            expected_trees = dendropy.TreeList.get(path=path, schema=schema)
+            with dendropy.TreeFileIndex(path, schema, is_persistent=False) as index:
+                self.assertEqual(len(index), len(expected_trees))
+                self.check_trees([index[i] for i in range(len(index))], expected_trees)
+                self.check_trees(list(index), expected_trees)
+                self.assertEqual(
+                        [t.label for t in index.taxon_namespace],
+                        [t.label for t in expected_trees.taxon_namespace])
+
+    def test_translate_and_multiple_collections(self):
+        path = self.write_tree_source("trees.nex", (
+            "#NEXUS\n"
+            "begin taxa; dimensions ntax=4; taxlabels A B 'C c' D; end;\n"
+            "begin trees; title first;\n"
+            "    translate 1 A, 2 B, 3 'C c', 4 D;\n"
+            "    tree one = [&R] ((1:1,2:2):1,(3:1,4:1):2);\n"
+            "    tree 'two;' = [&U] ((1,3),[;'](2,4));\n"
+            "end;\n"
+            "begin trees; title second;\n"
+            "    tree three = ((A,B),('C c',D));\n"
+            "end;\n"
+            ))
+        expected_trees = dendropy.TreeList.get(path=path, schema="nexus")
+        with dendropy.TreeFileIndex(path, "nexus") as index:
+            self.check_trees(index[:], expected_trees)
+            self.assertEqual(len(index.taxon_namespace), 4)
+        with dendropy.TreeFileIndex(path, "nexus", collection_offset=-1) as index:
+            self.check_trees(index[:], expected_trees[2:])
+        with self.assertRaises(IndexError):
+            dendropy.TreeFileIndex(path, "nexus", collection_offset=2)
+
+    def test_slices_and_samples(self):
+        path = self.copy_tree_source("pythonidae.mb.run1.t")
+        expected_trees = dendropy.TreeList.get(path=path, schema="nexus")
+        with dendropy.TreeFileIndex(path, "nexus") as index:
+            self.check_trees([index[-1]], expected_trees[-1:])
+            self.check_trees(index[5:12:3], expected_trees[5:12:3])
+            with self.assertRaises(IndexError):
+                index[len(expected_trees)]
+            trees = index.sample(10, rng=random.Random(1))
+            self.assertEqual(len(trees), 10)
+            self.assertEqual(len(set(t.label for t in trees)), 10)
+            for tree in trees:
+                self.assertIs(tree.taxon_namespace, index.taxon_namespace)
+            self.assertEqual(len(index.taxon_namespace), len(expected_trees.taxon_namespace))
+
+    def test_newick_statements(self):
+        path = self.write_tree_source("trees.tre",
+                "[&R] ((a,b),(c,d));\n[&U]((a,c),(b,'d e'));;\n (a,(b,(c,d)))[x];\ne")
+        expected_trees = dendropy.TreeList.get(path=path, schema="newick")
+        with dendropy.TreeFileIndex(path, "newick") as index:
+            self.check_trees(index[:], expected_trees)
+        path = self.write_tree_source("unterminated.tre", "(a,b);(c,d)")
+        with self.assertRaises(dendropy.dataio.newickreader.NewickReader.NewickReaderIncompleteTreeStatementError):
+            dendropy.TreeFileIndex(path, "newick")
+        with dendropy.TreeFileIndex(path, "newick", terminating_semicolon_required=False) as index:
+            self.assertEqual(len(index), 2)
+
+    def test_persistence(self):
+        path = self.copy_tree_source("dendropy-test-trees-n33-unrooted-x10a.nexus")
+        index_path = dendropy.TreeFileIndex.get_index_path(path)
+        self.assertIs(dendropy.TreeFileIndex.load(path, "nexus"), None)
+        with dendropy.TreeFileIndex(path, "nexus", is_persistent=False):
+            pass
+        self.assertFalse(os.path.exists(index_path))
+        with dendropy.TreeFileIndex(path, "nexus"):
+            pass
+        self.assertTrue(os.path.exists(index_path))
+        index = dendropy.TreeFileIndex.load(path, "nexus")
+        self.assertEqual(len(index), 10)
+        index.close()
+        # not valid for different settings ...
+        self.assertIs(dendropy.TreeFileIndex.load(path, "nexus", preserve_underscores=True), None)
+        # ... or once the file has changed
+        with open(path, "a") as dest:
+            dest.write("\n")
+        self.assertIs(dendropy.TreeFileIndex.load(path, "nexus"), None)
+
+    def test_get(self):
+        for filename, schema in (
+                ("dendropy-test-trees-n33-unrooted-annotated-x10a.nexus", "nexus"),
+                ("dendropy-test-trees-n33-unrooted-annotated-x10a.newick", "newick"),
+                ):
+            path = self.copy_tree_source(filename)
+            expected_trees = [dendropy.Tree.get(path=path, schema=schema, tree_offset=i) for i in (0, 3, -1)]
+            expected_tree_lists = [dendropy.TreeList.get(path=path, schema=schema, tree_offset=i) for i in (4, -3)]
+            with dendropy.TreeFileIndex(path, schema):
+                pass
+            trees = [dendropy.Tree.get(path=path, schema=schema, tree_offset=i) for i in (0, 3, -1)]
+            self.check_trees(trees, expected_trees)
+            for tree_offset, expected_tree_list in zip((4, -3), expected_tree_lists):
+                tree_list = dendropy.TreeList.get(path=path, schema=schema, tree_offset=tree_offset, label="x")
+                self.assertEqual(tree_list.label, "x")
+                self.check_trees(tree_list, expected_tree_list)
+            with self.assertRaises(IndexError):
+                dendropy.TreeList.get(path=path, schema=schema, tree_offset=10)
+
+    def test_get_in_processes(self):
+        for filename, schema in (
+                ("dendropy-test-trees-n33-unrooted-annotated-x10a.nexus", "nexus"),
+                ("dendropy-test-trees-n33-unrooted-annotated-x10a.newick", "newick"),
+                ("pythonidae.mb.run1.t", "nexus"),
+                ):
+            path = self.copy_tree_source(filename)
+            for tree_offset in (0, 3):
+                expected_trees = dendropy.TreeList.get(path=path, schema=schema, tree_offset=tree_offset)
+                trees = dendropy.TreeList.get(path=path, schema=schema, tree_offset=tree_offset, num_processes=2)
+                self.check_trees(trees, expected_trees)
+                self.assertEqual(
+                        [t.label for t in trees.taxon_namespace],
+                        [t.label for t in expected_trees.taxon_namespace])
+                for tree in trees:
+                    self.assertIs(tree.taxon_namespace, trees.taxon_namespace)
+                    for leaf in tree.leaf_node_iter():
+                        self.assertIn(leaf.taxon, trees.taxon_namespace)
+            # taxa already in the namespace are not duplicated
+            taxon_namespace = dendropy.TaxonNamespace()
+            trees1 = dendropy.TreeList.get(path=path, schema=schema, taxon_namespace=taxon_namespace)
+            trees2 = dendropy.TreeList.get(path=path, schema=schema, taxon_namespace=taxon_namespace, num_processes=2)
+            self.assertEqual(len(taxon_namespace), len(expected_trees.taxon_namespace))
+            self.assertEqual(
+                    set(leaf.taxon for tree in trees1 for leaf in tree.leaf_node_iter()),
+                    set(leaf.taxon for tree in trees2 for leaf in tree.leaf_node_iter()))
+
+    def test_tree_array_in_processes(self):
+        path = self.copy_tree_source("pythonidae.mb.run1.t")
+        tree_arrays = []
+        for num_processes in (1, 3):
+            tree_array = dendropy.TreeArray(taxon_namespace=dendropy.TaxonNamespace())
+            tree_array.read_from_files([path], schema="nexus", tree_offset=2, num_processes=num_processes)
+            tree_arrays.append(tree_array)
+        expected_tree_array, tree_array = tree_arrays
+        self.assertEqual(
+                [t.label for t in tree_array.taxon_namespace],
+                [t.label for t in expected_tree_array.taxon_namespace])
+        self.assertEqual(len(tree_array), len(expected_tree_array))
+        for idx in range(len(tree_array)):
+            self.assertEqual(
+                    tree_array.get_split_bitmask_and_edge_tuple(idx),
+                    expected_tree_array.get_split_bitmask_and_edge_tuple(idx))
+        self.assertEqual(
+                tree_array.split_distribution.split_counts,
+                expected_tree_array.split_distribution.split_counts)
+
+    def test_tree_array_in_processes_with_new_taxa(self):
+        # taxa first referenced by trees after the first one
+        rng = random.Random(1)
+        labels = ["t{}".format(idx) for idx in range(12)]
+        tree_strings = []
+        for tree_idx in range(40):
+            num_taxa = min(len(labels), 6 + tree_idx // 5)
+            subtrees = rng.sample(labels[:num_taxa], num_taxa)
+            while len(subtrees) > 2:
+                subtrees.append("({},{})".format(subtrees.pop(0), subtrees.pop(0)))
+            tree_strings.append("({},{});".format(*subtrees))
+        path = self.write_tree_source("new_taxa.newick", "\n".join(tree_strings))
+        # trees are only constructed if node ages are needed
+        for ignore_node_ages in (True, False):
+            tree_arrays = []
+            for num_processes in (1, 2, 3):
+                tree_array = dendropy.TreeArray(
+                        taxon_namespace=dendropy.TaxonNamespace(),
+                        ignore_node_ages=ignore_node_ages)
+                tree_array.read_from_files([path], schema="newick", num_processes=num_processes)
+                tree_arrays.append(tree_array)
+            expected_tree_array = tree_arrays[0]
+            self.assertEqual(len(expected_tree_array.taxon_namespace), len(labels))
+            for tree_array in tree_arrays[1:]:
+                self.assertEqual(
+                        [t.label for t in tree_array.taxon_namespace],
+                        [t.label for t in expected_tree_array.taxon_namespace])
+                self.assertEqual(len(tree_array), len(expected_tree_array))
+                for idx in range(len(tree_array)):
+                    self.assertEqual(
+                            tree_array.get_split_bitmask_and_edge_tuple(idx),
+                            expected_tree_array.get_split_bitmask_and_edge_tuple(idx))
+                self.assertEqual(
+                        tree_array.split_distribution.split_counts,
+                        expected_tree_array.split_distribution.split_counts)
+
+    def test_tree_offset_taxa(self):
+        # Taxa referenced only by the trees skipped over are still added to
+        # the namespace, in the same order as when all the trees are read
+        # and the unwanted ones then discarded.
+        tree_strings = [
+                "((g,'e f'),(c,[x,y]b)a)h;",
+                "((c,g),(i:1,b)0.5:1,d);",
+                "((b,c),(g,i),(d,a));",
+                "((a,b),(c,d),(g,i));",
+                "((d,a),(b,c),(g,i));",
+                ]
+        sources = (
+                ("newick", self.write_tree_source("burnin.newick", "\n".join(tree_strings))),
+                ("nexus", self.write_tree_source("burnin.nexus",
+                    "#NEXUS\nbegin trees;\n"
+                    + "".join("tree t{} = [&U] {}\n".format(idx, s) for idx, s in enumerate(tree_strings))
+                    + "end;\n")),
+                )
+        for schema, path in sources:
+            for tree_offset in (1, 3, -2):
+                expected_trees = dendropy.TreeList.get(path=path, schema=schema)
+                expected_labels = [t.label for t in expected_trees.taxon_namespace]
+                expected_tree_array = dendropy.TreeArray(taxon_namespace=expected_trees.taxon_namespace)
+                for tree in expected_trees[tree_offset:]:
+                    expected_tree_array.add_tree(tree)
+                tree_lists = [dendropy.TreeList.get(path=path, schema=schema, tree_offset=tree_offset)]
+                taxon_namespace = dendropy.TaxonNamespace()
+                tree_lists.append(dendropy.TreeList(list(dendropy.Tree.yield_from_files([path],
+                        schema=schema,
+                        taxon_namespace=taxon_namespace,
+                        tree_offset=tree_offset)), taxon_namespace=taxon_namespace))
+                with dendropy.TreeFileIndex(path, schema, is_persistent=True):
+                    pass
+                tree_lists.append(dendropy.TreeList.get(path=path, schema=schema, tree_offset=tree_offset))
+                os.remove(dendropy.TreeFileIndex.get_index_path(path))
+                for tree_list in tree_lists:
+                    self.assertEqual([t.label for t in tree_list.taxon_namespace], expected_labels)
+                    self.check_trees(tree_list, expected_trees[tree_offset:])
+                if tree_offset < 0:
+                    continue
+                for num_processes in (1, 2):
+                    tree_array = dendropy.TreeArray(taxon_namespace=dendropy.TaxonNamespace())
+                    tree_array.read_from_files([path],
+                            schema=schema,
+                            tree_offset=tree_offset,
+                            num_processes=num_processes)
+                    self.assertEqual([t.label for t in tree_array.taxon_namespace], expected_labels)
+                    self.assertEqual(len(tree_array), len(expected_tree_array))
+                    for idx in range(len(tree_array)):
+                        self.assertEqual(
+                                tree_array.get_split_bitmask_and_edge_tuple(idx),
+                                expected_tree_array.get_split_bitmask_and_edge_tuple(idx))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests for writing trees one at a time through TreeStreamWriter.
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import dendropy
+from dendropy.utility import error
+from dendropy.utility.textprocessing import StringIO
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+
+class TreeStreamWriterTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tempdir = tempfile.mkdtemp()
+        self.trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-annotated-x10a.nexus"),
+                schema="nexus")
+
+    def tearDown(self):
+        shutil.rmtree(self.tempdir)
+
+    def test_matches_tree_list_writer(self):
+        self.trees.label = "the trees"
+        for schema, kwargs in (
+                ("newick", {}),
+                ("newick", {"suppress_annotations": True, "store_tree_weights": True}),
+                ("nexus", {}),
+                ("nexus", {"translate_tree_taxa": True, "suppress_block_titles": False}),
+                ("nexus", {"simple": True, "file_comments": ["simulated trees"]}),
+                ("nexml", {}),
+                ("dendropy-bin", {}),
+                ):
+            if schema == "dendropy-bin":
+                expected_path = os.path.join(self.tempdir, "expected.bin")
+                self.trees.write(path=expected_path, schema=schema, **kwargs)
+                with open(expected_path, "rb") as src:
+                    expected = src.read()
+            else:
+                expected = self.trees.as_string(schema, **kwargs)
+            path = os.path.join(self.tempdir, "trees")
+            with dendropy.TreeStreamWriter(path, schema, label="the trees", **kwargs) as writer:
+                writer.tree_list.annotations = self.trees.annotations
+                writer.tree_list.comments = self.trees.comments
+                writer.write_trees(iter(self.trees))
+            self.assertEqual(writer.num_trees_written, len(self.trees))
+            with open(path, "rb" if schema == "dendropy-bin" else "r") as src:
+                self.assertEqual(src.read(), expected)
+
+    def test_stream_and_generator(self):
+        taxon_namespace = dendropy.TaxonNamespace(["a", "b", "c", "d"])
+        def tree_generator():
+            for idx in range(5):
+                tree = dendropy.Tree.get(
+                        data="((a:{0},b:1):1,(c:1,d:2):{0});".format(idx),
+                        schema="newick",
+                        taxon_namespace=taxon_namespace)
+                tree.label = "t{}".format(idx)
+                yield tree
+        dest = StringIO()
+        with dendropy.TreeStreamWriter(dest, "nexus", taxon_namespace=taxon_namespace) as writer:
+            writer.write_trees(tree_generator())
+        self.assertFalse(dest.closed)
+        trees = dendropy.TreeList.get(data=dest.getvalue(), schema="nexus")
+        self.assertEqual([t.label for t in trees], ["t{}".format(idx) for idx in range(5)])
+        self.assertEqual([t.label for t in trees.taxon_namespace], ["a", "b", "c", "d"])
+        self.assertEqual(trees[3].seed_node.child_nodes()[1].edge.length, 3.0)
+
+    def test_empty(self):
+        taxon_namespace = dendropy.TaxonNamespace(["a", "b"])
+        dest = StringIO()
+        with dendropy.TreeStreamWriter(dest, "nexus", taxon_namespace=taxon_namespace):
+            pass
+        trees = dendropy.TreeList.get(data=dest.getvalue(), schema="nexus")
+        self.assertEqual(len(trees), 0)
+        self.assertEqual(len(trees.taxon_namespace), 2)
+        dest = StringIO()
+        with dendropy.TreeStreamWriter(dest, "newick"):
+            pass
+        self.assertEqual(dest.getvalue(), "")
+
+    def test_compressed_path(self):
+        path = os.path.join(self.tempdir, "trees.nex.gz")
+        with dendropy.TreeStreamWriter(path, "nexus") as writer:
+            for tree in self.trees:
+                writer.write(tree)
+        trees = dendropy.TreeList.get(path=path, schema="nexus")
+        self.assertEqual(len(trees), len(self.trees))
+        self.assertEqual(trees[-1].as_string("newick"), self.trees[-1].as_string("newick"))
+
+    def test_errors(self):
+        with self.assertRaises(error.UnspecifiedSchemaError):
+            dendropy.TreeStreamWriter(StringIO(), None)
+        writer = dendropy.TreeStreamWriter(StringIO(), "newick")
+        writer.write(self.trees[0])
+        with self.assertRaises(error.TaxonNamespaceIdentityError):
+            writer.write(dendropy.Tree.get(data="(a,b);", schema="newick"))
+        writer.close()
+        with self.assertRaises(ValueError):
+            writer.write(self.trees[1])
+        taxon_namespace = dendropy.TaxonNamespace(["a", "b"])
+        writer = dendropy.TreeStreamWriter(StringIO(), "nexus", taxon_namespace=taxon_namespace)
+        writer.write(dendropy.Tree.get(data="(a,b);", schema="newick", taxon_namespace=taxon_namespace))
+        with self.assertRaises(ValueError):
+            writer.write(dendropy.Tree.get(data="(a,c);", schema="newick", taxon_namespace=taxon_namespace))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -27,6 +27,7 @@ import re
 import sys
 import json
 import os
+import random
 sys.path.insert(0, os.path.dirname(__file__))
 from support import pathmap
 from support import paupsplitsreference
@@ -99,6 +100,115 @@ class BipartitionEncodingTestCase(ExtendedTestCase):
                                 expected_split_bitmask = int(tree_bipartitions_ref[label]["split_bitmask"])
                                 self.assertEqual(bipartition.split_bitmask, expected_split_bitmask)
 
+class IncrementalBipartitionEncodingTestCase(ExtendedTestCase):
+
+    def spr(self, tree, subtree_node, target_node):
+        # prune subtree, suppressing the resulting unifurcation, and regraft
+        # onto the edge subtending ``target_node``
+        old_parent = subtree_node.parent_node
+        old_parent.remove_child(subtree_node)
+        modified_nodes = [old_parent]
+        if len(old_parent._child_nodes) == 1 and old_parent.parent_node is not None:
+            grandparent = old_parent.parent_node
+            sibling = old_parent._child_nodes[0]
+            pos = grandparent._child_nodes.index(old_parent)
+            grandparent.remove_child(old_parent)
+            old_parent.remove_child(sibling)
+            grandparent.insert_child(pos, sibling)
+            modified_nodes = [grandparent, old_parent]
+        target_parent = target_node.parent_node
+        new_node = dendropy.Node()
+        target_parent.insert_child(target_parent._child_nodes.index(target_node), new_node)
+        target_parent.remove_child(target_node)
+        new_node.add_child(target_node)
+        new_node.add_child(subtree_node)
+        modified_nodes.append(new_node)
+        return modified_nodes
+
+    def check_spr_moves(self, tree, num_moves, rng):
+        tree.encode_bipartitions(suppress_unifurcations=False, collapse_unrooted_basal_bifurcation=False)
+        self.assertTrue(tree.split_bitmask_edge_map)
+        for move_idx in range(num_moves):
+            nodes = [nd for nd in tree.preorder_node_iter() if nd.parent_node is not None]
+            subtree_node = rng.choice(nodes)
+            excluded = set(subtree_node.preorder_iter())
+            excluded.add(subtree_node.parent_node)
+            excluded.update(subtree_node.parent_node.child_nodes())
+            candidates = [nd for nd in nodes if nd not in excluded]
+            if not candidates:
+                continue
+            target_node = rng.choice(candidates)
+            modified_nodes = self.spr(tree, subtree_node, target_node)
+            observed = tree.update_bipartitions_on_paths(modified_nodes)
+            self.assertIs(observed, tree.bipartition_encoding)
+            observed_bitmasks = sorted((b.leafset_bitmask, b.split_bitmask) for b in observed)
+            self.assertEqual(
+                    sorted(id(b) for b in observed),
+                    sorted(id(edge.bipartition) for edge in tree.postorder_edge_iter()))
+            observed_edge_map = dict(tree.split_bitmask_edge_map)
+            expected = tree.encode_bipartitions(
+                    suppress_unifurcations=False,
+                    collapse_unrooted_basal_bifurcation=False)
+            expected_bitmasks = sorted((b.leafset_bitmask, b.split_bitmask) for b in expected)
+            self.assertEqual(observed_bitmasks, expected_bitmasks)
+            self.assertEqual(observed_edge_map, tree.split_bitmask_edge_map)
+
+    def test_spr_moves_rooted(self):
+        tree = dendropy.Tree.get_from_path(
+                pathmap.tree_source_path("pythonidae.mle.nex"),
+                "nexus",
+                rooting="force-rooted")
+        self.check_spr_moves(tree, 50, random.Random(1))
+
+    def test_spr_moves_unrooted(self):
+        tree = dendropy.Tree.get_from_path(
+                pathmap.tree_source_path("pythonidae.mle.nex"),
+                "nexus",
+                rooting="force-unrooted")
+        self.check_spr_moves(tree, 50, random.Random(2))
+
+    def test_tree_not_traversed(self):
+        tree = dendropy.Tree.get_from_path(
+                pathmap.tree_source_path("pythonidae.mle.nex"),
+                "nexus",
+                rooting="force-rooted")
+        tree.encode_bipartitions(suppress_unifurcations=False, collapse_unrooted_basal_bifurcation=False)
+        tree.split_bitmask_edge_map
+        num_traversals = [0]
+        def count_traversals(fn):
+            def wrapped(*args, **kwargs):
+                num_traversals[0] += 1
+                return fn(*args, **kwargs)
+            return wrapped
+        for name in ("postorder_edge_iter", "preorder_edge_iter", "postorder_node_iter",
+                "preorder_node_iter", "leaf_node_iter"):
+            setattr(tree, name, count_traversals(getattr(tree, name)))
+        rng = random.Random(3)
+        nodes = [nd for nd in tree.seed_node.preorder_iter() if nd.parent_node is not None]
+        for move_idx in range(20):
+            subtree_node = rng.choice(nodes)
+            excluded = set(subtree_node.preorder_iter())
+            excluded.add(subtree_node.parent_node)
+            excluded.update(subtree_node.parent_node.child_nodes())
+            candidates = [nd for nd in nodes if nd not in excluded]
+            if not candidates:
+                continue
+            modified_nodes = self.spr(tree, subtree_node, rng.choice(candidates))
+            nodes = [nd for nd in tree.seed_node.preorder_iter() if nd.parent_node is not None]
+            tree.update_bipartitions_on_paths(modified_nodes)
+        self.assertEqual(num_traversals[0], 0)
+
+    def test_fallback_on_leafset_change(self):
+        tree = dendropy.Tree.get_from_string("((a,b),(c,(d,e)));", "newick", rooting="force-rooted")
+        tree.encode_bipartitions(suppress_unifurcations=False)
+        d = tree.find_node_with_taxon_label("d")
+        parent = d.parent_node
+        parent.remove_child(d)
+        observed = tree.update_bipartitions_on_paths([parent])
+        self.assertEqual(tree.seed_node.edge.bipartition.leafset_bitmask, 0b10111)
+        for bipartition in observed:
+            self.assertEqual(bipartition.tree_leafset_bitmask, 0b10111)
+
 if __name__ == "__main__":
     unittest.main()
 
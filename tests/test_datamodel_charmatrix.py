@@ -23,12 +23,14 @@ Tests character sequence map.
 
 import copy
 import collections
+import functools
 import random
 import unittest
 import dendropy
 import itertools
 from dendropy.utility import error
 from dendropy.datamodel import charmatrixmodel
+from dendropy.datamodel import charstatemodel
 import os
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
@@ -1082,6 +1084,225 @@ class InfiniteSitesCharacterMatrixCreatingAndCloningTestCase(
         cls.nseqs = 100
         cls.build()
 
+class ByteCodedDnaCharacterMatrixCreatingAndCloningTestCase(
+        MatrixCreatingAndCloningTester,
+        dendropytest.ExtendedTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.matrix_type = functools.partial(dendropy.DnaCharacterMatrix, byte_coded=True)
+        cls.sequence_type = dendropy.ByteCodedDnaCharacterDataSequence
+        cls.sequence_source = list(dendropy.DnaCharacterMatrix.datatype_alphabet)
+        cls.nseqs = 100
+        cls.build()
+
+    def test_copies_are_byte_coded(self):
+        char_matrix1 = self.get_char_matrix()
+        for char_matrix2 in (
+                copy.copy(char_matrix1),
+                char_matrix1.clone(1),
+                copy.deepcopy(char_matrix1),
+                ):
+            self.assertTrue(char_matrix2.is_byte_coded)
+            for taxon in char_matrix2:
+                self.assertIs(type(char_matrix2[taxon]), self.__class__.sequence_type)
+            t = char_matrix2.taxon_namespace.new_taxon(label="new")
+            char_matrix2[t] = "ACGT"
+            self.assertIs(type(char_matrix2[t]), self.__class__.sequence_type)
+
+class ByteCodedCharacterDataSequenceTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.alphabet = dendropy.DNA_STATE_ALPHABET
+        self.symbols = "ACGT-?NRacgt"
+        self.states = [self.alphabet[c] for c in self.symbols]
+
+    def test_basic_list_operations(self):
+        s = dendropy.ByteCodedDnaCharacterDataSequence(self.states)
+        self.assertEqual(len(s), len(self.states))
+        for state1, state2 in zip(s, self.states):
+            self.assertIs(state1, state2)
+        self.assertIs(s[0], self.states[0])
+        self.assertIs(s[-1], self.states[-1])
+        self.assertIs(s.value_at(2), self.states[2])
+        self.assertEqual(s[1:3], self.states[1:3])
+        self.assertEqual(s.values(), self.states)
+        self.assertEqual(s.symbols_as_string(), "ACGT-?NRACGT")
+        self.assertEqual(s.symbols_as_string(sep=","), ",".join("ACGT-?NRACGT"))
+        self.assertEqual(s.symbols_as_list(), list("ACGT-?NRACGT"))
+        s.append("y")
+        self.assertIs(s[-1], self.alphabet["Y"])
+        s[0] = self.alphabet["T"]
+        s.insert(1, "G")
+        del s[2]
+        self.assertEqual(s.symbols_as_string(), "TGGT-?NRACGTY")
+        s.extend("AA")
+        s.extend(dendropy.ByteCodedDnaCharacterDataSequence("CC"))
+        self.assertEqual(s.symbols_as_string(), "TGGT-?NRACGTYAACC")
+        s.set_at(len(s) + 1, "A")
+        self.assertEqual(s.symbols_as_string(), "TGGT-?NRACGTYAACC?A")
+        with self.assertRaises(ValueError):
+            s.append(dendropy.RNA_STATE_ALPHABET["U"])
+        with self.assertRaises(ValueError):
+            s.append("Z")
+        with self.assertRaises(IndexError):
+            s[100]
+
+    def test_extend_symbols(self):
+        s = dendropy.ByteCodedDnaCharacterDataSequence()
+        self.assertTrue(s.extend_symbols("ac g\tT-\n"))
+        self.assertEqual(s.symbols_as_string(), "ACGT-")
+        self.assertFalse(s.extend_symbols("ACZ"))
+        self.assertFalse(s.extend_symbols("AC\u00e9"))
+        self.assertFalse(s.extend_symbols("A(CG)"))
+        self.assertEqual(s.symbols_as_string(), "ACGT-")
+
+    def test_types_and_annotations(self):
+        s = dendropy.ByteCodedDnaCharacterDataSequence(self.states)
+        self.assertIs(s._character_types, None)
+        self.assertIs(s._character_annotations, None)
+        self.assertIs(s.character_type_at(1), None)
+        self.assertFalse(s.has_annotations_at(1))
+        with self.assertRaises(IndexError):
+            s.character_type_at(100)
+        self.assertEqual(list(s.cell_iter()), [(state, None, None) for state in self.states])
+        self.assertIs(s._character_types, None)
+        character_type = charmatrixmodel.CharacterType(state_alphabet=self.alphabet)
+        s.set_character_type_at(1, character_type)
+        s.annotations_at(2).add_new("a", 1)
+        s.append("A")
+        s.insert(0, "C")
+        self.assertIs(s.character_type_at(2), character_type)
+        self.assertTrue(s.has_annotations_at(3))
+        self.assertFalse(s.has_annotations_at(4))
+        self.assertEqual(len(s._character_types), len(s))
+        self.assertEqual(len(s._character_annotations), len(s))
+        del s[0]
+        self.assertIs(s.character_type_at(1), character_type)
+        self.assertTrue(s.has_annotations_at(2))
+
+    def test_new_alphabet_states(self):
+        alphabet = charstatemodel.DnaStateAlphabet()
+        class _ByteCodedSequence(dendropy.ByteCodedDnaCharacterDataSequence):
+            state_alphabet = alphabet
+        s = _ByteCodedSequence("ACGT")
+        state = alphabet.new_polymorphic_state(symbol=None, member_state_symbols="AG")
+        alphabet.compile_lookup_mappings()
+        s.append(state)
+        s.append("-")
+        self.assertIs(s[4], state)
+        self.assertIs(s[5], alphabet["-"])
+        self.assertEqual(s.symbols_as_string(), "ACGT(A,G)-")
+
+    def test_conversion(self):
+        d = {"a": "ACGT", "b": "AC-?"}
+        char_matrix = dendropy.DnaCharacterMatrix.from_dict(d)
+        char_matrix[0].annotations.add_new("color", "red")
+        char_matrix[0].set_character_type_at(1, charmatrixmodel.CharacterType())
+        self.assertFalse(char_matrix.is_byte_coded)
+        char_matrix.is_byte_coded = True
+        self.assertTrue(char_matrix.is_byte_coded)
+        for taxon in char_matrix:
+            self.assertIs(type(char_matrix[taxon]), dendropy.ByteCodedDnaCharacterDataSequence)
+            self.assertEqual(char_matrix[taxon].symbols_as_string(), d[taxon.label])
+        self.assertEqual(char_matrix[0].annotations.get_value("color"), "red")
+        self.assertIsNot(char_matrix[0].character_type_at(1), None)
+        self.assertIs(char_matrix[1]._character_types, None)
+        char_matrix.is_byte_coded = False
+        for taxon in char_matrix:
+            self.assertIs(type(char_matrix[taxon]), dendropy.DnaCharacterDataSequence)
+            self.assertEqual(char_matrix[taxon].symbols_as_string(), d[taxon.label])
+        self.assertIsNot(char_matrix[0].character_type_at(1), None)
+        with self.assertRaises(TypeError):
+            dendropy.StandardCharacterMatrix(byte_coded=True)
+        with self.assertRaises(TypeError):
+            dendropy.StandardCharacterMatrix().is_byte_coded = True
+
+class SitePatternsTestCase(dendropytest.ExtendedTestCase):
+
+    def setUp(self):
+        self.d = collections.OrderedDict([
+            ("a", "ACAAGA-"),
+            ("b", "ACATGA?"),
+            ("c", "GCGTGGA"),
+            ])
+
+    def verify_site_patterns(self, char_matrix):
+        site_patterns = char_matrix.compress_site_patterns()
+        self.assertEqual([t.label for t in site_patterns.taxa], ["a", "b", "c"])
+        self.assertEqual(len(site_patterns), 5)
+        self.assertEqual(site_patterns.num_sites, 7)
+        self.assertEqual(site_patterns.site_pattern_indexes, (0, 1, 0, 2, 3, 0, 4))
+        self.assertEqual(site_patterns.weights, (3, 1, 1, 1, 1))
+        self.assertEqual(sum(site_patterns.weights), site_patterns.num_sites)
+        alphabet = char_matrix.default_state_alphabet
+        self.assertEqual(site_patterns.patterns[0], (alphabet["A"], alphabet["A"], alphabet["G"]))
+        self.assertEqual(site_patterns.patterns[4], (alphabet["-"], alphabet["?"], alphabet["A"]))
+        self.assertEqual(
+                ["".join(str(s) for s in row) for row in site_patterns.sequences()],
+                ["ACAG-", "ACTG?", "GCTGA"])
+        for site_idx, pattern_idx in enumerate(site_patterns.site_pattern_indexes):
+            self.assertEqual(
+                    site_patterns.patterns[pattern_idx],
+                    tuple(char_matrix[t][site_idx] for t in char_matrix))
+        self.assertEqual(site_patterns.expand(list(range(5))), [0, 1, 0, 2, 3, 0, 4])
+        self.assertIs(char_matrix.compress_site_patterns(), site_patterns)
+        return site_patterns
+
+    def test_compress_site_patterns(self):
+        for byte_coded in (False, True):
+            char_matrix = dendropy.DnaCharacterMatrix.from_dict(self.d)
+            char_matrix.is_byte_coded = byte_coded
+            self.verify_site_patterns(char_matrix)
+
+    def test_cache_invalidation(self):
+        for byte_coded in (False, True):
+            char_matrix = dendropy.DnaCharacterMatrix.from_dict(self.d)
+            char_matrix.is_byte_coded = byte_coded
+            alphabet = char_matrix.default_state_alphabet
+            site_patterns = self.verify_site_patterns(char_matrix)
+            char_matrix[0][0] = alphabet["C"]
+            site_patterns2 = char_matrix.compress_site_patterns()
+            self.assertIsNot(site_patterns2, site_patterns)
+            self.assertEqual(len(site_patterns2), 6)
+            char_matrix[0][0] = alphabet["A"]
+            self.assertEqual(char_matrix.compress_site_patterns().weights, site_patterns.weights)
+            char_matrix[2].append(alphabet["A"])
+            with self.assertRaises(ValueError):
+                char_matrix.compress_site_patterns()
+            del char_matrix[2][-1]
+            self.assertEqual(len(char_matrix.compress_site_patterns()), 5)
+            taxon = char_matrix.taxon_namespace[1]
+            char_matrix[taxon] = "ACAAGAA"
+            self.assertEqual(char_matrix.compress_site_patterns().weights, (3, 1, 1, 1, 1))
+            del char_matrix[taxon]
+            site_patterns3 = char_matrix.compress_site_patterns()
+            self.assertEqual(len(site_patterns3.taxa), 2)
+            self.assertEqual(site_patterns3.weights, (3, 1, 1, 1, 1))
+            char_matrix.taxon_namespace.sort(key=lambda t: t.label, reverse=True)
+            self.assertEqual([t.label for t in char_matrix.compress_site_patterns().taxa], ["c", "a"])
+
+    def test_taxon_state_sets_map(self):
+        char_matrix = dendropy.DnaCharacterMatrix.from_dict(self.d)
+        site_patterns = char_matrix.compress_site_patterns()
+        for gaps_as_missing in (True, False):
+            site_map = char_matrix.taxon_state_sets_map(gaps_as_missing=gaps_as_missing)
+            pattern_map = char_matrix.taxon_state_sets_map(
+                    gaps_as_missing=gaps_as_missing,
+                    site_patterns=site_patterns)
+            self.assertEqual(set(pattern_map), set(site_map))
+            for taxon in char_matrix:
+                self.assertEqual(len(pattern_map[taxon]), len(site_patterns))
+                self.assertEqual(site_patterns.expand(pattern_map[taxon]), site_map[taxon])
+
+    def test_empty(self):
+        char_matrix = dendropy.DnaCharacterMatrix()
+        site_patterns = char_matrix.compress_site_patterns()
+        self.assertEqual(len(site_patterns), 0)
+        self.assertEqual(site_patterns.num_sites, 0)
+        char_matrix = dendropy.DnaCharacterMatrix.from_dict({"a": "", "b": ""})
+        self.assertEqual(char_matrix.compress_site_patterns().sequences(), [[], []])
+
 class TestCharacterMatrixTaxa(dendropytest.ExtendedTestCase):
 
     def setUp(self):
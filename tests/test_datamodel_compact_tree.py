@@ -0,0 +1,112 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests the compact (``__slots__``-based) tree representation.
+"""
+
+import copy
+import unittest
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+import dendropy
+from dendropy.calculate import treecompare
+
+class CompactTreeTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tree_str = "[&R] ((A:1,B:2)x:3,(C:1[&a=1],D:2):1,E:5);"
+
+    def get_trees(self):
+        t1 = dendropy.Tree.get(data=self.tree_str, schema="newick")
+        t2 = dendropy.CompactTree.get(
+                data=self.tree_str,
+                schema="newick",
+                taxon_namespace=t1.taxon_namespace)
+        return t1, t2
+
+    def test_component_types(self):
+        t1, t2 = self.get_trees()
+        for nd in t2:
+            self.assertIs(type(nd), dendropy.CompactNode)
+            self.assertIs(type(nd.edge), dendropy.CompactEdge)
+            self.assertIsInstance(nd, dendropy.Node)
+            self.assertIsInstance(nd.edge, dendropy.Edge)
+            self.assertEqual(nd.__dict__, {})
+            self.assertEqual(nd.edge.__dict__, {})
+
+    def test_lazy_comments_and_annotations(self):
+        nd = dendropy.CompactNode()
+        self.assertFalse(hasattr(nd, "_comments"))
+        self.assertFalse(nd.has_annotations)
+        self.assertEqual(nd.comments, [])
+        nd.comments.append("c")
+        self.assertEqual(nd.comments, ["c"])
+        nd.annotations.add_new("x", 1)
+        self.assertTrue(nd.has_annotations)
+        self.assertEqual(nd.__dict__, {})
+
+    def test_structure_and_bipartitions(self):
+        t1, t2 = self.get_trees()
+        self.assertEqual(
+                [nd.label for nd in t1.postorder_node_iter()],
+                [nd.label for nd in t2.postorder_node_iter()])
+        b1 = t1.encode_bipartitions()
+        b2 = t2.encode_bipartitions()
+        for b in b2:
+            self.assertIs(type(b), dendropy.CompactBipartition)
+        self.assertEqual(
+                [b.split_bitmask for b in b1],
+                [b.split_bitmask for b in b2])
+        self.assertEqual(treecompare.symmetric_difference(t1, t2), 0)
+
+    def test_writing(self):
+        t1, t2 = self.get_trees()
+        for schema in ("newick", "nexus"):
+            self.assertEqual(
+                    t1.as_string(schema, suppress_annotations=False),
+                    t2.as_string(schema, suppress_annotations=False))
+
+    def test_copy(self):
+        t1, t2 = self.get_trees()
+        for t3 in (copy.deepcopy(t2), dendropy.CompactTree(t2), t2.extract_tree()):
+            self.assertEqual(t2.as_string("newick"), t3.as_string("newick"))
+            for nd2, nd3 in zip(t2.preorder_node_iter(), t3.preorder_node_iter()):
+                self.assertIsNot(nd2, nd3)
+                self.assertIs(type(nd3), dendropy.CompactNode)
+                self.assertEqual(nd2.edge.length, nd3.edge.length)
+
+    def test_read_tree_list(self):
+        trees = dendropy.TreeList(tree_type=dendropy.CompactTree)
+        trees.read(
+                path=pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x10a.nexus"),
+                schema="nexus")
+        ref_trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("dendropy-test-trees-n33-unrooted-x10a.nexus"),
+                schema="nexus",
+                taxon_namespace=trees.taxon_namespace)
+        self.assertEqual(len(trees), len(ref_trees))
+        for t1, t2 in zip(ref_trees, trees):
+            self.assertIs(type(t2.seed_node), dendropy.CompactNode)
+            self.assertEqual(t1.as_string("newick"), t2.as_string("newick"))
+
+if __name__ == "__main__":
+    unittest.main()
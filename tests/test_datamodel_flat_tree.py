@@ -0,0 +1,131 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+##############################################################################
+##  DendroPy Phylogenetic Computing Library.
+##
+##  Copyright 2010-2015 Jeet Sukumaran and Mark T. Holder.
+##  All rights reserved.
+##
+##  See "LICENSE.rst" for terms and conditions of usage.
+##
+##  If you use this work or any portion thereof in published work,
+##  please cite it as:
+##
+##     Sukumaran, J. and M. T. Holder. 2010. DendroPy: a Python library
+##     for phylogenetic computing. Bioinformatics 26: 1569-1571.
+##
+##############################################################################
+
+"""
+Tests the array-backed FlatTree representation.
+"""
+
+import unittest
+import os
+import sys
+sys.path.insert(0, os.path.dirname(__file__))
+from support import pathmap
+import dendropy
+from dendropy.calculate import treemeasure
+
+class FlatTreeStructureTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("dendropy-test-trees-multifurcating-rooted.nexus"),
+                schema="nexus")
+
+    def test_indexes(self):
+        for tree in self.trees:
+            flat_tree = tree.as_flat_tree()
+            nodes = list(tree.preorder_node_iter())
+            self.assertEqual(len(flat_tree), len(nodes))
+            for index, nd in enumerate(nodes):
+                if nd.parent_node is None:
+                    self.assertEqual(flat_tree.parent_indexes[index], -1)
+                else:
+                    self.assertIs(nodes[flat_tree.parent_indexes[index]], nd.parent_node)
+                self.assertEqual(
+                        [nodes[i] for i in flat_tree.child_index_iter(index)],
+                        nd.child_nodes())
+                self.assertEqual(flat_tree.num_child_nodes[index], len(nd.child_nodes()))
+                self.assertIs(flat_tree.taxon(index), nd.taxon)
+                self.assertEqual(flat_tree.node_labels[index], nd.label)
+                self.assertEqual(flat_tree.edge_length(index), nd.edge.length)
+            self.assertEqual(
+                    [nodes[i] for i in flat_tree.postorder_index_iter()],
+                    list(tree.postorder_node_iter()))
+            self.assertEqual(
+                    [nodes[i] for i in flat_tree.leaf_index_iter()],
+                    list(tree.leaf_node_iter()))
+
+    def test_round_trip(self):
+        for tree in self.trees:
+            tree2 = tree.as_flat_tree().as_tree()
+            self.assertIs(tree2.taxon_namespace, tree.taxon_namespace)
+            self.assertEqual(tree2.is_rooted, tree.is_rooted)
+            self.assertEqual(tree.as_string("newick"), tree2.as_string("newick"))
+
+    def test_round_trip_with_new_taxon_namespace(self):
+        tns = dendropy.TaxonNamespace()
+        tree = self.trees[0]
+        tree2 = tree.as_flat_tree().as_tree(taxon_namespace=tns)
+        self.assertIs(tree2.taxon_namespace, tns)
+        self.assertEqual(
+                set(t.label for t in tns),
+                set(nd.taxon.label for nd in tree.leaf_node_iter()))
+        self.assertEqual(tree.as_string("newick"), tree2.as_string("newick"))
+
+    def test_leafset_bitmasks(self):
+        for tree in self.trees:
+            flat_tree = tree.as_flat_tree()
+            leafset_bitmasks = flat_tree.leafset_bitmasks()
+            tree.encode_bipartitions(suppress_unifurcations=False, collapse_unrooted_basal_bifurcation=False)
+            for index, nd in enumerate(tree.preorder_node_iter()):
+                self.assertEqual(leafset_bitmasks[index], nd.edge.bipartition.leafset_bitmask)
+            self.assertEqual(
+                    [b.split_bitmask for b in flat_tree.encode_bipartitions()],
+                    [b.split_bitmask for b in tree.bipartition_encoding])
+
+class FlatTreeCalculationsTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.tree = dendropy.Tree.get(
+                path=pathmap.tree_source_path("pythonidae.beast.summary.tre"),
+                schema="nexus")
+
+    def test_node_ages(self):
+        flat_tree = self.tree.as_flat_tree()
+        ages1 = self.tree.calc_node_ages(is_force_max_age=True)
+        ages2 = flat_tree.calc_node_ages(is_force_max_age=True)
+        self.assertEqual(len(ages1), len(ages2))
+        for a1, a2 in zip(ages1, ages2):
+            self.assertAlmostEqual(a1, a2)
+
+    def test_tree_measures(self):
+        flat_tree = self.tree.as_flat_tree()
+        for fn in (treemeasure.B1,
+                treemeasure.colless_tree_imbalance,
+                treemeasure.N_bar,
+                treemeasure.sackin_index,
+                treemeasure.treeness,
+                ):
+            self.assertAlmostEqual(fn(self.tree), fn(flat_tree))
+        self.assertAlmostEqual(
+                treemeasure.pybus_harvey_gamma(self.tree),
+                treemeasure.pybus_harvey_gamma(flat_tree))
+
+    def test_phylogenetic_distance_matrix(self):
+        flat_tree = self.tree.as_flat_tree()
+        pdm1 = self.tree.phylogenetic_distance_matrix()
+        pdm2 = dendropy.PhylogeneticDistanceMatrix.from_tree(flat_tree)
+        nodes = list(self.tree.preorder_node_iter())
+        for t1, t2 in pdm1.distinct_taxon_pair_iter():
+            self.assertAlmostEqual(pdm1.patristic_distance(t1, t2), pdm2.patristic_distance(t1, t2))
+            self.assertEqual(pdm1.path_edge_count(t1, t2), pdm2.path_edge_count(t1, t2))
+            self.assertIs(pdm1.mrca(t1, t2), nodes[pdm2.mrca(t1, t2)])
+        self.assertAlmostEqual(pdm1.sum_of_distances(), pdm2.sum_of_distances())
+
+if __name__ == "__main__":
+    unittest.main()
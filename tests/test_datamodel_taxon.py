@@ -24,6 +24,7 @@ Tests creation, reading, update, deletion of Taxon and TaxonNamespace objects.
 import collections
 import unittest
 import copy
+import pickle
 from dendropy import Taxon, TaxonNamespace
 import os
 import sys
@@ -694,6 +695,94 @@ class TaxonNamespaceTaxonManagement(unittest.TestCase):
             x.append(t)
         self.assertEqual(len(x), 0)
 
+    ### label lookups kept up to date ###
+
+    def test_label_lookup_after_add_and_remove(self):
+        tns = TaxonNamespace(self.str_labels)
+        self.assertEqual(len(tns.findall("z")), 3)
+        t = tns.new_taxon("Z")
+        self.assertEqual(tns.findall("z")[-1], t)
+        self.assertIs(tns.get_taxon("Z", is_case_sensitive=True), t)
+        tns.remove_taxon(t)
+        self.assertEqual(len(tns.findall("z")), 3)
+        self.assertIs(tns.get_taxon("Z", is_case_sensitive=True), None)
+        tns.discard_taxon_label("z")
+        self.assertFalse(tns.has_taxon_label("z"))
+        tns.clear()
+        self.assertFalse(tns.has_taxon_label("a"))
+        tns.new_taxon("a")
+        self.assertTrue(tns.has_taxon_label("A"))
+
+    def test_label_lookup_after_relabel(self):
+        tns = TaxonNamespace(self.str_labels)
+        t = tns.get_taxon("b")
+        t.label = "Q"
+        self.assertIs(tns.get_taxon("b"), None)
+        self.assertIs(tns.get_taxon("q"), t)
+        self.assertIs(tns.get_taxon("Q", is_case_sensitive=True), t)
+        self.assertIs(tns.get_taxon("q", is_case_sensitive=True), None)
+        # relabeling taxa that are in another namespace
+        tns2 = TaxonNamespace([t])
+        self.assertIs(tns2.get_taxon("q"), t)
+        t.label = "b"
+        self.assertIs(tns.get_taxon("b"), t)
+        self.assertIs(tns2.get_taxon("b"), t)
+        self.assertIs(tns2.get_taxon("q"), None)
+
+    def test_label_lookup_order_after_sort(self):
+        tns = TaxonNamespace(["b", "B", "a"])
+        self.assertEqual([t.label for t in tns.findall("b")], ["b", "B"])
+        tns.sort()
+        self.assertEqual([t.label for t in tns.findall("b")], ["B", "b"])
+        self.assertEqual(tns.get_taxon("b").label, "B")
+        tns.reverse()
+        self.assertEqual(tns.get_taxon("b").label, "b")
+
+    def test_label_lookup_in_copy(self):
+        tns1 = TaxonNamespace(self.str_labels)
+        tns1.get_taxon("a")
+        tns2 = copy.deepcopy(tns1)
+        t1 = tns1.get_taxon("c")
+        t2 = tns2.get_taxon("c")
+        self.assertIsNot(t1, t2)
+        self.assertIn(t2, tns2)
+        t = tns2.new_taxon("y")
+        self.assertIs(tns2.get_taxon("y"), t)
+        self.assertIs(tns1.get_taxon("y"), None)
+        t2.label = "x"
+        self.assertIs(tns2.get_taxon("x"), t2)
+        self.assertIs(tns1.get_taxon("x"), None)
+
+    def test_relabel_only_invalidates_containing_namespaces(self):
+        tns1 = TaxonNamespace(self.str_labels)
+        tns2 = TaxonNamespace(["p", "q"])
+        tns1.get_taxon("a")
+        tns2.get_taxon("p")
+        label_indexes = tns1._label_indexes
+        label_version = tns1._label_version
+        tns2.get_taxon("q").label = "r"
+        self.assertIs(tns1._label_indexes, label_indexes)
+        self.assertEqual(tns1._label_version, label_version)
+        self.assertEqual(tns2.get_taxon("r").label, "r")
+        # removed taxa no longer affect the namespace
+        t = tns1.get_taxon("c")
+        tns1.remove_taxon(t)
+        tns1.get_taxon("a")
+        label_indexes = tns1._label_indexes
+        t.label = "a"
+        self.assertIs(tns1._label_indexes, label_indexes)
+        self.assertEqual(len(tns1.findall("a")), 2)
+
+    def test_label_lookup_after_pickling(self):
+        tns1 = TaxonNamespace(self.str_labels)
+        tns2 = pickle.loads(pickle.dumps(tns1))
+        t = tns2.get_taxon("c")
+        self.assertIsNot(t, tns1.get_taxon("c"))
+        t.label = "y"
+        self.assertIs(tns2.get_taxon("y"), t)
+        self.assertIs(tns2.get_taxon("c"), None)
+        self.assertIs(tns1.get_taxon("y"), None)
+
 class TaxonNamespaceIdentity(unittest.TestCase):
 
     def setUp(self):
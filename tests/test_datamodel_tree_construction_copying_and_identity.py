@@ -151,6 +151,99 @@ class TestTreeCopying(
                 self.assertIsNot(nd1.taxon, nd2.taxon)
                 self.assertEqual(nd1.taxon.label, nd2.taxon.label)
 
+    def test_clone_structure(self):
+        tree1, anodes1, lnodes1, inodes1 = self.get_tree(suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        self.add_annotations(tree1)
+        tree2 = tree1.clone_structure()
+        self.compare_distinct_trees(tree1, tree2,
+                taxon_namespace_scoped=True,
+                compare_tree_annotations=False,
+                compare_taxon_annotations=False)
+        for nd in tree2:
+            self.assertFalse(nd.has_annotations)
+            self.assertFalse(nd.edge.has_annotations)
+        for copy_on_write in (False, True):
+            tree2 = tree1.clone_structure(copy_annotations=True, copy_on_write=copy_on_write)
+            for nd in tree2:
+                # force deferred copies
+                nd.annotations
+                nd.edge.annotations
+            self.compare_distinct_trees(tree1, tree2,
+                    taxon_namespace_scoped=True,
+                    compare_tree_annotations=True,
+                    compare_taxon_annotations=False)
+
+    def test_clone_structure_copy_on_write(self):
+        tree1, anodes1, lnodes1, inodes1 = self.get_tree(suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        self.add_annotations(tree1)
+        tree2 = tree1.clone_structure(copy_annotations=True, copy_on_write=True)
+        nodes1 = [nd for nd in tree1]
+        nodes2 = [nd for nd in tree2]
+        for nd1, nd2 in zip(nodes1, nodes2):
+            self.assertFalse(hasattr(nd2, "_annotations"))
+            self.assertTrue(nd2.has_annotations)
+        nodes2[0].annotations.add_new("new", 1)
+        nodes2[0].label = "changed"
+        self.assertEqual(len(nodes2[0].annotations), len(nodes1[0].annotations) + 1)
+        self.assertFalse(nodes1[0].annotations.find(name="new"))
+        bound = nodes2[0].annotations.find(name="label")
+        self.assertEqual(bound.value, "changed")
+        self.assertFalse(hasattr(nodes2[1], "_annotations"))
+        tree3 = copy.deepcopy(tree2)
+        self.assertEqual(len(list(tree3)[1].annotations), len(nodes1[1].annotations))
+
+    def test_clone_structure_copy_on_write_after_source_changes(self):
+        tree1, anodes1, lnodes1, inodes1 = self.get_tree(suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        self.add_annotations(tree1)
+        nodes1 = [nd for nd in tree1]
+        expected = [[(a.name, a.value) for a in nd.annotations] for nd in nodes1]
+        tree2 = tree1.clone_structure(copy_annotations=True, copy_on_write=True)
+        tree1.annotations.add_new("new", 1)
+        for nd in nodes1:
+            nd.annotations.add_new("new", 1)
+            for a in nd.annotations:
+                if not a.is_attribute:
+                    a.value = "changed"
+        nodes2 = [nd for nd in tree2]
+        self.assertFalse(tree2.annotations.find(name="new"))
+        for nd2, expected_annotations in zip(nodes2, expected):
+            self.assertEqual([(a.name, a.value) for a in nd2.annotations], expected_annotations)
+
+    def test_clone_structure_copy_on_write_shares_until_accessed(self):
+        tree1, anodes1, lnodes1, inodes1 = self.get_tree(suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        self.add_annotations(tree1)
+        nodes1 = [nd for nd in tree1]
+        originals = [list(nd.annotations) for nd in nodes1]
+        tree2 = tree1.clone_structure(copy_annotations=True, copy_on_write=True)
+        tree3 = tree2.clone_structure(copy_annotations=True, copy_on_write=True)
+        nodes2 = [nd for nd in tree2]
+        nodes3 = [nd for nd in tree3]
+        for nd1, nd2, nd3, annotations in zip(nodes1, nodes2, nodes3, originals):
+            # nothing is copied until accessed
+            self.assertEqual(list(nd2._deferred_annotations[0]), annotations)
+            self.assertIs(nd3._deferred_annotations, nd2._deferred_annotations)
+            # the source copies for the clones on write ...
+            for a in nd1.annotations:
+                if not a.is_attribute:
+                    a.value = "changed"
+            self.assertEqual(list(nd1.annotations), annotations)
+            for nd in (nd2, nd3):
+                self.assertEqual(len(nd.annotations), len(annotations))
+                for a1, a2 in zip(annotations, nd.annotations):
+                    self.assertIsNot(a1, a2)
+                    self.assertEqual(a2.name, a1.name)
+                    if a1.is_attribute:
+                        self.assertIs(a2._value[0], nd)
+                    else:
+                        self.assertNotEqual(a2.value, "changed")
+            # ... and each clone for itself
+            nodes3[0].annotations.add_new("new", 1)
+            self.assertFalse(nodes2[0].annotations.find(name="new"))
+
     def test_deepcopy_excluding_namespace(self):
         tree1, anodes1, lnodes1, inodes1 = self.get_tree(suppress_internal_node_taxa=False,
                 suppress_leaf_node_taxa=False)
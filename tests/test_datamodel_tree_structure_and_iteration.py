@@ -22,6 +22,8 @@ Tests basic Tree structure and iteration.
 """
 
 import unittest
+import gc
+import weakref
 import dendropy
 import os
 import sys
@@ -551,6 +553,268 @@ class TestTreeIterators(curated_test_tree.CuratedTestTree, unittest.TestCase):
             ancestors = [ch.label for ch in nd.ancestor_iter(inclusive=True, filter_fn=filter_fn)]
             self.assertEqual(ancestors, expected_ancestors)
 
+class TestTreeTraversalCaching(curated_test_tree.CuratedTestTree, unittest.TestCase):
+
+    def test_repeated_traversals(self):
+        tree, anodes, lnodes, inodes = self.get_tree()
+        for i in range(3):
+            self.assertSequenceEqual(
+                    [nd.label for nd in tree.preorder_node_iter()],
+                    self.preorder_sequence)
+            self.assertSequenceEqual(
+                    [nd.label for nd in tree.postorder_node_iter()],
+                    self.postorder_sequence)
+            self.assertSequenceEqual(
+                    [nd.label for nd in tree.leaf_node_iter()],
+                    self.leaf_sequence)
+        f = lambda x: x.edge.length > 13
+        nodes = [nd for nd in tree.postorder_node_iter(filter_fn=f)]
+        exp_labels = [x for x in self.postorder_sequence if self.node_edge_lengths[x] > 13]
+        self.assertEqual([nd.label for nd in nodes], exp_labels)
+
+    def test_incomplete_traversal_not_recorded(self):
+        tree, anodes, lnodes, inodes = self.get_tree()
+        for nd in tree.preorder_node_iter():
+            break
+        self.assertSequenceEqual(
+                [nd.label for nd in tree.preorder_node_iter()],
+                self.preorder_sequence)
+
+    def test_invalidated_by_structural_change(self):
+        tree, anodes, lnodes, inodes = self.get_tree()
+        for order in ("preorder", "postorder", "leaf"):
+            leaf = tree.find_node_with_label("j")
+            self.assertIn(leaf, list(tree.leaf_node_iter()))
+            parent = leaf.parent_node
+            parent.remove_child(leaf)
+            nodes = [nd for nd in getattr(tree, order + "_node_iter")()]
+            self.assertNotIn(leaf, nodes)
+            parent.add_child(leaf)
+            nodes = [nd for nd in getattr(tree, order + "_node_iter")()]
+            self.assertIn(leaf, nodes)
+
+    def test_invalidated_by_new_seed_node(self):
+        tree, anodes, lnodes, inodes = self.get_tree()
+        self.assertEqual(len(list(tree.postorder_node_iter())), len(anodes))
+        subtree_root = tree.find_node_with_label("g")
+        tree.reroot_at_node(subtree_root, suppress_unifurcations=False)
+        self.assertEqual(list(tree.preorder_node_iter())[0], subtree_root)
+        self.assertEqual(list(tree.postorder_node_iter())[-1], subtree_root)
+
+    def test_not_invalidated_by_changes_to_other_trees(self):
+        tree1, anodes, lnodes, inodes = self.get_tree()
+        tree2, anodes2, lnodes2, inodes2 = self.get_tree()
+        nodes = list(tree1.preorder_node_iter())
+        lca_index = tree1.lca_index()
+        cached_nodes = tree1._traversal_cache["preorder"]
+        leaf = tree2.find_node_with_label("j")
+        leaf.parent_node.remove_child(leaf)
+        self.assertIs(tree1._traversal_cache["preorder"], cached_nodes)
+        self.assertTrue(lca_index.is_current())
+        self.assertIs(tree1.lca_index(), lca_index)
+        self.assertEqual(list(tree1.preorder_node_iter()), nodes)
+        leaf = tree1.find_node_with_label("j")
+        leaf.parent_node.remove_child(leaf)
+        self.assertFalse(lca_index.is_current())
+        self.assertNotIn(leaf, list(tree1.preorder_node_iter()))
+
+    def test_iteration_over_snapshot(self):
+        # the same nodes are visited whether or not the traversal is cached
+        # when nodes are removed during the iteration
+        for is_cached in (False, True):
+            tree, anodes, lnodes, inodes = self.get_tree()
+            if is_cached:
+                list(tree.postorder_node_iter())
+            else:
+                tree.clear_traversal_cache()
+            visited = []
+            for nd in tree.postorder_node_iter():
+                visited.append(nd.label)
+                if nd.label == "g":
+                    nd.parent_node.remove_child(nd)
+            self.assertEqual(visited, list(self.postorder_sequence))
+            self.assertNotIn("g", [nd.label for nd in tree.postorder_node_iter()])
+
+    def test_removed_nodes_not_kept_alive(self):
+        tree, anodes, lnodes, inodes = self.get_tree()
+        del anodes, lnodes, inodes
+        for order in ("preorder", "postorder", "leaf"):
+            list(getattr(tree, order + "_node_iter")())
+        tree.lca_index()
+        leaf = tree.find_node_with_label("j")
+        leaf.parent_node.remove_child(leaf)
+        self.assertEqual(tree._traversal_cache, {})
+        leaf_ref = weakref.ref(leaf)
+        del leaf
+        gc.collect()
+        self.assertIsNone(leaf_ref())
+
+    def test_not_shared_with_copies(self):
+        tree, anodes, lnodes, inodes = self.get_tree()
+        nodes = list(tree.preorder_node_iter())
+        tree2 = tree.clone(depth=2)
+        nodes2 = list(tree2.preorder_node_iter())
+        self.assertEqual(len(nodes), len(nodes2))
+        for nd1, nd2 in zip(nodes, nodes2):
+            self.assertIsNot(nd1, nd2)
+            self.assertEqual(nd1.label, nd2.label)
+
+class TestTreeNodeIndexes(curated_test_tree.CuratedTestTree, unittest.TestCase):
+
+    def test_lookups(self):
+        tree, anodes, lnodes, inodes = self.get_tree(
+                suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        tree.build_node_indexes()
+        for nd in anodes:
+            self.assertIs(tree.find_node_with_label(nd.label), nd)
+            self.assertIs(tree.find_node_for_taxon(nd.taxon), nd)
+            self.assertIs(tree.find_node_with_taxon_label(nd.taxon.label), nd)
+        self.assertIs(tree.find_node_with_label("zzz"), None)
+        self.assertIs(tree.find_node_with_taxon_label("zzz"), None)
+        self.assertIs(tree.find_node_for_taxon(dendropy.Taxon("zzz")), None)
+
+    def test_relabeled_nodes(self):
+        tree, anodes, lnodes, inodes = self.get_tree(
+                suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        node = tree.find_node_with_label("j")
+        node.label = "zzz"
+        self.assertIs(tree.find_node_with_label("j"), None)
+        self.assertIs(tree.find_node_with_label("zzz"), node)
+        taxon = node.taxon
+        other_node = tree.find_node_with_label("k")
+        node.taxon = other_node.taxon
+        other_node.taxon = taxon
+        self.assertIs(tree.find_node_for_taxon(taxon), other_node)
+        self.assertIs(tree.find_node_with_taxon_label(taxon.label), other_node)
+
+    def test_missing_keys_do_not_rebuild(self):
+        tree, anodes, lnodes, inodes = self.get_tree(
+                suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        build_node_indexes = tree.build_node_indexes
+        builds = []
+        def counted_build_node_indexes():
+            builds.append(1)
+            return build_node_indexes()
+        tree.build_node_indexes = counted_build_node_indexes
+        for i in range(3):
+            self.assertIs(tree.find_node_with_label("zzz"), None)
+            self.assertIs(tree.find_node_with_taxon_label("zzz"), None)
+            self.assertIs(tree.find_node_for_taxon(dendropy.Taxon("zzz")), None)
+        self.assertEqual(len(builds), 1)
+        node = tree.find_node_with_label("j")
+        node.label = "zzz"
+        self.assertIs(tree.find_node_with_label("zzz"), node)
+        self.assertIs(tree.find_node_with_label("j"), None)
+        self.assertEqual(len(builds), 1)
+
+    def test_relabeling_in_lookup_loop_does_not_rebuild(self):
+        tree, anodes, lnodes, inodes = self.get_tree(
+                suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        tree.find_node_with_label("a")
+        preorder_nodes = tree._get_traversal_cache()["preorder"]
+        lca_index = tree.lca_index()
+        build_node_indexes = tree.build_node_indexes
+        builds = []
+        def counted_build_node_indexes():
+            builds.append(1)
+            return build_node_indexes()
+        tree.build_node_indexes = counted_build_node_indexes
+        taxon_namespace = dendropy.TaxonNamespace()
+        leaf_labels = sorted(nd.label for nd in lnodes)
+        for label in leaf_labels:
+            node = tree.find_node_with_label(label)
+            self.assertIs(tree.find_node_with_taxon_label(label), node)
+            node.label = label.upper()
+            node.taxon = taxon_namespace.require_taxon(label.upper())
+            node.annotations.add_new("relabeled", True)
+        self.assertEqual(len(builds), 0)
+        self.assertIs(tree._get_traversal_cache()["preorder"], preorder_nodes)
+        self.assertIs(tree.lca_index(), lca_index)
+        for label in leaf_labels:
+            node = tree.find_node_with_label(label.upper())
+            self.assertEqual(node.label, label.upper())
+            self.assertIs(tree.find_node_with_label(label), None)
+            self.assertIs(tree.find_node_for_taxon(node.taxon), node)
+        self.assertEqual(len(builds), 0)
+
+    def test_relabeled_nodes_with_shared_keys(self):
+        tree, anodes, lnodes, inodes = self.get_tree(
+                suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        nodes = list(tree.preorder_node_iter())
+        tree.find_node_with_label("a")
+        # the first node in preorder with a label is found
+        nodes[2].label = "dup"
+        nodes[1].label = "dup"
+        self.assertIs(tree.find_node_with_label("dup"), nodes[1])
+        nodes[1].label = None
+        self.assertIs(tree.find_node_with_label("dup"), nodes[2])
+        nodes[2].label = "other"
+        self.assertIs(tree.find_node_with_label("dup"), None)
+        # the first node in postorder with a taxon is found
+        taxon = nodes[1].taxon
+        nodes[2].taxon = taxon
+        self.assertIs(tree.find_node_for_taxon(taxon), nodes[2])
+        self.assertIs(tree.find_node_with_taxon_label(taxon.label), nodes[1])
+        nodes[2].taxon = None
+        self.assertIs(tree.find_node_for_taxon(taxon), nodes[1])
+        self.assertIs(tree.find_node_with_taxon_label(taxon.label), nodes[1])
+
+    def test_reassigned_taxa_in_lca_index(self):
+        tree, anodes, lnodes, inodes = self.get_tree(
+                suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        lca_index = tree.lca_index()
+        node1 = tree.find_node_with_label("i")
+        node2 = tree.find_node_with_label("j")
+        taxon1 = node1.taxon
+        taxon2 = node2.taxon
+        self.assertIs(lca_index.mrca(taxon1, taxon2), node1.parent_node)
+        node1.taxon, node2.taxon = taxon2, taxon1
+        self.assertIs(tree.lca_index(), lca_index)
+        self.assertIs(lca_index.mrca(taxon1, taxon1), node2)
+        self.assertIs(lca_index.mrca(taxon2, taxon2), node1)
+        node2.taxon = None
+        with self.assertRaises(KeyError):
+            lca_index.mrca(taxon1, taxon2)
+
+    def test_relabeled_taxa(self):
+        tree, anodes, lnodes, inodes = self.get_tree(
+                suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        node = tree.find_node_with_taxon_label("j")
+        node.taxon.label = "zzz"
+        self.assertIs(tree.find_node_with_taxon_label("j"), None)
+        self.assertIs(tree.find_node_with_taxon_label("zzz"), node)
+
+    def test_invalidated_by_structural_change(self):
+        tree, anodes, lnodes, inodes = self.get_tree(
+                suppress_internal_node_taxa=False,
+                suppress_leaf_node_taxa=False)
+        leaf = tree.find_node_with_label("j")
+        leaf.parent_node.remove_child(leaf)
+        self.assertIs(tree.find_node_with_label("j"), None)
+        self.assertIs(tree.find_node_for_taxon(leaf.taxon), None)
+
+    def test_mrca_with_taxon_labels(self):
+        tree, anodes, lnodes, inodes = self.get_tree(
+                suppress_internal_node_taxa=True,
+                suppress_leaf_node_taxa=False)
+        tree.is_rooted = True
+        tree.encode_bipartitions()
+        for labels, mrca_label in (
+                (["i", "j"], "b"),
+                (["j", "k"], "e"),
+                (["l", "p"], "c"),
+                ):
+            self.assertEqual(tree.mrca(taxon_labels=labels).label, mrca_label)
+        with self.assertRaises(KeyError):
+            tree.mrca(taxon_labels=["i", "zzz"])
+
 class TreeRootingState(dendropytest.ExtendedTestCase):
 
     def test_is_rooted(self):
@@ -597,5 +861,23 @@ class TestTreeApply(curated_test_tree.CuratedTestTree, unittest.TestCase):
                 ]
         self.assertEqual(observed, expected)
 
+class TestDeepTree(unittest.TestCase):
+
+    def test_newick_string(self):
+        # deeper than the interpreter recursion limit
+        num_levels = sys.getrecursionlimit() + 100
+        tree = dendropy.Tree()
+        nd = tree.seed_node
+        for i in range(num_levels):
+            nd.new_child(label="T{}".format(i), edge_length=1)
+            nd = nd.new_child(edge_length=2)
+        nd.label = "T{}".format(num_levels)
+        s = tree._as_newick_string()
+        self.assertTrue(s.startswith("(T0:1.0,(T1:1.0,(T2:1.0,"))
+        self.assertIn("(T{}:1.0,T{}:2.0):2.0):2.0".format(num_levels-1, num_levels), s)
+        self.assertTrue(s.endswith("):2.0)"))
+        self.assertEqual(s.count("("), num_levels)
+        self.assertEqual(s.count(")"), num_levels)
+
 if __name__ == "__main__":
     unittest.main()
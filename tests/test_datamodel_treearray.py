@@ -22,6 +22,7 @@ import os
 import sys
 sys.path.insert(0, os.path.dirname(__file__))
 from support import pathmap
+from dendropy.utility.textprocessing import StringIO
 import dendropy
 
 class TreeArrayBasicTreeAccession(unittest.TestCase):
@@ -58,6 +59,101 @@ class TreeArrayBasicTreeAccession(unittest.TestCase):
             tree_array.add_tree(tree)
         self.verify_tree_array(tree_array, trees)
 
+    def test_read_from_files(self):
+        trees = self.get_trees()
+        tree_array = dendropy.TreeArray(taxon_namespace=trees.taxon_namespace)
+        tree_array.read_from_files(
+                [pathmap.tree_source_path("pythonidae.reference-trees.nexus")],
+                "nexus")
+        self.verify_tree_array(tree_array, trees)
+
+class TreeArraySplitsOnlyAccession(unittest.TestCase):
+
+    def check_splits_only(self, data, schema, **kwargs):
+        expected_tree_array = dendropy.TreeArray(use_tree_weights=True)
+        for tree in dendropy.Tree.yield_from_files(
+                [StringIO(data)],
+                schema=schema,
+                taxon_namespace=expected_tree_array.taxon_namespace,
+                **kwargs):
+            expected_tree_array.add_tree(tree)
+        tree_array = dendropy.TreeArray(use_tree_weights=True)
+        tree_array.read_from_files([StringIO(data)], schema=schema, **kwargs)
+        self.assertEqual(
+                [t.label for t in tree_array.taxon_namespace],
+                [t.label for t in expected_tree_array.taxon_namespace])
+        self.assertEqual(len(tree_array), len(expected_tree_array))
+        for idx in range(len(tree_array)):
+            self.assertEqual(
+                    tree_array.get_split_bitmask_and_edge_tuple(idx),
+                    expected_tree_array.get_split_bitmask_and_edge_tuple(idx))
+        self.assertEqual(tree_array._tree_leafset_bitmasks, expected_tree_array._tree_leafset_bitmasks)
+        self.assertEqual(tree_array._tree_weights, expected_tree_array._tree_weights)
+        self.assertEqual(tree_array.is_rooted_trees, expected_tree_array.is_rooted_trees)
+        split_distribution = tree_array.split_distribution
+        expected_split_distribution = expected_tree_array.split_distribution
+        self.assertEqual(split_distribution.split_counts, expected_split_distribution.split_counts)
+        self.assertEqual(split_distribution.split_edge_lengths, expected_split_distribution.split_edge_lengths)
+        self.assertEqual(split_distribution.sum_of_tree_weights, expected_split_distribution.sum_of_tree_weights)
+
+    def test_tree_structures(self):
+        # unifurcations (including at the seed node), basal bifurcations,
+        # blank nodes and missing edge lengths
+        trees = [
+            "((a:1,b:2):3,((c:4,d:5):6):1.5):7;",
+            "(((a:1,b:2):3):4,(c,d));",
+            "[&W 3/4]((a:1)x:2,(b,c)y:3);",
+            "[&W 0.5]((((a:1):2):3,b:1):1,(c:1,d:1):1);",
+            "(,a,,b,(c,),());",
+            "((a,b)e,(c,d)f)g;",
+            "((a,b),(c,d):2,e);",
+            "((a,b):1,((c:2,d):3):4);",
+            "((a,b)):2;",
+            "a:3;",
+            ]
+        data = "\n".join(trees)
+        for rooting in ("default-unrooted", "force-rooted"):
+            self.check_splits_only(data, "newick", rooting=rooting, store_tree_weights=True)
+            self.check_splits_only(data, "newick", rooting=rooting, suppress_edge_lengths=True)
+            self.check_splits_only(
+                    "#NEXUS\nbegin trees;\n" + "".join("tree t{} = {}\n".format(i, t) for i, t in enumerate(trees)) + "end;\n",
+                    "nexus",
+                    rooting=rooting,
+                    store_tree_weights=True)
+
+    def test_tree_files(self):
+        for filename, schema in (
+                ("pythonidae.reference-trees.nexus", "nexus"),
+                ("pythonidae.mb.run1.t", "nexus"),
+                ("dendropy-test-trees-n33-unrooted-annotated-x10a.newick", "newick"),
+                ("dendropy-test-trees-multifurcating-rooted-annotated.nexus", "nexus"),
+                ):
+            with open(pathmap.tree_source_path(filename)) as src:
+                self.check_splits_only(src.read(), schema)
+
+    def test_yield_splits(self):
+        taxon_namespace = dendropy.TaxonNamespace()
+        tree_splits = list(dendropy.Tree.yield_from_files(
+                [StringIO("[&R] ((a:1,b:2):3,c:4); [&U] ((a,b),(c,d));")],
+                schema="newick",
+                taxon_namespace=taxon_namespace,
+                splits_only=True))
+        self.assertEqual([t.label for t in taxon_namespace], ["a", "b", "c", "d"])
+        self.assertEqual(tree_splits[0].split_bitmasks, [1, 2, 3, 4, 7])
+        self.assertEqual(tree_splits[0].edge_lengths, [1.0, 2.0, 3.0, 4.0, None])
+        self.assertEqual(tree_splits[0].is_rooted, True)
+        self.assertEqual(tree_splits[0].leafset_bitmask, 7)
+        self.assertEqual(tree_splits[1].split_bitmasks, [14, 2, 12, 4, 8, 0])
+        self.assertEqual(tree_splits[1].is_rooted, False)
+        split_distribution = dendropy.SplitDistribution(taxon_namespace=taxon_namespace)
+        with self.assertRaises(ValueError):
+            dendropy.SplitDistribution(
+                    taxon_namespace=taxon_namespace,
+                    ignore_node_ages=False).count_tree_splits(tree_splits[0])
+        split_distribution.count_tree_splits(tree_splits[0], default_edge_length_value=0.0)
+        self.assertEqual(split_distribution.split_counts[3], 1)
+        self.assertEqual(split_distribution.split_edge_lengths[7], [0.0])
+
 
 if __name__ == "__main__":
     unittest.main()
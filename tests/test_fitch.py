@@ -31,6 +31,7 @@ if not (sys.version_info.major >= 3 and sys.version_info.minor >= 4):
     from dendropy.utility.filesys import pre_py34_open as open
 import dendropy
 from dendropy.calculate.treescore import fitch_down_pass
+from dendropy.model import parsimony
 sys.path.insert(0, os.path.dirname(__file__))
 from support import pathmap
 
@@ -78,6 +79,14 @@ class FitchTest(unittest.TestCase):
         # for x in sa:
         #     print("{}\t{}\t{}\t\t\t\t{}".format(x, x._index, x.fundamental_indexes, x.fundamental_indexes_with_gaps_as_missing))
         taxon_state_sets_map = char_mat.taxon_state_sets_map(gaps_as_missing=gaps_as_missing)
+        site_patterns = char_mat.compress_site_patterns()
+        pattern_state_sets_map = char_mat.taxon_state_sets_map(
+                gaps_as_missing=gaps_as_missing,
+                site_patterns=site_patterns)
+        bit_packed_fitch = parsimony.BitPackedFitch(taxon_state_sets_map)
+        bit_packed_pattern_fitch = parsimony.BitPackedFitch(
+                pattern_state_sets_map,
+                weights=site_patterns.weights)
         tree_list = dataset.tree_lists[0]
         self.assertEqual(len(expected_scores), len(tree_list))
         for n, tree in enumerate(tree_list):
@@ -85,6 +94,91 @@ class FitchTest(unittest.TestCase):
             pscore = fitch_down_pass(node_list, taxon_state_sets_map=taxon_state_sets_map)
             # print("{} vs. {}".format(expected_scores[n], pscore))
             self.assertEqual(expected_scores[n], pscore)
+            pscore = fitch_down_pass(
+                    tree.postorder_node_iter(),
+                    state_sets_attr_name=None,
+                    taxon_state_sets_map=pattern_state_sets_map,
+                    weights=site_patterns.weights)
+            self.assertEqual(expected_scores[n], pscore)
+            pscore = bit_packed_fitch.fitch_down_pass(tree.postorder_node_iter())
+            self.assertEqual(expected_scores[n], pscore)
+            pscore = bit_packed_pattern_fitch.fitch_down_pass(
+                    tree.postorder_node_iter(),
+                    state_sets_attr_name=None)
+            self.assertEqual(expected_scores[n], pscore)
+
+class BitPackedFitchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.taxon_namespace = dendropy.TaxonNamespace(["A", "B", "C", "D", "E"])
+        t1, t2, t3, t4, t5 = self.taxon_namespace
+        self.taxon_state_sets_map = {
+            t1: [ set([0,1]),  set([0,1]),  set([0]),     set([0]) ],
+            t2: [ set([1]),    set([1]),    set([1]),     set([0]) ],
+            t3: [ set([0]),    set([1]),    set([1]),     set([0]) ],
+            t4: [ set([0]),    set([1]),    set([0,1]),   set([1]) ],
+            t5: [ set([1]),    set([0]),    set([2]),     set([1]) ],
+        }
+
+    def test_pack_and_unpack(self):
+        fitch = parsimony.BitPackedFitch(self.taxon_state_sets_map)
+        self.assertEqual(fitch.num_characters, 4)
+        self.assertEqual(fitch.states, [0, 1, 2])
+        packed = fitch.taxon_packed_state_sets_map[self.taxon_namespace[0]]
+        self.assertEqual(packed, (0b1111, 0b0011, 0b0000))
+        for taxon, state_sets in self.taxon_state_sets_map.items():
+            self.assertEqual(fitch.unpack(fitch.taxon_packed_state_sets_map[taxon]), state_sets)
+        with self.assertRaises(ValueError):
+            fitch.pack([set([0])])
+        with self.assertRaises(ValueError):
+            parsimony.BitPackedFitch(self.taxon_state_sets_map, weights=[1, 2])
+
+    def test_matches_set_based_passes(self):
+        weights = [1, 2.5, 0, 3]
+        for tree_str in ("(A,(B,(C,(D,E))));", "((A,B),(C,(D,E)));", "(A,B,(C,D,E));"):
+            tree = dendropy.Tree.get(data=tree_str, schema="newick", taxon_namespace=self.taxon_namespace)
+            for w in (None, weights):
+                score_by_character_list = []
+                expected = fitch_down_pass(tree.postorder_node_iter(),
+                        taxon_state_sets_map=self.taxon_state_sets_map,
+                        weights=w,
+                        score_by_character_list=score_by_character_list)
+                fitch = parsimony.BitPackedFitch(self.taxon_state_sets_map, weights=w)
+                packed_score_by_character_list = []
+                self.assertEqual(fitch.fitch_down_pass(tree.postorder_node_iter(),
+                        state_sets_attr_name="packed_state_sets",
+                        score_by_character_list=packed_score_by_character_list), expected)
+                self.assertEqual(packed_score_by_character_list, score_by_character_list)
+                for nd in tree:
+                    self.assertEqual(fitch.unpack(nd.packed_state_sets), nd.state_sets)
+                if len(tree.seed_node.child_nodes()) == 2:
+                    parsimony.fitch_up_pass(tree.preorder_node_iter(),
+                            taxon_state_sets_map=self.taxon_state_sets_map)
+                    fitch.fitch_up_pass(tree.preorder_node_iter(),
+                            state_sets_attr_name="packed_state_sets")
+                    for nd in tree:
+                        self.assertEqual(fitch.unpack(nd.packed_state_sets), nd.state_sets)
+                for nd in tree:
+                    del nd.state_sets
+
+    def test_up_pass_with_data(self):
+        dataset = dendropy.DataSet.get_from_path(
+                pathmap.char_source_path("apternodus.chars.nexus"),
+                "nexus")
+        dataset.read_from_path(
+                pathmap.tree_source_path("apternodus.tre"),
+                schema='NEXUS',
+                taxon_namespace=dataset.taxon_namespaces[0])
+        taxon_state_sets_map = dataset.char_matrices[0].taxon_state_sets_map(gaps_as_missing=False)
+        fitch = parsimony.BitPackedFitch(taxon_state_sets_map)
+        for tree in dataset.tree_lists[0][:4]:
+            tree.resolve_polytomies()
+            fitch_down_pass(tree.postorder_node_iter(), taxon_state_sets_map=taxon_state_sets_map)
+            parsimony.fitch_up_pass(tree.preorder_node_iter(), taxon_state_sets_map=taxon_state_sets_map)
+            fitch.fitch_down_pass(tree.postorder_node_iter(), state_sets_attr_name="packed_state_sets")
+            fitch.fitch_up_pass(tree.preorder_node_iter(), state_sets_attr_name="packed_state_sets")
+            for nd in tree.postorder_internal_node_iter():
+                self.assertEqual(fitch.unpack(nd.packed_state_sets), nd.state_sets)
 
 if __name__ == "__main__":
     unittest.main()
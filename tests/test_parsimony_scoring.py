@@ -492,6 +492,124 @@ class ParsimonyScoringTest(unittest.TestCase):
                     gaps_as_missing=gaps_as_missing)
             self.assertEqual(pscore, expected_scores[tree_idx])
 
+            score_by_character_list = []
+            pscore = treescore.parsimony_score(
+                    tree,
+                    chars,
+                    gaps_as_missing=gaps_as_missing,
+                    score_by_character_list=score_by_character_list,
+                    compress_site_patterns=True)
+            self.assertEqual(pscore, expected_scores[tree_idx])
+            self.assertEqual(score_by_character_list, expected_per_site_scores[tree_idx])
+
+            for compress_site_patterns in (False, True):
+                score_by_character_list = []
+                pscore = treescore.parsimony_score(
+                        tree,
+                        chars,
+                        gaps_as_missing=gaps_as_missing,
+                        score_by_character_list=score_by_character_list,
+                        compress_site_patterns=compress_site_patterns,
+                        bit_packed=True)
+                self.assertEqual(pscore, expected_scores[tree_idx])
+                self.assertEqual(score_by_character_list, expected_per_site_scores[tree_idx])
+
+            weights = [(idx % 3) + 1 for idx in range(len(score_by_character_list))]
+            pscore = treescore.parsimony_score(
+                    tree,
+                    chars,
+                    gaps_as_missing=gaps_as_missing,
+                    weights=weights,
+                    compress_site_patterns=True)
+            self.assertEqual(pscore, sum(s * w for s, w in zip(expected_per_site_scores[tree_idx], weights)))
+            self.assertEqual(pscore, treescore.parsimony_score(
+                    tree,
+                    chars,
+                    gaps_as_missing=gaps_as_missing,
+                    weights=weights))
+            self.assertEqual(pscore, treescore.parsimony_score(
+                    tree,
+                    chars,
+                    gaps_as_missing=gaps_as_missing,
+                    weights=weights,
+                    bit_packed=True))
+
+        self.assertEqual(treescore.parsimony_scores(
+                trees,
+                chars,
+                gaps_as_missing=gaps_as_missing), expected_scores)
+        score_by_character_lists = []
+        pscores = treescore.parsimony_scores(
+                trees,
+                chars,
+                gaps_as_missing=gaps_as_missing,
+                score_by_character_lists=score_by_character_lists)
+        self.assertEqual(pscores, expected_scores)
+        self.assertEqual(score_by_character_lists, expected_per_site_scores)
+        weights = [(idx % 3) + 1 for idx in range(len(expected_per_site_scores[0]))]
+        self.assertEqual(
+                treescore.parsimony_scores(
+                    trees,
+                    chars,
+                    gaps_as_missing=gaps_as_missing,
+                    weights=weights),
+                [sum(s * w for s, w in zip(site_scores, weights)) for site_scores in expected_per_site_scores])
+
+    def test_pscores_of_tree_array(self):
+        taxon_namespace = dendropy.TaxonNamespace()
+        chars = dendropy.DnaCharacterMatrix.get(
+                path=pathmap.char_source_path("pythonidae.chars.nexus"),
+                schema="nexus",
+                taxon_namespace=taxon_namespace)
+        trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.random.bd0301.tre"),
+                schema="nexus",
+                taxon_namespace=taxon_namespace)
+        tree_array = dendropy.TreeArray.from_tree_list(trees)
+        expected_scores = treescore.parsimony_scores(trees, chars)
+        self.assertEqual(len(expected_scores), len(trees))
+        for tree_idx in range(0, len(trees), 25):
+            self.assertEqual(expected_scores[tree_idx], treescore.parsimony_score(trees[tree_idx], chars))
+        self.assertEqual(treescore.parsimony_scores(tree_array, chars), expected_scores)
+
+    def test_pscores_in_processes(self):
+        taxon_namespace = dendropy.TaxonNamespace()
+        chars = dendropy.StandardCharacterMatrix.get(
+                path=pathmap.char_source_path("apternodus.chars.nexus"),
+                schema="nexus",
+                taxon_namespace=taxon_namespace)
+        trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("apternodus.tre"),
+                schema="nexus",
+                taxon_namespace=taxon_namespace)
+        score_by_character_lists = []
+        expected_scores = treescore.parsimony_scores(
+                trees,
+                chars,
+                score_by_character_lists=score_by_character_lists)
+        for num_processes in (1, 2):
+            self.assertEqual(treescore.parsimony_scores(
+                    trees,
+                    chars,
+                    num_processes=num_processes), expected_scores)
+        pscore_by_character_lists = []
+        self.assertEqual(treescore.parsimony_scores(
+                trees,
+                chars,
+                score_by_character_lists=pscore_by_character_lists,
+                num_processes=2), expected_scores)
+        self.assertEqual(pscore_by_character_lists, score_by_character_lists)
+
+    def test_pscores_with_different_taxon_namespace(self):
+        chars = dendropy.DnaCharacterMatrix.get(
+                path=pathmap.char_source_path("pythonidae.chars.nexus"),
+                schema="nexus")
+        trees = dendropy.TreeList.get(
+                path=pathmap.tree_source_path("pythonidae.mle.nex"),
+                schema="nexus")
+        with self.assertRaises(dendropy.utility.error.TaxonNamespaceIdentityError):
+            treescore.parsimony_scores(trees, chars)
+
 if __name__ == "__main__":
     unittest.main()
 
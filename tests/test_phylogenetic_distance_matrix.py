@@ -857,6 +857,60 @@ class NodeToNodeDistancesTest(unittest.TestCase):
                     #     obs_mrca.edge.bipartition.leafset_bitmask))
                     self.assertIs(exp_mrca, obs_mrca)
 
+class LCAIndexTest(unittest.TestCase):
+
+    def test_node_distances(self):
+        for tree_filename in ("hiv1.newick", "pythonidae.mle.numbered-nodes.newick"):
+            tree = dendropy.Tree.get_from_path(
+                    src=pathmap.tree_source_path(tree_filename),
+                    schema='newick',
+                    suppress_leaf_node_taxa=True)
+            ndm = tree.node_distance_matrix()
+            lca_index = tree.lca_index()
+            self.assertEqual(len(lca_index), len(tree.nodes()))
+            for nd1 in tree.postorder_node_iter():
+                self.assertEqual(lca_index.depth(nd1), nd1.level())
+                self.assertAlmostEqual(lca_index.root_distance(nd1), nd1.distance_from_root())
+                for nd2 in tree.postorder_node_iter():
+                    self.assertIs(lca_index.mrca(nd1, nd2), ndm.mrca(nd1, nd2))
+                    self.assertAlmostEqual(lca_index.patristic_distance(nd1, nd2),
+                            ndm.patristic_distance(nd1, nd2))
+                    self.assertEqual(lca_index.path_edge_count(nd1, nd2),
+                            ndm.path_edge_count(nd1, nd2))
+
+    def test_taxon_mrca(self):
+        tree = dendropy.Tree.get_from_path(
+                src=pathmap.tree_source_path("pythonidae.mle.nex"),
+                schema='nexus')
+        tree.encode_bipartitions()
+        lca_index = tree.lca_index()
+        pdm = tree.phylogenetic_distance_matrix()
+        taxa = list(tree.taxon_namespace)
+        for t1 in taxa:
+            for t2 in taxa:
+                self.assertIs(lca_index.mrca(t1, t2), pdm.mrca(t1, t2))
+                self.assertAlmostEqual(lca_index.patristic_distance(t1, t2),
+                        pdm.patristic_distance(t1, t2))
+        for i in range(1, len(taxa)):
+            subset = taxa[:i+1:2]
+            self.assertIs(lca_index.mrca(*subset), tree.mrca(taxa=subset))
+        self.assertRaises(KeyError, lca_index.mrca, dendropy.Taxon("x"))
+
+    def test_rebuilt_on_structural_change(self):
+        tree = dendropy.Tree.get_from_string("(((a:1, b:1):1, c:2):1, (d:2, (e:1,f:1):1):1):0;", schema="newick")
+        lca_index = tree.lca_index()
+        self.assertIs(tree.lca_index(), lca_index)
+        a = tree.find_node_with_taxon_label("a")
+        d = tree.find_node_with_taxon_label("d")
+        self.assertIs(lca_index.mrca(a, d), tree.seed_node)
+        a.parent_node.remove_child(a)
+        d.add_child(a)
+        self.assertFalse(lca_index.is_current())
+        lca_index2 = tree.lca_index()
+        self.assertIsNot(lca_index2, lca_index)
+        self.assertIs(lca_index2.mrca(a, d), d)
+        self.assertEqual(lca_index2.patristic_distance(a, d), 1.0)
+
 class PhylogeneticPathTest(unittest.TestCase):
 
     def test1(self):
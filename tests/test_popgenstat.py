@@ -107,6 +107,25 @@ class SinglePopTest(dendropytest.ExtendedTestCase):
     def test_wattersons_theta(self):
         self.assertAlmostEqual(popgenstat.wattersons_theta(self.data, ignore_uncertain=True), 49.00528, 4)
 
+    def test_site_pattern_weights(self):
+        sequences = self.data.sequences()
+        state_alphabet = self.data.default_state_alphabet
+        site_patterns = self.data.compress_site_patterns()
+        self.assertLess(len(site_patterns), len(sequences[0]))
+        for ignore_uncertain in (True, False):
+            self.assertEqual(
+                    popgenstat._count_differences(site_patterns.sequences(), state_alphabet, ignore_uncertain, weights=site_patterns.weights),
+                    popgenstat._count_differences(sequences, state_alphabet, ignore_uncertain))
+            self.assertEqual(
+                    popgenstat._num_segregating_sites(site_patterns.sequences(), state_alphabet, ignore_uncertain, weights=site_patterns.weights),
+                    popgenstat._num_segregating_sites(sequences, state_alphabet, ignore_uncertain))
+
+    def test_byte_coded(self):
+        data = dendropy.DnaCharacterMatrix.get_from_path(pathmap.char_source_path('COII_Apes.nex'), schema="nexus", byte_coded=True)
+        self.assertEqual(popgenstat.num_segregating_sites(data, ignore_uncertain=True), 183)
+        self.assertAlmostEqual(popgenstat.average_number_of_pairwise_differences(data, ignore_uncertain=True),  62.75000, 4)
+        self.assertAlmostEqual(popgenstat.tajimas_d(data, ignore_uncertain=True), 1.12467, 4)
+
 class PopulationPairSummaryStatisticsTests(dendropytest.ExtendedTestCase):
 
     def testPopulationPairSummaryStatistics(self):
@@ -216,6 +216,78 @@ class PruneTest(unittest.TestCase):
     def testRetainTaxaRooted(self):
         self.check("Rooted", "prune_rooted", True)
 
+class BulkPruneTest(ExtendedTestCase):
+
+    tree_str = "[&R] ((a:1,(b:2,(c:3,d:4):5):6):7,((e:8,f:9)g:10,(h:11,i:12):13):14);"
+
+    def get_tree(self):
+        return dendropy.Tree.get(data=self.tree_str, schema="newick", suppress_internal_node_taxa=False)
+
+    def test_retain_merges_edge_lengths(self):
+        tree = self.get_tree()
+        to_retain = [tree.taxon_namespace.get_taxon(label) for label in ("a", "c", "h")]
+        tree.retain_taxa(to_retain)
+        self.assertEqual(tree.as_string(schema="newick").strip(),
+                "[&R] ((a:1.0,c:14.0):7.0,h:38.0);")
+        self.assertEqual(len(tree.nodes()), 5)
+        for nd in tree.postorder_node_iter():
+            for ch in nd.child_node_iter():
+                self.assertIs(ch.parent_node, nd)
+
+    def test_retain_not_in_place(self):
+        tree = self.get_tree()
+        original_str = tree.as_string(schema="newick")
+        to_retain = [tree.taxon_namespace.get_taxon(label) for label in ("a", "c", "h")]
+        tree2 = tree.retain_taxa(to_retain, in_place=False)
+        self.assertEqual(tree.as_string(schema="newick"), original_str)
+        self.assertEqual(tree2.as_string(schema="newick").strip(),
+                "[&R] ((a:1.0,c:14.0):7.0,h:38.0);")
+        self.assertIs(tree2.taxon_namespace, tree.taxon_namespace)
+        original_nodes = set(tree.nodes())
+        for nd in tree2:
+            self.assertNotIn(nd, original_nodes)
+
+    def test_prune_emptied_internal_node_with_taxon(self):
+        tree = self.get_tree()
+        to_prune = [tree.taxon_namespace.get_taxon(label) for label in ("e", "f", "h", "i")]
+        tree2 = tree.prune_taxa(to_prune, in_place=False)
+        self.assertEqual(tree2.as_string(schema="newick").strip(),
+                "[&R] ((a:1.0,(b:2.0,(c:3.0,d:4.0):5.0):6.0):7.0,g:24.0);")
+        to_prune.append(tree.taxon_namespace.get_taxon("g"))
+        tree.prune_taxa(to_prune)
+        self.assertEqual(tree.as_string(schema="newick").strip(),
+                "[&R] (a:1.0,(b:2.0,(c:3.0,d:4.0):5.0):6.0):7.0;")
+
+    def test_prune_internal_node_subtree(self):
+        tree = self.get_tree()
+        to_prune = [tree.taxon_namespace.get_taxon("g")]
+        tree.prune_taxa(to_prune,
+                is_apply_filter_to_leaf_nodes=False,
+                is_apply_filter_to_internal_nodes=True)
+        self.assertEqual(tree.as_string(schema="newick").strip(),
+                "[&R] ((a:1.0,(b:2.0,(c:3.0,d:4.0):5.0):6.0):7.0,(h:11.0,i:12.0):27.0);")
+
+    def test_prune_all_taxa(self):
+        tree = self.get_tree()
+        with self.assertRaises(dendropy.SeedNodeDeletionException):
+            tree.prune_taxa(tree.taxon_namespace)
+
+    def test_matches_extract_tree(self):
+        tree = dendropy.Tree.get(
+                path=pathmap.tree_source_path("pythonidae.mle.nex"),
+                schema="nexus")
+        taxa = list(tree.taxon_namespace)
+        for step in (2, 3, 7):
+            to_retain = set(taxa[::step])
+            expected = tree.extract_tree_with_taxa(to_retain)
+            observed = tree.retain_taxa(to_retain, in_place=False)
+            self.assertEqual(treecompare.symmetric_difference(observed, expected), 0)
+            self.assertAlmostEqual(treecompare.weighted_robinson_foulds_distance(observed, expected), 0.0)
+            observed = tree.prune_taxa(to_retain, in_place=False)
+            expected = tree.extract_tree_without_taxa(to_retain)
+            self.assertEqual(treecompare.symmetric_difference(observed, expected), 0)
+            self.assertAlmostEqual(treecompare.weighted_robinson_foulds_distance(observed, expected), 0.0)
+
 class TruncateTree(unittest.TestCase):
 
     def setUp(self):
@@ -289,6 +361,25 @@ class TreeMidpointRootingTest(ExtendedTestCase):
                         expected_tree.bipartition_edge_map[bipartition].length,
                         3)
 
+    def testMidpointRootingIncrementalBipartitions(self):
+        test_trees = dendropy.TreeList.get_from_path(pathmap.tree_source_path('pythonidae.random.bd0301.randomly-rooted.tre'),
+                "nexus",
+                rooting="force-rooted")
+        for test_tree in test_trees:
+            test_tree.encode_bipartitions(suppress_unifurcations=False)
+            test_tree.split_bitmask_edge_map
+            test_tree.reroot_at_midpoint(update_bipartitions=True)
+            observed = sorted((b.leafset_bitmask, b.split_bitmask) for b in test_tree.bipartition_encoding)
+            observed_edge_map = dict(test_tree.split_bitmask_edge_map)
+            expected = test_tree.encode_bipartitions(suppress_unifurcations=False)
+            self.assertEqual(observed, sorted((b.leafset_bitmask, b.split_bitmask) for b in expected))
+            self.assertEqual(observed_edge_map, test_tree.split_bitmask_edge_map)
+            pdm = test_tree.phylogenetic_distance_matrix()
+            max_dist = pdm.max_pairwise_distance_taxa()
+            seed_edge_length = test_tree.seed_node.edge.length or 0.0
+            root_dist = max(nd.distance_from_root() for nd in test_tree.leaf_node_iter()) - seed_edge_length
+            self.assertAlmostEqual(root_dist, pdm.patristic_distance(*max_dist) / 2)
+
 class TreeRerootingTests(dendropytest.ExtendedTestCase):
     #                  a
     #                 / \